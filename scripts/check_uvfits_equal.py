@@ -11,6 +11,13 @@ from pyuvdata import UVData
 parser = argparse.ArgumentParser()
 parser.add_argument("uvfits1", help="name of first uvfits file.")
 parser.add_argument("uvfits2", help="name of second uvfits file to compare to first.")
+parser.add_argument(
+    "--fingerprint",
+    action="store_true",
+    help="Compare the fingerprints (hashes) of the objects rather than testing "
+    "equality within tolerances. Only one file is held in memory at a time, but "
+    "the files must have identical metadata and data to match.",
+)
 
 args = parser.parse_args()
 
@@ -22,16 +29,29 @@ uvfits_file2 = args.uvfits2
 if not op.isfile(uvfits_file2):
     raise OSError(f"There is no file named {args.uvfits_file2}")
 
-uv1 = UVData()
-uv1.read_uvfits(uvfits_file1)
+if args.fingerprint:
+    fingerprints = []
+    for uvfits_file in [uvfits_file1, uvfits_file2]:
+        uv = UVData()
+        uv.read_uvfits(uvfits_file)
+        fingerprints.append(uv.fingerprint())
+        del uv
+
+    if fingerprints[0] == fingerprints[1]:
+        print("UVData objects from files are identical")
+    else:
+        print("UVData objects from files are not identical")
+else:
+    uv1 = UVData()
+    uv1.read_uvfits(uvfits_file1)
 
-uv2 = UVData()
-uv2.read_uvfits(uvfits_file2)
+    uv2 = UVData()
+    uv2.read_uvfits(uvfits_file2)
 
-if uv1 == uv2:
-    print("UVData objects from files are equal")
-else:
-    print("UVData objects from files are not equal")
+    if uv1 == uv2:
+        print("UVData objects from files are equal")
+    else:
+        print("UVData objects from files are not equal")
 
-del uv1
-del uv2
+    del uv1
+    del uv2
@@ -14,11 +14,21 @@ of metadata.
 from __future__ import annotations
 
 import builtins
+import copy
+import hashlib
+import itertools
 import warnings
 
 import numpy as np
 from astropy import units
-from astropy.coordinates import EarthLocation, SkyCoord
+from astropy.coordinates import (
+    BaseRepresentationOrDifferential,
+    EarthLocation,
+    SkyCoord,
+)
+from astropy.time import Time
+
+from .utils.io.hdf5 import LazyHDF5Array
 
 allowed_location_types = [EarthLocation]
 try:
@@ -33,6 +43,13 @@ except ImportError:
 
 __all__ = ["UVParameter", "AngleParameter", "LocationParameter", "SkyCoordParameter"]
 
+# Counter used to give each value set on a UVParameter a unique version number, so
+# that changes can be detected by comparing versions (e.g. to skip checks).
+_value_versions = itertools.count()
+
+# Default number of bytes to hash at a time when computing digests.
+_DIGEST_CHUNK_SIZE = 2**24
+
 
 def _get_generic_type(expected_type, strict_type_check=False):
     """Return tuple of more generic types.
@@ -168,6 +185,145 @@ def _param_dict_equal(this_dict, other_dict):
     return True, ""
 
 
+def _update_hash(hasher, tag, data=b""):
+    """Feed a tagged and length-prefixed block of bytes into a hash object."""
+    hasher.update(tag.encode() + b":" + len(data).to_bytes(8, "little"))
+    hasher.update(data)
+
+
+def _iter_array_blocks(value, *, dtype, chunk_size):
+    """
+    Iterate over contiguous blocks of an array in C order.
+
+    Blocks are taken along the first axis (recursing into later axes for large
+    rows) and are close to `chunk_size` bytes, so at most one block is copied or
+    read from disk at a time.
+    """
+    if value.ndim == 0:
+        yield np.ascontiguousarray(value, dtype=dtype)
+        return
+
+    row_bytes = dtype.itemsize * int(np.prod(value.shape[1:]))
+    if value.ndim > 1 and row_bytes > chunk_size:
+        for ind in range(value.shape[0]):
+            yield from _iter_array_blocks(
+                value[ind], dtype=dtype, chunk_size=chunk_size
+            )
+        return
+
+    n_rows = max(chunk_size // max(row_bytes, 1), 1)
+    for start in range(0, value.shape[0], n_rows):
+        yield np.ascontiguousarray(value[start : start + n_rows], dtype=dtype)
+
+
+def _hash_array(hasher, value, *, chunk_size):
+    """Feed an array (or array-like, e.g. a LazyHDF5Array) into a hash object."""
+    dtype = np.dtype(value.dtype)
+    shape = np.asarray(value.shape, dtype="<i8").tobytes()
+    if dtype.names is not None:
+        # hash each field separately to avoid hashing any padding bytes
+        value = np.asarray(value)
+        _update_hash(hasher, "record_array", shape)
+        for name in dtype.names:
+            _update_hash(hasher, "field", name.encode())
+            _hash_array(hasher, value[name], chunk_size=chunk_size)
+        return
+    if dtype.hasobject:
+        _update_hash(hasher, "object_array", shape)
+        for item in np.asarray(value).flat:
+            _hash_value(hasher, item, chunk_size=chunk_size)
+        return
+
+    # Use little-endian data so that arrays read from big-endian files (e.g. FITS)
+    # hash the same as native ones.
+    dtype = dtype.newbyteorder("<")
+    _update_hash(hasher, "array", dtype.str.encode())
+    _update_hash(hasher, "shape", shape)
+    for block in _iter_array_blocks(value, dtype=dtype, chunk_size=chunk_size):
+        hasher.update(block.reshape(-1).view(np.uint8))
+
+
+def _hash_value(hasher, value, *, chunk_size=_DIGEST_CHUNK_SIZE, use_cache=True):
+    """
+    Feed a parameter value into a hash object.
+
+    Each value is tagged with its type (and lengths or shapes as needed) so that
+    different values cannot give the same stream of bytes. Containers are hashed
+    recursively, dicts in sorted key order.
+
+    Parameters
+    ----------
+    hasher : hashlib hash object
+        The hash object to update.
+    value
+        The value to hash.
+    chunk_size : int
+        Number of bytes of array data to hash at a time.
+    use_cache : bool
+        Passed to the `fingerprint` method of any UVBase objects in the value.
+
+    Raises
+    ------
+    ValueError
+        If the value (or an item in it) is of a type that cannot be hashed.
+
+    """
+    kwargs = {"chunk_size": chunk_size, "use_cache": use_cache}
+    if value is None:
+        _update_hash(hasher, "none")
+    elif isinstance(value, str):
+        _update_hash(hasher, "str", value.encode("utf-8"))
+    elif isinstance(value, bytes):
+        _update_hash(hasher, "bytes", value)
+    elif isinstance(value, bool | int | float | complex | np.number | np.bool_):
+        # hash scalars as the equivalent python type so that the digest does not
+        # depend on the precision used to store them
+        if isinstance(value, np.generic):
+            value = value.item()
+        _hash_array(hasher, np.asarray(value), chunk_size=chunk_size)
+    elif isinstance(value, tuple(allowed_location_types)):
+        _update_hash(hasher, "location", type(value).__name__.encode())
+        _hash_value(hasher, str(getattr(value, "ellipsoid", None)), **kwargs)
+        for comp in (value.x, value.y, value.z):
+            _hash_array(hasher, np.asarray(comp.to_value("m")), chunk_size=chunk_size)
+    elif isinstance(value, SkyCoord):
+        _update_hash(hasher, "skycoord", str(value.frame.name).encode())
+        _hash_value(hasher, value.data, **kwargs)
+        for name in sorted(value.frame.frame_attributes):
+            _update_hash(hasher, "frame_attribute", name.encode())
+            _hash_value(hasher, getattr(value.frame, name), **kwargs)
+    elif isinstance(value, BaseRepresentationOrDifferential):
+        _update_hash(hasher, "representation", value.get_name().encode())
+        for comp in value.components:
+            _hash_value(hasher, getattr(value, comp), **kwargs)
+    elif isinstance(value, Time):
+        _update_hash(hasher, "time", value.scale.encode())
+        _hash_array(hasher, np.asarray(value.jd1), chunk_size=chunk_size)
+        _hash_array(hasher, np.asarray(value.jd2), chunk_size=chunk_size)
+        _hash_value(hasher, value.location, **kwargs)
+    elif isinstance(value, units.Quantity):
+        _update_hash(hasher, "quantity", value.unit.to_string().encode())
+        _hash_array(hasher, value.view(np.ndarray), chunk_size=chunk_size)
+    elif isinstance(value, dict):
+        _update_hash(hasher, "dict", len(value).to_bytes(8, "little"))
+        for key in sorted(value, key=lambda key: (type(key).__name__, key)):
+            _hash_value(hasher, key, **kwargs)
+            _hash_value(hasher, value[key], **kwargs)
+    elif isinstance(value, list | tuple):
+        _update_hash(hasher, "sequence", len(value).to_bytes(8, "little"))
+        for item in value:
+            _hash_value(hasher, item, **kwargs)
+    elif callable(getattr(value, "fingerprint", None)):
+        # UVBase objects (e.g. Telescope objects)
+        fingerprint = value.fingerprint(algorithm=hasher.name, **kwargs)
+        _update_hash(hasher, type(value).__name__, fingerprint.encode())
+    elif hasattr(value, "shape") and hasattr(value, "dtype"):
+        # numpy arrays and array-likes (e.g. LazyHDF5Array objects)
+        _hash_array(hasher, value, chunk_size=chunk_size)
+    else:
+        raise ValueError(f"Cannot compute a digest for values of type {type(value)}.")
+
+
 class UVParameter:
     """
     Data and metadata objects for interferometric data sets.
@@ -262,6 +418,9 @@ class UVParameter:
         When True, the input expected_type is used exactly, otherwise a more
         generic type is found to allow changes in precisions or to/from numpy
         dtypes to not break checks.
+    value_version : int
+        A number that is unique to each value set on the UVParameter. It changes
+        every time the value is set, but not when the value is modified in place.
 
     """
 
@@ -311,6 +470,82 @@ class UVParameter:
         self.ignore_eq_none = ignore_eq_none and not required
         self._setter = setter
 
+    def __setattr__(self, name, value):
+        """Give the value a new version number every time it is set."""
+        if name == "value":
+            super().__setattr__("_value_version", next(_value_versions))
+        super().__setattr__(name, value)
+
+    @property
+    def value_version(self):
+        """Get the version number of the current value."""
+        return self.__dict__.get("_value_version")
+
+    def digest(self, *, algorithm="sha256", chunk_size=None, use_cache=True):
+        """
+        Get a hash of the value.
+
+        The value is hashed exactly rather than within the tolerances used for
+        equality testing. Parameters with the same digest have identical values
+        (arrays must also have the same datatype), but parameters with different
+        digests may still be equal. Scalar numbers are hashed as the equivalent
+        python type, so e.g. ``3`` and ``np.int32(3)`` give the same digest.
+
+        Arrays are hashed in chunks, so they are not copied in full. Arrays that are
+        not in memory (e.g. LazyHDF5Array objects) are read one chunk at a time.
+
+        The digest is cached until the value is set. In place changes to the value
+        (e.g. setting some elements of an array) are only detected if the object
+        marks the parameter as changed afterwards (see
+        :meth:`pyuvdata.uvbase.UVBase._mark_changed`), as the methods on pyuvdata
+        objects do. Pass ``use_cache=False`` after changing the value in place
+        without doing so.
+
+        Parameters
+        ----------
+        algorithm : str
+            Name of the hash algorithm to use, passed to :func:`hashlib.new`.
+        chunk_size : int, optional
+            Number of bytes of array data to hash at a time, this does not change
+            the digest. Defaults to 16 MiB.
+        use_cache : bool
+            Option to use the cached digest if the value has not been set since it
+            was computed. Dicts, lists and UVBase objects are never cached, because
+            they are often modified in place.
+
+        Returns
+        -------
+        str
+            The hexadecimal digest of the value.
+
+        Raises
+        ------
+        ValueError
+            If chunk_size is not a positive integer or the value (or an item in it)
+            is of a type that cannot be hashed.
+
+        """
+        if chunk_size is None:
+            chunk_size = _DIGEST_CHUNK_SIZE
+        elif not isinstance(chunk_size, int | np.integer) or chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+
+        cacheable = not isinstance(self.value, dict | list) and not callable(
+            getattr(self.value, "fingerprint", None)
+        )
+        digests = self.__dict__.setdefault("_digests", {})
+        if use_cache and cacheable and algorithm in digests:
+            version, digest = digests[algorithm]
+            if version == self.value_version:
+                return digest
+
+        hasher = hashlib.new(algorithm)
+        _hash_value(hasher, self.value, chunk_size=chunk_size, use_cache=use_cache)
+        digest = hasher.hexdigest()
+        if cacheable:
+            digests[algorithm] = (self.value_version, digest)
+        return digest
+
     def __eq__(self, other, *, silent=False):
         """
         Test if classes match and values are within tolerances.
@@ -346,6 +581,14 @@ class UVParameter:
                 print(f"{self.name} is None on right, but not left")
             return False
 
+        if isinstance(self.value, LazyHDF5Array) or isinstance(
+            other.value, LazyHDF5Array
+        ):
+            # compare lazily loaded arrays as numpy arrays (which reads the data)
+            this, other = copy.copy(self), copy.copy(other)
+            this.value, other.value = np.asarray(this.value), np.asarray(other.value)
+            return this.__eq__(other, silent=silent)
+
         if isinstance(self.value, tuple(allowed_location_types)) and not isinstance(
             other.value, tuple(allowed_location_types)
         ):
@@ -461,7 +461,14 @@ class Telescope(UVBase):
 
         return super().__setattr__(__name, __value)
 
-    def check(self, *, check_extra=True, run_check_acceptability=True):
+    def check(
+        self,
+        *,
+        check_extra=True,
+        run_check_acceptability=True,
+        check_level="full",
+        only_changed=False,
+    ):
         """
         Add some extra checks on top of checks on UVBase class.
 
@@ -474,6 +481,12 @@ class Telescope(UVBase):
             If true, check all parameters, otherwise only check required parameters.
         run_check_acceptability : bool
             Option to check if values in parameters are acceptable.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full".
+            See :meth:`pyuvdata.uvbase.UVBase.check` for details.
+        only_changed : bool
+            Option to only run checks on parameters that have been set since they
+            last passed the checks. Changes made in place are not tracked.
 
         Returns
         -------
@@ -490,15 +503,23 @@ class Telescope(UVBase):
         # first run the basic check from UVBase
 
         super().check(
-            check_extra=check_extra, run_check_acceptability=run_check_acceptability
+            check_extra=check_extra,
+            run_check_acceptability=run_check_acceptability,
+            check_level=check_level,
+            only_changed=only_changed,
         )
 
-        if run_check_acceptability:
+        if run_check_acceptability and check_level != "shape":
             # Check antenna positions
-            utils.coordinates.check_surface_based_positions(
-                antenna_positions=self.antenna_positions,
-                telescope_loc=self.location,
-                raise_error=False,
+            self._run_cached_check(
+                "surface_based_positions",
+                lambda: utils.coordinates.check_surface_based_positions(
+                    antenna_positions=self.antenna_positions,
+                    telescope_loc=self.location,
+                    raise_error=False,
+                ),
+                params=["_antenna_positions", "_location"],
+                only_changed=only_changed,
             )
 
         return True
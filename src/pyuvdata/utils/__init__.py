@@ -26,6 +26,7 @@ from . import coordinates  # noqa
 from . import frequency  # noqa
 from . import history  # noqa
 from . import io  # noqa
+from . import lru_cache  # noqa
 from . import phase_center_catalog  # noqa
 from . import phasing  # noqa
 from . import pol  # noqa
@@ -96,6 +96,9 @@ def apply_uvflag(
     if mismatch_freqs:
         raise ValueError("UVFlag and UVData have mismatched frequency arrays.")
 
+    # the flags are modified in place, so they need to be in memory
+    uvd.load_lazy_data()
+
     # unflag if desired
     if unflag_first:
         uvd.flag_array[:] = False
@@ -112,6 +115,7 @@ def apply_uvflag(
         uvf_ap_inds = uvf.antpair2ind(*ap)
         # addition of boolean is OR
         uvd.flag_array[uvd_ap_inds] += uvf.flag_array[uvf_ap_inds]
+    uvd._mark_changed("_flag_array")
 
     uvd.history += "\nFlagged with pyuvdata.utils.apply_uvflags."
 
@@ -241,3 +241,100 @@ def collapse(
             + "."
         ) from err
     return out
+
+
+def _sum_segments(arr, starts):
+    """Sum contiguous segments along the first axis in a single pass."""
+    # Get the dtype np.sum would use (promoting booleans and small integers)
+    # from an empty reduction.
+    dtype = np.add.reduce(arr[:0], axis=0).dtype
+    lengths = np.diff(np.append(starts, arr.shape[0]))
+    if lengths.size > 0 and np.all(lengths == lengths[0]):
+        # all the segments are the same length, so just reshape and sum
+        return np.sum(
+            arr.reshape((lengths.size, lengths[0]) + arr.shape[1:]), axis=1, dtype=dtype
+        )
+    return np.add.reduceat(arr, starts, axis=0, dtype=dtype)
+
+
+def collapse_segments(
+    arr, alg, *, starts, weights=None, return_weights=False, return_weights_square=False
+):
+    """
+    Collapse contiguous segments along the first axis of an array.
+
+    This gives the same results (up to floating point summation order) as calling
+    :func:`collapse` with ``axis=0`` on each of the segments
+    ``arr[starts[i]:starts[i + 1]]``, but collapses all the segments at once
+    rather than looping over them.
+
+    Parameters
+    ----------
+    arr : array
+        Input array to process, sorted so that each segment is contiguous along
+        the first axis.
+    alg : str
+        Algorithm to use, one of "mean", "absmean", "quadmean", "or", "and".
+    starts : array of int
+        Indices along the first axis where each segment starts. Must be
+        strictly increasing and start with 0 so that no segment is empty.
+    weights: ndarray, optional
+        weights for collapse operation (e.g. weighted mean), same shape as `arr`.
+        NOTE: The "or" and "and" algorithms do not use the weights.
+    return_weights : bool
+        Whether to return sum of weights.
+    return_weights_square: bool
+        Whether to return the sum of the squares of the weights. Default is False.
+
+    """
+    if alg not in ["mean", "absmean", "quadmean", "or", "and"]:
+        raise ValueError(
+            "Collapse algorithm must be one of: mean, absmean, quadmean, or, and."
+        )
+    starts = np.asarray(starts)
+    if alg in ["or", "and"]:
+        if arr.dtype != np.bool_:
+            raise ValueError(f"Input to {alg}_collapse function must be boolean array")
+        if alg == "or":
+            out = np.logical_or.reduceat(arr, starts, axis=0)
+            operation = "OR-ing"
+        else:
+            out = np.logical_and.reduceat(arr, starts, axis=0)
+            operation = "AND-ing"
+        if (weights is not None) and not np.all(weights == weights.reshape(-1)[0]):
+            warnings.warn(
+                f"Currently weights are not handled when {operation} boolean arrays."
+            )
+        if return_weights:
+            return out, np.ones_like(out, dtype=np.float64)
+        else:
+            return out
+
+    # Apply the same transformations as the mean_collapse based functions.
+    if alg == "absmean":
+        arr = np.abs(arr)
+    elif alg == "quadmean":
+        arr = np.abs(arr) ** 2
+    else:
+        arr = deepcopy(arr)
+    if weights is None:
+        weights = np.ones_like(arr)
+    weights = weights * np.logical_not(np.isinf(arr))
+    arr[np.isinf(arr)] = 0
+    weight_out = _sum_segments(weights, starts)
+    if return_weights_square:
+        weights_square_out = _sum_segments(weights**2, starts)
+    out = _sum_segments(weights * arr, starts)
+    where = weight_out > 1e-10
+    out = np.true_divide(out, weight_out, where=where)
+    out = np.where(where, out, np.inf)
+    if alg == "quadmean":
+        out = np.sqrt(out)
+    if return_weights and return_weights_square:
+        return out, weight_out, weights_square_out
+    elif return_weights:
+        return out, weight_out
+    elif return_weights_square:
+        return out, weights_square_out
+    else:
+        return out
@@ -4,8 +4,13 @@
 
 from __future__ import annotations
 
+import collections
+import concurrent.futures
 import json
+import os
+import sys
 from functools import cached_property
+from multiprocessing import shared_memory
 from pathlib import Path
 from typing import Any
 
@@ -24,6 +29,7 @@ except ImportError:
 import contextlib
 
 from ..coordinates import ENU_from_ECEF, LatLonAlt_from_XYZ
+from ..tools import _convert_to_slices
 
 hdf5plugin_present = True
 try:
@@ -151,7 +157,7 @@ def _get_dset_shape(dset, indices):
     return dset_shape, indices
 
 
-def _index_dset(dset, indices, *, input_array=None):
+def _index_dset(dset, indices, *, input_array=None, nworkers=1, pool=None):
     """
     Index a UVH5 data, flags or nsamples h5py dataset to get data or overwrite data.
 
@@ -175,6 +181,12 @@ def _index_dset(dset, indices, *, input_array=None):
     input_array : ndarray, optional
         Array to be copied into the dset at the indices. If not provided, the data in
         the dset is indexed and returned.
+    nworkers : int
+        Number of worker processes to use to read (and decompress) the data, see
+        :func:`_read_dset_parallel`. Only used if `input_array` is not passed.
+    pool : concurrent.futures.ProcessPoolExecutor, optional
+        Process pool to use for the workers, see :func:`_decompression_pool`. If not
+        passed (and `nworkers` is greater than 1), a pool is started for this read.
 
     Returns
     -------
@@ -190,6 +202,9 @@ def _index_dset(dset, indices, *, input_array=None):
     This function specializes in repeated slices over the same axis,
     e.g. if indices is [[slice(0, 5), slice(10, 15), ...], ..., ]
     """
+    if input_array is None and nworkers > 1:
+        return _read_dset_parallel(dset, indices, nworkers=nworkers, pool=pool)
+
     # get dset and arr shape
     dset_shape = dset.shape
     arr_shape, indices = _get_dset_shape(dset, indices)
@@ -263,7 +278,9 @@ def _index_dset(dset, indices, *, input_array=None):
         return
 
 
-def _read_complex_astype(dset, indices, dtype_out=np.complex64):
+def _read_complex_astype(
+    dset, indices, dtype_out=np.complex64, *, nworkers=1, pool=None
+):
     """
     Read the given data set of a specified type to floating point complex data.
 
@@ -278,6 +295,12 @@ def _read_complex_astype(dset, indices, dtype_out=np.complex64):
         The datatype of the output array. One of (complex, np.complex64,
         np.complex128). Default is np.complex64 (single-precision real and
         imaginary floats).
+    nworkers : int
+        Number of worker processes to use to read (and decompress) the data, see
+        :func:`_read_dset_parallel`.
+    pool : concurrent.futures.ProcessPoolExecutor, optional
+        Process pool to use for the workers, see :func:`_decompression_pool`. If not
+        passed (and `nworkers` is greater than 1), a pool is started for this read.
 
     Returns
     -------
@@ -293,6 +316,11 @@ def _read_complex_astype(dset, indices, dtype_out=np.complex64):
         raise ValueError(
             "output datatype must be one of (complex, np.complex64, np.complex128)"
         )
+    if nworkers > 1:
+        return _read_dset_parallel(
+            dset, indices, nworkers=nworkers, dtype_out=dtype_out, pool=pool
+        )
+
     dset_shape, indices = _get_dset_shape(dset, indices)
     output_array = np.empty(dset_shape, dtype=dtype_out)
     # dset is indexed in native dtype, but is upcast upon assignment
@@ -307,6 +335,264 @@ def _read_complex_astype(dset, indices, dtype_out=np.complex64):
     return output_array
 
 
+@contextlib.contextmanager
+def _decompression_pool(nworkers):
+    """
+    Get a process pool to share between the parallel reads of several datasets.
+
+    Worker processes are only started when work is first submitted to the pool, so
+    this is cheap if none of the reads end up being done in parallel.
+
+    Parameters
+    ----------
+    nworkers : int
+        The number of worker processes.
+
+    Yields
+    ------
+    concurrent.futures.ProcessPoolExecutor or None
+        The process pool, None if `nworkers` is less than 2.
+
+    """
+    if nworkers < 2:
+        yield None
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=nworkers) as pool:
+        yield pool
+
+
+# The maximum size of the blocks passed through shared memory in parallel reads.
+_PARALLEL_READ_BLOCK_BYTES = 2**26
+
+
+def _shared_memory_space():
+    """
+    Get the space available for shared memory blocks.
+
+    Returns
+    -------
+    int or None
+        The number of free bytes in /dev/shm, None if it cannot be found (e.g. on
+        systems without a /dev/shm file system).
+
+    """
+    try:
+        stat = os.statvfs("/dev/shm")
+    except (AttributeError, OSError):
+        return None
+    return stat.f_bavail * stat.f_frsize
+
+
+def _read_dset_block(filename, dset_name, indices, dtype_out, shm_name, shape, dtype):
+    """
+    Read a block of a dataset into an array in shared memory.
+
+    This is the worker function for :func:`_read_dset_parallel`, it is a module
+    level function so it can be sent to the workers of a process pool.
+
+    Parameters
+    ----------
+    filename : str
+        The name of the HDF5 file.
+    dset_name : str
+        The name of the dataset in the file.
+    indices : tuple
+        The indices to read, as passed to :func:`_index_dset`.
+    dtype_out : numpy dtype or None
+        If not None, read the data using :func:`_read_complex_astype` with this
+        output datatype, otherwise use :func:`_index_dset`.
+    shm_name : str
+        The name of the shared memory block to put the block into.
+    shape : tuple of int
+        The shape of the block.
+    dtype : numpy dtype
+        The datatype of the block.
+
+    """
+    # The block is owned (and unlinked) by the calling process. Pool workers share
+    # the resource tracker of the calling process, so attaching to the block here
+    # does not need to be (and must not be) undone with the tracker.
+    if sys.version_info >= (3, 13):  # pragma: no cover
+        shm = shared_memory.SharedMemory(name=shm_name, track=False)
+    else:
+        shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        with h5py.File(filename, "r") as h5f:
+            dset = h5f[dset_name]
+            if dtype_out is None:
+                block = _index_dset(dset, indices)
+            else:
+                block = _read_complex_astype(dset, indices, dtype_out)
+        np.ndarray(shape, dtype=dtype, buffer=shm.buf)[...] = block
+        del block
+    finally:
+        shm.close()
+
+
+def _read_dset_parallel(dset, indices, *, nworkers, dtype_out=None, pool=None):
+    """
+    Read (and decompress) a chunked dataset using multiple processes.
+
+    The HDF5 library (and h5py) only allows one thread at a time to make HDF5 calls,
+    so chunk decompression for compressed datasets can only use a single core per
+    process. This function splits the requested indices along the first axis into
+    blocks aligned with the dataset chunks, which are read concurrently by worker
+    processes. Each block is passed back through a shared memory block and copied
+    into the output array (in ordinary memory) as soon as it is read. The blocks
+    are limited in size and at most `nworkers` are in shared memory at a time, so
+    only a small part of the data is ever in shared memory (which is often limited,
+    e.g. in containers).
+
+    Datasets that are not chunked (so cannot be compressed), reads that only touch
+    one chunk along the first axis and reads where the blocks would not fit in the
+    available shared memory are read in the calling process.
+
+    Parameters
+    ----------
+    dset : h5py dataset
+        A reference to an HDF5 dataset on disk.
+    indices : tuple
+        The indices to read, see :func:`_index_dset`.
+    nworkers : int
+        The number of worker processes to use.
+    dtype_out : numpy dtype, optional
+        If passed, read the data using :func:`_read_complex_astype` with this
+        output datatype, otherwise use :func:`_index_dset`.
+    pool : concurrent.futures.ProcessPoolExecutor, optional
+        Process pool to use for the workers, see :func:`_decompression_pool`. If not
+        passed, a pool of `nworkers` processes is started for this read.
+
+    Returns
+    -------
+    ndarray
+        The indexed dataset.
+
+    """
+    arr_shape, indices = _get_dset_shape(dset, indices)
+    dtype = dset.dtype if dtype_out is None else np.dtype(dtype_out)
+
+    # get the explicit indices along the first axis
+    axis_inds = indices[0]
+    if isinstance(axis_inds, int | np.integer):
+        axis_inds = np.asarray([axis_inds])
+    elif isinstance(axis_inds, slice):
+        axis_inds = np.arange(dset.shape[0])[axis_inds]
+    elif isinstance(axis_inds[0], slice):
+        axis_inds = np.concatenate([np.arange(dset.shape[0])[s] for s in axis_inds])
+    else:
+        axis_inds = np.asarray(axis_inds)
+
+    # split into runs of indices in the same chunk
+    if dset.chunks is not None and axis_inds.size > 0:
+        chunk_ids = axis_inds // dset.chunks[0]
+        run_edges = np.nonzero(np.diff(chunk_ids))[0] + 1
+    else:
+        run_edges = np.zeros(0, dtype=int)
+    run_edges = np.concatenate([[0], run_edges, [axis_inds.size]])
+
+    # Group the runs into blocks, aiming for at least one block per worker but
+    # limiting the size of the blocks. The blocks in flight must fit in the
+    # available shared memory.
+    row_bytes = int(np.prod(arr_shape[1:])) * dtype.itemsize
+    block_limit = _PARALLEL_READ_BLOCK_BYTES
+    shm_space = _shared_memory_space()
+    if shm_space is not None:
+        block_limit = min(block_limit, shm_space // (2 * nworkers))
+    target_rows = min(
+        -(-axis_inds.size // nworkers), max(block_limit // max(row_bytes, 1), 1)
+    )
+    block_edges = [0]
+    for prev_edge, edge in zip(run_edges[:-1], run_edges[1:], strict=True):
+        if edge - block_edges[-1] > target_rows and prev_edge > block_edges[-1]:
+            block_edges.append(prev_edge)
+    block_edges.append(axis_inds.size)
+    nblocks = len(block_edges) - 1
+    max_block_bytes = int(np.max(np.diff(block_edges))) * row_bytes
+
+    if (
+        nblocks < 2
+        or int(np.prod(arr_shape)) == 0
+        or (
+            shm_space is not None
+            and max_block_bytes * min(nworkers, nblocks) > shm_space
+        )
+    ):
+        if dtype_out is None:
+            return _index_dset(dset, indices)
+        return _read_complex_astype(dset, indices, dtype_out)
+
+    blocks = []
+    for start, stop in zip(block_edges[:-1], block_edges[1:], strict=True):
+        slices, sliceable = _convert_to_slices(
+            axis_inds[start:stop], max_nslice=max(1, (stop - start) // 10)
+        )
+        block_inds = slices if sliceable else axis_inds[start:stop].tolist()
+        blocks.append(((block_inds, *indices[1:]), start, stop))
+    blocks = iter(blocks)
+
+    out = np.empty(arr_shape, dtype=dtype)
+    pending = collections.deque()
+
+    def _submit_next():
+        block = next(blocks, None)
+        if block is None:
+            return
+        block_inds, start, stop = block
+        block_shape = (stop - start, *arr_shape[1:])
+        shm = shared_memory.SharedMemory(
+            create=True, size=max(int(np.prod(block_shape)) * dtype.itemsize, 1)
+        )
+        try:
+            future = pool.submit(
+                _read_dset_block,
+                dset.file.filename,
+                dset.name,
+                block_inds,
+                dtype_out,
+                shm.name,
+                block_shape,
+                dtype,
+            )
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        pending.append((future, shm, start, stop))
+
+    try:
+        with contextlib.ExitStack() as stack:
+            if pool is None:
+                pool = stack.enter_context(
+                    concurrent.futures.ProcessPoolExecutor(
+                        max_workers=min(nworkers, nblocks)
+                    )
+                )
+            for _ in range(nworkers):
+                _submit_next()
+            while pending:
+                future, shm, start, stop = pending[0]
+                future.result()
+                out[start:stop] = np.ndarray(
+                    out[start:stop].shape, dtype=dtype, buffer=shm.buf
+                )
+                pending.popleft()
+                shm.close()
+                shm.unlink()
+                _submit_next()
+    finally:
+        # the pool may be shared, so make sure no other blocks are still running
+        # before releasing their shared memory
+        for future, _, _, _ in pending:
+            future.cancel()
+        concurrent.futures.wait([future for future, _, _, _ in pending])
+        for _, shm, _, _ in pending:
+            shm.close()
+            shm.unlink()
+
+    return out
+
+
 def _write_complex_astype(data, dset, indices):
     """
     Write floating point complex data as a specified type.
@@ -384,6 +670,352 @@ def _get_compression(compression):
     return compression_use, compression_opts
 
 
+class LazyHDF5Array(np.lib.mixins.NDArrayOperatorsMixin):
+    """
+    An array-like object backed by a data-like dataset in a UVH5 file.
+
+    This is used for the data_array, flag_array and nsample_array on UVData objects
+    read with ``lazy=True``. Nothing is read from disk until the object is indexed
+    (which reads just the indexed portion) or converted to a numpy array (which
+    reads all of it, e.g. ``np.asarray(uvd.data_array)``). The file is (re)opened
+    through the HDF5Meta object as needed.
+
+    Arithmetic, numpy ufuncs and the common array methods (e.g. `astype`,
+    `reshape`, `conj`) read all of the data and return numpy arrays. The file is
+    never written to: the first write to the object (setting elements or an in
+    place operation) reads all of the data into memory, after which the object
+    works on the in-memory array.
+
+    Parameters
+    ----------
+    meta : HDF5Meta
+        The metadata object for the file containing the dataset.
+    name : str
+        Name of the dataset in the "Data" group of the file, one of "visdata",
+        "flags" or "nsamples".
+    dtype : numpy dtype, optional
+        Datatype of the arrays returned when indexing. Only used if the dataset has
+        a custom (integer) complex datatype, in which case it must be np.complex64
+        or np.complex128 (defaults to np.complex128). Otherwise the dataset datatype
+        is used.
+    indices : tuple of array_like of int, optional
+        The indices along the baseline-time, frequency and polarization axes of the
+        dataset that this object represents (e.g. after a select), None means all
+        the indices along that axis. Defaults to all of the indices on all axes.
+
+    """
+
+    def __init__(self, meta, name, *, dtype=None, indices=(None, None, None)):
+        self.meta = meta
+        self.name = name
+        dset = meta.datagrp[name]
+        # old shaped datasets have a length one spw axis as the second axis
+        self._dset_shape = (
+            dset.shape if dset.ndim == 3 else dset.shape[::2] + (dset.shape[3],)
+        )
+        if dset.dtype.names is not None:
+            _check_complex_dtype(dset.dtype)
+            self._custom_dtype = True
+            self.dtype = np.dtype(np.complex128 if dtype is None else dtype)
+            if self.dtype not in (np.complex64, np.complex128):
+                raise ValueError("dtype must be np.complex64 or np.complex128")
+        else:
+            self._custom_dtype = False
+            self.dtype = dset.dtype
+
+        if len(indices) != 3:
+            raise ValueError("indices must have a length of 3.")
+        self._indices = tuple(
+            None if inds is None else np.asarray(inds, dtype=int) for inds in indices
+        )
+        self.shape = tuple(
+            dlen if inds is None else inds.size
+            for inds, dlen in zip(self._indices, self._dset_shape, strict=True)
+        )
+        # the in-memory array, only set once the object has been written to
+        self._array = None
+
+    @property
+    def ndim(self):
+        """The number of dimensions of the array."""
+        return len(self.shape)
+
+    @property
+    def size(self):
+        """The number of elements in the array."""
+        return int(np.prod(self.shape))
+
+    @property
+    def nbytes(self):
+        """The number of bytes the array will take up when read into memory."""
+        return self.size * self.dtype.itemsize
+
+    def __len__(self):
+        """Get the length of the first axis."""
+        return self.shape[0]
+
+    def __repr__(self):
+        """Get a string representation of the object."""
+        return (
+            f"LazyHDF5Array(path={str(self.meta.path)!r}, name={self.name!r}, "
+            f"shape={self.shape}, dtype={self.dtype})"
+        )
+
+    def __copy__(self):
+        """Get a copy of the object, which shares the metadata object."""
+        if self._array is not None:
+            return self._array.copy()
+        return type(self)(self.meta, self.name, dtype=self.dtype, indices=self._indices)
+
+    def __deepcopy__(self, memo):
+        """
+        Get a copy of the object, which shares the metadata object.
+
+        The data on disk are never modified, so there's no need to copy the
+        metadata object (which would also copy all of its cached metadata).
+        """
+        return self.__copy__()
+
+    def _axis_inds(self, axis):
+        """Get the dataset indices along an axis."""
+        if self._indices[axis] is None:
+            return np.arange(self._dset_shape[axis])
+        return self._indices[axis]
+
+    def take(self, indices, axis):
+        """
+        Select along an axis, returning a new LazyHDF5Array (no data is read).
+
+        Parameters
+        ----------
+        indices : array_like of int
+            The indices to select along the axis.
+        axis : int
+            The axis to select along.
+
+        Returns
+        -------
+        LazyHDF5Array
+            A new object representing the selected data.
+
+        """
+        indices = np.asarray(indices)
+        if indices.ndim != 1:
+            raise ValueError("indices must be one dimensional.")
+        if self._array is not None:
+            return self._array.take(indices, axis=axis)
+        new_indices = list(self._indices)
+        new_indices[axis] = self._axis_inds(axis)[indices]
+        return type(self)(
+            self.meta, self.name, dtype=self.dtype, indices=tuple(new_indices)
+        )
+
+    def __getitem__(self, key):
+        """
+        Read the indexed portion of the data from disk.
+
+        Integers, slices, ellipses and 1D integer or boolean arrays are supported
+        along each axis. Any other indexing (e.g. multidimensional boolean masks)
+        reads the full array and indexes it in memory.
+        """
+        if self._array is not None:
+            return self._array[key]
+        if not isinstance(key, tuple):
+            key = (key,)
+        if any(k is None or (not isinstance(k, slice) and np.ndim(k) > 1) for k in key):
+            return np.asarray(self)[key]
+
+        n_ellipsis = sum(k is Ellipsis for k in key)
+        if n_ellipsis > 1:
+            raise IndexError("an index can only have a single ellipsis ('...')")
+        if n_ellipsis == 1:
+            ell_ind = next(ind for ind, k in enumerate(key) if k is Ellipsis)
+            key = (
+                key[:ell_ind]
+                + (slice(None),) * (self.ndim - len(key) + 1)
+                + key[ell_ind + 1 :]
+            )
+        if len(key) > self.ndim:
+            raise IndexError(
+                f"too many indices for array: array is {self.ndim}-dimensional, "
+                f"but {len(key)} were indexed"
+            )
+        key = key + (slice(None),) * (self.ndim - len(key))
+
+        # Get the dataset indices to read along each axis (sorted and unique for
+        # any array indices) and the key to index the block that is read in memory.
+        # The in-memory key has the same structure as the input key, so multiple
+        # array (or integer) indices follow the usual numpy rules.
+        sel_inds = []
+        mem_key = []
+        for axis, axis_key in enumerate(key):
+            axis_inds = self._axis_inds(axis)
+            pos = np.arange(axis_inds.size)[axis_key]
+            if isinstance(axis_key, slice):
+                sel_inds.append(axis_inds[pos])
+                mem_key.append(slice(None))
+            elif np.ndim(pos) == 0:
+                sel_inds.append(axis_inds[[pos]])
+                mem_key.append(0)
+            else:
+                unique_pos, inverse = np.unique(pos, return_inverse=True)
+                sel_inds.append(axis_inds[unique_pos])
+                mem_key.append(inverse)
+
+        arr = self._read_block(sel_inds)
+        if any(not isinstance(axis_key, slice) for axis_key in mem_key):
+            arr = arr[tuple(mem_key)]
+        return arr
+
+    def _read_block(self, sel_inds):
+        """
+        Read the outer product of 1D dataset indices along each axis.
+
+        HDF5 requires sorted, unique indices and only supports indexing with a list
+        of indices on one axis at a time. Use slices where possible, a list of
+        indices on the first axis that cannot be sliced and the bounding slice on
+        any other axes, then index in memory as needed.
+        """
+        out_shape = tuple(inds.size for inds in sel_inds)
+        if 0 in out_shape:
+            return np.empty(out_shape, dtype=self.dtype)
+
+        dset_inds = []
+        post_inds = []
+        use_list = True
+        for inds in sel_inds:
+            unique_inds, inverse = np.unique(inds, return_inverse=True)
+            slices, sliceable = _convert_to_slices(unique_inds, max_nslice_frac=0.1)
+            if sliceable:
+                dset_inds.append(slices[0] if len(slices) == 1 else slices)
+                post_inds.append(inverse)
+            elif use_list:
+                dset_inds.append(unique_inds.tolist())
+                post_inds.append(inverse)
+                use_list = False
+            else:
+                dset_inds.append(slice(unique_inds[0], unique_inds[-1] + 1))
+                post_inds.append(inds - unique_inds[0])
+
+        dset = self.meta.datagrp[self.name]
+        if self._custom_dtype:
+            arr = _read_complex_astype(dset, tuple(dset_inds), self.dtype)
+        else:
+            arr = _index_dset(dset, tuple(dset_inds))
+        if arr.ndim == 4:
+            arr = arr[:, 0]
+
+        if any(
+            not np.array_equal(inds, np.arange(arr.shape[axis]))
+            for axis, inds in enumerate(post_inds)
+        ):
+            arr = arr[np.ix_(*post_inds)]
+        return arr
+
+    def _load(self):
+        """Read all of the data into memory to allow writing to it."""
+        if self._array is None:
+            self._array = self[...]
+        return self._array
+
+    def __setitem__(self, key, value):
+        """Set elements of the array, reading all of the data into memory first."""
+        self._load()[key] = value
+
+    def __array__(self, dtype=None, copy=None):
+        """Read the full array from disk."""
+        if self._array is not None:
+            return np.array(self._array, dtype=dtype, copy=copy)
+        if copy is False:
+            raise ValueError(
+                "A copy is always required to convert a LazyHDF5Array to an array."
+            )
+        arr = self[...]
+        if dtype is not None:
+            arr = arr.astype(dtype, copy=False)
+        return arr
+
+    def item(self, *args):
+        """Read a single element of the array from disk as a python scalar."""
+        if len(args) == 0:
+            if self.size != 1:
+                raise ValueError(
+                    "can only convert an array of size 1 to a Python scalar"
+                )
+            index = (0,) * self.ndim
+        elif len(args) == 1 and isinstance(args[0], int | np.integer):
+            index = np.unravel_index(args[0], self.shape)
+        else:
+            index = args[0] if len(args) == 1 else args
+        return self[tuple(index)].item()
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Read the full array from disk and apply a ufunc to it.
+
+        Outputs to LazyHDF5Array objects (e.g. for in place operations) are written
+        to their in-memory arrays.
+        """
+        out = kwargs.get("out", ())
+        if any(isinstance(arr, LazyHDF5Array) for arr in out):
+            kwargs["out"] = tuple(
+                arr._load() if isinstance(arr, LazyHDF5Array) else arr for arr in out
+            )
+        inputs = tuple(
+            np.asarray(arr) if isinstance(arr, LazyHDF5Array) else arr for arr in inputs
+        )
+        result = getattr(ufunc, method)(*inputs, **kwargs)
+        if any(isinstance(arr, LazyHDF5Array) for arr in out):
+            # return the objects themselves so in place operators keep them
+            return out[0] if len(out) == 1 else out
+        return result
+
+    def astype(self, dtype, **kwargs):
+        """Read the full array from disk as a numpy array with a new datatype."""
+        return np.asarray(self).astype(dtype, **kwargs)
+
+    def copy(self):
+        """Read the full array from disk into a numpy array."""
+        return np.array(self)
+
+    def conj(self):
+        """Read the full array from disk and return its complex conjugate."""
+        return np.conj(np.asarray(self))
+
+    conjugate = conj
+
+    def reshape(self, *shape, **kwargs):
+        """Read the full array from disk and reshape it."""
+        return np.asarray(self).reshape(*shape, **kwargs)
+
+    def flatten(self, order="C"):
+        """Read the full array from disk and flatten it."""
+        return np.asarray(self).flatten(order=order)
+
+    def repeat(self, repeats, axis=None):
+        """Read the full array from disk and repeat its elements."""
+        return np.asarray(self).repeat(repeats, axis=axis)
+
+    def transpose(self, *axes):
+        """Read the full array from disk and permute its axes."""
+        return np.asarray(self).transpose(*axes)
+
+    @property
+    def T(self):  # noqa N802
+        """Read the full array from disk and transpose it."""
+        return self.transpose()
+
+    @property
+    def real(self):
+        """Read the full array from disk and return its real part."""
+        return np.asarray(self).real
+
+    @property
+    def imag(self):
+        """Read the full array from disk and return its imaginary part."""
+        return np.asarray(self).imag
+
+
 class HDF5Meta:
     """
     A base class for fast read-only interface to our HDF5 file metadata.
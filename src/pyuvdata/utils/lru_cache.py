@@ -0,0 +1,153 @@
+# Copyright (c) 2024 Radio Astronomy Software Group
+# Licensed under the 2-clause BSD License
+"""Process-wide least recently used caches for expensive utility calculations."""
+
+import hashlib
+import threading
+import warnings
+from collections import OrderedDict
+from copy import deepcopy
+
+import numpy as np
+
+
+def array_key(value):
+    """
+    Get a hashable key for an array-like value.
+
+    A hash of the values is used rather than the values themselves, so caches do
+    not keep copies of the (possibly large) input arrays alive.
+
+    Parameters
+    ----------
+    value : array_like or None
+        The value to get a key for.
+
+    Returns
+    -------
+    tuple or None
+        Tuple of the dtype string, the shape and the sha256 hex digest of the values,
+        None if `value` is None.
+
+    """
+    if value is None:
+        return None
+    value = np.asarray(value)
+    digest = hashlib.sha256(np.ascontiguousarray(value).data).hexdigest()
+    return (value.dtype.str, value.shape, digest)
+
+
+class LRUCache:
+    """
+    A thread safe least recently used cache that also stores warnings.
+
+    Any warnings raised while calculating a value are stored with it and raised
+    again when the value is taken from the cache, so the warnings raised by a call
+    do not depend on earlier calls. Values are deep copied when they are stored and
+    when they are taken from the cache, so callers can modify them freely.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries to keep, the least recently used entries are
+        removed first. Zero disables the cache.
+
+    """
+
+    def __init__(self, maxsize):
+        self._entries = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "maxsize": 0}
+        self._lock = threading.Lock()
+        self.set_size(maxsize)
+
+    def info(self):
+        """
+        Get statistics for the cache.
+
+        Returns
+        -------
+        dict
+            Dict with the number of cache "hits" and "misses" since the cache was
+            last cleared, the "maxsize" (maximum number of entries) of the cache and
+            the number of entries currently in it ("currsize").
+
+        """
+        with self._lock:
+            return {**self._stats, "currsize": len(self._entries)}
+
+    def clear(self):
+        """Clear the cache and reset its statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._stats["hits"] = 0
+            self._stats["misses"] = 0
+
+    def set_size(self, maxsize):
+        """
+        Set the maximum number of entries in the cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of entries to keep, the least recently used entries are
+            removed first. Setting this to zero disables the cache.
+
+        """
+        if not isinstance(maxsize, int | np.integer) or maxsize < 0:
+            raise ValueError("maxsize must be a non-negative integer.")
+        with self._lock:
+            self._stats["maxsize"] = int(maxsize)
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def get(self, key, calc_func):
+        """
+        Get a value from the cache, calculating it if needed.
+
+        Parameters
+        ----------
+        key : tuple
+            Hashable key identifying all of the inputs to the calculation.
+        calc_func : callable
+            Function that does the calculation, taking no arguments.
+
+        Returns
+        -------
+        object
+            The value returned by `calc_func` (a copy of it if it is cached).
+
+        """
+        with self._lock:
+            use_cache = self._stats["maxsize"] > 0
+            cached = self._entries.get(key) if use_cache else None
+            if cached is not None:
+                self._stats["hits"] += 1
+                self._entries.move_to_end(key)
+            elif use_cache:
+                self._stats["misses"] += 1
+
+        if cached is not None:
+            value, cached_warnings = cached
+            for message, category in cached_warnings:
+                warnings.warn(message, category)
+            return deepcopy(value)
+
+        if not use_cache:
+            return calc_func()
+
+        with warnings.catch_warnings(record=True) as caught:
+            value = calc_func()
+        for warn in caught:
+            warnings.warn_explicit(
+                warn.message, warn.category, warn.filename, warn.lineno
+            )
+
+        with self._lock:
+            self._entries[key] = (
+                deepcopy(value),
+                [(str(warn.message), warn.category) for warn in caught],
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._stats["maxsize"]:
+                self._entries.popitem(last=False)
+        return value
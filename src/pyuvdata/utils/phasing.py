@@ -12,6 +12,7 @@ from astropy.time import Time
 from astropy.utils import iers
 
 from . import _phasing
+from .lru_cache import LRUCache, array_key
 from .times import get_lst_for_time
 
 try:
@@ -21,6 +22,107 @@ try:
 except ImportError:
     hasmoon = False
 
+# Process-wide LRU cache of apparent coordinates and frame position angles, keyed on
+# all of the inputs to the calculation. See `app_coords_cache_info`.
+_app_coords_cache = LRUCache(128)
+
+
+def app_coords_cache_info():
+    """
+    Get statistics for the apparent coordinate cache.
+
+    The results of `transform_icrs_to_app` and `calc_frame_pos_angle` (which are used
+    when phasing UVData objects) are stored in a process-wide least recently used
+    cache, so repeating a calculation for the same source, times and telescope
+    location (e.g. when phasing several objects to the same position or rephasing
+    back and forth) does not redo the coordinate transforms. Any warnings from the
+    transforms are stored with the cached values and raised again on cache hits.
+
+    Returns
+    -------
+    dict
+        Dict with the number of cache "hits" and "misses" since the cache was last
+        cleared, the "maxsize" (maximum number of entries) of the cache and the
+        number of entries currently in it ("currsize").
+
+    """
+    return _app_coords_cache.info()
+
+
+def clear_app_coords_cache():
+    """
+    Clear the apparent coordinate cache and reset its statistics.
+
+    This should be called if the IERS tables used for the coordinate transforms
+    are changed, as they are not part of the cache keys.
+
+    """
+    _app_coords_cache.clear()
+
+
+def set_app_coords_cache_size(maxsize):
+    """
+    Set the maximum number of entries in the apparent coordinate cache.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries to keep, the least recently used entries are
+        removed first. Setting this to zero disables the cache.
+
+    """
+    _app_coords_cache.set_size(maxsize)
+
+
+def _cache_array_key(value):
+    """Get a hashable key for an array-like or Time value for the coordinate cache."""
+    if isinstance(value, Time):
+        return (value.scale, _cache_array_key(value.jd1), _cache_array_key(value.jd2))
+    return array_key(value)
+
+
+def _cache_location_key(site_loc):
+    """Get a hashable key for a telescope location for the coordinate cache."""
+    return (
+        type(site_loc).__name__,
+        str(getattr(site_loc, "ellipsoid", None)),
+        *(float(comp.to_value("m")) for comp in (site_loc.x, site_loc.y, site_loc.z)),
+    )
+
+
+def _cache_telescope_key(telescope_loc, telescope_frame, ellipsoid):
+    """Get a hashable key for a telescope_loc parameter for the coordinate cache."""
+    if isinstance(telescope_loc, EarthLocation) or (
+        hasmoon and isinstance(telescope_loc, MoonLocation)
+    ):
+        return _cache_location_key(telescope_loc)
+    return (_cache_array_key(telescope_loc), telescope_frame.upper(), ellipsoid)
+
+
+def _cached_app_coords(key, calc_func):
+    """
+    Get arrays from the apparent coordinate cache, calculating them if needed.
+
+    Any warnings raised by the calculation are recorded with the cached arrays and
+    raised again when the arrays are taken from the cache, so the warnings do not
+    depend on earlier calls. Warnings are only recorded when the cache is in use.
+
+    Parameters
+    ----------
+    key : tuple
+        Hashable key identifying all of the inputs to the calculation.
+    calc_func : callable
+        Function that does the calculation, taking no arguments and returning a tuple
+        of arrays.
+
+    Returns
+    -------
+    tuple of ndarray
+        The arrays returned by `calc_func` (copies of them if they are cached).
+
+    """
+    return _app_coords_cache.get(key, calc_func)
+
 
 def old_uvw_calc(ra, dec, initial_uvw):
     """
@@ -924,6 +1026,9 @@ def transform_icrs_to_app(
     coordinates natively in the apparent frame (whereas NOVAS and astropy do not), as
     well as the fact that of the three libraries, it produces results the fastest.
 
+    Results are stored in a process-wide cache (see `app_coords_cache_info`), so
+    repeated calls with the same inputs do not redo the transformation.
+
     Parameters
     ----------
     time_array : float or array-like of float
@@ -989,6 +1094,52 @@ def transform_icrs_to_app(
     app_dec : ndarray of floats
         Apparent declination coordinates, in units of radians, of shape (Ntimes,).
     """
+    cache_key = (
+        "icrs_to_app",
+        *(_cache_array_key(val) for val in [time_array, ra, dec, epoch]),
+        *(_cache_array_key(val) for val in [pm_ra, pm_dec, vrad, dist]),
+        _cache_telescope_key(telescope_loc, telescope_frame, ellipsoid),
+        astrometry_library,
+    )
+    return _cached_app_coords(
+        cache_key,
+        lambda: _transform_icrs_to_app(
+            time_array=time_array,
+            ra=ra,
+            dec=dec,
+            telescope_loc=telescope_loc,
+            telescope_frame=telescope_frame,
+            ellipsoid=ellipsoid,
+            epoch=epoch,
+            pm_ra=pm_ra,
+            pm_dec=pm_dec,
+            vrad=vrad,
+            dist=dist,
+            astrometry_library=astrometry_library,
+        ),
+    )
+
+
+def _transform_icrs_to_app(
+    *,
+    time_array,
+    ra,
+    dec,
+    telescope_loc,
+    telescope_frame="itrs",
+    ellipsoid=None,
+    epoch=2000.0,
+    pm_ra=None,
+    pm_dec=None,
+    vrad=None,
+    dist=None,
+    astrometry_library=None,
+):
+    """
+    Transform coordinates in ICRS to apparent coordinates, without caching.
+
+    See `transform_icrs_to_app` for a description of the parameters.
+    """
     if telescope_frame.upper() == "MCMF":
         if not hasmoon:
             raise ValueError(
@@ -1651,41 +1802,59 @@ def calc_frame_pos_angle(
     # Figure out how many elements we need to transform
     n_coord = len(unique_mask)
 
-    # Offset north/south positions by 0.5 deg, such that the PA is determined over a
-    # 1 deg arc.
-    up_dec = unique_dec + offset_pos
-    dn_dec = unique_dec - offset_pos
-    up_ra = dn_ra = unique_ra
+    def _calc_unique_pa():
+        # Offset north/south positions by 0.5 deg, such that the PA is determined
+        # over a 1 deg arc.
+        up_dec = unique_dec + offset_pos
+        dn_dec = unique_dec - offset_pos
+        up_ra = dn_ra = unique_ra
 
-    # Wrap the positions if they happen to go over the poles
-    up_ra[up_dec > (np.pi / 2.0)] = np.mod(
-        up_ra[up_dec > (np.pi / 2.0)] + np.pi, 2.0 * np.pi
-    )
-    up_dec[up_dec > (np.pi / 2.0)] = np.pi - up_dec[up_dec > (np.pi / 2.0)]
+        # Wrap the positions if they happen to go over the poles
+        up_ra[up_dec > (np.pi / 2.0)] = np.mod(
+            up_ra[up_dec > (np.pi / 2.0)] + np.pi, 2.0 * np.pi
+        )
+        up_dec[up_dec > (np.pi / 2.0)] = np.pi - up_dec[up_dec > (np.pi / 2.0)]
 
-    dn_ra[-dn_dec > (np.pi / 2.0)] = np.mod(
-        dn_ra[dn_dec > (np.pi / 2.0)] + np.pi, 2.0 * np.pi
-    )
-    dn_dec[-dn_dec > (np.pi / 2.0)] = np.pi - dn_dec[-dn_dec > (np.pi / 2.0)]
-
-    # Run the set of offset coordinates through the "reverse" transform. The two offset
-    # positions are concat'd together to help reduce overheads
-    ref_ra, ref_dec = calc_sidereal_coords(
-        time_array=np.tile(unique_time, 2),
-        app_ra=np.concatenate((dn_ra, up_ra)),
-        app_dec=np.concatenate((dn_dec, up_dec)),
-        telescope_loc=telescope_loc,
-        coord_frame=ref_frame,
-        telescope_frame=telescope_frame,
-        ellipsoid=ellipsoid,
-        coord_epoch=ref_epoch,
-    )
+        dn_ra[-dn_dec > (np.pi / 2.0)] = np.mod(
+            dn_ra[dn_dec > (np.pi / 2.0)] + np.pi, 2.0 * np.pi
+        )
+        dn_dec[-dn_dec > (np.pi / 2.0)] = np.pi - dn_dec[-dn_dec > (np.pi / 2.0)]
+
+        # Run the set of offset coordinates through the "reverse" transform. The two
+        # offset positions are concat'd together to help reduce overheads
+        ref_ra, ref_dec = calc_sidereal_coords(
+            time_array=np.tile(unique_time, 2),
+            app_ra=np.concatenate((dn_ra, up_ra)),
+            app_dec=np.concatenate((dn_dec, up_dec)),
+            telescope_loc=telescope_loc,
+            coord_frame=ref_frame,
+            telescope_frame=telescope_frame,
+            ellipsoid=ellipsoid,
+            coord_epoch=ref_epoch,
+        )
 
-    # Use the pas function from ERFA to calculate the position angle. The negative sign
-    # is here because we're measuring PA of app -> frame, but we want frame -> app.
-    unique_pa = -erfa.pas(
-        ref_ra[:n_coord], ref_dec[:n_coord], ref_ra[n_coord:], ref_dec[n_coord:]
+        # Use the pas function from ERFA to calculate the position angle. The negative
+        # sign is here because we're measuring PA of app -> frame, but we want
+        # frame -> app.
+        unique_pa = -erfa.pas(
+            ref_ra[:n_coord], ref_dec[:n_coord], ref_ra[n_coord:], ref_dec[n_coord:]
+        )
+
+        # unique_ra is modified in place above if the offset positions wrap over
+        # the poles, so return (and cache) it to fill in the same way below.
+        return unique_ra, unique_pa
+
+    cache_key = (
+        "frame_pa",
+        _cache_array_key(unique_ra),
+        _cache_array_key(unique_dec),
+        _cache_array_key(unique_time),
+        _cache_telescope_key(telescope_loc, telescope_frame, ellipsoid),
+        ref_frame,
+        _cache_array_key(ref_epoch),
+        offset_pos,
     )
+    unique_ra, unique_pa = _cached_app_coords(cache_key, _calc_unique_pa)
 
     # Finally, we have to go back through and "fill in" the redundant entries
     frame_pa = np.zeros_like(app_ra)
@@ -1699,6 +1868,258 @@ def calc_frame_pos_angle(
     return frame_pa
 
 
+# Time steps used for JPL-Horizons queries covering a time range, in days.
+_JPLH_STEPS = {"3h": 3.0 / 24.0, "3m": 3.0 / 1440.0}
+# Tolerance for matching ephemeris times, in days (~0.1 sec).
+_EPHEM_TIME_TOL = 1e-6
+_EPHEM_CACHE_COLUMNS = ("jd", "ra", "dec", "dist", "vel")
+
+
+def _get_jplh_site_loc(telescope_loc):
+    """
+    Get a telescope location in the format used by JPL-Horizons.
+
+    This is nominally a dict w/ entries for lon (units of deg), lat (units of deg),
+    and elevation (units of km), or None for the geocentric position.
+    """
+    if isinstance(telescope_loc, EarthLocation):
+        return {
+            "lon": telescope_loc.lon.deg,
+            "lat": telescope_loc.lat.deg,
+            "elevation": telescope_loc.height.to_value(unit=units.km),
+        }
+    elif hasmoon and isinstance(telescope_loc, MoonLocation):
+        raise NotImplementedError(
+            "Cannot lookup JPL positions for telescopes with a MoonLocation"
+        )
+    elif telescope_loc is None:
+        # Setting to None will report the geocentric position
+        return None
+    else:
+        return {
+            "lon": telescope_loc[1] * (180.0 / np.pi),
+            "lat": telescope_loc[0] * (180.0 / np.pi),
+            "elevation": telescope_loc[2] * (0.001),  # m -> km
+        }
+
+
+def _get_ephem_cache_key(target_name, site_loc, step):
+    """
+    Get the key for an ephemeris in an ephemeris store.
+
+    Ephemerides are stored separately for each target, site (to about a cm) and
+    query cadence, with step set to None for individually looked up points.
+    """
+    if site_loc is None:
+        site = "geocentric"
+    else:
+        site = ",".join(f"{site_loc[name]:.8f}" for name in ["lon", "lat", "elevation"])
+    return f"{target_name};{site};{'points' if step is None else step}"
+
+
+def _load_ephem_cache(ephem_cache):
+    """Load an ephemeris store, an empty dict if the file does not exist."""
+    import json
+
+    try:
+        with open(ephem_cache) as fhandle:
+            return json.load(fhandle)
+    except FileNotFoundError:
+        return {}
+
+
+def _read_ephem_cache(ephem_cache, key, times, *, step):
+    """
+    Get an ephemeris from an ephemeris store.
+
+    Parameters
+    ----------
+    ephem_cache : str or path-like
+        Path to the ephemeris store.
+    key : str
+        Key for the ephemeris in the store, see `_get_ephem_cache_key`.
+    times : ndarray of float
+        The start and stop times of the ephemeris for regularly sampled ephemerides,
+        otherwise all of the times that are needed, in UTC Julian days.
+    step : str or None
+        The cadence of the ephemeris (a key in `_JPLH_STEPS`), or None for
+        individually looked up points.
+
+    Returns
+    -------
+    tuple of ndarray of float or None
+        The ephemeris times, RA, Dec, distance and velocity as returned by
+        `lookup_jplhorizons`, or None if the store does not cover the times.
+
+    """
+    for segment in _load_ephem_cache(ephem_cache).get(key, []):
+        columns = [
+            np.asarray(segment[name], dtype=float) for name in _EPHEM_CACHE_COLUMNS
+        ]
+        seg_times = columns[0]
+        if step is not None:
+            # JPL-Horizons only returns points up to the stop time, so the last
+            # point can be up to one step before it.
+            if (seg_times[0] > times[0] + _EPHEM_TIME_TOL) or (
+                seg_times[-1] <= times[-1] - _JPLH_STEPS[step]
+            ):
+                continue
+            # include the points on either side of the range (if there are any) so
+            # that the whole range can be interpolated
+            first = np.searchsorted(seg_times, times[0] + _EPHEM_TIME_TOL, "right")
+            last = np.searchsorted(seg_times, times[-1] - _EPHEM_TIME_TOL, "left")
+            inds = np.arange(first - 1, min(last, seg_times.size - 1) + 1)
+        else:
+            inds = np.searchsorted(seg_times, times)
+            inds[inds == seg_times.size] = seg_times.size - 1
+            # use the closest of the entries on either side
+            prev_inds = np.maximum(inds - 1, 0)
+            use_prev = np.abs(seg_times[prev_inds] - times) < np.abs(
+                seg_times[inds] - times
+            )
+            inds[use_prev] = prev_inds[use_prev]
+            if np.any(np.abs(seg_times[inds] - times) > _EPHEM_TIME_TOL):
+                continue
+            inds = np.unique(inds)
+        return tuple(col[inds] for col in columns)
+
+    return None
+
+
+def _write_ephem_cache(ephem_cache, key, ephem_info, *, step):
+    """
+    Add an ephemeris to an ephemeris store.
+
+    The ephemeris is merged with any stored ephemerides that it overlaps with (or
+    that are within one time step of it), with the new values used for any times
+    that are in both. Individually looked up points (`step` of None) are all
+    stored together.
+
+    Parameters
+    ----------
+    ephem_cache : str or path-like
+        Path to the ephemeris store, created if it does not exist.
+    key : str
+        Key for the ephemeris in the store, see `_get_ephem_cache_key`.
+    ephem_info : tuple of array-like of float
+        The ephemeris times, RA, Dec, distance and velocity as returned by
+        `lookup_jplhorizons`.
+    step : str or None
+        The cadence of the ephemeris (a key in `_JPLH_STEPS`), or None for
+        individually looked up points.
+
+    """
+    import json
+    import os
+
+    max_gap = np.inf if step is None else 1.5 * _JPLH_STEPS[step]
+
+    new_cols = [np.atleast_1d(np.asarray(col, dtype=float)) for col in ephem_info]
+    store = _load_ephem_cache(ephem_cache)
+    segments = []
+    for segment in store.get(key, []):
+        seg_cols = [
+            np.asarray(segment[name], dtype=float) for name in _EPHEM_CACHE_COLUMNS
+        ]
+        if (seg_cols[0][0] > new_cols[0].max() + max_gap) or (
+            seg_cols[0][-1] < new_cols[0].min() - max_gap
+        ):
+            segments.append(segment)
+        else:
+            new_cols = [
+                np.concatenate((new_col, seg_col))
+                for new_col, seg_col in zip(new_cols, seg_cols, strict=True)
+            ]
+
+    # sort by time, keeping the first (newest) entry for duplicated times
+    _, inds = np.unique(np.round(new_cols[0] / _EPHEM_TIME_TOL), return_index=True)
+    segments.append(
+        {
+            name: col[inds].tolist()
+            for name, col in zip(_EPHEM_CACHE_COLUMNS, new_cols, strict=True)
+        }
+    )
+    store[key] = sorted(segments, key=lambda segment: segment["jd"][0])
+
+    # write to a temporary file and then move it, so the store is never left
+    # partially written
+    tmp_file = f"{os.fspath(ephem_cache)}.{os.getpid()}.tmp"
+    with open(tmp_file, "w") as fhandle:
+        json.dump(store, fhandle)
+    os.replace(tmp_file, ephem_cache)
+
+
+def add_to_ephem_cache(
+    ephem_cache,
+    target_name,
+    *,
+    ephem_times,
+    ephem_ra,
+    ephem_dec,
+    ephem_dist,
+    ephem_vel,
+    telescope_loc=None,
+    high_cadence=False,
+    force_indv_lookup=False,
+):
+    """
+    Add an ephemeris to an ephemeris store used by `lookup_jplhorizons`.
+
+    This can be used to populate a store without network access (e.g. from
+    ephemerides saved elsewhere), so that `lookup_jplhorizons` (and phasing with
+    `lookup_name=True`) can use them rather than querying JPL-Horizons.
+
+    Parameters
+    ----------
+    ephem_cache : str or path-like
+        Path to the JSON file for the ephemeris store, created if it does not exist.
+    target_name : str
+        Name of the target, as it would be passed to `lookup_jplhorizons`.
+    ephem_times : array-like of float
+        Times of the ephemeris points, in UTC Julian days.
+    ephem_ra : array-like of float
+        ICRS Right ascension of the target at `ephem_times`, in units of radians.
+    ephem_dec : array-like of float
+        ICRS Declination of the target at `ephem_times`, in units of radians.
+    ephem_dist : array-like of float
+        Distance of the target relative to the observer at `ephem_times`, in the
+        units returned by `lookup_jplhorizons`.
+    ephem_vel : array-like of float
+        Velocity of the target relative to the observer at `ephem_times`, in units
+        of km/sec.
+    telescope_loc : tuple of floats or EarthLocation
+        ITRS latitude, longitude, and altitude (rel to sea-level) of the observer,
+        as it would be passed to `lookup_jplhorizons`. Default is None, meaning the
+        geocentric position.
+    high_cadence : bool
+        Set to True if the ephemeris is sampled every 3 minutes (as it would be by
+        `lookup_jplhorizons` with `high_cadence=True`) rather than every 3 hours.
+    force_indv_lookup : bool
+        Set to True if the ephemeris is for individual times rather than a regular
+        time grid, these are used for lookups of small numbers of times.
+
+    """
+    ephem_info = [
+        np.atleast_1d(np.asarray(col, dtype=float))
+        for col in [ephem_times, ephem_ra, ephem_dec, ephem_dist, ephem_vel]
+    ]
+    if any(col.shape != ephem_info[0].shape or col.ndim != 1 for col in ephem_info):
+        raise ValueError(
+            "ephem_times, ephem_ra, ephem_dec, ephem_dist and ephem_vel must all be "
+            "1D arrays of the same length."
+        )
+    if force_indv_lookup:
+        step = None
+    else:
+        step = "3m" if high_cadence else "3h"
+    _write_ephem_cache(
+        ephem_cache,
+        _get_ephem_cache_key(target_name, _get_jplh_site_loc(telescope_loc), step),
+        ephem_info,
+        step=step,
+    )
+
+
 def lookup_jplhorizons(
     target_name,
     time_array,
@@ -1706,6 +2127,7 @@ def lookup_jplhorizons(
     telescope_loc=None,
     high_cadence=False,
     force_indv_lookup=None,
+    ephem_cache=None,
 ):
     """
     Lookup solar system body coordinates via the JPL-Horizons service.
@@ -1713,7 +2135,8 @@ def lookup_jplhorizons(
     This utility is useful for generating ephemerides, which can then be interpolated in
     order to provide positional data for a target which is moving, such as planetary
     bodies and other solar system objects. Use of this function requires the
-    installation of the `astroquery` module.
+    installation of the `astroquery` module, unless the ephemeris can be found in the
+    store given by `ephem_cache`.
 
 
     Parameters
@@ -1736,6 +2159,14 @@ def lookup_jplhorizons(
         `time_array`. If False, a regularized time grid is sampled that encloses the
         values contained within `time_array`. Default is False, unless `time_array` is
         of length 1, in which the default is set to True.
+    ephem_cache : str or path-like, optional
+        Path to a JSON file used as a persistent store of ephemerides. If the store
+        has an ephemeris for the target and site that covers the requested times
+        (at the same cadence), it is used rather than querying JPL-Horizons.
+        Otherwise the result of the query is added to the store (merging it with
+        any overlapping ephemerides), creating the file if needed. Stores can be
+        populated offline with `add_to_ephem_cache` or copied between machines,
+        allowing ephemerides to be used without network access.
 
 
     Returns
@@ -1755,40 +2186,12 @@ def lookup_jplhorizons(
         Velocity of the targets relative to the observer, at the values within
         `ephem_times`, in units of km/sec.
     """
-    try:
-        from astroquery.jplhorizons import Horizons
-    except ImportError as err:  # pragma: no cover
-        raise ImportError(
-            "astroquery is not installed but is required for "
-            "planet ephemeris functionality"
-        ) from err
     from json import load as json_load
     from os.path import join as path_join
 
     from pyuvdata.data import DATA_PATH
 
-    # Get the telescope location into a format that JPL-Horizons can understand,
-    # which is nominally a dict w/ entries for lon (units of deg), lat (units of
-    # deg), and elevation (units of km).
-    if isinstance(telescope_loc, EarthLocation):
-        site_loc = {
-            "lon": telescope_loc.lon.deg,
-            "lat": telescope_loc.lat.deg,
-            "elevation": telescope_loc.height.to_value(unit=units.km),
-        }
-    elif hasmoon and isinstance(telescope_loc, MoonLocation):
-        raise NotImplementedError(
-            "Cannot lookup JPL positions for telescopes with a MoonLocation"
-        )
-    elif telescope_loc is None:
-        # Setting to None will report the geocentric position
-        site_loc = None
-    else:
-        site_loc = {
-            "lon": telescope_loc[1] * (180.0 / np.pi),
-            "lat": telescope_loc[0] * (180.0 / np.pi),
-            "elevation": telescope_loc[2] * (0.001),  # m -> km
-        }
+    site_loc = _get_jplh_site_loc(telescope_loc)
 
     # If force_indv_lookup is True, or unset but only providing a single value, then
     # just calculate the RA/Dec for the times requested rather than creating a table
@@ -1797,6 +2200,7 @@ def lookup_jplhorizons(
         (np.array(time_array).size == 1) and (force_indv_lookup is None)
     ):
         epoch_list = np.unique(time_array)
+        cache_step = None
         if len(epoch_list) > 50:
             raise ValueError(
                 "Requesting too many individual ephem points from JPL-Horizons. This "
@@ -1830,6 +2234,7 @@ def lookup_jplhorizons(
             if (len(np.unique(time_array)) <= 50) and (force_indv_lookup is None):
                 # If we have a _very_ sparse set of epochs, pass that along instead
                 epoch_list = np.unique(time_array)
+                cache_step = None
             else:
                 # Otherwise, time to raise an error
                 raise ValueError(
@@ -1843,6 +2248,7 @@ def lookup_jplhorizons(
                 "stop": Time(stop_time, format="jd").isot,
                 "step": step_time,
             }
+            cache_step = step_time
     # Check to make sure dates are within the 1700-2200 time range,
     # since not all targets are supported outside of this range
     if (np.min(time_array) < 2341973.0) or (np.max(time_array) > 2524593.0):
@@ -1851,6 +2257,26 @@ def lookup_jplhorizons(
             "Check back later (or possibly earlier)..."
         )
 
+    if ephem_cache is not None:
+        cache_key = _get_ephem_cache_key(target_name, site_loc, cache_step)
+        if cache_step is None:
+            cache_times = epoch_list
+        else:
+            cache_times = np.array([start_time, stop_time])
+        ephem_info = _read_ephem_cache(
+            ephem_cache, cache_key, cache_times, step=cache_step
+        )
+        if ephem_info is not None:
+            return ephem_info
+
+    try:
+        from astroquery.jplhorizons import Horizons
+    except ImportError as err:  # pragma: no cover
+        raise ImportError(
+            "astroquery is not installed but is required for "
+            "planet ephemeris functionality"
+        ) from err
+
     # JPL-Horizons has a separate catalog with what it calls 'major bodies',
     # and will throw an error if you use the wrong catalog when calling for
     # astrometry. We'll use the dict below to capture this behavior.
@@ -1902,6 +2328,14 @@ def lookup_jplhorizons(
     ephem_dist = np.array(ephem_data["delta"])  # AU
     ephem_vel = np.array(ephem_data["delta_rate"])  # km/s
 
+    if ephem_cache is not None:
+        _write_ephem_cache(
+            ephem_cache,
+            cache_key,
+            (ephem_times, ephem_ra, ephem_dec, ephem_dist, ephem_vel),
+            step=cache_step,
+        )
+
     return ephem_times, ephem_ra, ephem_dec, ephem_dist, ephem_vel
 
 
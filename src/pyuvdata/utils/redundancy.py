@@ -6,63 +6,128 @@ import warnings
 from copy import deepcopy
 
 import numpy as np
-from scipy.spatial.distance import cdist
+from scipy import sparse
+from scipy.sparse import csgraph
+from scipy.spatial import cKDTree
 
 from .bls import antnums_to_baseline, baseline_index_flip
+from .lru_cache import LRUCache, array_key
 
+# Process-wide LRU cache of the redundant groups found by `get_antenna_redundancies`,
+# keyed on the antenna layout and all the other inputs. See `redundancy_cache_info`.
+_redundancy_cache = LRUCache(16)
 
-def _adj_list(vecs, tol, n_blocks=None):
-    """Identify neighbors of each vec in vecs, to distance tol."""
-    n_items = len(vecs)
-    max_items = 2**10  # Max array size used is max_items**2. Avoid using > 1 GiB
-
-    if n_blocks is None:
-        n_blocks = max(n_items // max_items, 1)
-
-    # We may sort blocks so that some pairs of blocks may be skipped.
-    # Reorder vectors by x.
-
-    order = np.argsort(vecs[:, 0])
-    blocks = np.array_split(order, n_blocks)
-    adj = [{k} for k in range(n_items)]  # Adjacency lists
-    for b1 in blocks:
-        for b2 in blocks:
-            v1, v2 = vecs[b1], vecs[b2]
-            # Check for no overlap, with tolerance.
-            xmin1 = v1[0, 0] - tol
-            xmax1 = v1[-1, 0] + tol
-            xmin2 = v2[0, 0] - tol
-            xmax2 = v2[-1, 0] + tol
-            if max(xmin1, xmin2) > min(xmax1, xmax2):
-                continue
-
-            adj_mat = cdist(vecs[b1], vecs[b2]) < tol
-            for bi, col in enumerate(adj_mat):
-                adj[b1[bi]] = adj[b1[bi]].union(b2[col])
-    return [frozenset(g) for g in adj]
-
-
-def _find_cliques(adj, strict=False):
-    n_items = len(adj)
-
-    loc_gps = []
-    visited = np.zeros(n_items, dtype=bool)
-    for k in range(n_items):
-        if visited[k]:
-            continue
-        a0 = adj[k]
-        visited[k] = True
-        if all(adj[it].__hash__() == a0.__hash__() for it in a0):
-            group = list(a0)
-            group.sort()
-            visited[list(a0)] = True
-            loc_gps.append(group)
+
+def redundancy_cache_info():
+    """
+    Get statistics for the redundant group cache.
+
+    The results of `get_antenna_redundancies` (which is used by
+    `UVData.get_redundancies` when `use_antpos` is True) are stored in a
+    process-wide least recently used cache, so finding the redundant groups again
+    for the same antenna layout and tolerance does not redo the clustering. Any
+    warnings from the clustering are stored with the cached groups and raised again
+    on cache hits.
+
+    Returns
+    -------
+    dict
+        Dict with the number of cache "hits" and "misses" since the cache was last
+        cleared, the "maxsize" (maximum number of entries) of the cache and the
+        number of entries currently in it ("currsize").
+
+    """
+    return _redundancy_cache.info()
+
+
+def clear_redundancy_cache():
+    """Clear the redundant group cache and reset its statistics."""
+    _redundancy_cache.clear()
+
+
+def set_redundancy_cache_size(maxsize):
+    """
+    Set the maximum number of entries in the redundant group cache.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries to keep, the least recently used entries are
+        removed first. Setting this to zero disables the cache.
+
+    """
+    _redundancy_cache.set_size(maxsize)
+
+
+def _neighbor_pairs(vecs, tol):
+    """
+    Find all pairs of vectors that are closer than a tolerance to each other.
+
+    The neighbors are found with a KD-tree, so this scales as N log N with the
+    number of vectors (for vectors that are not all within the tolerance of each
+    other) and only the neighboring pairs are stored.
+
+    Parameters
+    ----------
+    vecs : ndarray of float
+        Vectors to find neighbors for, shape (N, Ndims).
+    tol : float
+        Distance two vectors must be less than to be neighbors.
+
+    Returns
+    -------
+    ndarray of int
+        Array of shape (Npairs, 2) giving the indices of each pair of neighbors,
+        with the first index less than the second.
+
+    """
+    pairs = cKDTree(vecs).query_pairs(tol, output_type="ndarray")
+    # query_pairs includes pairs exactly tol apart
+    dists = np.linalg.norm(vecs[pairs[:, 0]] - vecs[pairs[:, 1]], axis=1)
+    return pairs[dists < tol]
+
+
+def _find_isolated_cliques(pairs, n_items, *, strict=False):
+    """
+    Find the isolated cliques in a graph.
+
+    An isolated clique is a connected component of the graph in which every item
+    is a neighbor of every other item. Items in connected components which are not
+    cliques are not assigned to any group.
+
+    Parameters
+    ----------
+    pairs : ndarray of int
+        Array of shape (Npairs, 2) giving the indices of each pair of neighbors,
+        each pair should only be included once.
+    n_items : int
+        The number of items in the graph.
+    strict : bool
+        Require that all the connected components are cliques.
+
+    Returns
+    -------
+    list of list of int
+        List of the sorted item indices in each clique, ordered by the first item.
+
+    """
+    graph = sparse.coo_array(
+        (np.ones(len(pairs), dtype=bool), (pairs[:, 0], pairs[:, 1])),
+        shape=(n_items, n_items),
+    )
+    _, labels = csgraph.connected_components(graph, directed=False)
+    sizes = np.bincount(labels, minlength=n_items)
+    n_pairs = np.bincount(labels[pairs[:, 0]], minlength=n_items)
+    is_clique = n_pairs == sizes * (sizes - 1) // 2
 
     # Require all adjacency lists to be isolated maximal cliques:
-    if strict and not all(sorted(st) in loc_gps for st in adj):
+    if strict and not np.all(is_clique[labels]):
         raise ValueError("Non-isolated cliques found in graph.")
 
-    return loc_gps
+    # connected_components labels components in order of their first item
+    order = np.argsort(labels, kind="stable")
+    loc_gps = np.split(order, np.cumsum(sizes[sizes > 0])[:-1])
+    return [gp.tolist() for gp in loc_gps if is_clique[labels[gp[0]]]]
 
 
 def find_clusters(*, location_ids, location_vectors, tol, strict=False):
@@ -92,9 +157,11 @@ def find_clusters(*, location_ids, location_vectors, tol, strict=False):
     if location_vectors.ndim == 1:
         location_vectors = location_vectors[:, np.newaxis]
 
-    adj = _adj_list(location_vectors, tol)  # adj = list of sets
+    if location_ids.size == 0:
+        return []
 
-    loc_gps = _find_cliques(adj, strict=strict)
+    pairs = _neighbor_pairs(location_vectors, tol)
+    loc_gps = _find_isolated_cliques(pairs, location_ids.size, strict=strict)
     loc_gps = [np.sort(location_ids[gp]).tolist() for gp in loc_gps]
     return loc_gps
 
@@ -156,8 +223,9 @@ def find_clusters_grid(location_ids, location_vectors, tol=1.0):
         return
 
     baseline_ind_conj = []
-    for bl_i, bl in enumerate(location_ids):
-        delta = tuple(np.round(location_vectors[bl_i] / grid_size).astype(int))
+    deltas = np.round(np.asarray(location_vectors) / grid_size).astype(int).tolist()
+    for bl, delta in zip(location_ids, deltas, strict=True):
+        delta = tuple(delta)
         new_key = check_neighbors(delta)
         if new_key is not None:
             # this has a match
@@ -171,6 +239,67 @@ def find_clusters_grid(location_ids, location_vectors, tol=1.0):
     return bl_list, baseline_ind_conj
 
 
+def _pair_baselines(ant1, ant2, *, Nants_telescope):  # noqa: N803
+    """
+    Get the baseline numbers for arrays of antenna pairs.
+
+    The baseline numbering standard is chosen separately for each pair (so the
+    2147483648 standard is only used for pairs with an antenna number >= 2048),
+    giving the same results as calling `antnums_to_baseline` on each pair.
+
+    Parameters
+    ----------
+    ant1 : ndarray of int
+        First antenna number in each pair.
+    ant2 : ndarray of int
+        Second antenna number in each pair.
+    Nants_telescope : int
+        Number of antennas.
+
+    Returns
+    -------
+    ndarray of int
+        Baseline number for each pair.
+
+    """
+    baselines = np.zeros(ant1.size, dtype=np.int64)
+    large = np.maximum(ant1, ant2) >= 2048
+    for mask in [large, ~large]:
+        if np.any(mask):
+            baselines[mask] = antnums_to_baseline(
+                ant1[mask], ant2[mask], Nants_telescope=Nants_telescope
+            )
+    return baselines
+
+
+def _flip_baselines(baselines, *, Nants_telescope):  # noqa: N803
+    """
+    Get the baseline numbers with the antennas reversed for an array of baselines.
+
+    Parameters
+    ----------
+    baselines : ndarray of int
+        Baseline numbers to flip, made with `_pair_baselines`.
+    Nants_telescope : int
+        Number of antennas.
+
+    Returns
+    -------
+    ndarray of int
+        The flipped baseline numbers.
+
+    """
+    flipped = np.zeros(baselines.size, dtype=np.int64)
+    # baselines using the 2147483648 standard are all >= 2**16 + 2**22
+    large = baselines >= 2**16 + 2**22
+    for mask in [large, ~large]:
+        if np.any(mask):
+            flipped[mask] = baseline_index_flip(
+                baselines[mask], Nants_telescope=Nants_telescope
+            )
+    return flipped
+
+
 def get_baseline_redundancies(
     baselines, baseline_vecs, *, tol=1.0, include_conjugates=False, use_grid_alg=None
 ):
@@ -224,16 +353,13 @@ def get_baseline_redundancies(
     baseline_vecs = deepcopy(baseline_vecs)  # Protect the vectors passed in.
 
     if include_conjugates:
-        conjugates = []
-        for bv in baseline_vecs:
-            uneg = bv[0] < -tol
-            uzer = np.isclose(bv[0], 0.0, atol=tol)
-            vneg = bv[1] < -tol
-            vzer = np.isclose(bv[1], 0.0, atol=tol)
-            wneg = bv[2] < -tol
-            conjugates.append(uneg or (uzer and vneg) or (uzer and vzer and wneg))
-
-        conjugates = np.array(conjugates, dtype=bool)
+        uneg = baseline_vecs[:, 0] < -tol
+        uzer = np.isclose(baseline_vecs[:, 0], 0.0, atol=tol)
+        vneg = baseline_vecs[:, 1] < -tol
+        vzer = np.isclose(baseline_vecs[:, 1], 0.0, atol=tol)
+        wneg = baseline_vecs[:, 2] < -tol
+        conjugates = uneg | (uzer & vneg) | (uzer & vzer & wneg)
+
         baseline_vecs[conjugates] *= -1
         baseline_ind_conj = baselines[conjugates]
         bl_gps, vec_bin_centers, lens = get_baseline_redundancies(
@@ -268,9 +394,18 @@ def get_baseline_redundancies(
 
     n_unique = len(bl_gps)
     vec_bin_centers = np.zeros((n_unique, 3))
-    for gi, gp in enumerate(bl_gps):
-        inds = [np.where(i == baselines)[0] for i in gp]
-        vec_bin_centers[gi] = np.mean(baseline_vecs[inds, :], axis=0)
+    if n_unique > 0:
+        bl_sort = np.argsort(baselines)
+        inds = bl_sort[
+            np.searchsorted(
+                baselines,
+                np.concatenate(bl_gps).astype(baselines.dtype),
+                sorter=bl_sort,
+            )
+        ]
+        gp_stops = np.cumsum([len(gp) for gp in bl_gps])
+        for gi, gp_inds in enumerate(np.split(inds, gp_stops[:-1])):
+            vec_bin_centers[gi] = np.mean(baseline_vecs[gp_inds], axis=0)
 
     lens = np.sqrt(np.sum(vec_bin_centers**2, axis=1))
     return bl_gps, vec_bin_centers, lens
@@ -326,6 +461,10 @@ def get_antenna_redundancies(
     object, ``UVData.conjugate_bls('u>0', uvw_tol=tol)``, where `tol` is
     the tolerance used here.
 
+    The results are stored in a least recently used cache keyed on the antenna
+    layout and the other inputs, see :func:`redundancy_cache_info` and
+    :func:`set_redundancy_cache_size`.
+
     """
     if use_grid_alg is None:
         # This was added in v2.4.2 (Feb 2024). It should go away at some point.
@@ -339,30 +478,50 @@ def get_antenna_redundancies(
         )
         use_grid_alg = True
 
+    key = (
+        array_key(antenna_numbers),
+        array_key(antenna_positions),
+        float(tol),
+        bool(include_autos),
+        bool(use_grid_alg),
+    )
+    return _redundancy_cache.get(
+        key,
+        lambda: _calc_antenna_redundancies(
+            antenna_numbers,
+            antenna_positions,
+            tol=tol,
+            include_autos=include_autos,
+            use_grid_alg=use_grid_alg,
+        ),
+    )
+
+
+def _calc_antenna_redundancies(
+    antenna_numbers, antenna_positions, *, tol, include_autos, use_grid_alg
+):
+    """Find redundant baseline groups, see `get_antenna_redundancies`."""
+    antenna_numbers = np.asarray(antenna_numbers)
+    antenna_positions = np.asarray(antenna_positions)
     Nants = antenna_numbers.size
 
-    bls = []
-    bl_vecs = []
-
-    for aj in range(Nants):
-        mini = aj + 1
-        if include_autos:
-            mini = aj
-        for ai in range(mini, Nants):
-            anti, antj = antenna_numbers[ai], antenna_numbers[aj]
-            bidx = antnums_to_baseline(antj, anti, Nants_telescope=Nants)
-            bv = antenna_positions[ai] - antenna_positions[aj]
-            bl_vecs.append(bv)
-            bls.append(bidx)
-    bls = np.array(bls)
-    bl_vecs = np.array(bl_vecs)
+    aj, ai = np.triu_indices(Nants, k=0 if include_autos else 1)
+    bls = _pair_baselines(
+        antenna_numbers[aj], antenna_numbers[ai], Nants_telescope=Nants
+    )
+    bl_vecs = antenna_positions[ai] - antenna_positions[aj]
     gps, vecs, lens, conjs = get_baseline_redundancies(
         bls, bl_vecs, tol=tol, include_conjugates=True, use_grid_alg=use_grid_alg
     )
     # Flip the baselines in the groups.
-    for gi, gp in enumerate(gps):
-        for bi, bl in enumerate(gp):
-            if bl in conjs:
-                gps[gi][bi] = baseline_index_flip(bl, Nants_telescope=Nants)
+    gp_bls = np.concatenate(gps).astype(np.int64) if gps else np.zeros(0, dtype=int)
+    flip = np.isin(gp_bls, conjs)
+    gp_bls[flip] = _flip_baselines(gp_bls[flip], Nants_telescope=Nants)
+    gp_bls = gp_bls.tolist()
+    gp_starts = np.cumsum([0] + [len(gp) for gp in gps]).tolist()
+    gps = [
+        gp_bls[start:stop]
+        for start, stop in zip(gp_starts[:-1], gp_starts[1:], strict=True)
+    ]
 
     return gps, vecs, lens
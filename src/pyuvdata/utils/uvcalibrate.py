@@ -7,7 +7,7 @@ from typing import Literal
 
 import numpy as np
 
-from .pol import POL_TO_FEED_DICT, jnum2str, parse_jpolstr, polnum2str, polstr2num
+from .pol import POL_TO_FEED_DICT, jnum2str, jstr2num, parse_jpolstr, polnum2str
 
 
 def _get_pol_conventions(
@@ -151,6 +151,7 @@ def uvcalibrate(
     ant_check: bool = True,
     uvc_pol_convention: Literal["sum", "avg"] | None = None,
     uvd_pol_convention: Literal["sum", "avg"] | None = None,
+    blt_chunk_size: int | None = None,
 ):
     """
     Calibrate a UVData object with a UVCal object.
@@ -203,6 +204,12 @@ def uvcalibrate(
         represents either the convention that *has* been adopted in ``uvdata`` (in the
         case that ``undo=True``), or the convention that is *desired* for the resulting
         ``UVData`` object (if ``undo=False``).
+    blt_chunk_size : int, optional
+        The number of baseline-times to calibrate at once. The gains are applied to
+        all baselines, frequencies and polarizations in a chunk of baseline-times
+        together, which requires temporary arrays the size of the chunk of the
+        data_array. Set this to limit the memory used for large data sets. Defaults
+        to calibrating all baseline-times at once.
 
     Returns
     -------
@@ -230,6 +237,11 @@ def uvcalibrate(
             "https://github.com/RadioAstronomySoftwareGroup/pyuvdata/issues/new"
         )
 
+    if blt_chunk_size is not None and (
+        not isinstance(blt_chunk_size, int | np.integer) or blt_chunk_size < 1
+    ):
+        raise ValueError("blt_chunk_size must be a positive integer.")
+
     if uvcal.gain_scale is None:
         warnings.warn(
             "gain_scale is not set, so there is no way to know what the resulting units"
@@ -250,6 +262,8 @@ def uvcalibrate(
     )
     if not inplace:
         uvdata = uvdata.copy()
+    # the data are modified in place, so they need to be in memory
+    uvdata.load_lazy_data()
 
     # check both objects
     uvdata.check()
@@ -524,67 +538,95 @@ def uvcalibrate(
             )
         )
 
-        # iterate over keys
-        for key in uvdata.get_antpairpols():
-            # get indices for this key
-            blt_inds = uvdata.antpair2ind(key)
-            pol_ind = np.argmin(
-                np.abs(uvdata.polarization_array - polstr2num(key[2], uvd_x))
-            )
-
-            # try to get gains for each antenna
-            ant1_num = key[0]
-            ant2_num = key[1]
-
-            feed1, feed2 = POL_TO_FEED_DICT[key[2]]
-            try:
-                uvcal_ant1_num = uvcal_ant_dict[uvdata_ant_dict[ant1_num]]
-            except KeyError:
-                uvcal_ant1_num = None
-            try:
-                uvcal_ant2_num = uvcal_ant_dict[uvdata_ant_dict[ant2_num]]
-            except KeyError:
-                uvcal_ant2_num = None
-
-            if (uvcal_ant1_num is None or uvcal_ant2_num is None) or not (
-                uvcal_use._key_exists(antnum=uvcal_ant1_num, jpol=feed1)
-                and uvcal_use._key_exists(antnum=uvcal_ant2_num, jpol=feed2)
-            ):
-                uvdata.flag_array[blt_inds, :, pol_ind] = True
-                continue
-
-            uvcal_key1 = (uvcal_ant1_num, feed1)
-            uvcal_key2 = (uvcal_ant2_num, feed2)
-            if flip_gain_conj:
-                gain = (
-                    np.conj(uvcal_use.get_gains(uvcal_key1))
-                    * uvcal_use.get_gains(uvcal_key2)
-                ).T  # tranpose to match uvdata shape
-            else:
-                gain = (
-                    uvcal_use.get_gains(uvcal_key1)
-                    * np.conj(uvcal_use.get_gains(uvcal_key2))
-                ).T  # tranpose to match uvdata shape
-            flag = (uvcal_use.get_flags(uvcal_key1) | uvcal_use.get_flags(uvcal_key2)).T
+        # map the UVData antennas to antenna indices on the UVCal object, with -1
+        # for antennas that are missing from the UVCal object.
+        uvcal_ant_inds = {ant: i for i, ant in enumerate(uvcal_use.ant_array.tolist())}
+        uvdata_ants, ant_inv = np.unique(
+            np.concatenate((uvdata.ant_1_array, uvdata.ant_2_array)),
+            return_inverse=True,
+        )
+        uvdata_ant_cal_inds = np.array(
+            [
+                uvcal_ant_inds.get(uvcal_ant_dict.get(uvdata_ant_dict.get(ant), -1), -1)
+                for ant in uvdata_ants.tolist()
+            ],
+            dtype=int,
+        )
+        ant1_inds, ant2_inds = np.split(uvdata_ant_cal_inds[ant_inv], 2)
+
+        # map the UVData polarizations to jones indices on the UVCal object for the
+        # feeds of each antenna, with -1 for jones that are missing from the UVCal
+        # object.
+        jones_inds = np.full((2, uvdata.Npols), -1, dtype=int)
+        for pol_ind, pol in enumerate(uvdata_pol_strs):
+            for feed_ind, feed in enumerate(POL_TO_FEED_DICT[pol]):
+                jnum = jstr2num(feed, x_orientation=uvcal_use.telescope.x_orientation)
+                wh_jones = np.nonzero(uvcal_use.jones_array == jnum)[0]
+                if wh_jones.size > 0:
+                    jones_inds[feed_ind, pol_ind] = wh_jones[0]
+
+        # map the UVData baseline-times to time indices on the UVCal object
+        if uvcal_use.Ntimes == 1:
+            cal_time_inds = np.zeros(uvdata.Nblts, dtype=int)
+        elif uvcal.time_range is not None:
+            cal_time_inds = trange_ind_arr
+        else:
+            cal_time_inds = np.argmin(
+                np.abs(uvdata_times[:, np.newaxis] - uvcal_use.time_array), axis=1
+            )[uvd_time_ri]
+
+        # baseline-pols that cannot be calibrated are flagged and left unchanged
+        missing = (
+            (ant1_inds[:, np.newaxis] < 0)
+            | (ant2_inds[:, np.newaxis] < 0)
+            | np.any(jones_inds < 0, axis=0)
+        )
+        uvdata.flag_array |= missing[:, np.newaxis, :]
+        ant1_inds = np.where(ant1_inds < 0, 0, ant1_inds)
+        ant2_inds = np.where(ant2_inds < 0, 0, ant2_inds)
+        jones1_inds, jones2_inds = np.where(jones_inds < 0, 0, jones_inds)
+
+        # arrange the gains and flags for the two feeds of each UVData polarization
+        # to have shape (Nants, Ntimes, Nfreqs, Npols), so that indexing them with
+        # the antenna and time indices gives arrays matching the uvdata shape.
+        gains = uvcal_use.gain_array.transpose(0, 2, 1, 3)
+        flags = uvcal_use.flag_array.transpose(0, 2, 1, 3)
+        if flip_gain_conj:
+            gains1 = np.conj(gains[..., jones1_inds])
+            gains2 = gains[..., jones2_inds]
+        else:
+            gains1 = gains[..., jones1_inds]
+            gains2 = np.conj(gains[..., jones2_inds])
+        flags1 = flags[..., jones1_inds]
+        flags2 = flags[..., jones2_inds]
+
+        mult_gains = uvcal_use.gain_convention == "multiply"
+        if undo:
+            mult_gains = not mult_gains
 
-            if uvcal.time_range is not None and uvcal.Ntimes > 1:
-                gain = gain[trange_ind_arr[blt_inds], :]
-                flag = flag[trange_ind_arr[blt_inds], :]
+        if blt_chunk_size is None:
+            blt_chunk_size = max(uvdata.Nblts, 1)
+        for blt_start in range(0, uvdata.Nblts, blt_chunk_size):
+            blts = slice(blt_start, blt_start + blt_chunk_size)
+            inds1 = (ant1_inds[blts], cal_time_inds[blts])
+            inds2 = (ant2_inds[blts], cal_time_inds[blts])
+            gain = gains1[inds1] * gains2[inds2]
 
             # propagate flags
+            mask = np.broadcast_to(missing[blts, np.newaxis, :], gain.shape)
             if prop_flags:
-                mask = np.isclose(gain, 0.0) | flag
-                gain[mask] = 1.0
-                uvdata.flag_array[blt_inds, :, pol_ind] += mask
+                # this is equivalent to np.isclose(gain, 0.0) but faster
+                prop_mask = (np.abs(gain) <= 1e-8) | flags1[inds1] | flags2[inds2]
+                uvdata.flag_array[blts] |= prop_mask
+                mask = mask | prop_mask
+            gain[mask] = 1.0
 
             # apply to data
-            mult_gains = uvcal_use.gain_convention == "multiply"
-            if undo:
-                mult_gains = not mult_gains
             if mult_gains:
-                uvdata.data_array[blt_inds, :, pol_ind] *= gain
+                uvdata.data_array[blts] *= gain
             else:
-                uvdata.data_array[blt_inds, :, pol_ind] /= gain
+                uvdata.data_array[blts] /= gain
+    uvdata._mark_changed("_data_array", "_flag_array")
 
     # update attributes
     uvdata.history += "\nCalibrated with pyuvdata.utils.uvcalibrate."
@@ -8,6 +8,7 @@ Subclassed by UVData and Telescope.
 """
 
 import copy
+import hashlib
 import warnings
 
 import numpy as np
@@ -19,6 +20,8 @@ from .utils.tools import _get_iterable
 
 __all__ = ["UVBase"]
 
+_CHECK_LEVELS = ("shape", "cheap", "full")
+
 # the old names of attributes as keys, values are the names on the telescope object
 old_telescope_metadata_attrs = {
     "telescope_name": "name",
@@ -643,12 +646,201 @@ class UVBase:
             silent=silent,
         )
 
+    def fingerprint(
+        self,
+        *,
+        check_extra=True,
+        ignore_params=("filename",),
+        algorithm="sha256",
+        chunk_size=None,
+        use_cache=True,
+    ):
+        """
+        Get a hash of the parameter values on the object.
+
+        This is computed from the digests of the UVParameters (see
+        :meth:`pyuvdata.parameter.UVParameter.digest`), which are cached, so only
+        parameters that have been set since the last call are rehashed. Objects
+        with the same fingerprint have identical parameter values, so fingerprints
+        can be used to deduplicate objects or files or to verify conversions with a
+        single pass over each object rather than pairwise comparisons. Note that no
+        tolerances are used, so objects that are equal (within the tolerances used
+        by ``__eq__``) may have different fingerprints.
+
+        Parameters
+        ----------
+        check_extra : bool
+            Option to include all parameters, or just the required ones.
+        ignore_params : iterable of str, optional
+            Names of parameters to leave out of the fingerprint. By default, the
+            `filename` parameter is ignored (as it is in equality testing).
+        algorithm : str
+            Name of the hash algorithm to use, passed to :func:`hashlib.new`.
+        chunk_size : int, optional
+            Number of bytes of array data to hash at a time, this does not change
+            the fingerprint. Defaults to 16 MiB.
+        use_cache : bool
+            Option to use cached digests for parameters that have not been set since
+            they were computed. Methods on the object that change parameter values
+            in place mark them as changed, but other in place changes (e.g. setting
+            some elements of an array directly) are not detected, so set this to
+            False after making them.
+
+        Returns
+        -------
+        str
+            The hexadecimal fingerprint.
+
+        """
+        if ignore_params is None:
+            ignore_params = ()
+        elif isinstance(ignore_params, str):
+            ignore_params = [ignore_params]
+        ignore_params = {
+            param if param.startswith("_") else "_" + param for param in ignore_params
+        }
+
+        if hasattr(self, "metadata_only"):
+            # this sets which data-like parameters are required
+            self.metadata_only  # noqa B018
+
+        params = list(self.required())
+        if check_extra:
+            params += list(self.extra())
+
+        hasher = hashlib.new(algorithm)
+        hasher.update(type(self).__name__.encode())
+        for param in sorted(params):
+            if param in ignore_params:
+                continue
+            digest = getattr(self, param).digest(
+                algorithm=algorithm, chunk_size=chunk_size, use_cache=use_cache
+            )
+            hasher.update(f"\n{param}:{digest}".encode())
+        return hasher.hexdigest()
+
+    def _get_check_key(self, params, options=()):
+        """
+        Get a key identifying the state of the parameters used by a check.
+
+        Parameters
+        ----------
+        params : iterable of str
+            Names of the UVParameter attributes used by the check (e.g.
+            "_time_array"). Parameters on UVBase objects attached to this object
+            can be given as dotted names (e.g. "telescope._location").
+        options : tuple
+            Any other values that affect the outcome of the check.
+
+        Returns
+        -------
+        tuple or None
+            The key, which changes whenever any of the parameter values are set.
+            None if the state cannot be tracked, because a parameter is not a
+            UVParameter on the object or its value is a dict or list (which are
+            often modified in place).
+
+        """
+        versions = []
+        for name in params:
+            obj = self
+            *parents, param_name = name.split(".")
+            for parent in parents:
+                obj = getattr(obj, parent)
+            if obj is None:
+                versions.append(None)
+                continue
+            param = getattr(obj, param_name, None)
+            if (
+                not isinstance(param, uvp.UVParameter)
+                or param.value_version is None
+                or isinstance(param.value, dict | list)
+            ):
+                return None
+            versions.append(param.value_version)
+        return tuple(versions), options
+
+    def _mark_changed(self, *params):
+        """
+        Mark parameters as changed after their values were modified in place.
+
+        Checks run with `only_changed` (and cached digests) only notice values
+        that have been set, so methods that modify parameter values in place
+        (e.g. setting elements of an array) should call this afterwards.
+
+        Parameters
+        ----------
+        *params : str
+            Names of the UVParameter attributes that were modified (e.g.
+            "_uvw_array").
+
+        """
+        for name in params:
+            param = getattr(self, name)
+            param.value = param.value
+
+    def _run_cached_check(
+        self, name, check_func, *, params, options=(), only_changed=False
+    ):
+        """
+        Run a check, skipping it if the parameters it uses have not changed.
+
+        The check is skipped if `only_changed` is True and the parameter values
+        have not been set since the check last passed with the same options. Any
+        warnings raised by the check are re-raised when it is skipped. Checks are
+        only recorded when `only_changed` is True.
+
+        Parameters
+        ----------
+        name : str
+            Name to record the check under.
+        check_func : callable
+            Function that runs the check, taking no arguments. It should raise an
+            error if the check does not pass.
+        params : iterable of str
+            Names of the UVParameter attributes used by the check, see
+            :meth:`_get_check_key`.
+        options : tuple
+            Any other values that affect the outcome of the check.
+        only_changed : bool
+            Option to skip the check if the parameters have not changed.
+
+        """
+        if not only_changed:
+            # Only record the check when it might be skipped, recording the warnings
+            # swaps the (process wide) warning filters.
+            check_func()
+            return
+
+        key = self._get_check_key(params, options)
+        check_records = self.__dict__.setdefault("_check_records", {})
+        record = check_records.pop(name, None)
+        if key is not None and record is not None and record[0] == key:
+            check_records[name] = record
+            for message, category in record[1]:
+                warnings.warn(message, category)
+            return
+
+        with warnings.catch_warnings(record=True) as caught:
+            check_func()
+        for warn in caught:
+            warnings.warn_explicit(
+                warn.message, warn.category, warn.filename, warn.lineno
+            )
+        if key is not None:
+            check_records[name] = (
+                key,
+                [(str(warn.message), warn.category) for warn in caught],
+            )
+
     def check(
         self,
         *,
         check_extra=True,
         run_check_acceptability=True,
         ignore_requirements=False,
+        check_level="full",
+        only_changed=False,
     ):
         """
         Check that required parameters exist and have the correct shapes.
@@ -666,6 +858,20 @@ class UVBase:
             Do not error if a required parameter isn't set.
             This allows the user to run the shape/acceptability checks
             on parameters in a partially-defined UVData object.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full".
+            "shape" only checks that the parameters exist and have the expected
+            shapes and types. "cheap" adds the acceptability checks (if
+            `run_check_acceptability` is True) and any other checks that are fast
+            to run. "full" runs all the checks, including those that are
+            expensive to compute (e.g. recalculating the LSTs on UVData objects).
+        only_changed : bool
+            Option to only check parameters (and run other checks on values
+            derived from them) that have been set since they last passed the
+            checks on this object. Changes made in place by the methods on the
+            object are tracked, but other changes made in place (e.g. setting
+            elements of an array or entries in a dict) are not, set the attribute
+            again (e.g. ``obj.time_array = obj.time_array``) to mark it as changed.
 
         Returns
         -------
@@ -676,154 +882,232 @@ class UVBase:
         ------
         ValueError
             If required UVParameter values have not been set or if set UVParameters
-            values do not have the expected names, shapes, types or values.
+            values do not have the expected names, shapes, types or values. Also if
+            `check_level` is not one of the allowed values.
 
         """
+        if check_level not in _CHECK_LEVELS:
+            raise ValueError(f"check_level must be one of: {', '.join(_CHECK_LEVELS)}.")
+        if check_level == "shape":
+            run_check_acceptability = False
+
         if check_extra:
             p_check = list(self.required()) + list(self.extra())
         else:
             p_check = list(self.required())
 
+        check_records = self.__dict__.setdefault("_check_records", {})
         for p in p_check:
             param = getattr(self, p)
-            if p != ("_" + param.name):
-                raise ValueError(
-                    f"UVParameter {p} does not follow the required naming convention"
-                    f"(expected be {'_' + param.name})."
+            record_name = "param" + p
+            key = None
+            if not isinstance(param.value, UVBase):
+                # The expected shape depends on other parameters named in the form
+                form_params = []
+                if isinstance(param.form, tuple):
+                    form_params = ["_" + f for f in param.form if isinstance(f, str)]
+                key = self._get_check_key(
+                    [p] + form_params,
+                    options=(
+                        param.required,
+                        param.form,
+                        param.expected_type,
+                        copy.copy(param.acceptable_vals),
+                        param.acceptable_range,
+                        ignore_requirements,
+                    ),
                 )
+            record = check_records.pop(record_name, None)
+            if (
+                only_changed
+                and key is not None
+                and record is not None
+                and record[0] == key
+                and (record[1] or not run_check_acceptability)
+            ):
+                check_records[record_name] = record
+                continue
+
+            self._check_parameter(
+                p,
+                param,
+                run_check_acceptability=run_check_acceptability,
+                ignore_requirements=ignore_requirements,
+                check_level=check_level,
+                only_changed=only_changed,
+            )
+            if key is not None:
+                check_records[record_name] = (key, run_check_acceptability)
+
+        return True
+
+    def _check_parameter(
+        self,
+        p,
+        param,
+        *,
+        run_check_acceptability,
+        ignore_requirements,
+        check_level,
+        only_changed,
+    ):
+        """
+        Check a single UVParameter, see :meth:`check` for details.
+
+        Parameters
+        ----------
+        p : str
+            Name of the UVParameter attribute.
+        param : UVParameter
+            The UVParameter to check.
+        run_check_acceptability : bool
+            Option to check if the values are acceptable.
+        ignore_requirements : bool
+            Do not error if a required parameter isn't set.
+        check_level : str
+            Passed to the check method of UVBase object values.
+        only_changed : bool
+            Passed to the check method of UVBase object values.
+
+        """
+        if p != ("_" + param.name):
+            raise ValueError(
+                f"UVParameter {p} does not follow the required naming convention"
+                f"(expected be {'_' + param.name})."
+            )
 
-            # Check required parameter exists
-            if param.value is None:
-                if ignore_requirements:
-                    continue
-                if param.required is True:
-                    raise ValueError(f"Required UVParameter {p} has not been set.")
+        # Check required parameter exists
+        if param.value is None:
+            if ignore_requirements:
+                return
+            if param.required is True:
+                raise ValueError(f"Required UVParameter {p} has not been set.")
+        else:
+            # Check parameter shape
+            eshape = param.expected_shape(self)
+            # default value of eshape is ()
+            if eshape == "str" or (eshape == () and param.expected_type == "str"):
+                # Check that it's a string
+                if not isinstance(param.value, str):
+                    raise ValueError(
+                        f"UVParameter {p} expected to be string, but is not."
+                    )
             else:
-                # Check parameter shape
-                eshape = param.expected_shape(self)
-                # default value of eshape is ()
-                if eshape == "str" or (eshape == () and param.expected_type == "str"):
-                    # Check that it's a string
-                    if not isinstance(param.value, str):
+                # Check the shape of the parameter value. Note that np.shape
+                # returns an empty tuple for single numbers.
+                # eshape should do the same.
+                if not np.shape(param.value) == eshape:
+                    raise ValueError(
+                        f"UVParameter {p} is not expected shape. Parameter "
+                        f"shape is {np.shape(param.value)}, expected shape "
+                        f"is {eshape}."
+                    )
+                # Handle UVBase objects (e.g. Telescope) separately
+                if isinstance(param.value, UVBase):
+                    param.value.check(
+                        check_level=check_level, only_changed=only_changed
+                    )
+
+                # Handle SkyCoord objects separately
+                if isinstance(param, uvp.SkyCoordParameter):
+                    if not issubclass(param.value.__class__, SkyCoord):
                         raise ValueError(
-                            f"UVParameter {p} expected to be string, but is not."
+                            f"UVParameter {p} should be a subclass of a "
+                            f"SkyCoord object but it is {type(param.value)}."
                         )
-                else:
-                    # Check the shape of the parameter value. Note that np.shape
-                    # returns an empty tuple for single numbers.
-                    # eshape should do the same.
-                    if not np.shape(param.value) == eshape:
+                    else:
+                        # matches expected type. Don't need to iterate through it.
+                        return  # pragma: no cover
+
+                # Handle recarrays separately
+                if isinstance(param.value, np.recarray):
+                    rec_names = param.value.dtype.names
+                    if not isinstance(param.expected_type, list) or len(
+                        param.expected_type
+                    ) != len(rec_names):
                         raise ValueError(
-                            f"UVParameter {p} is not expected shape. Parameter "
-                            f"shape is {np.shape(param.value)}, expected shape "
-                            f"is {eshape}."
+                            f"Parameter {p} is a recarray, but the expected type "
+                            "is not a list with a length equal to the number of "
+                            "columns in the recarray. The expected type is: "
+                            f"{param.expected_type}, the recarray dtype is "
+                            f"{param.value.dtype}."
                         )
-                    # Handle UVBase objects (e.g. Telescope) separately
-                    if isinstance(param.value, UVBase):
-                        param.value.check()
 
-                    # Handle SkyCoord objects separately
-                    if isinstance(param, uvp.SkyCoordParameter):
-                        if not issubclass(param.value.__class__, SkyCoord):
+                    for ind, name in enumerate(rec_names):
+                        if isinstance(
+                            param.value[name].item(0), param.expected_type[ind]
+                        ):
                             raise ValueError(
-                                f"UVParameter {p} should be a subclass of a "
-                                f"SkyCoord object but it is {type(param.value)}."
+                                f"Parameter {p} is a recarray, the columns do not "
+                                "all have the expected types. The expected type is:"
+                                f" {param.expected_type}, the recarray dtype is "
+                                f"{param.value.dtype}."
                             )
-                        else:
-                            # matches expected type. Don't need to iterate through it.
-                            continue  # pragma: no cover
-
-                    # Handle recarrays separately
-                    if isinstance(param.value, np.recarray):
-                        rec_names = param.value.dtype.names
-                        if not isinstance(param.expected_type, list) or len(
-                            param.expected_type
-                        ) != len(rec_names):
+                    return  # pragma: no cover
+
+                # Quantity objects complicate things slightly
+                # Do a separate check with warnings until a quantity based
+                # parameter value is created
+                if isinstance(param.value, Quantity):
+                    # check if user put expected type as a type of quantity
+                    # not a more generic type of number.
+                    if any(
+                        issubclass(param_type, Quantity)
+                        for param_type in _get_iterable(param.expected_type)
+                    ):
+                        # Verify the param is an instance
+                        # of the specific Quantity type
+                        if not isinstance(param.value, param.expected_type):
                             raise ValueError(
-                                f"Parameter {p} is a recarray, but the expected type "
-                                "is not a list with a length equal to the number of "
-                                "columns in the recarray. The expected type is: "
-                                f"{param.expected_type}, the recarray dtype is "
-                                f"{param.value.dtype}."
+                                f"UVParameter {p} is a Quantity object "
+                                "but not the appropriate type. "
+                                f"Is {type(param.value)} but "
+                                f"expected {param.expected_type}."
                             )
-
-                        for ind, name in enumerate(rec_names):
-                            if isinstance(
-                                param.value[name].item(0), param.expected_type[ind]
-                            ):
-                                raise ValueError(
-                                    f"Parameter {p} is a recarray, the columns do not "
-                                    "all have the expected types. The expected type is:"
-                                    f" {param.expected_type}, the recarray dtype is "
-                                    f"{param.value.dtype}."
-                                )
-                        continue  # pragma: no cover
-
-                    # Quantity objects complicate things slightly
-                    # Do a separate check with warnings until a quantity based
-                    # parameter value is created
-                    if isinstance(param.value, Quantity):
-                        # check if user put expected type as a type of quantity
-                        # not a more generic type of number.
-                        if any(
-                            issubclass(param_type, Quantity)
-                            for param_type in _get_iterable(param.expected_type)
-                        ):
-                            # Verify the param is an instance
-                            # of the specific Quantity type
-                            if not isinstance(param.value, param.expected_type):
-                                raise ValueError(
-                                    f"UVParameter {p} is a Quantity object "
-                                    "but not the appropriate type. "
-                                    f"Is {type(param.value)} but "
-                                    f"expected {param.expected_type}."
-                                )
-                            else:
-                                # matches expected type
-                                continue  # pragma: no cover
                         else:
-                            # Expected type is not a Quantity subclass
-                            # Assuming it is a data type like float, int, etc
-                            # continuing with check below
-                            warnings.warn(
-                                f"Parameter {p} is a Quantity object, "
-                                "but the expected type is a precision identifier: "
-                                f"{param.expected_type}. "
-                                "Testing the precision of the value, but this "
-                                "check will fail in a future version."
-                            )
-                            check_vals = [param.value.item(0).value]
-                    elif eshape == ():
-                        # Single element
-                        check_vals = [param.value]
+                            # matches expected type
+                            return  # pragma: no cover
                     else:
-                        if isinstance(param.value, list | tuple):
-                            # List & tuples needs to be handled differently than array
-                            # list values may be different types, so they all
-                            # need to be checked
-                            check_vals = list(param.value)
-                        else:
-                            # numpy array
-                            # the code below ensures that the check value is the type
-                            # given by the dtype
-                            check_vals = [param.value.dtype.type(param.value.item(0))]
-
-                    for val in check_vals:
-                        if not isinstance(val, param.expected_type):
-                            raise ValueError(
-                                f"UVParameter {p} is not the appropriate"
-                                f" type. Is:  {type(val)}. "
-                                f"Should be: {param.expected_type}."
-                            )
+                        # Expected type is not a Quantity subclass
+                        # Assuming it is a data type like float, int, etc
+                        # continuing with check below
+                        warnings.warn(
+                            f"Parameter {p} is a Quantity object, "
+                            "but the expected type is a precision identifier: "
+                            f"{param.expected_type}. "
+                            "Testing the precision of the value, but this "
+                            "check will fail in a future version."
+                        )
+                        check_vals = [param.value.item(0).value]
+                elif eshape == ():
+                    # Single element
+                    check_vals = [param.value]
+                else:
+                    if isinstance(param.value, list | tuple):
+                        # List & tuples needs to be handled differently than array
+                        # list values may be different types, so they all
+                        # need to be checked
+                        check_vals = list(param.value)
+                    else:
+                        # numpy array
+                        # the code below ensures that the check value is the type
+                        # given by the dtype
+                        check_vals = [param.value.dtype.type(param.value.item(0))]
 
-                if run_check_acceptability:
-                    accept, message = param.check_acceptability()
-                    if not accept:
+                for val in check_vals:
+                    if not isinstance(val, param.expected_type):
                         raise ValueError(
-                            f"UVParameter {p} has unacceptable values. {message}"
+                            f"UVParameter {p} is not the appropriate"
+                            f" type. Is:  {type(val)}. "
+                            f"Should be: {param.expected_type}."
                         )
 
-        return True
+            if run_check_acceptability:
+                accept, message = param.check_acceptability()
+                if not accept:
+                    raise ValueError(
+                        f"UVParameter {p} has unacceptable values. {message}"
+                    )
 
     def copy(self):
         """
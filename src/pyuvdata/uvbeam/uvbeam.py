@@ -12,14 +12,143 @@ import yaml
 from astropy import units
 from astropy.coordinates import Angle
 from docstring_parser import DocstringStyle
-from scipy import interpolate, ndimage
+from scipy import interpolate, ndimage, sparse
 
 from .. import parameter as uvp, utils
 from ..docstrings import combine_docstrings, copy_replace_short_description
 from ..uvbase import UVBase
 from . import _uvbeam, initializers
 
-__all__ = ["UVBeam"]
+__all__ = ["UVBeam", "BeamInterpPlan"]
+
+
+def _pixel_slices(npix, chunk_size):
+    """
+    Get slices to loop over pixels in chunks.
+
+    Parameters
+    ----------
+    npix : int
+        Number of pixels.
+    chunk_size : int or None
+        Maximum number of pixels in each chunk, None to use a single chunk.
+
+    Returns
+    -------
+    list of slice
+        Slices covering all of the pixels.
+
+    """
+    if chunk_size is None:
+        return [slice(None)]
+    if not isinstance(chunk_size, int | np.integer) or chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    return [
+        slice(start, min(start + chunk_size, npix))
+        for start in range(0, npix, chunk_size)
+    ]
+
+
+class BeamInterpPlan:
+    """
+    Precomputed weights to interpolate beams to fixed locations and frequencies.
+
+    Plans are made with `UVBeam.make_interp_plan` and used by passing them to the
+    `interp_plan` parameter of `UVBeam.interp`. A plan can be used for any beam with
+    the same pixel grid and frequencies as the beam used to make it, so it is useful
+    when interpolating many beams (or the same beam many times) to the same places.
+
+    Attributes
+    ----------
+    interpolation_function : str
+        The interpolation function the plan is equivalent to.
+    freq_interp_kind : str or None
+        The frequency interpolation method the plan is equivalent to, None if the
+        plan does not interpolate in frequency.
+    freq_array : ndarray of float or None
+        The frequencies to interpolate to, None if the plan does not interpolate
+        in frequency.
+    az_array : ndarray of float or None
+        The azimuths of the locations to interpolate to in radians, None if the plan
+        does not interpolate spatially.
+    za_array : ndarray of float or None
+        The zenith angles of the locations to interpolate to in radians, None if the
+        plan does not interpolate spatially.
+
+    """
+
+    _grid_params = [
+        "pixel_coordinate_system",
+        "nside",
+        "ordering",
+        "pixel_array",
+        "axis1_array",
+        "axis2_array",
+    ]
+
+    def __init__(
+        self,
+        beam,
+        *,
+        interpolation_function,
+        freq_interp_kind=None,
+        freq_array=None,
+        freq_weights=None,
+        az_array=None,
+        za_array=None,
+        pixel_weights=None,
+    ):
+        self.interpolation_function = interpolation_function
+        self.freq_interp_kind = freq_interp_kind
+        self.freq_array = freq_array
+        self.az_array = az_array
+        self.za_array = za_array
+
+        # the grid of the beam the plan was made for, used to check beams it is
+        # applied to
+        self._beam_grid = {
+            param: copy.deepcopy(getattr(beam, param)) for param in self._grid_params
+        }
+        self._beam_freq_array = copy.deepcopy(beam.freq_array)
+
+        # shape (freq_array.size, Nfreqs)
+        self._freq_weights = freq_weights
+        # sparse, shape (az_array.size, Npixels or Naxes2 * Naxes1)
+        self._pixel_weights = pixel_weights
+
+    def _check_beam(self, beam):
+        """Check that the plan can be applied to a beam."""
+        for param, value in self._beam_grid.items():
+            beam_value = getattr(beam, param)
+            if isinstance(value, np.ndarray) or isinstance(beam_value, np.ndarray):
+                match = np.array_equal(value, beam_value)
+            else:
+                match = value == beam_value
+            if not match:
+                raise ValueError(
+                    f"The {param} on this beam does not match the beam the "
+                    "interpolation plan was made for."
+                )
+        if self._freq_weights is not None and not np.array_equal(
+            self._beam_freq_array, beam.freq_array
+        ):
+            raise ValueError(
+                "The freq_array on this beam does not match the beam the "
+                "interpolation plan was made for."
+            )
+
+    def _interp_freq(self, data, *, axis):
+        """Interpolate an array along its frequency axis."""
+        return np.moveaxis(
+            np.tensordot(self._freq_weights, data, axes=(1, axis)), 0, axis
+        )
+
+    def _interp_pixels(self, data):
+        """Interpolate a data array (with pixels on the trailing axes) spatially."""
+        data_shape = data.shape[:3]
+        data = data.reshape(-1, self._pixel_weights.shape[1])
+        interp_data = np.asarray(self._pixel_weights @ data.T).T
+        return interp_data.reshape(data_shape + (self._pixel_weights.shape[0],))
 
 
 class UVBeam(UVBase):
@@ -878,6 +1007,7 @@ class UVBeam(UVBase):
         check_extra=True,
         run_check_acceptability=True,
         inplace=True,
+        chunk_size=None,
     ):
         """
         Convert E-field beam to power beam.
@@ -903,6 +1033,10 @@ class UVBeam(UVBase):
             after converting to power.
         check_extra : bool
             Option to check optional parameters as well as required ones.
+        chunk_size : int, optional
+            Number of pixels to convert at a time, which limits the size of the
+            temporary arrays used for large beams. Default is to convert all pixels
+            at once.
 
         """
         if self.beam_type != "efield":
@@ -913,6 +1047,8 @@ class UVBeam(UVBase):
                 "Conversion to power is not yet implemented for phased_array antennas"
             )
 
+        pix_slices = _pixel_slices(int(np.prod(self.data_array.shape[3:])), chunk_size)
+
         if inplace:
             beam_object = self
         else:
@@ -957,40 +1093,42 @@ class UVBeam(UVBase):
             beam_object._data_array.expected_shape(beam_object), dtype=np.complex128
         )
 
-        if keep_basis_vector:
-            for pol_i, pair in enumerate(feed_pol_order):
-                power_data[:, pol_i] = efield_data[:, pair[0]] * np.conj(
-                    efield_data[:, pair[1]]
+        if not keep_basis_vector and efield_naxes_vec != 2:
+            raise ValueError(
+                "Conversion to power with 3-vector efields "
+                "is not currently supported because we have "
+                "no examples to work with."
+            )
+
+        # Flatten the pixel axes and calculate all the polarizations at once.
+        pix_shape = efield_data.shape[3:]
+        efield_data = efield_data.reshape(efield_data.shape[:3] + (-1,))
+        power_data = power_data.reshape(power_data.shape[:3] + (-1,))
+        feed_inds1 = [pair[0] for pair in feed_pol_order]
+        feed_inds2 = [pair[1] for pair in feed_pol_order]
+        if not keep_basis_vector:
+            basis_vec = beam_object.basis_vector_array[:, :2].reshape(2, 2, -1)
+
+        for pix_slice in pix_slices:
+            if keep_basis_vector:
+                power_data[..., pix_slice] = efield_data[
+                    :, feed_inds1, :, pix_slice
+                ] * np.conj(efield_data[:, feed_inds2, :, pix_slice])
+            else:
+                # Project the efields for each feed onto the components of the
+                # basis vectors, then sum the products over the components.
+                # shape (Ncomponents_vec, Nfeeds, Nfreqs, Npixels)
+                efield_comp = (
+                    basis_vec[0, :, np.newaxis, np.newaxis, pix_slice]
+                    * efield_data[0, np.newaxis, :, :, pix_slice]
+                    + basis_vec[1, :, np.newaxis, np.newaxis, pix_slice]
+                    * efield_data[1, np.newaxis, :, :, pix_slice]
                 )
-        else:
-            for pol_i, pair in enumerate(feed_pol_order):
-                if efield_naxes_vec == 2:
-                    for comp_i in range(2):
-                        power_data[0, pol_i] += (
-                            (efield_data[0, pair[0]] * np.conj(efield_data[0, pair[1]]))
-                            * beam_object.basis_vector_array[0, comp_i] ** 2
-                            + (
-                                efield_data[1, pair[0]]
-                                * np.conj(efield_data[1, pair[1]])
-                            )
-                            * beam_object.basis_vector_array[1, comp_i] ** 2
-                            + (
-                                efield_data[0, pair[0]]
-                                * np.conj(efield_data[1, pair[1]])
-                                + efield_data[1, pair[0]]
-                                * np.conj(efield_data[0, pair[1]])
-                            )
-                            * (
-                                beam_object.basis_vector_array[0, comp_i]
-                                * beam_object.basis_vector_array[1, comp_i]
-                            )
-                        )
-                else:
-                    raise ValueError(
-                        "Conversion to power with 3-vector efields "
-                        "is not currently supported because we have "
-                        "no examples to work with."
-                    )
+                power_data[0, ..., pix_slice] = np.sum(
+                    efield_comp[:, feed_inds1] * np.conj(efield_comp[:, feed_inds2]),
+                    axis=0,
+                )
+        power_data = power_data.reshape(power_data.shape[:3] + pix_shape)
 
         if not calc_cross_pols:
             max_abs_imag = np.max(np.abs(power_data.imag))
@@ -1114,6 +1252,7 @@ class UVBeam(UVBase):
         run_check=True,
         check_extra=True,
         run_check_acceptability=True,
+        chunk_size=None,
     ):
         """
         Convert E-field to pseudo-stokes power.
@@ -1137,6 +1276,10 @@ class UVBeam(UVBase):
             after converting to power.
         check_extra : bool
             Option to check optional parameters as well as required ones.
+        chunk_size : int, optional
+            Number of pixels to convert at a time, which limits the size of the
+            temporary arrays used for large beams. Default is to convert all pixels
+            at once.
 
         """
         if inplace:
@@ -1147,9 +1290,10 @@ class UVBeam(UVBase):
         if beam_object.beam_type != "efield":
             raise ValueError("beam_type must be efield.")
 
+        pix_slices = _pixel_slices(int(np.prod(self.data_array.shape[3:])), chunk_size)
+
         efield_data = beam_object.data_array
         _sh = beam_object.data_array.shape
-        Nfreqs = beam_object.Nfreqs
 
         if self.pixel_coordinate_system != "healpix":
             Naxes2, Naxes1 = beam_object.Naxes2, beam_object.Naxes1
@@ -1157,36 +1301,24 @@ class UVBeam(UVBase):
             efield_data = efield_data.reshape(efield_data.shape[:-2] + (npix,))
             _sh = efield_data.shape
 
-        # construct jones matrix containing the electric field
-
         pol_strings = ["pI", "pQ", "pU", "pV"]
-        power_data = np.zeros(
-            (1, len(pol_strings), _sh[-2], _sh[-1]), dtype=np.complex128
-        )
-        beam_object.polarization_array = np.array(
-            [
-                utils.polstr2num(ps.upper(), x_orientation=self.x_orientation)
-                for ps in pol_strings
-            ]
-        )
-
-        for fq_i in range(Nfreqs):
-            jones = np.zeros((_sh[-1], 2, 2), dtype=np.complex128)
-            pol_strings = ["pI", "pQ", "pU", "pV"]
-            jones[:, 0, 0] = efield_data[0, 0, fq_i, :]
-            jones[:, 0, 1] = efield_data[0, 1, fq_i, :]
-            jones[:, 1, 0] = efield_data[1, 0, fq_i, :]
-            jones[:, 1, 1] = efield_data[1, 1, fq_i, :]
-
-            for pol_i in range(len(pol_strings)):
-                power_data[:, pol_i, fq_i, :] = self._construct_mueller(
-                    jones=jones, pol_index1=pol_i, pol_index2=pol_i
-                )
-        assert not np.any(np.iscomplex(power_data)), (
-            "The calculated pstokes beams are complex but should be real. This is a "
-            "bug, please report it in our issue log"
-        )
-        power_data = np.abs(power_data)
+        power_data = np.zeros((1, len(pol_strings), _sh[-2], _sh[-1]), dtype=float)
+
+        # The Jones matrix for each frequency and pixel is efield_data[:2, :2, fq, pix].
+        # Calculate all polarizations and frequencies at once using the diagonal
+        # Mueller matrix elements (see _construct_mueller) written out in terms of
+        # the Jones matrix elements for the Pauli matrices from _stokes_matrix.
+        for pix_slice in pix_slices:
+            jones = efield_data[:2, :2, :, pix_slice]
+            jones_sq = np.abs(jones) ** 2
+            cross_diag = np.real(jones[1, 1] * np.conj(jones[0, 0]))
+            cross_off = np.real(jones[1, 0] * np.conj(jones[0, 1]))
+            power_data[0, 0, :, pix_slice] = 0.5 * np.sum(jones_sq, axis=(0, 1))
+            power_data[0, 1, :, pix_slice] = 0.5 * np.abs(
+                jones_sq[0, 0] - jones_sq[0, 1] - jones_sq[1, 0] + jones_sq[1, 1]
+            )
+            power_data[0, 2, :, pix_slice] = np.abs(cross_diag + cross_off)
+            power_data[0, 3, :, pix_slice] = np.abs(cross_diag - cross_off)
 
         if self.pixel_coordinate_system != "healpix":
             power_data = power_data.reshape(power_data.shape[:-1] + (Naxes2, Naxes1))
@@ -1944,6 +2076,481 @@ class UVBeam(UVBase):
             interp_arrays.append(interp_coupling_matrix)
         return tuple(interp_arrays)
 
+    def _prepare_interp_inputs(
+        self,
+        *,
+        az_array,
+        za_array,
+        interpolation_function,
+        freq_interp_kind,
+        az_za_grid,
+        healpix_nside,
+        healpix_inds,
+        freq_array,
+        freq_interp_tol,
+    ):
+        """
+        Handle the interpolation inputs shared by "interp" and "make_interp_plan".
+
+        Returns
+        -------
+        interpolation_function : str
+            The interpolation function to use.
+        interp_func : str
+            The name of the method implementing the interpolation function.
+        freq_interp_kind : str
+            The frequency interpolation method to use.
+        az_array_use : ndarray of float or None
+            The azimuths of all the interpolation points.
+        za_array_use : ndarray of float or None
+            The zenith angles of all the interpolation points.
+        healpix_inds : ndarray of int or None
+            The HEALPix indices of the interpolation points if interpolating to
+            HEALPix pixels.
+
+        """
+        if interpolation_function is None:
+            if self.pixel_coordinate_system == "az_za":
+                interpolation_function = "az_za_simple"
+            elif self.pixel_coordinate_system == "healpix":
+                interpolation_function = "healpix_simple"
+            else:
+                raise ValueError(
+                    "There is no default interpolation function for objects with "
+                    f"pixel_coordinate_system: {self.pixel_coordinate_system}"
+                )
+
+        if freq_interp_kind is None:
+            freq_interp_kind = "cubic"
+
+        allowed_interp_funcs = list(self.interpolation_function_dict.keys())
+        if interpolation_function not in allowed_interp_funcs:
+            raise ValueError(
+                "interpolation_function not recognized, must be one of "
+                f"{allowed_interp_funcs}"
+            )
+        interp_func = self.interpolation_function_dict[interpolation_function]["func"]
+
+        if freq_array is not None:
+            # get frequency distances
+            freq_dists = np.abs(self.freq_array - freq_array.reshape(-1, 1))
+            nearest_dist = np.min(freq_dists, axis=1)
+            interp_bool = np.any(nearest_dist >= freq_interp_tol)
+
+            # use the beam at nearest neighbors if not interp_bool
+            if not interp_bool:
+                freq_interp_kind = "nearest"
+
+        if az_za_grid:
+            if az_array is None or za_array is None:
+                raise ValueError(
+                    "If az_za_grid is set to True, az_array and za_array must be "
+                    "provided."
+                )
+            az_array_use, za_array_use = np.meshgrid(az_array, za_array)
+            az_array_use = az_array_use.flatten()
+            za_array_use = za_array_use.flatten()
+        else:
+            az_array_use = copy.copy(az_array)
+            za_array_use = copy.copy(za_array)
+
+        if healpix_nside is not None or healpix_inds is not None:
+            if healpix_nside is None:
+                raise ValueError("healpix_nside must be set if healpix_inds is set.")
+            if az_array is not None or za_array is not None:
+                raise ValueError(
+                    "healpix_nside and healpix_inds can not be "
+                    "set if az_array or za_array is set."
+                )
+            try:
+                from astropy_healpix import HEALPix
+            except ImportError as e:  # pragma: no cover
+                raise ImportError(
+                    "astropy_healpix is not installed but is "
+                    "required for healpix functionality. "
+                    "Install 'astropy-healpix' using conda or pip."
+                ) from e
+
+            hp_obj = HEALPix(nside=healpix_nside)
+            if healpix_inds is None:
+                healpix_inds = np.arange(hp_obj.npix)
+
+            hpx_lon, hpx_lat = hp_obj.healpix_to_lonlat(healpix_inds)
+
+            za_array_use = (Angle(np.pi / 2, units.radian) - hpx_lat).radian
+            az_array_use = hpx_lon.radian
+
+        return (
+            interpolation_function,
+            interp_func,
+            freq_interp_kind,
+            az_array_use,
+            za_array_use,
+            healpix_inds,
+        )
+
+    def _get_freq_interp_weights(self, freq_array, *, kind):
+        """
+        Get the weights to interpolate along the frequency axis.
+
+        The interpolation methods supported by `_interp_freq` are all linear in the
+        data, so the weights are found by interpolating the identity matrix.
+
+        Parameters
+        ----------
+        freq_array : ndarray of float
+            Frequency values to interpolate to.
+        kind : str
+            Interpolation method to use frequency.
+            See scipy.interpolate.interp1d for details.
+
+        Returns
+        -------
+        ndarray of float
+            The interpolation weights, shape (freq_array.size, Nfreqs).
+
+        """
+        if kind == "nearest":
+            freq_dists = np.abs(self.freq_array[np.newaxis] - freq_array.reshape(-1, 1))
+            return np.eye(self.Nfreqs)[np.argmin(freq_dists, axis=1)]
+
+        if self.Nfreqs == 1:
+            raise ValueError("Only one frequency in UVBeam so cannot interpolate.")
+
+        if np.min(freq_array) < np.min(self.freq_array) or np.max(freq_array) > np.max(
+            self.freq_array
+        ):
+            raise ValueError(
+                "at least one interpolation frequency is outside of "
+                "the UVBeam freq_array range."
+            )
+
+        lut = interpolate.interp1d(
+            self.freq_array, np.eye(self.Nfreqs), kind=kind, axis=0
+        )
+        return lut(freq_array)
+
+    def _get_pixel_interp_weights(
+        self, *, interp_func, az_array, za_array, spline_opts, check_azza_domain
+    ):
+        """
+        Get a sparse matrix of the weights to interpolate to new locations.
+
+        Parameters
+        ----------
+        interp_func : str
+            The name of the method implementing the interpolation function, must be
+            "_interp_healpix_bilinear" or "_interp_az_za_map_coordinates".
+        az_array : ndarray of float
+            Azimuth values to interpolate to in radians.
+        za_array : ndarray of float
+            Zenith values to interpolate to in radians.
+        spline_opts : dict
+            Options for scipy.ndimage.map_coordinates.
+        check_azza_domain : bool
+            Whether to check the domain of az/za to ensure that they are covered by
+            the intrinsic data array.
+
+        Returns
+        -------
+        scipy.sparse.csr_array
+            The interpolation weights, shape: (az_array.size, Npixels) for HEALPix
+            beams or (az_array.size, Naxes2 * Naxes1) otherwise.
+
+        """
+        assert isinstance(az_array, np.ndarray)
+        assert isinstance(za_array, np.ndarray)
+        assert az_array.ndim == 1
+        assert az_array.shape == za_array.shape
+
+        npoints = az_array.size
+        if interp_func == "_interp_healpix_bilinear":
+            if self.pixel_coordinate_system != "healpix":
+                raise ValueError(
+                    "pixel_coordinate_system must be 'healpix' to use this "
+                    "interpolation function"
+                )
+            from astropy_healpix import HEALPix
+
+            if not self.Npixels == 12 * self.nside**2:
+                raise ValueError(
+                    "simple healpix interpolation requires full sky healpix maps."
+                )
+            if not np.max(np.abs(np.diff(self.pixel_array))) == 1:
+                raise ValueError(
+                    "simple healpix interpolation requires healpix pixels to be in "
+                    "order."
+                )
+            hp_obj = HEALPix(nside=self.nside, order=self.ordering)
+            lat_array = Angle(np.pi / 2, units.radian) - Angle(za_array, units.radian)
+            lon_array = Angle(az_array, units.radian)
+            pix_inds, weights = hp_obj.bilinear_interpolation_weights(
+                lon_array, lat_array
+            )
+            point_inds = np.broadcast_to(np.arange(npoints), pix_inds.shape)
+            npix = self.Npixels
+        else:
+            if self.pixel_coordinate_system != "az_za":
+                raise ValueError(
+                    "pixel_coordinate_system must be 'az_za' to use this "
+                    "interpolation function"
+                )
+            if spline_opts is None or not isinstance(spline_opts, dict):
+                spline_opts = {}
+            if spline_opts.get("order") != 1 or set(spline_opts) - {
+                "order",
+                "prefilter",
+            }:
+                raise ValueError(
+                    "Interpolation plans for az_za_map_coordinates interpolation are "
+                    "only supported for linear interpolation, set spline_opts to "
+                    "{'order': 1}."
+                )
+
+            # the phi grid may be extended to wrap around, get the index into the
+            # original grid for each extended grid point
+            phi_inds, phi_use, theta_use = self._prepare_coordinate_data(
+                np.arange(self.Naxes1).reshape(1, 1, 1, 1, -1)
+            )
+            phi_inds = phi_inds[0, 0, 0, 0]
+            if check_azza_domain:
+                self._check_interpolation_domain(az_array, za_array, phi_use, theta_use)
+
+            # fractional indices into the (phi extended) grid, as in
+            # _interp_az_za_map_coordinates
+            az_coord = (
+                (az_array - phi_use.min())
+                / (phi_use.max() - phi_use.min())
+                * (phi_use.size - 1)
+            )
+            za_coord = (
+                (za_array - theta_use.min())
+                / (theta_use.max() - theta_use.min())
+                * (theta_use.size - 1)
+            )
+            # locations outside the grid are set to zero by map_coordinates
+            in_grid = (
+                (az_coord >= 0)
+                & (az_coord <= phi_use.size - 1)
+                & (za_coord >= 0)
+                & (za_coord <= theta_use.size - 1)
+            )
+            az_low = np.clip(np.floor(az_coord).astype(int), 0, phi_use.size - 2)
+            za_low = np.clip(np.floor(za_coord).astype(int), 0, theta_use.size - 2)
+            az_frac = az_coord - az_low
+            za_frac = za_coord - za_low
+
+            pix_inds = []
+            weights = []
+            for za_off, za_weight in [(0, 1 - za_frac), (1, za_frac)]:
+                for az_off, az_weight in [(0, 1 - az_frac), (1, az_frac)]:
+                    pix_inds.append(
+                        (za_low + za_off) * self.Naxes1 + phi_inds[az_low + az_off]
+                    )
+                    weights.append(za_weight * az_weight * in_grid)
+            pix_inds = np.stack(pix_inds)
+            weights = np.stack(weights)
+            point_inds = np.broadcast_to(np.arange(npoints), pix_inds.shape)
+            npix = self.Naxes2 * self.Naxes1
+
+        # duplicate entries (e.g. from the extended phi grid) are summed
+        return sparse.csr_array(
+            (weights.ravel(), (point_inds.ravel(), pix_inds.ravel())),
+            shape=(npoints, npix),
+        )
+
+    def make_interp_plan(
+        self,
+        *,
+        az_array=None,
+        za_array=None,
+        interpolation_function,
+        freq_interp_kind=None,
+        az_za_grid=False,
+        healpix_nside=None,
+        healpix_inds=None,
+        freq_array=None,
+        freq_interp_tol=1.0,
+        spline_opts=None,
+        check_azza_domain: bool = True,
+    ):
+        """
+        Make a plan to repeatedly interpolate beams to the same locations.
+
+        The plan holds the frequency interpolation weights and the (sparse) spatial
+        interpolation weights so that they are not recalculated on each call to
+        `interp`. Pass it to the `interp_plan` parameter of `interp` on this object
+        or on any other object with the same pixels and frequencies (e.g. beams for
+        other antennas or after changing the data), which gives the same results as
+        calling `interp` with the same parameters. The polarizations to interpolate
+        can be chosen when calling `interp`.
+
+        Only the "healpix_simple" and (linear) "az_za_map_coordinates" interpolation
+        functions are supported, because the splines used by the other functions
+        do not have a small set of weights per location. Note that these are not
+        the defaults used by `interp` for objects with the "az_za"
+        pixel_coordinate_system, so the interpolation function (and for
+        "az_za_map_coordinates", linear interpolation) must be chosen explicitly.
+
+        Parameters
+        ----------
+        az_array : array_like of floats, optional
+            Azimuth values to interpolate to in radians, either specifying the
+            azimuth positions for every interpolation point or specifying the
+            azimuth vector for a meshgrid if az_za_grid is True.
+        za_array : array_like of floats, optional
+            Zenith values to interpolate to in radians, either specifying the
+            zenith positions for every interpolation point or specifying the
+            zenith vector for a meshgrid if az_za_grid is True.
+        interpolation_function : str
+            Specify the interpolation function to use, either "healpix_simple" or
+            "az_za_map_coordinates".
+        freq_interp_kind : str
+            Interpolation method to use frequency. See scipy.interpolate.interp1d
+            for details. Defaults to "cubic".
+        az_za_grid : bool
+            Option to treat the `az_array` and `za_array` as the input vectors
+            for points on a mesh grid.
+        healpix_nside : int, optional
+            HEALPix nside parameter if interpolating to HEALPix pixels.
+        healpix_inds : array_like of int, optional
+            HEALPix indices to interpolate to. Defaults to all indices in the
+            map if `healpix_nside` is set and `az_array` and `za_array` are None.
+        freq_array : array_like of floats, optional
+            Frequency values to interpolate to.
+        freq_interp_tol : float
+            Frequency distance tolerance [Hz] of nearest neighbors.
+            If *all* elements in freq_array have nearest neighbor distances within
+            the specified tolerance then return the beam at each nearest neighbor,
+            otherwise interpolate the beam.
+        spline_opts : dict
+            Options for `az_za_map_coordinates` interpolation, required for that
+            interpolation function and must be {"order": 1} (the plan only supports
+            linear interpolation).
+        check_azza_domain : bool
+            Whether to check the domain of az/za to ensure that they are covered by the
+            intrinsic data array.
+
+        Returns
+        -------
+        BeamInterpPlan
+            The interpolation plan.
+
+        """
+        if interpolation_function is None:
+            raise ValueError("interpolation_function must be set.")
+
+        (
+            interpolation_function,
+            interp_func,
+            freq_interp_kind,
+            az_array_use,
+            za_array_use,
+            healpix_inds,
+        ) = self._prepare_interp_inputs(
+            az_array=az_array,
+            za_array=za_array,
+            interpolation_function=interpolation_function,
+            freq_interp_kind=freq_interp_kind,
+            az_za_grid=az_za_grid,
+            healpix_nside=healpix_nside,
+            healpix_inds=healpix_inds,
+            freq_array=freq_array,
+            freq_interp_tol=freq_interp_tol,
+        )
+        if interp_func == "_interp_az_za_rect_spline":
+            raise ValueError(
+                "Interpolation plans are only supported for the healpix_simple and "
+                "az_za_map_coordinates interpolation functions."
+            )
+
+        if freq_array is None:
+            freq_interp_kind = None
+            freq_weights = None
+        else:
+            assert isinstance(freq_array, np.ndarray)
+            assert freq_array.ndim == 1
+            freq_weights = self._get_freq_interp_weights(
+                freq_array, kind=freq_interp_kind
+            )
+
+        if az_array_use is None or za_array_use is None:
+            pixel_weights = None
+        else:
+            pixel_weights = self._get_pixel_interp_weights(
+                interp_func=interp_func,
+                az_array=az_array_use,
+                za_array=za_array_use,
+                spline_opts=spline_opts,
+                check_azza_domain=check_azza_domain,
+            )
+
+        return BeamInterpPlan(
+            self,
+            interpolation_function=interpolation_function,
+            freq_interp_kind=freq_interp_kind,
+            freq_array=freq_array,
+            freq_weights=freq_weights,
+            az_array=az_array_use,
+            za_array=za_array_use,
+            pixel_weights=pixel_weights,
+        )
+
+    def _interp_with_plan(
+        self, interp_plan, *, polarizations, return_bandpass, return_coupling
+    ):
+        """
+        Interpolate the beam using an interpolation plan.
+
+        Parameters
+        ----------
+        interp_plan : BeamInterpPlan
+            The interpolation plan, see `make_interp_plan`.
+        polarizations : list of str
+            polarizations to interpolate if beam_type is 'power'.
+            Default is all polarizations in self.polarization_array.
+        return_bandpass : bool
+            Option to return the interpolated bandpass.
+        return_coupling : bool
+            Option to return the interpolated coupling matrix.
+
+        Returns
+        -------
+        tuple of array_like
+            The same arrays as returned by `interp`.
+
+        """
+        interp_plan._check_beam(self)
+
+        interp_data = self.data_array
+        if interp_plan._freq_weights is not None:
+            interp_data = interp_plan._interp_freq(interp_data, axis=2)
+            interp_bandpass = interp_plan._interp_freq(self.bandpass_array, axis=0)
+            if self.antenna_type == "phased_array":
+                interp_coupling_matrix = interp_plan._interp_freq(
+                    self.coupling_matrix, axis=-1
+                )
+        else:
+            interp_bandpass = self.bandpass_array[0]
+            if self.antenna_type == "phased_array":
+                interp_coupling_matrix = self.coupling_matrix
+
+        if interp_plan._pixel_weights is not None:
+            _, pol_inds = self._prepare_polarized_inputs(polarizations)
+            interp_data = interp_plan._interp_pixels(interp_data[:, pol_inds])
+            interp_basis_vector = self._prepare_basis_vector_array(
+                interp_plan.az_array.size
+            )
+        else:
+            interp_basis_vector = self.basis_vector_array
+
+        interp_arrays = [interp_data, interp_basis_vector]
+        if return_bandpass:
+            interp_arrays.append(interp_bandpass)
+        if return_coupling:
+            interp_arrays.append(interp_coupling_matrix)
+        return tuple(interp_arrays)
+
     def interp(
         self,
         *,
@@ -1966,6 +2573,7 @@ class UVBeam(UVBase):
         check_extra=True,
         run_check_acceptability=True,
         check_azza_domain: bool = True,
+        interp_plan=None,
     ):
         """
         Interpolate beam to given frequency, az & za locations or Healpix pixel centers.
@@ -2047,6 +2655,13 @@ class UVBeam(UVBase):
             intrinsic data array. Checking them can be quite computationally expensive.
             Conversely, if the passed az/za are outside of the domain, they will be
             silently extrapolated and the behavior is not well-defined.
+        interp_plan : BeamInterpPlan, optional
+            An interpolation plan made with `make_interp_plan` (on this object or
+            another object with the same pixels and frequencies), which defines the
+            locations, frequencies and interpolation functions. Using a plan avoids
+            recalculating the interpolation weights on every call. If this is set,
+            the parameters defined by the plan cannot be set and `new_object` must be
+            False.
 
         Returns
         -------
@@ -2071,20 +2686,6 @@ class UVBeam(UVBase):
             Shape: (Nelements, Nelements, Nfeeds, Nfeeds, freq_array.size)
 
         """
-        if interpolation_function is None:
-            if self.pixel_coordinate_system == "az_za":
-                interpolation_function = "az_za_simple"
-            elif self.pixel_coordinate_system == "healpix":
-                interpolation_function = "healpix_simple"
-            else:
-                raise ValueError(
-                    "There is no default interpolation function for objects with "
-                    f"pixel_coordinate_system: {self.pixel_coordinate_system}"
-                )
-
-        if freq_interp_kind is None:
-            freq_interp_kind = "cubic"
-
         if return_coupling is True and self.antenna_type != "phased_array":
             raise ValueError(
                 "return_coupling can only be set if antenna_type is phased_array"
@@ -2097,67 +2698,57 @@ class UVBeam(UVBase):
                 "for frequency only interpolation."
             )
 
-        allowed_interp_funcs = list(self.interpolation_function_dict.keys())
-        if interpolation_function not in allowed_interp_funcs:
-            raise ValueError(
-                "interpolation_function not recognized, must be one of "
-                f"{allowed_interp_funcs}"
-            )
-        interp_func_name = interpolation_function
-        interp_func = self.interpolation_function_dict[interpolation_function]["func"]
-
-        if freq_array is not None:
-            # get frequency distances
-            freq_dists = np.abs(self.freq_array - freq_array.reshape(-1, 1))
-            nearest_dist = np.min(freq_dists, axis=1)
-            interp_bool = np.any(nearest_dist >= freq_interp_tol)
-
-            # use the beam at nearest neighbors if not interp_bool
-            if not interp_bool:
-                freq_interp_kind = "nearest"
-
-        if az_za_grid:
-            if az_array is None or za_array is None:
-                raise ValueError(
-                    "If az_za_grid is set to True, az_array and za_array must be "
-                    "provided."
-                )
-            az_array_use, za_array_use = np.meshgrid(az_array, za_array)
-            az_array_use = az_array_use.flatten()
-            za_array_use = za_array_use.flatten()
-        else:
-            az_array_use = copy.copy(az_array)
-            za_array_use = copy.copy(za_array)
-
-        if healpix_nside is not None or healpix_inds is not None:
-            if healpix_nside is None:
-                raise ValueError("healpix_nside must be set if healpix_inds is set.")
-            if az_array is not None or za_array is not None:
+        if interp_plan is not None:
+            if (
+                az_array is not None
+                or za_array is not None
+                or az_za_grid
+                or healpix_nside is not None
+                or healpix_inds is not None
+                or freq_array is not None
+                or interpolation_function is not None
+                or freq_interp_kind is not None
+                or new_object
+            ):
                 raise ValueError(
-                    "healpix_nside and healpix_inds can not be "
-                    "set if az_array or za_array is set."
+                    "az_array, za_array, az_za_grid, healpix_nside, healpix_inds, "
+                    "freq_array, interpolation_function, freq_interp_kind and "
+                    "new_object cannot be set if interp_plan is set."
                 )
-            try:
-                from astropy_healpix import HEALPix
-            except ImportError as e:  # pragma: no cover
-                raise ImportError(
-                    "astropy_healpix is not installed but is "
-                    "required for healpix functionality. "
-                    "Install 'astropy-healpix' using conda or pip."
-                ) from e
-
-            hp_obj = HEALPix(nside=healpix_nside)
-            if healpix_inds is None:
-                healpix_inds = np.arange(hp_obj.npix)
-
-            hpx_lon, hpx_lat = hp_obj.healpix_to_lonlat(healpix_inds)
+            return self._interp_with_plan(
+                interp_plan,
+                polarizations=polarizations,
+                return_bandpass=return_bandpass,
+                return_coupling=return_coupling,
+            )
 
-            za_array_use = (Angle(np.pi / 2, units.radian) - hpx_lat).radian
-            az_array_use = hpx_lon.radian
+        (
+            interpolation_function,
+            interp_func,
+            freq_interp_kind,
+            az_array_use,
+            za_array_use,
+            healpix_inds,
+        ) = self._prepare_interp_inputs(
+            az_array=az_array,
+            za_array=za_array,
+            interpolation_function=interpolation_function,
+            freq_interp_kind=freq_interp_kind,
+            az_za_grid=az_za_grid,
+            healpix_nside=healpix_nside,
+            healpix_inds=healpix_inds,
+            freq_array=freq_array,
+            freq_interp_tol=freq_interp_tol,
+        )
+        interp_func_name = interpolation_function
 
         extra_keyword_dict = {}
         if interp_func == "_interp_az_za_rect_spline":
             extra_keyword_dict["reuse_spline"] = reuse_spline
+        if interp_func in [
+            "_interp_az_za_rect_spline",
+            "_interp_az_za_map_coordinates",
+        ]:
             extra_keyword_dict["spline_opts"] = spline_opts
             extra_keyword_dict["check_azza_domain"] = check_azza_domain
 
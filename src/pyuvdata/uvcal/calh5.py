@@ -319,6 +319,8 @@ class CalH5(UVCal):
         phase_center_ids,
         catalog_names,
         gain_array_dtype,
+        decompression_nworkers=1,
+        decompression_pool=None,
     ):
         """
         Read the data-size arrays (gain/delay arrays, flags, qualities) from a file.
@@ -420,16 +422,39 @@ class CalH5(UVCal):
             # no select, read in all the data
             inds = (np.s_[:], np.s_[:], np.s_[:], np.s_[:])
             if self.cal_type == "gain":
-                self.gain_array = hdf5_utils._index_dset(dgrp["gains"], inds)
+                self.gain_array = hdf5_utils._index_dset(
+                    dgrp["gains"],
+                    inds,
+                    nworkers=decompression_nworkers,
+                    pool=decompression_pool,
+                )
             else:
-                self.delay_array = hdf5_utils._index_dset(dgrp["delays"], inds)
-            self.flag_array = hdf5_utils._index_dset(dgrp["flags"], inds)
+                self.delay_array = hdf5_utils._index_dset(
+                    dgrp["delays"],
+                    inds,
+                    nworkers=decompression_nworkers,
+                    pool=decompression_pool,
+                )
+            self.flag_array = hdf5_utils._index_dset(
+                dgrp["flags"],
+                inds,
+                nworkers=decompression_nworkers,
+                pool=decompression_pool,
+            )
             if quality_present:
-                self.quality_array = hdf5_utils._index_dset(dgrp["qualities"], inds)
+                self.quality_array = hdf5_utils._index_dset(
+                    dgrp["qualities"],
+                    inds,
+                    nworkers=decompression_nworkers,
+                    pool=decompression_pool,
+                )
             if total_quality_present:
                 tq_inds = (np.s_[:], np.s_[:], np.s_[:])
                 self.total_quality_array = hdf5_utils._index_dset(
-                    dgrp["total_qualities"], tq_inds
+                    dgrp["total_qualities"],
+                    tq_inds,
+                    nworkers=decompression_nworkers,
+                    pool=decompression_pool,
                 )
         else:
             # do select operations on everything except data_array, flag_array
@@ -553,13 +578,33 @@ class CalH5(UVCal):
                 jones_frac = 1
 
             # index datasets
-            cal_data = hdf5_utils._index_dset(caldata_dset, inds)
-            flags = hdf5_utils._index_dset(flags_dset, inds)
+            cal_data = hdf5_utils._index_dset(
+                caldata_dset,
+                inds,
+                nworkers=decompression_nworkers,
+                pool=decompression_pool,
+            )
+            flags = hdf5_utils._index_dset(
+                flags_dset,
+                inds,
+                nworkers=decompression_nworkers,
+                pool=decompression_pool,
+            )
             if quality_present:
-                qualities = hdf5_utils._index_dset(qualities_dset, inds)
+                qualities = hdf5_utils._index_dset(
+                    qualities_dset,
+                    inds,
+                    nworkers=decompression_nworkers,
+                    pool=decompression_pool,
+                )
             if total_quality_present:
                 tq_inds = inds[1:]
-                total_qualities = hdf5_utils._index_dset(total_qualities_dset, tq_inds)
+                total_qualities = hdf5_utils._index_dset(
+                    total_qualities_dset,
+                    tq_inds,
+                    nworkers=decompression_nworkers,
+                    pool=decompression_pool,
+                )
             # down select on other dimensions if necessary
             # use indices not slices here: generally not the bottleneck
             if ant_frac < 1:
@@ -628,6 +673,7 @@ class CalH5(UVCal):
         catalog_names=None,
         read_data=True,
         gain_array_dtype=np.complex128,
+        decompression_nworkers=1,
         background_lsts=True,
         run_check=True,
         check_extra=True,
@@ -662,23 +708,29 @@ class CalH5(UVCal):
         )
 
         if read_data:
-            # Now read in the data
-            self._get_data(
-                meta.datagrp,
-                antenna_nums=antenna_nums,
-                antenna_names=antenna_names,
-                frequencies=frequencies,
-                freq_chans=freq_chans,
-                spws=spws,
-                times=times,
-                time_range=time_range,
-                lsts=lsts,
-                lst_range=lst_range,
-                jones=jones,
-                gain_array_dtype=gain_array_dtype,
-                phase_center_ids=phase_center_ids,
-                catalog_names=catalog_names,
-            )
+            # Now read in the data, sharing one pool of worker processes between
+            # the datasets if decompressing in parallel
+            with hdf5_utils._decompression_pool(
+                decompression_nworkers
+            ) as decompression_pool:
+                self._get_data(
+                    meta.datagrp,
+                    antenna_nums=antenna_nums,
+                    antenna_names=antenna_names,
+                    frequencies=frequencies,
+                    freq_chans=freq_chans,
+                    spws=spws,
+                    times=times,
+                    time_range=time_range,
+                    lsts=lsts,
+                    lst_range=lst_range,
+                    jones=jones,
+                    gain_array_dtype=gain_array_dtype,
+                    phase_center_ids=phase_center_ids,
+                    catalog_names=catalog_names,
+                    decompression_nworkers=decompression_nworkers,
+                    decompression_pool=decompression_pool,
+                )
 
         if close_meta:
             meta.close()
@@ -1519,6 +1519,7 @@ class UVCal(UVBase):
         if new_id is not None:
             self.phase_center_id_array[self.phase_center_id_array == cat_id] = new_id
             self.phase_center_catalog[new_id] = self.phase_center_catalog.pop(cat_id)
+            self._mark_changed("_phase_center_id_array")
 
     def _consolidate_phase_center_catalogs(
         self, *, reference_catalog=None, other=None, ignore_name=False
@@ -3289,6 +3290,13 @@ class UVCal(UVBase):
                 this.total_quality_array[np.ix_(freqs_t2o, times_t2o, jones_t2o)] = (
                     other.total_quality_array
                 )
+            this._mark_changed(
+                "_delay_array",
+                "_gain_array",
+                "_quality_array",
+                "_flag_array",
+                "_total_quality_array",
+            )
 
             # Fix ordering
             ant_axis_num = 0
@@ -4707,6 +4715,14 @@ class UVCal(UVBase):
             Read in the data-like arrays (gains/delays, flags, qualities). If set to
             False, only the metadata will be read in. Setting read_data to False
             results in a metadata only object.
+        decompression_nworkers : int
+            Number of worker processes to use to read and decompress the data-like
+            arrays. If greater than 1, each dataset read is split along chunk
+            boundaries on the antenna axis and the pieces are read concurrently by
+            separate processes (HDF5 calls cannot run concurrently from threads).
+            This helps for compressed files where reading is limited by
+            decompression rather than disk speed, it has no effect for uncompressed
+            (unchunked) datasets. Ignored if read_data is False.
         background_lsts : bool
             When set to True, the lst_array is calculated in a background thread.
         run_check : bool
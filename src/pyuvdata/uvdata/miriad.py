@@ -729,6 +729,8 @@ class Miriad(UVData):
         check_extra=True,
         run_check_acceptability=True,
         strict_uvw_antpos_check=False,
+        check_level="full",
+        only_changed=False,
         calc_lst=True,
         fix_old_proj=False,
         fix_use_ant_pos=True,
@@ -936,131 +938,57 @@ class Miriad(UVData):
         if n_selects > 0:
             self.history += history_update_string
 
-        data_accumulator = {}
-        pol_list = []
-        app_ra = None
-        app_dec = None
-        frame_pa = None
-        epoch = None
-        phase_frame = None
-        sou_dict = {}
-        Nphase = 0
         record_epoch = "epoch" in uv.vartable
         record_phase_frame = "phsframe" in uv.vartable
         record_app = ("obsra" in uv.vartable) and ("obsdec" in uv.vartable)
         record_pa = "obspa" in uv.vartable
 
-        # dra_list - Stubbing out for later
-        # ddec_list - Stubbing out for later
-        for (uvw, t, (i, j)), d, f in uv.all_data(raw=True):
-            # control for the case of only a single spw not showing up in
-            # the dimension
-            # Note that the (i, j) tuple is calculated from a baseline number in
-            # _miriad (see miriad_wrap.h). The i, j values are also adjusted by _miriad
-            # to start at 0 rather than 1.
-            # N.B. (Karto): So the below is right, but for the wrong reasons. The data
-            # array return is of length nchan, which encompasses the total number of
-            # channels in all spectral windows, where 'ischan' and 'nschan' demark the
-            # starting positions and length of the individual windows. I don't think
-            # this array should ever _not_ be 1D, but the below does cast the shape of
-            # the data array correctly so that the vestigial spw-axis is preserved. At
-            # some point, the below will need to be fixed -- I'm keeping this here so
-            # that I can skip reading through the MIRIAD programmers guide yet again.
-            if len(d.shape) == 1:
-                d.shape = (1,) + d.shape
-
-            if np.size(d) != self.Nfreqs:
-                raise ValueError("Number of channels in spectrum has changed!")
-            try:
-                cnt = uv["cnt"]
-            except KeyError:
-                cnt = np.ones(d.shape, dtype=np.float64)
-            ra = uv["ra"]
-            dec = uv["dec"]
-            if record_epoch:
-                epoch = uv["epoch"]
-            if record_phase_frame:
-                phase_frame = uv["phsframe"]
-            else:
-                phase_frame = None
-            if record_app:
-                app_ra = uv["obsra"]
-                app_dec = uv["obsdec"]
-            if record_pa:
-                frame_pa = uv["obspa"]
-            # LST is pulled from the file here, atlhough as some PAPER/early HERA
-            # data calculated LST from pyephem (which is inconsistent w/ astropy
-            # to the order of ~5 seconds), these values can be recalculated by
-            # setting `calc_lst=True` when calling read_miriad.
-            lst = uv["lst"]
-            inttime = uv["inttime"]
-            try:
-                sou_id = sou_dict[uv["source"]]
-            except KeyError:
-                sou_dict[uv["source"]] = Nphase
-                sou_id = Nphase
-                Nphase += 1
-
-            try:
-                # TODO: Gotta clean this up at some point - there are going to be
-                # addition things to stick into the metadata accumulator, and accessing
-                # those values by index number will likely make it more difficult to
-                # maintain/expand the code in the future.
-                data_accumulator[uv["pol"]].append(
-                    [
-                        uvw,  # Entry 0
-                        t,  # Entry 1
-                        i,  # Entry 2
-                        j,  # Entry 3
-                        d,  # Entry 4
-                        f,  # Entry 5
-                        cnt,  # Entry 6
-                        ra,  # Entry 7
-                        dec,  # Entry 8
-                        inttime,  # Entry 9
-                        sou_id,  # Entry 10
-                        epoch,  # Entry 11
-                        app_ra,  # Entry 12
-                        app_dec,  # Entry 13
-                        frame_pa,  # Entry 14
-                        lst,  # Entry 15
-                        phase_frame,  # Entry 16
-                    ]
-                )
-            except KeyError:
-                data_accumulator[uv["pol"]] = [
-                    [
-                        uvw,  # Entry 0
-                        t,  # Entry 1
-                        i,  # Entry 2
-                        j,  # Entry 3
-                        d,  # Entry 4
-                        f,  # Entry 5
-                        cnt,  # Entry 6
-                        ra,  # Entry 7
-                        dec,  # Entry 8
-                        inttime,  # Entry 9
-                        sou_id,  # Entry 10
-                        epoch,  # Entry 11
-                        app_ra,  # Entry 12
-                        app_dec,  # Entry 13
-                        frame_pa,  # Entry 14
-                        lst,  # Entry 15
-                        phase_frame,  # Entry 16
-                    ]
-                ]
-                pol_list.append(uv["pol"])
-                # NB: flag types in miriad are usually ints
+        if uv.nchan != self.Nfreqs:
+            raise ValueError("Number of channels in spectrum has changed!")
+
+        # Read all of the records (respecting any selections made above) in one go.
+        # LST is pulled from the file here, atlhough as some PAPER/early HERA data
+        # calculated LST from pyephem (which is inconsistent w/ astropy to the order
+        # of ~5 seconds), these values can be recalculated by setting
+        # `calc_lst=True` when calling read_miriad.
+        record_vars = ["pol", "cnt", "ra", "dec", "lst", "inttime", "source"]
+        record_vars += ["epoch"] * record_epoch + ["phsframe"] * record_phase_frame
+        record_vars += ["obsra", "obsdec"] * record_app + ["obspa"] * record_pa
+        preamble, vis_data, vis_flags, rec_vars = uv.bulk_read(
+            uv.nchan,
+            {name: uv.vartable[name] for name in record_vars if name in uv.vartable},
+        )
 
-        if len(list(data_accumulator.keys())) == 0:
+        if preamble.shape[0] == 0:
             raise ValueError(
                 "No data is present, probably as a result of "
                 "select on read that excludes all the data"
             )
-
-        for pol, data in data_accumulator.items():
-            # make array "object" dtype because underlying array may be ragged
-            data_accumulator[pol] = np.array(data, dtype="object")
+        nrecs = preamble.shape[0]
+
+        # Note that the (i, j) antenna numbers are calculated from the baseline
+        # number following the conventions in _miriad (see miriad_wrap.h), which
+        # adjusts them to start at 0 rather than 1.
+        bl_rec = preamble[:, 4].astype(int)
+        big_bl = bl_rec > 65536
+        ant_i_rec = np.where(big_bl, (bl_rec - 65536) // 2048, bl_rec >> 8) - 1
+        ant_j_rec = np.where(big_bl, (bl_rec - 65536) % 2048, bl_rec & 255) - 1
+        t_rec = preamble[:, 3]
+        int_rec = rec_vars["inttime"]
+        pol_rec = rec_vars["pol"].astype(int)
+
+        # keep the polarizations in the order they first appear in the file
+        _, pol_first = np.unique(pol_rec, return_index=True)
+        pol_list = pol_rec[np.sort(pol_first)].tolist()
+
+        # likewise, source IDs are assigned in the order they appear in the file
+        sou_names, sou_first, sou_id_rec = np.unique(
+            rec_vars["source"], return_index=True, return_inverse=True
+        )
+        sou_order = np.argsort(sou_first)
+        sou_dict = {sou_names[idx]: sou_id for sou_id, idx in enumerate(sou_order)}
+        sou_id_rec = np.argsort(sou_order)[sou_id_rec.ravel()]
+        Nphase = len(sou_dict)
 
         self.polarization_array = np.array(pol_list)
         if polarizations is None and len(self.polarization_array) != self.Npols:
@@ -1072,54 +1000,26 @@ class Miriad(UVData):
             )
         self.Npols = len(pol_list)
 
-        # makes a data_array (and flag_array) of zeroes to be filled in by
-        #   data values
-        # any missing data will have zeros
-
-        # use set to get the unique list of all times ever listed in the file
-        # iterate over polarizations and all spectra (bls and times) in two
-        # nested loops, then flatten into a single vector, then set
-        # then list again.
-
-        times = list(
-            set(np.concatenate([[k[1] for k in d] for d in data_accumulator.values()]))
-        )
-        times = np.sort(times)
-
-        ant_i_unique = list(
-            set(np.concatenate([[k[2] for k in d] for d in data_accumulator.values()]))
-        )
-        ant_j_unique = list(
-            set(np.concatenate([[k[3] for k in d] for d in data_accumulator.values()]))
-        )
-
-        sorted_unique_ants = sorted(set(ant_i_unique + ant_j_unique))
-        ant_i_unique = np.array(ant_i_unique)
-        ant_j_unique = np.array(ant_j_unique)
+        # figure out the unique times and baselines
+        times = np.unique(t_rec)
+        sorted_unique_ants = np.unique(np.concatenate((ant_i_rec, ant_j_rec))).tolist()
 
-        # Determine maximum digits needed to distinguish different values
-        if sorted_unique_ants[-1] > 0:
-            ndig_ant = np.ceil(np.log10(sorted_unique_ants[-1])).astype(int) + 1
-        else:
-            ndig_ant = 1
-        # Be excessive in precision because we use the floating point values as
-        # dictionary keys later
+        # Round the times to a (more than excessive) precision so that floating
+        # point noise does not create spurious extra blts.
         prec_t = -2 * np.floor(np.log10(self._time_array.tols[-1])).astype(int)
-        ndig_t = np.ceil(np.log10(times[-1])).astype(int) + prec_t + 2
-        blts = []
-        for d in data_accumulator.values():
-            for k in d:
-                blt = [
-                    "{1:.{0}f}".format(prec_t, k[1]).zfill(ndig_t),
-                    str(k[2]).zfill(ndig_ant),
-                    str(k[3]).zfill(ndig_ant),
-                    str(k[9]).zfill(ndig_t),
-                ]
-                blt = "_".join(blt)
-                blts.append(blt)
-        unique_blts = np.unique(np.array(blts))
-
-        reverse_inds = dict(zip(unique_blts, range(len(unique_blts)), strict=True))
+        t_rounded = np.array([float(f"{t:.{prec_t}f}") for t in times])
+        t_rec_rounded = t_rounded[np.searchsorted(times, t_rec)]
+
+        # A blt is a unique combination of time, antenna pair and integration time,
+        # sorted in that order.
+        tij_grid, blt_inds = np.unique(
+            np.stack((t_rec_rounded, ant_i_rec, ant_j_rec, int_rec), axis=1),
+            axis=0,
+            return_inverse=True,
+        )
+        blt_inds = blt_inds.ravel()
+        pol_sort = np.argsort(self.polarization_array)
+        pol_inds = pol_sort[np.searchsorted(self.polarization_array[pol_sort], pol_rec)]
         self.Nants_data = len(sorted_unique_ants)
 
         # load antennas and antenna positions using sorted unique ants list
@@ -1127,7 +1027,6 @@ class Miriad(UVData):
 
         # form up a grid which indexes time and baselines along the 'long'
         # axis of the visdata array
-        tij_grid = np.array([list(map(float, x.split("_"))) for x in unique_blts])
         t_grid, ant_i_grid, ant_j_grid, int_grid = tij_grid.T
         # set the data sizes
         if (
@@ -1208,126 +1107,71 @@ class Miriad(UVData):
             )
         self.nsample_array = np.ones(self.data_array.shape, dtype=np.float64)
 
-        # Temporary arrays to hold polarization axis, which will be collapsed
-        ra_pol_list = np.zeros((self.Nblts, self.Npols))
-        dec_pol_list = np.zeros((self.Nblts, self.Npols))
-        uvw_pol_list = np.zeros((self.Nblts, 3, self.Npols))
-        sou_id_pol_list = np.zeros((self.Nblts, self.Npols), dtype=int)
-        epoch_pol_list = np.zeros((self.Nblts, self.Npols))
-        phase_frame_pol_list = np.zeros((self.Nblts, self.Npols), dtype=object)
-        app_ra_pol_list = np.zeros((self.Nblts, self.Npols))
-        app_dec_pol_list = np.zeros((self.Nblts, self.Npols))
-        frame_pa_pol_list = np.zeros((self.Nblts, self.Npols))
-        lst_pol_list = np.zeros((self.Nblts, self.Npols))
+        self.data_array[blt_inds, :, pol_inds] = vis_data
+        self.flag_array[blt_inds, :, pol_inds] = vis_flags
+        if "cnt" in rec_vars:
+            self.nsample_array[blt_inds, :, pol_inds] = rec_vars["cnt"].reshape(
+                nrecs, -1
+            )
+
+        # because there are uvws/ra/dec for each pol, and one pol may not have that
+        # visibility, we collapse along the polarization axis but avoid any missing
+        # visbilities. Use the first good pol for each blt (or the first pol if
+        # there are no good pols), and check that the others agree with it.
+        good_pols = ~np.all(self.flag_array, axis=1)
+        first_good = np.argmax(good_pols, axis=1)
+        blt_range = np.arange(self.Nblts)
 
         c_ns = const.c.to_value("m/ns")
-        for pol, data in data_accumulator.items():
-            pol_ind = self._pol_to_ind(pol)
-            for d in data:
-                blt = [
-                    "{1:.{0}f}".format(prec_t, d[1]).zfill(ndig_t),
-                    str(d[2]).zfill(ndig_ant),
-                    str(d[3]).zfill(ndig_ant),
-                    str(d[9]).zfill(ndig_t),
-                ]
-                blt = "_".join(blt)
-                blt_index = reverse_inds[blt]
-
-                self.data_array[blt_index, :, pol_ind] = d[4]
-                self.flag_array[blt_index, :, pol_ind] = d[5]
-                self.nsample_array[blt_index, :, pol_ind] = d[6]
-                # because there are uvws/ra/dec for each pol, and one pol may not
-                # have that visibility, we collapse along the polarization
-                # axis but avoid any missing visbilities
-                uvw = d[0] * c_ns
-                uvw.shape = (1, 3)
-                uvw_pol_list[blt_index, :, pol_ind] = uvw
-                ra_pol_list[blt_index, pol_ind] = d[7]
-                dec_pol_list[blt_index, pol_ind] = d[8]
-                sou_id_pol_list[blt_index, pol_ind] = d[10]
-                epoch_pol_list[blt_index, pol_ind] = d[11]
-                app_ra_pol_list[blt_index, pol_ind] = d[12]
-                app_dec_pol_list[blt_index, pol_ind] = d[13]
-                frame_pa_pol_list[blt_index, pol_ind] = d[14]
-                lst_pol_list[blt_index, pol_ind] = d[15]
-                phase_frame_pol_list[blt_index, pol_ind] = d[16]
-
-        # Collapse pol axis for ra_list, dec_list, and uvw_list
-        ra_list = np.zeros(self.Nblts)
-        dec_list = np.zeros(self.Nblts)
-        sou_id_list = np.zeros(self.Nblts, dtype=int)
-        epoch_list = np.zeros(self.Nblts)
-        phase_frame_list = np.zeros(self.Nblts, dtype=object)
-        app_ra_list = np.zeros(self.Nblts)
-        app_dec_list = np.zeros(self.Nblts)
-        frame_pa_list = np.zeros(self.Nblts)
-        lst_list = np.zeros(self.Nblts)
-
-        for blt_index in range(self.Nblts):
-            test = ~np.all(self.flag_array[blt_index, :, :], axis=0)
-            good_pol = np.where(test)[0]
-            if len(good_pol) == 0:
-                # No good pols for this blt. Fill with first one.
-                good_pol = np.array([0])
-            if len(good_pol) == 1:
-                # Only one good pol, use it
-                good_pol = good_pol[0]
-                self.uvw_array[blt_index, :] = uvw_pol_list[blt_index, :, good_pol]
-                ra_list[blt_index] = ra_pol_list[blt_index, good_pol]
-                dec_list[blt_index] = dec_pol_list[blt_index, good_pol]
-                sou_id_list[blt_index] = sou_id_pol_list[blt_index, good_pol]
-                epoch_list[blt_index] = epoch_pol_list[blt_index, good_pol]
-                phase_frame_list[blt_index] = phase_frame_pol_list[blt_index, good_pol]
-                app_ra_list[blt_index] = app_ra_pol_list[blt_index, good_pol]
-                app_dec_list[blt_index] = app_dec_pol_list[blt_index, good_pol]
-                frame_pa_list[blt_index] = frame_pa_pol_list[blt_index, good_pol]
-                lst_list[blt_index] = lst_pol_list[blt_index, good_pol]
-            else:
-                # Multiple good pols, check for consistency. pyuvdata does not
-                # support pol-dependent uvw, ra, or dec.
-                if np.any(np.diff(uvw_pol_list[blt_index, :, good_pol], axis=0)):
-                    raise ValueError("uvw values are different by polarization.")
-                else:
-                    self.uvw_array[blt_index, :] = uvw_pol_list[
-                        blt_index, :, good_pol[0]
-                    ]
+        uvw_pol_arr = np.zeros((self.Nblts, 3, self.Npols))
+        uvw_pol_arr[blt_inds, :, pol_inds] = preamble[:, :3] * c_ns
+        self.uvw_array = uvw_pol_arr[blt_range, :, first_good]
+        if np.any(
+            good_pols[:, np.newaxis] & (uvw_pol_arr != self.uvw_array[:, :, np.newaxis])
+        ):
+            raise ValueError("uvw values are different by polarization.")
+
+        # Values for the variables that were not recorded end up as NaN (or None
+        # for phsframe).
+        rec_vars["source id"] = sou_id_rec
+        if not record_epoch:
+            rec_vars["epoch"] = np.full(nrecs, np.nan)
+        if not record_phase_frame:
+            rec_vars["phsframe"] = np.full(nrecs, None, dtype=object)
+        if not record_app:
+            rec_vars["obsra"] = rec_vars["obsdec"] = np.full(nrecs, np.nan)
+        if not record_pa:
+            rec_vars["obspa"] = np.full(nrecs, np.nan)
+
+        check_names = ["ra", "dec", "source id", "lst"]
+        check_names += ["epoch"] * record_epoch + ["phsframe"] * record_phase_frame
+        check_names += ["obsra", "obsdec"] * record_app + ["obspa"] * record_pa
+        collapsed = {}
+        all_names = ["ra", "dec", "source id", "lst", "epoch", "phsframe"]
+        all_names += ["obsra", "obsdec", "obspa"]
+        for name in all_names:
+            dtype = {"source id": int, "phsframe": object}.get(name, float)
+            pol_arr = np.zeros((self.Nblts, self.Npols), dtype=dtype)
+            pol_arr[blt_inds, pol_inds] = rec_vars[name]
+            collapsed[name] = pol_arr[blt_range, first_good]
+            # Multiple good pols, check for consistency. pyuvdata does not
+            # support pol-dependent uvw, ra, or dec.
+            if name in check_names and np.any(
+                good_pols & (pol_arr != collapsed[name][:, np.newaxis])
+            ):
+                raise ValueError(
+                    f"{name} values are different by polarization." + reporting_request
+                )
 
-                check_list = [ra_pol_list, dec_pol_list, sou_id_pol_list, lst_pol_list]
-                assign_list = [ra_list, dec_list, sou_id_list, lst_list]
-                check_names = ["ra", "dec", "source id", "lst"]
-                if record_epoch:
-                    check_list.append(epoch_pol_list)
-                    assign_list.append(epoch_list)
-                    check_names.append("epoch")
-                if record_phase_frame:
-                    check_list.append(phase_frame_pol_list)
-                    assign_list.append(phase_frame_list)
-                    check_names.append("phsframe")
-                if record_app:
-                    check_list.extend([app_ra_pol_list, app_dec_pol_list])
-                    assign_list.extend([app_ra_list, app_dec_list])
-                    check_names.extend(["obsra", "obsdec"])
-                if record_pa:
-                    check_list.append(frame_pa_pol_list)
-                    assign_list.append(frame_pa_list)
-                    check_names.append("obspa")
-
-                for item, name in zip(check_list, check_names, strict=True):
-                    if name == "phsframe":
-                        arr = item[blt_index, good_pol]
-                        if np.any(arr != arr[0]):
-                            raise ValueError(
-                                f"{name} values are different by polarization."
-                                + reporting_request
-                            )
-                    else:
-                        if np.any(np.diff(item[blt_index, good_pol])):
-                            raise ValueError(
-                                f"{name} values are different by polarization."
-                                + reporting_request
-                            )
-                for item, target in zip(check_list, assign_list, strict=True):
-                    target[blt_index] = item[blt_index, good_pol[0]]
+        ra_list = collapsed["ra"]
+        dec_list = collapsed["dec"]
+        sou_id_list = collapsed["source id"]
+        lst_list = collapsed["lst"]
+        epoch_list = collapsed["epoch"]
+        phase_frame_list = collapsed["phsframe"]
+        app_ra_list = collapsed["obsra"]
+        app_dec_list = collapsed["obsdec"]
+        frame_pa_list = collapsed["obspa"]
 
         # get unflagged blts
         # If we have a 1-baseline, single integration data set, set single_ra and
@@ -1579,6 +1423,8 @@ class Miriad(UVData):
                 check_extra=check_extra,
                 run_check_acceptability=run_check_acceptability,
                 strict_uvw_antpos_check=strict_uvw_antpos_check,
+                check_level=check_level,
+                only_changed=only_changed,
                 allow_flip_conj=True,
                 check_autos=check_autos,
                 fix_autos=fix_autos,
@@ -1985,8 +1831,6 @@ class Miriad(UVData):
             ephem_interp = False
             ra_interp_func = {}
             dec_interp_func = {}
-            ra_use = {}
-            dec_use = {}
             for cat_id in self.phase_center_catalog:
                 if self.phase_center_catalog[cat_id]["cat_type"] != "ephem":
                     continue
@@ -2011,113 +1855,119 @@ class Miriad(UVData):
                     self.phase_center_catalog[cat_id]["cat_lat"][unique_inds],
                     kind=interp_kind,
                 )
-        for viscnt in range(self.data_array.shape[0]):
-            uvw = (self.uvw_array[viscnt] / c_ns).astype(np.double)
-            this_t = miriad_time_array[viscnt]
-            this_i = self.ant_1_array[viscnt]
-            this_j = self.ant_2_array[viscnt]
-
-            uv["lst"] = miriad_lsts[viscnt].astype(np.double)
-            uv["inttime"] = self.integration_time[viscnt].astype(np.float32)
-
-            cat_id = self.phase_center_id_array[viscnt]
-            uv["source"] = self.phase_center_catalog[cat_id]["cat_name"]
-            cat_type = self.phase_center_catalog[cat_id]["cat_type"]
+        # Build up the values of the variables that can change with every blt.
+        # Values that are not marked to be written keep their previous value.
+        nblts = self.data_array.shape[0]
+        ra_arr = np.zeros(nblts)
+        dec_arr = np.zeros(nblts)
+        epoch_arr = np.zeros(nblts)
+        write_epoch = np.ones(nblts, dtype=bool)
+        source_arr = np.empty(nblts, dtype=object)
+        phsframe_arr = np.empty(nblts, dtype=object)
+        for cat_id, cat_dict in self.phase_center_catalog.items():
+            cat_mask = self.phase_center_id_array == cat_id
+            if not np.any(cat_mask):
+                continue
+            source_arr[cat_mask] = cat_dict["cat_name"]
+            cat_type = cat_dict["cat_type"]
             if cat_type == "unprojected":
-                uv["ra"] = self.phase_center_app_ra[viscnt]
-                uv["dec"] = self.phase_center_app_dec[viscnt]
-                uv["phsframe"] = "unprojected"
+                ra_arr[cat_mask] = self.phase_center_app_ra[cat_mask]
+                dec_arr[cat_mask] = self.phase_center_app_dec[cat_mask]
+                write_epoch[cat_mask] = False
+                phsframe_arr[cat_mask] = "unprojected"
+                continue
             elif cat_type == "sidereal":
-                uv["ra"] = self.phase_center_catalog[cat_id]["cat_lon"]
-                uv["dec"] = self.phase_center_catalog[cat_id]["cat_lat"]
-                uv["epoch"] = self.phase_center_catalog[cat_id]["cat_epoch"]
-                uv["phsframe"] = self.phase_center_catalog[cat_id]["cat_frame"]
+                ra_arr[cat_mask] = cat_dict["cat_lon"]
+                dec_arr[cat_mask] = cat_dict["cat_lat"]
             elif cat_type == "ephem":
-                if self.phase_center_catalog[cat_id]["cat_times"].size == 1:
+                if cat_dict["cat_times"].size == 1:
                     ephem_interp = True
                     # if there's only one time, just use the values
-                    uv["ra"] = self.phase_center_catalog[cat_id]["cat_lon"]
-                    uv["dec"] = self.phase_center_catalog[cat_id]["cat_lat"]
+                    ra_arr[cat_mask] = cat_dict["cat_lon"]
+                    dec_arr[cat_mask] = cat_dict["cat_lat"]
                 else:
                     # there are multiple times. find closest time. Use the
                     # integration center time NOT the miriad time
-                    t_use = self.time_array[viscnt]
-
-                    if cat_id in ra_use and t_use in ra_use[cat_id]:
-                        # already calculated the ra/dec to use for this cat_id & time
-                        uv["ra"] = ra_use[cat_id][t_use]
-                        uv["dec"] = dec_use[cat_id][t_use]
-                    else:
-                        if cat_id not in ra_use:
-                            ra_use[cat_id] = {}
-                            dec_use[cat_id] = {}
-                        t_diffs = np.abs(
-                            self.phase_center_catalog[cat_id]["cat_times"] - t_use
-                        )
+                    for t_use in np.unique(self.time_array[cat_mask]):
+                        t_mask = cat_mask & (self.time_array == t_use)
+                        t_diffs = np.abs(cat_dict["cat_times"] - t_use)
                         t_min_loc = np.argmin(t_diffs)
                         tols = self._time_array.tols
                         if np.isclose(
                             0, t_diffs[t_min_loc], rtol=tols[0], atol=tols[1]
                         ):
-                            ra_use[cat_id][t_use] = self.phase_center_catalog[cat_id][
-                                "cat_lon"
-                            ][t_min_loc]
-                            dec_use[cat_id][t_use] = self.phase_center_catalog[cat_id][
-                                "cat_lat"
-                            ][t_min_loc]
-
-                            uv["ra"] = ra_use[cat_id][t_use]
-                            uv["dec"] = dec_use[cat_id][t_use]
+                            ra_arr[t_mask] = cat_dict["cat_lon"][t_min_loc]
+                            dec_arr[t_mask] = cat_dict["cat_lat"][t_min_loc]
                         else:
                             ephem_interp = True
                             try:
-                                ra_use[cat_id][t_use] = np.asarray(
-                                    [ra_interp_func[cat_id](t_use)]
-                                )
-                                dec_use[cat_id][t_use] = np.asarray(
-                                    [dec_interp_func[cat_id](t_use)]
-                                )
+                                ra_arr[t_mask] = ra_interp_func[cat_id](t_use)
+                                dec_arr[t_mask] = dec_interp_func[cat_id](t_use)
                             except ValueError:
                                 # If t_use would require extrapolation, use the closest
                                 # time
-                                ra_use[cat_id][t_use] = self.phase_center_catalog[
-                                    cat_id
-                                ]["cat_lon"][t_min_loc]
-                                dec_use[cat_id][t_use] = self.phase_center_catalog[
-                                    cat_id
-                                ]["cat_lat"][t_min_loc]
-                            uv["ra"] = ra_use[cat_id][t_use]
-                            uv["dec"] = dec_use[cat_id][t_use]
-                uv["epoch"] = self.phase_center_catalog[cat_id]["cat_epoch"]
-                uv["phsframe"] = self.phase_center_catalog[cat_id]["cat_frame"]
+                                ra_arr[t_mask] = cat_dict["cat_lon"][t_min_loc]
+                                dec_arr[t_mask] = cat_dict["cat_lat"][t_min_loc]
             else:
                 # This is a driftscan, use driftscan_coords to set ra/dec
-                t_ind = np.nonzero(
-                    driftscan_coords[cat_id]["times"] == self.time_array[viscnt]
-                )[0]
-                uv["ra"] = driftscan_coords[cat_id]["coord"][t_ind].ra.rad
-                uv["dec"] = driftscan_coords[cat_id]["coord"][t_ind].dec.rad
-                uv["epoch"] = driftscan_coords[cat_id]["coord"].equinox.jyear
-                uv["phsframe"] = driftscan_coords[cat_id]["coord"].frame.name
-
-            uv["obspa"] = self.phase_center_frame_pa[viscnt]
-            uv["obsra"] = self.phase_center_app_ra[viscnt]
-            uv["obsdec"] = self.phase_center_app_dec[viscnt]
-
-            for polcnt, pol in enumerate(self.polarization_array):
-                uv["pol"] = pol.astype(np.int64)
-                uv["cnt"] = self.nsample_array[viscnt, :, polcnt].astype(np.double)
-                data = self.data_array[viscnt, :, polcnt]
-                flags = self.flag_array[viscnt, :, polcnt]
-                # Using an assert here because it should be guaranteed by an earlier
-                # method call.
-                assert this_j >= this_i, (
-                    "Miriad requires ant1<ant2 which should be "
-                    "guaranteed by prior conjugate_bls call"
-                )
-                preamble = (uvw, this_t, (this_i, this_j))
+                coords = driftscan_coords[cat_id]["coord"]
+                for t_ind, t_use in enumerate(driftscan_coords[cat_id]["times"]):
+                    t_mask = cat_mask & (self.time_array == t_use)
+                    ra_arr[t_mask] = coords[t_ind].ra.rad
+                    dec_arr[t_mask] = coords[t_ind].dec.rad
+                epoch_arr[cat_mask] = coords.equinox.jyear
+                phsframe_arr[cat_mask] = coords.frame.name
+                continue
+            epoch_arr[cat_mask] = cat_dict["cat_epoch"]
+            phsframe_arr[cat_mask] = cat_dict["cat_frame"]
+
+        # Using an assert here because it should be guaranteed by an earlier
+        # method call.
+        assert np.all(self.ant_2_array >= self.ant_1_array), (
+            "Miriad requires ant1<ant2 which should be "
+            "guaranteed by prior conjugate_bls call"
+        )
+        # The preamble is u, v, w (in ns), time and baseline number (following the
+        # conventions in _miriad, see miriad_wrap.h, which has antennas starting at 1)
+        ant_i = self.ant_1_array + 1
+        ant_j = self.ant_2_array + 1
+        preamble = np.zeros((nblts, 5), dtype=np.float64)
+        preamble[:, :3] = self.uvw_array / c_ns
+        preamble[:, 3] = miriad_time_array
+        preamble[:, 4] = np.where(
+            (ant_i < 256) & (ant_j < 256),
+            (ant_i << 8) | ant_j,
+            ant_i * 2048 + ant_j + 65536,
+        )
 
-                uv.write(preamble, data, flags)
+        write_all = np.ones(nblts, dtype=bool)
+        variables = {
+            "lst": miriad_lsts,
+            "inttime": self.integration_time,
+            "source": source_arr,
+            "ra": ra_arr,
+            "dec": dec_arr,
+            "epoch": epoch_arr,
+            "phsframe": phsframe_arr,
+            "obspa": self.phase_center_frame_pa,
+            "obsra": self.phase_center_app_ra,
+            "obsdec": self.phase_center_app_dec,
+        }
+        uv.bulk_write(
+            preamble,
+            self.data_array,
+            self.flag_array,
+            self.nsample_array.astype(np.float64, copy=False),
+            self.polarization_array.astype(np.intc),
+            {
+                name: (
+                    uv.vartable[name],
+                    vals,
+                    write_epoch if name == "epoch" else write_all,
+                )
+                for name, vals in variables.items()
+            },
+        )
 
         if any_ephem and ephem_interp:
             warnings.warn(
@@ -34,6 +34,46 @@ except ImportError as error:  # pragma: no cover
     casa_error = error
 
 
+def _get_ms_col(tb, column, *, chans, corrs, nchan, ncorr, chan_axis=True):
+    """
+    Read the selected channels and correlations of a column from a MS table.
+
+    Only the bounding box of the selection is read from disk (via getcolslice), which
+    is then trimmed down to the actual selection in memory.
+
+    Parameters
+    ----------
+    tb : casacore table
+        The table (or reference table) to read from.
+    column : str
+        Name of the column to read.
+    chans : ndarray of int
+        Sorted indices of the channels to read.
+    corrs : ndarray of int
+        Sorted indices of the correlations to read.
+    nchan : int
+        Number of channels in the column.
+    ncorr : int
+        Number of correlations in the column.
+    chan_axis : bool
+        Whether the column has a channel axis, default is True. Set to False for
+        per-row columns like WEIGHT, which only have a correlation axis.
+
+    Returns
+    -------
+    ndarray
+        The column values, of shape (Nrows, len(chans), len(corrs)), or
+        (Nrows, len(corrs)) for columns without a channel axis.
+    """
+    if len(chans) == nchan and len(corrs) == ncorr:
+        return tb.getcol(column)
+    if not chan_axis:
+        col = tb.getcolslice(column, [corrs[0]], [corrs[-1]])
+        return col[:, corrs - corrs[0]]
+    col = tb.getcolslice(column, [chans[0], corrs[0]], [chans[-1], corrs[-1]])
+    return col[:, chans - chans[0]][:, :, corrs - corrs[0]]
+
+
 class MS(UVData):
     """
     Defines a class for reading and writing casa measurement sets.
@@ -381,13 +421,12 @@ class MS(UVData):
         *,
         data_column,
         data_desc_dict,
-        read_weights=True,
         flip_conj=False,
         raise_error=True,
         allow_flex_pol=False,
     ):
         """
-        Read data from the main table of a MS file.
+        Read metadata from the main table of a MS file.
 
         This method is not meant to be called by users, and is instead a utility
         function for the `read_ms` method (which users should call instead).
@@ -404,9 +443,6 @@ class MS(UVData):
             an MS file. Keys match to the individual rows, and the values are themselves
             dicts containing several keys (including "CORR_TYPE", "SPW_ID", "NUM_CORR",
             "NUM_CHAN").
-        read_weights : bool
-            Read in the weights from the MS file, default is True. If false, the method
-            will set the `nsamples_array` to the same uniform value (namely 1.0).
         flip_conj : bool
             On read, whether to flip the conjugation of the baselines. Normally the MS
             format is the same as what is used for pyuvdata (ant2 - ant1), hence the
@@ -439,6 +475,12 @@ class MS(UVData):
             read (differing window-to-window), list of the polarization IDs present
             for each window. Equivalent to the attribute `flex_spw_polarization_array`
             in a UVData object.
+        data_desc_info : dict
+            Dictionary describing where the records for each data description are
+            found in the main table (under "ROWS") and where they land in the
+            data-like arrays (under "BLT_IDX", "STARTCHAN", "STOPCHAN" and "POL_IDX"),
+            for use with `_read_ms_data`. If "ROWS" is None, then there is only one
+            data description, whose rows map one-to-one onto baseline-times.
 
         Raises
         ------
@@ -507,7 +549,7 @@ class MS(UVData):
 
         if data_desc_count == 0:
             # If there are no records selected, then there isn't a whole lot to do
-            return None, None, None, None
+            return None, None, None, None, None
         elif data_desc_count == 1:
             # If we only have a single spectral window, then we can bypass a whole lot
             # of slicing and dicing on account of there being a one-to-one relationship
@@ -522,25 +564,6 @@ class MS(UVData):
             self.phase_center_id_array = field_arr
             self.scan_number_array = scan_number_arr
 
-            self.flag_array = tb_main.getcol("FLAG")
-
-            if flip_conj:
-                self.data_array = np.conj(tb_main.getcol(data_column))
-            else:
-                self.data_array = tb_main.getcol(data_column)
-
-            if read_weights:
-                try:
-                    self.nsample_array = tb_main.getcol("WEIGHT_SPECTRUM")
-                except RuntimeError:
-                    self.nsample_array = np.repeat(
-                        np.expand_dims(tb_main.getcol("WEIGHT"), axis=1),
-                        self.data_array.shape[1],
-                        axis=1,
-                    )
-            else:
-                self.nsample_array = np.ones_like(self.data_array, dtype=float)
-
             data_desc_key = np.intersect1d(
                 unique_data_desc, list(data_desc_dict.keys())
             )[0]
@@ -555,8 +578,18 @@ class MS(UVData):
                 for key in data_desc_dict[data_desc_key]["CORR_TYPE"]
             ]
 
+            # Rows map one-to-one onto blts here, which is flagged by ROWS=None.
+            data_desc_info = {
+                data_desc_key: {
+                    "ROWS": None,
+                    "STARTCHAN": 0,
+                    "STOPCHAN": data_desc_dict[data_desc_key]["NUM_CHAN"],
+                    "POL_IDX": np.arange(len(pol_list)),
+                }
+            }
+
             tb_main.close()
-            return spw_list, field_list, pol_list, None
+            return spw_list, field_list, pol_list, None, data_desc_info
 
         tb_main.close()
 
@@ -574,6 +607,7 @@ class MS(UVData):
 
             use_row[sel_mask] = True
             data_dict[key] = dict(data_desc_dict[key])
+            data_dict[key]["ROWS"] = np.nonzero(sel_mask)[0]  # Rows in main table
             data_dict[key]["TIME"] = time_arr[sel_mask]  # Midpoint time in mjd seconds
             data_dict[key]["EXPOSURE"] = int_arr[sel_mask]  # Int time in sec
             data_dict[key]["ANTENNA1"] = ant_1_arr[sel_mask]  # First antenna
@@ -599,7 +633,6 @@ class MS(UVData):
         pol_list = np.unique(
             [item for key in data_dict for item in data_dict[key]["CORR_TYPE"]]
         )
-        npols = len(pol_list)
 
         spw_dict = {
             data_dict[key]["SPW_ID"]: {
@@ -667,17 +700,10 @@ class MS(UVData):
                 ]
                 data_dict[key]["POL_IDX"] = np.array([0])
             pol_list = np.array([0])
-            npols = 1
             flex_pol = np.array(
                 [spw_dict[key]["POL"] for key in sorted(spw_dict.keys())], dtype=int
             )
 
-        # We have all of the meta-information linked the various data desc IDs,
-        # so now we can finally get to the business of filling in the actual data.
-        data_array = np.zeros((nblts, nfreqs, npols), dtype=complex)
-        nsample_array = np.ones((nblts, nfreqs, npols))
-        flag_array = np.ones((nblts, nfreqs, npols), dtype=bool)
-
         # We will also fill in our own metadata on a per-blt basis here
         time_arr = np.zeros(nblts)
         int_arr = np.zeros(nblts)
@@ -715,9 +741,6 @@ class MS(UVData):
         for key in data_dict:
             # Get the indexing information for the data array
             blt_idx = data_dict[key]["BLT_IDX"]
-            startchan = data_dict[key]["STARTCHAN"]
-            stopchan = data_dict[key]["STOPCHAN"]
-            pol_idx = data_dict[key]["POL_IDX"]
 
             # Identify which values have already been populated with data, so we know
             # which values to check.
@@ -751,82 +774,199 @@ class MS(UVData):
             # Can has data now please?
             has_data[blt_idx] = True
 
-            # Remove a slice out of the larger arrays for us to populate with an MS read
-            # operation. This has the advantage that if different data descrips contain
-            # different polarizations (which is allowed), it will populate the arrays
-            # correctly, although for most files (where all pols are written in one
-            # data descrip), this shouldn't matter.
-            temp_data = data_array[blt_idx, startchan:stopchan]
-            temp_flags = flag_array[blt_idx, startchan:stopchan]
-            if read_weights:
-                temp_weights = nsample_array[blt_idx, startchan:stopchan]
-
-            # This TaQL call allows the low-level C++ routines to handle mapping data
-            # access, and returns a table object that _only_ has records matching our
-            # request. This allows one to do a simple and fast getcol for reading the
-            # data, flags, and weights, since they should all be the same shape on a
-            # per-row basis for the same data description. Alternative read methods
-            # w/ getcell, getvarcol, and per-row getcols produced way slower code.
-            tb_main_sel = tables.taql(
-                f"select from {filepath} where DATA_DESC_ID == {key}"  # nosec
-            )
+        self.ant_1_array = ant_1_arr
+        self.ant_2_array = ant_2_arr
 
-            # Fill in the temp arrays, and then plug them back into the main array.
-            # Note that this operation has to be split in two because you can only use
-            # advanced slicing on one axis (which both blt_idx and pol_idx require).
-            if flip_conj:
-                temp_data[:, :, pol_idx] = np.conj(tb_main_sel.getcol(data_column))
+        self.time_array = Time(
+            time_arr / 86400.0, format="mjd", scale=timescale.lower()
+        ).utc.jd
+        self.integration_time = int_arr
+        self.uvw_array = uvw_arr * ((-1) ** flip_conj)
+        self.phase_center_id_array = field_arr
+        self.scan_number_array = scan_number_arr
+        self.flex_spw_id_array = spw_id_array
+
+        field_list = np.unique(field_arr).astype(int).tolist()
+
+        data_desc_info = {
+            key: {
+                name: data_dict[key][name]
+                for name in ["ROWS", "BLT_IDX", "STARTCHAN", "STOPCHAN", "POL_IDX"]
+            }
+            for key in data_dict
+        }
+
+        return spw_list, field_list, pol_list, flex_pol, data_desc_info
+
+    def _read_ms_data(
+        self,
+        filepath,
+        *,
+        data_column,
+        data_desc_info,
+        blt_map,
+        freq_map,
+        pol_map,
+        read_weights=True,
+        flip_conj=False,
+    ):
+        """
+        Read the data, flags and weights from the main table of a MS file.
+
+        This method is not meant to be called by users, and is instead a utility
+        function for the `read_ms` method (which users should call instead). Only the
+        rows, channels and correlations which map onto the (possibly down-selected)
+        object are read from disk.
+
+        Parameters
+        ----------
+        filepath : str
+            The measurement set root directory to read from.
+        data_column : str
+            name of CASA data column to read into data_array. Options are:
+            'DATA', 'MODEL_DATA', or 'CORRECTED_DATA'
+        data_desc_info : dict
+            Dictionary describing the location of the records for each data
+            description, as returned by `_read_ms_main`.
+        blt_map : ndarray of int
+            Index on the baseline-time axis of the object for each baseline-time in
+            the file, with -1 marking those that are not to be read.
+        freq_map : ndarray of int
+            Index on the frequency axis of the object for each channel in the file,
+            with -1 marking those that are not to be read.
+        pol_map : ndarray of int
+            Index on the polarization axis of the object for each polarization in the
+            file, with -1 marking those that are not to be read.
+        read_weights : bool
+            Read in the weights from the MS file, default is True. If false, the method
+            will set the `nsamples_array` to the same uniform value (namely 1.0).
+        flip_conj : bool
+            On read, whether to flip the conjugation of the baselines. Normally the MS
+            format is the same as what is used for pyuvdata (ant2 - ant1), hence the
+            default is False.
+        """
+        tb_main = tables.table(filepath, ack=False)
+
+        data_shape = (
+            np.count_nonzero(blt_map >= 0),
+            np.count_nonzero(freq_map >= 0),
+            np.count_nonzero(pol_map >= 0),
+        )
+        single_desc = any(info["ROWS"] is None for info in data_desc_info.values())
+        if not single_desc:
+            data_array = np.zeros(data_shape, dtype=complex)
+            nsample_array = np.ones(data_shape)
+            flag_array = np.ones(data_shape, dtype=bool)
+
+        for info in data_desc_info.values():
+            if info["ROWS"] is None:
+                # Rows and blts are one-to-one, so the selection is the same
+                rows = np.nonzero(blt_map >= 0)[0]
+                out_blts = slice(None)
             else:
-                temp_data[:, :, pol_idx] = tb_main_sel.getcol(data_column)
+                out_blts = blt_map[info["BLT_IDX"]]
+                rows = info["ROWS"][out_blts >= 0]
+                out_blts = out_blts[out_blts >= 0]
 
-            temp_flags[:, :, pol_idx] = tb_main_sel.getcol("FLAG")
+            nchan = info["STOPCHAN"] - info["STARTCHAN"]
+            out_chans = freq_map[info["STARTCHAN"] : info["STOPCHAN"]]
+            chans = np.nonzero(out_chans >= 0)[0]
+            out_chans = out_chans[chans]
 
-            data_array[blt_idx, startchan:stopchan] = temp_data
-            flag_array[blt_idx, startchan:stopchan] = temp_flags
+            ncorr = len(info["POL_IDX"])
+            out_pols = pol_map[info["POL_IDX"]]
+            corrs = np.nonzero(out_pols >= 0)[0]
+            out_pols = out_pols[corrs]
 
+            if len(rows) == 0 or len(chans) == 0 or len(corrs) == 0:
+                continue
+
+            # Selecting rows gives a reference table, so that the low-level C++
+            # routines handle the data access, and we can use the (much faster) getcol
+            # and getcolslice rather than getcell or per-row reads.
+            tb_main_sel = tb_main
+            if len(rows) < tb_main.nrows():
+                tb_main_sel = tb_main.selectrows(rows)
+
+            col_kwargs = {
+                "chans": chans,
+                "corrs": corrs,
+                "nchan": nchan,
+                "ncorr": ncorr,
+            }
+            data = _get_ms_col(tb_main_sel, data_column, **col_kwargs)
+            if flip_conj:
+                data = np.conj(data)
+            flags = _get_ms_col(tb_main_sel, "FLAG", **col_kwargs)
             if read_weights:
                 # The weights can be stored in a couple of different columns, but we
                 # use a try/except here to capture two separate cases (that both will
                 # produce runtime errors) -- when WEIGHT_SPECTRUM isn't a column, and
                 # when it is BUT its unfilled (which causes getcol to throw an error).
                 try:
-                    temp_weights[:, :, pol_idx] = tb_main_sel.getcol("WEIGHT_SPECTRUM")
+                    weights = _get_ms_col(tb_main_sel, "WEIGHT_SPECTRUM", **col_kwargs)
                 except RuntimeError:
-                    temp_weights[:, :, pol_idx] = np.repeat(
-                        np.expand_dims(tb_main_sel.getcol("WEIGHT"), axis=1),
-                        data_desc_dict[key]["NUM_CHAN"],
+                    weights = np.repeat(
+                        np.expand_dims(
+                            _get_ms_col(
+                                tb_main_sel, "WEIGHT", chan_axis=False, **col_kwargs
+                            ),
+                            axis=1,
+                        ),
+                        len(chans),
                         axis=1,
                     )
-                nsample_array[blt_idx, startchan:stopchan, :] = temp_weights
 
-            # Close the table, get ready for the next loop
-            tb_main_sel.close()
+            if tb_main_sel is not tb_main:
+                tb_main_sel.close()
+
+            if single_desc:
+                # The selection indices are sorted, so the data are already in the
+                # right order (and we preserve the on-disk dtype).
+                data_array = data
+                flag_array = flags
+                if read_weights:
+                    nsample_array = weights
+                else:
+                    nsample_array = np.ones_like(data, dtype=float)
+                continue
+
+            # Fill in the data. Using np.ix_ lets us populate the arrays correctly
+            # even if different data descrips contain different polarizations (which
+            # is allowed), although for most files (where all pols are written in one
+            # data descrip), this shouldn't matter.
+            inds = np.ix_(out_blts, out_chans, out_pols)
+            data_array[inds] = data
+            flag_array[inds] = flags
+            if read_weights:
+                nsample_array[inds] = weights
+
+        tb_main.close()
 
         self.data_array = data_array
         self.flag_array = flag_array
         self.nsample_array = nsample_array
 
-        self.ant_1_array = ant_1_arr
-        self.ant_2_array = ant_2_arr
-
-        self.time_array = Time(
-            time_arr / 86400.0, format="mjd", scale=timescale.lower()
-        ).utc.jd
-        self.integration_time = int_arr
-        self.uvw_array = uvw_arr * ((-1) ** flip_conj)
-        self.phase_center_id_array = field_arr
-        self.scan_number_array = scan_number_arr
-        self.flex_spw_id_array = spw_id_array
-
-        field_list = np.unique(field_arr).astype(int).tolist()
-
-        return spw_list, field_list, pol_list, flex_pol
-
     @copy_replace_short_description(UVData.read_ms, style=DocstringStyle.NUMPYDOC)
     def read_ms(
         self,
         filepath,
         *,
+        antenna_nums=None,
+        antenna_names=None,
+        ant_str=None,
+        bls=None,
+        frequencies=None,
+        freq_chans=None,
+        times=None,
+        time_range=None,
+        lsts=None,
+        lst_range=None,
+        polarizations=None,
+        blt_inds=None,
+        phase_center_ids=None,
+        catalog_names=None,
+        keep_all_metadata=True,
         data_column="DATA",
         pol_order="AIPS",
         background_lsts=True,
@@ -834,6 +974,8 @@ class MS(UVData):
         check_extra=True,
         run_check_acceptability=True,
         strict_uvw_antpos_check=False,
+        check_level="full",
+        only_changed=False,
         ignore_single_chan=True,
         raise_error=True,
         read_weights=True,
@@ -900,11 +1042,10 @@ class MS(UVData):
         # convention change. So if the data in the MS came via that task and was not
         # written by pyuvdata, we do need to flip the uvws & conjugate the data
         flip_conj = ("importuvfits" in self.history) and (not pyuvdata_written)
-        spw_list, field_list, pol_list, flex_pol = self._read_ms_main(
+        spw_list, field_list, pol_list, flex_pol, data_desc_info = self._read_ms_main(
             filepath,
             data_column=data_column,
             data_desc_dict=data_desc_dict,
-            read_weights=read_weights,
             flip_conj=flip_conj,
             raise_error=raise_error,
             allow_flex_pol=allow_flex_pol,
@@ -933,7 +1074,7 @@ class MS(UVData):
             self.channel_width[sel_mask] = data_desc_dict[key]["CHAN_WIDTH"]
 
         self.Ntimes = int(np.unique(self.time_array).size)
-        self.Nblts = int(self.data_array.shape[0])
+        self.Nblts = len(self.time_array)
         self.Nants_data = len(
             np.unique(
                 np.concatenate(
@@ -1017,6 +1158,60 @@ class MS(UVData):
 
         if proc is not None:
             proc.join()
+
+        # figure out what data to read in
+        blt_inds, freq_inds, pol_inds, history_update_string = self._select_preprocess(
+            antenna_nums=antenna_nums,
+            antenna_names=antenna_names,
+            ant_str=ant_str,
+            bls=bls,
+            frequencies=frequencies,
+            freq_chans=freq_chans,
+            times=times,
+            time_range=time_range,
+            lsts=lsts,
+            lst_range=lst_range,
+            polarizations=polarizations,
+            blt_inds=blt_inds,
+            phase_center_ids=phase_center_ids,
+            catalog_names=catalog_names,
+        )
+
+        # map from the indices in the file to those on the object (-1 if not read)
+        index_maps = []
+        for inds, size in zip(
+            [blt_inds, freq_inds, pol_inds],
+            [self.Nblts, self.Nfreqs, self.Npols],
+            strict=True,
+        ):
+            index_map = np.arange(size)
+            if inds is not None:
+                index_map = np.full(size, -1)
+                index_map[inds] = np.arange(len(inds))
+            index_maps.append(index_map)
+
+        if any(inds is not None for inds in [blt_inds, freq_inds, pol_inds]):
+            # do select operations on everything except data_array, flag_array
+            # and nsample_array
+            self._select_by_index(
+                blt_inds=blt_inds,
+                freq_inds=freq_inds,
+                pol_inds=pol_inds,
+                history_update_string=history_update_string,
+                keep_all_metadata=keep_all_metadata,
+            )
+
+        self._read_ms_data(
+            filepath,
+            data_column=data_column,
+            data_desc_info=data_desc_info,
+            blt_map=index_maps[0],
+            freq_map=index_maps[1],
+            pol_map=index_maps[2],
+            read_weights=read_weights,
+            flip_conj=flip_conj,
+        )
+
         # Fill in the apparent coordinates here
         self._set_app_coords_helper()
 
@@ -1029,6 +1224,8 @@ class MS(UVData):
                 check_extra=check_extra,
                 run_check_acceptability=run_check_acceptability,
                 strict_uvw_antpos_check=strict_uvw_antpos_check,
+                check_level=check_level,
+                only_changed=only_changed,
                 allow_flip_conj=True,
                 check_autos=check_autos,
                 fix_autos=fix_autos,
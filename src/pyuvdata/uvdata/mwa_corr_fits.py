@@ -1322,6 +1322,8 @@ class MWACorrFITS(UVData):
         check_extra=True,
         run_check_acceptability=True,
         strict_uvw_antpos_check=False,
+        check_level="full",
+        only_changed=False,
         check_autos=True,
         fix_autos=True,
         use_future_array_shapes=None,
@@ -1859,6 +1861,8 @@ class MWACorrFITS(UVData):
                 check_extra=check_extra,
                 run_check_acceptability=run_check_acceptability,
                 strict_uvw_antpos_check=strict_uvw_antpos_check,
+                check_level=check_level,
+                only_changed=only_changed,
                 allow_flip_conj=True,
                 check_autos=check_autos,
                 fix_autos=fix_autos,
@@ -12,7 +12,7 @@ cimport numpy
 numpy.import_array()
 
 cimport libcpp.complex
-from libc.string cimport strncmp
+from libc.string cimport strcmp, strncmp
 
 DEF PREAMBLE_SIZE = 5
 DEF MAXVAR = 32768
@@ -95,6 +95,10 @@ ctypedef numpy.int64_t DTYPE_t
 ctypedef numpy.complex64_t DTYPE_c
 ctypedef numpy.float64_t DTYPE_f64
 
+ctypedef fused vis_t:
+  float complex
+  double complex
+
 cdef inline int GETI(int bl):
   return (bl - 65536) // 2048 - 1 if bl > 65536 else (bl >> 8) - 1
 
@@ -457,6 +461,163 @@ cdef class UV:
 
     return (uvw, preamble[3], (i, j)), data, flags, nread
 
+  @cython.boundscheck(False)
+  @cython.wraparound(False)
+  def bulk_read(self, int n2read, dict variables, int chunk_size=4096):
+    """
+    Read all remaining records into preallocated arrays.
+
+    Parameters
+    ----------
+    n2read : int
+      Number of channels to read per record.
+    variables : dict
+      Per-record UV variables to capture, keyed on name with the variable type as
+      values. Numeric variables are returned as float64, strings as object arrays.
+    chunk_size : int
+      Number of records to allocate at a time.
+
+    Returns
+    -------
+    preamble : ndarray of float64
+      Array of shape (Nrecords, 5) containing u, v, w, time and baseline.
+    data : ndarray of complex64
+      Array of shape (Nrecords, n2read).
+    flags : ndarray of bool
+      Array of shape (Nrecords, n2read), True where the data are flagged.
+    var_dict : dict
+      Values of the requested variables for each record, with arrays of shape
+      (Nrecords,) or (Nrecords, length) for variables with multiple elements.
+    """
+    cdef int nread, length, updated, ind, var_ind
+    cdef Py_ssize_t k = 0, ncap = 0
+    cdef double preamble[PREAMBLE_SIZE]
+    cdef char value[MAXVAR]
+    cdef char var_type
+    cdef double[:, ::1] pre_view
+    cdef float complex[:, ::1] data_view
+    cdef int[:, ::1] flag_view
+    cdef double[:, ::1] num_view
+    cdef object[:, ::1] str_view
+
+    num_names = [name for name, vt in variables.items() if vt[0] != "a"]
+    str_names = [name for name, vt in variables.items() if vt[0] == "a"]
+    cdef Py_ssize_t nnum = len(num_names), nstr = len(str_names)
+    cdef Py_ssize_t[::1] offsets = np.zeros(nnum + 1, dtype=np.intp)
+    cdef Py_ssize_t[::1] lengths = np.zeros(nnum, dtype=np.intp)
+    num_types = b"".join([variables[name][0].encode() for name in num_names])
+    enc_num = [name.encode() for name in num_names]
+    enc_str = [name.encode() for name in str_names]
+    prev_str = [None] * nstr
+    prev_obj = [None] * nstr
+
+    chunks = []
+    while True:
+      if k == ncap:
+        # Out of space, allocate a new chunk of records
+        pre_chunk = np.zeros((chunk_size, PREAMBLE_SIZE), dtype=np.float64)
+        data_chunk = np.zeros((chunk_size, n2read), dtype=np.complex64)
+        flag_chunk = np.zeros((chunk_size, n2read), dtype=np.intc)
+        num_chunk = np.zeros((chunk_size, offsets[nnum]), dtype=np.float64)
+        str_chunk = np.empty((chunk_size, nstr), dtype=object)
+        cur_chunk = [pre_chunk, data_chunk, flag_chunk, num_chunk, str_chunk]
+        chunks.append(cur_chunk)
+        pre_view = pre_chunk
+        data_view = data_chunk
+        flag_view = flag_chunk
+        num_view = num_chunk
+        str_view = str_chunk
+        k = 0
+        ncap = chunk_size
+
+      while True:
+        uvread_c(
+          self.tno, preamble, <float *>&data_view[k, 0], &flag_view[k, 0], n2read, &nread
+        )
+        if (preamble[3] != self.curtime):
+          self.intcnt += 1
+          self.curtime = preamble[3]
+
+        if ((self.intcnt - self.decphase) % self.decimate == 0 or nread == 0):
+          break
+
+      if nread == 0:
+        break
+
+      for ind in range(PREAMBLE_SIZE):
+        pre_view[k, ind] = preamble[ind]
+
+      if offsets[nnum] == 0 and nnum > 0:
+        # Figure out the variable lengths from the first record
+        for var_ind in range(nnum):
+          uvprobvr_c(self.tno, enc_num[var_ind], value, &length, &updated)
+          lengths[var_ind] = length
+          offsets[var_ind + 1] = offsets[var_ind] + length
+        num_chunk = np.zeros((ncap, offsets[nnum]), dtype=np.float64)
+        cur_chunk[3] = num_chunk
+        num_view = num_chunk
+
+      for var_ind in range(nnum):
+        uvprobvr_c(self.tno, enc_num[var_ind], value, &length, &updated)
+        if length != lengths[var_ind]:
+          raise ValueError(
+            f"Length of UV variable {num_names[var_ind]} changed between records."
+          )
+        var_type = num_types[var_ind]
+        if var_type == b"d":
+          uvgetvr_c(self.tno, H_DBLE, enc_num[var_ind], value, length)
+          for ind in range(length):
+            num_view[k, offsets[var_ind] + ind] = (<double *>value)[ind]
+        elif var_type == b"r":
+          uvgetvr_c(self.tno, H_REAL, enc_num[var_ind], value, length)
+          for ind in range(length):
+            num_view[k, offsets[var_ind] + ind] = (<float *>value)[ind]
+        elif var_type == b"i":
+          uvgetvr_c(self.tno, H_INT, enc_num[var_ind], value, length)
+          for ind in range(length):
+            num_view[k, offsets[var_ind] + ind] = (<int *>value)[ind]
+        elif var_type == b"j":
+          uvgetvr_c(self.tno, H_INT2, enc_num[var_ind], value, length)
+          for ind in range(length):
+            num_view[k, offsets[var_ind] + ind] = (<short *>value)[ind]
+        else:
+          raise ValueError(
+            f"Unsupported type for UV variable {num_names[var_ind]}: {chr(var_type)}"
+          )
+
+      for var_ind in range(nstr):
+        uvprobvr_c(self.tno, enc_str[var_ind], value, &length, &updated)
+        if length >= MAXVAR:
+          raise ValueError(
+            f"UV variable {str_names[var_ind]} is too big for pyuvdata's internal "
+            "buffers"
+          )
+        uvgetvr_c(self.tno, H_BYTE, enc_str[var_ind], value, length + 1)
+        # Only make a new python string when the value changes
+        if prev_str[var_ind] is None or strcmp(value, <char *>prev_str[var_ind]) != 0:
+          prev_str[var_ind] = <bytes>value
+          prev_obj[var_ind] = prev_str[var_ind].decode("utf-8")
+        str_view[k, var_ind] = prev_obj[var_ind]
+
+      k += 1
+
+    # Trim the last chunk and stitch everything together
+    for ind in range(len(cur_chunk)):
+      cur_chunk[ind] = cur_chunk[ind][:k]
+    preamble_arr, data_arr, flag_arr, num_arr, str_arr = [
+      np.concatenate(arrs) for arrs in zip(*chunks)
+    ]
+
+    var_dict = {}
+    for var_ind, name in enumerate(num_names):
+      var_dict[name] = num_arr[:, offsets[var_ind]:offsets[var_ind + 1]]
+      if lengths[var_ind] == 1:
+        var_dict[name] = var_dict[name][:, 0]
+    for var_ind, name in enumerate(str_names):
+      var_dict[name] = str_arr[:, var_ind]
+
+    return preamble_arr, data_arr, flag_arr == 0, var_dict
+
   cpdef void raw_write(self, object input_preamble, numpy.ndarray[dtype=DTYPE_c, ndim=1] data, numpy.ndarray[dtype=int, ndim=1] flags) except +:
     cdef int nread
     cdef double preamble[PREAMBLE_SIZE]
@@ -476,6 +637,131 @@ cdef class UV:
 
     return
 
+  @cython.boundscheck(False)
+  @cython.wraparound(False)
+  def bulk_write(
+    self,
+    const double[:, ::1] preamble,
+    const vis_t[:, :, :] data,
+    const numpy.npy_bool[:, :, :] flags,
+    const double[:, :, :] cnt,
+    const int[::1] pols,
+    dict variables,
+  ):
+    """
+    Write a set of records, one per polarization for each baseline-time.
+
+    Parameters
+    ----------
+    preamble : ndarray of float64
+      Array of shape (Nblts, 5) containing u, v, w, time and baseline.
+    data : ndarray of complex
+      Array of shape (Nblts, Nchan, Npols).
+    flags : ndarray of bool
+      Array of shape (Nblts, Nchan, Npols), True where the data are flagged.
+    cnt : ndarray of float64
+      Array of shape (Nblts, Nchan, Npols) written to the "cnt" variable.
+    pols : ndarray of int32
+      Polarization numbers written to the "pol" variable, length Npols.
+    variables : dict
+      Per baseline-time UV variables to write before the records for that
+      baseline-time, keyed on name with values that are tuples of (type, values,
+      write), where values has length Nblts (numeric values should be float64,
+      strings should be an object array) and write is a boolean array marking which
+      values to write (the variable keeps its previous value otherwise).
+    """
+    cdef Py_ssize_t nblts = preamble.shape[0], nchan = data.shape[1]
+    cdef Py_ssize_t npols = data.shape[2], blt_ind, chan_ind, pol_ind, var_ind
+    cdef Py_ssize_t nvar = len(variables)
+    cdef double rec_preamble[PREAMBLE_SIZE]
+    cdef double dval
+    cdef float rval
+    cdef int ival
+    cdef short jval
+    cdef int pol
+    cdef char var_type
+    cdef float complex[::1] rec_data = np.zeros(nchan, dtype=np.complex64)
+    cdef int[::1] rec_flags = np.zeros(nchan, dtype=np.intc)
+    cdef double[::1] rec_cnt = np.zeros(nchan, dtype=np.float64)
+    cdef const double[::1] num_view
+    cdef const numpy.npy_bool[::1] write_view
+
+    if (
+      data.shape[0] != nblts
+      or any(flags.shape[ind] != data.shape[ind] for ind in range(3))
+      or any(cnt.shape[ind] != data.shape[ind] for ind in range(3))
+      or pols.shape[0] != npols
+    ):
+      raise ValueError("Input arrays for bulk_write do not have consistent shapes.")
+
+    names = [name.encode() for name in variables]
+    types = [vals[0][0].encode() for vals in variables.values()]
+    values = []
+    writes = []
+    for name, (vt, vals, write) in variables.items():
+      if len(vals) != nblts or len(write) != nblts:
+        raise ValueError(f"UV variable {name} must have one value per baseline-time.")
+      if vt[0] == "a":
+        values.append(vals)
+      elif vt[0] in ["d", "r", "i", "j"]:
+        values.append(np.ascontiguousarray(vals, dtype=np.float64))
+      else:
+        raise ValueError(f"Unsupported type for UV variable {name}: {vt[0]}")
+      writes.append(np.ascontiguousarray(write, dtype=np.bool_))
+    prev_obj = [None] * nvar
+    prev_str = [None] * nvar
+
+    for blt_ind in range(nblts):
+      for var_ind in range(nvar):
+        write_view = writes[var_ind]
+        if not write_view[blt_ind]:
+          continue
+        var_type = (<bytes>types[var_ind])[0]
+        if var_type == b"a":
+          # Only encode the string when the value changes
+          val = values[var_ind][blt_ind]
+          if val is not prev_obj[var_ind]:
+            prev_obj[var_ind] = val
+            prev_str[var_ind] = val.encode()
+          uvputvr_c(
+            self.tno,
+            H_BYTE,
+            names[var_ind],
+            <char *>prev_str[var_ind],
+            len(prev_str[var_ind]) + 1,
+          )
+          continue
+        num_view = values[var_ind]
+        dval = num_view[blt_ind]
+        if var_type == b"d":
+          uvputvr_c(self.tno, H_DBLE, names[var_ind], <char *>&dval, 1)
+        elif var_type == b"r":
+          rval = <float>dval
+          uvputvr_c(self.tno, H_REAL, names[var_ind], <char *>&rval, 1)
+        elif var_type == b"i":
+          ival = <int>dval
+          uvputvr_c(self.tno, H_INT, names[var_ind], <char *>&ival, 1)
+        else:
+          jval = <short>dval
+          uvputvr_c(self.tno, H_INT2, names[var_ind], <char *>&jval, 1)
+
+      for chan_ind in range(PREAMBLE_SIZE):
+        rec_preamble[chan_ind] = preamble[blt_ind, chan_ind]
+
+      for pol_ind in range(npols):
+        pol = pols[pol_ind]
+        uvputvr_c(self.tno, H_INT, "pol", <char *>&pol, 1)
+        for chan_ind in range(nchan):
+          rec_cnt[chan_ind] = cnt[blt_ind, chan_ind, pol_ind]
+          rec_data[chan_ind] = <float complex>data[blt_ind, chan_ind, pol_ind]
+          rec_flags[chan_ind] = not flags[blt_ind, chan_ind, pol_ind]
+        uvputvr_c(self.tno, H_DBLE, "cnt", <char *>&rec_cnt[0], nchan)
+        uvwrite_c(
+          self.tno, rec_preamble, <float *>&rec_data[0], &rec_flags[0], nchan
+        )
+
+    return
+
   cpdef void copyvr(self, UV uv):
     uvcopyvr_c(uv.tno, self.tno)
     return
@@ -5,7 +5,9 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import copy
+import itertools
 import os
 import threading
 import warnings
@@ -38,6 +40,194 @@ reporting_request = (
     "this feature, we would like to investigate this more."
 )
 
+_PARALLEL_READ_EXECUTORS = {
+    "thread": concurrent.futures.ThreadPoolExecutor,
+    "process": concurrent.futures.ProcessPoolExecutor,
+}
+
+# approximate number of data array elements to handle at once when averaging
+# in `downsample_in_time`, limits the size of temporary arrays.
+_DOWNSAMPLE_CHUNK_SIZE = 2**24
+
+
+def _window_sum(array, starts, lengths):
+    """
+    Sum an array over consecutive windows along the first axis.
+
+    This gives identical results to calling `np.sum(..., axis=0)` on each window
+    separately (which is not guaranteed with np.add.reduceat), for all the windows
+    at once. For multidimensional arrays np.sum adds the elements along the first
+    axis one at a time in order, which is done here for all the windows together.
+    For 1D arrays np.sum uses pairwise summation, so the windows with the same
+    length are gathered into the rows of a 2D array and summed along the rows.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        Array to sum, the windows are along the first axis.
+    starts : np.ndarray of int
+        Index of the first element of each window.
+    lengths : np.ndarray of int
+        Number of elements in each window, must be at least one.
+
+    Returns
+    -------
+    np.ndarray
+        Array of the window sums, the first axis has the same length as `starts`.
+
+    """
+    if array.ndim == 1:
+        window_sum = np.zeros(starts.size, dtype=np.sum(array[:0]).dtype)
+        for length in np.unique(lengths):
+            which = np.nonzero(lengths == length)[0]
+            window_sum[which] = np.sum(
+                array[starts[which, np.newaxis] + np.arange(length)], axis=1
+            )
+        return window_sum
+
+    window_sum = array[starts]
+    for offset in range(1, np.max(lengths, initial=1)):
+        has_offset = lengths > offset
+        window_sum[has_offset] += array[starts[has_offset] + offset]
+    return window_sum
+
+
+def _read_single_file(filename, read_kwargs, *, record_warnings=False):
+    """
+    Read a single file into a new UVData object.
+
+    This is a module-level function (rather than a method) so that it can be
+    pickled and sent to the workers of a process pool when reading multiple
+    files concurrently in `UVData.read`.
+
+    Parameters
+    ----------
+    filename : str
+        The file to read.
+    read_kwargs : dict
+        Keyword arguments to pass to `UVData.read`.
+    record_warnings : bool
+        Option to record the warnings raised while reading the file rather than
+        emitting them. Warnings raised in the workers of a process pool are not
+        shown, so they are recorded and re-emitted in the main process.
+
+    Returns
+    -------
+    UVData
+        The object read from the file.
+    list of tuple
+        The message, category, filename and line number of each warning raised
+        while reading the file, empty unless `record_warnings` is True.
+
+    """
+    uvd = UVData()
+    if not record_warnings:
+        uvd.read(filename, **read_kwargs)
+        return uvd, []
+
+    with warnings.catch_warnings(record=True) as warn_list:
+        warnings.simplefilter("always")
+        uvd.read(filename, **read_kwargs)
+    return uvd, [(w.message, w.category, w.filename, w.lineno) for w in warn_list]
+
+
+def _increasing_inds_to_slice(inds):
+    """
+    Convert an array of evenly spaced, increasing indices to a slice.
+
+    Parameters
+    ----------
+    inds : ndarray of int
+        Array of indices.
+
+    Returns
+    -------
+    slice or None
+        The equivalent slice, None if the indices cannot be represented as one.
+
+    """
+    if len(inds) == 1:
+        return slice(inds[0], inds[0] + 1, 1)
+    step = inds[1] - inds[0]
+    if step <= 0 or np.any(np.diff(inds) != step):
+        return None
+    return slice(inds[0], inds[-1] + 1, step)
+
+
+def _get_blt_keys(uvd_list, *, prec_t):
+    """
+    Get integer keys identifying each baseline-time for combining objects.
+
+    Times are split into an integer day and a day fraction rounded to `prec_t`
+    decimal places (kept as separate integers, since packing them into one would
+    overflow an int64 for high precisions). The unique (day, fraction) pairs and
+    baselines across all the objects are then numbered and combined into a single
+    integer key, so keys can be compared between the objects and sorting them gives
+    time major, baseline minor order.
+
+    Parameters
+    ----------
+    uvd_list : list of UVData
+        Objects to get the keys for.
+    prec_t : int
+        Number of decimal places to use for the times in the keys.
+
+    Returns
+    -------
+    list of ndarray of int
+        List of arrays (one per object) of length Nblts with a key combining the
+        time and baseline.
+
+    """
+    time_array = np.concatenate([uvd.time_array for uvd in uvd_list])
+    days = np.floor(time_array)
+    time_pairs = np.stack(
+        (
+            days.astype(np.int64),
+            np.round((time_array - days) * 10**prec_t).astype(np.int64),
+        ),
+        axis=-1,
+    )
+    _, time_inds = np.unique(time_pairs, axis=0, return_inverse=True)
+    time_inds = time_inds.reshape(-1)
+    unique_bls, bl_inds = np.unique(
+        np.concatenate([uvd.baseline_array for uvd in uvd_list]), return_inverse=True
+    )
+    keys = time_inds.astype(np.int64) * unique_bls.size + bl_inds
+    return np.split(keys, np.cumsum([uvd.Nblts for uvd in uvd_list])[:-1])
+
+
+def _get_axis_union(keys):
+    """
+    Get the union of an axis across objects that are being combined.
+
+    Parameters
+    ----------
+    keys : ndarray of int
+        Concatenated keys identifying the elements along the axis in each of the
+        objects, in the order the objects are combined.
+
+    Returns
+    -------
+    union_inds : ndarray of int
+        Indices into `keys` of the first occurrence of each unique key, in the order
+        they appear. So the elements of the first object come first, followed by
+        the new elements from each of the other objects in turn.
+    target_inds : ndarray of int
+        The index of each element of `keys` into `union_inds`.
+    is_new : ndarray of bool
+        Whether each element of `keys` is the first occurrence of its key, i.e. it
+        is not in any of the earlier objects.
+
+    """
+    _, first_inds, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    union_inds = np.sort(first_inds)
+    positions = np.zeros(union_inds.size, dtype=int)
+    positions[inverse[union_inds]] = np.arange(union_inds.size)
+    is_new = first_inds[inverse] == np.arange(keys.size)
+    return union_inds, positions[inverse], is_new
+
 
 class UVData(UVBase):
     """
@@ -598,6 +788,7 @@ class UVData(UVBase):
         )
 
         self.__antpair2ind_cache = {}
+        self.__antpair_blt_table = None
         self.__key2ind_cache = {}
 
         super().__init__()
@@ -632,6 +823,7 @@ class UVData(UVBase):
     def _clear_antpair2ind_cache(obj):
         """Clear the antpair2ind cache."""
         obj.__antpair2ind_cache = {}
+        obj.__antpair_blt_table = None
         obj.__key2ind_cache = {}
 
     @staticmethod
@@ -1133,6 +1325,7 @@ class UVData(UVBase):
                 force_update=True,
             )
             self.phase_center_id_array[select_mask] = cat_id
+            self._mark_changed("_phase_center_id_array")
 
     def merge_phase_centers(
         self, catalog_identifier, *, force_merge=False, ignore_name=False
@@ -1236,6 +1429,7 @@ class UVData(UVBase):
         self.phase_center_id_array[np.isin(self.phase_center_id_array, cat_id_list)] = (
             cat_id_list[0]
         )
+        self._mark_changed("_phase_center_id_array")
 
         # Finally, remove the defunct cat IDs
         for cat_id in cat_id_list[1:]:
@@ -1327,6 +1521,7 @@ class UVData(UVBase):
         if new_id is not None:
             self.phase_center_id_array[self.phase_center_id_array == cat_id] = new_id
             self.phase_center_catalog[new_id] = self.phase_center_catalog.pop(cat_id)
+            self._mark_changed("_phase_center_id_array")
 
     def _consolidate_phase_center_catalogs(
         self, *, reference_catalog=None, other=None, ignore_name=False
@@ -2103,6 +2298,23 @@ class UVData(UVBase):
         """Calculate the number of antennas from ant_1_array and ant_2_array arrays."""
         return int(np.union1d(self.ant_1_array, self.ant_2_array).size)
 
+    def load_lazy_data(self):
+        """
+        Read any lazily loaded data-like arrays into memory.
+
+        The data_array, flag_array and nsample_array are lazily loaded if the object
+        was read from a UVH5 file with ``lazy=True``, in which case they are
+        :class:`pyuvdata.utils.io.hdf5.LazyHDF5Array` objects that only read data
+        from disk when indexed. This replaces them with numpy arrays. Writing to the
+        lazy arrays also reads them into memory, but methods that modify the data
+        in place call this first so the arrays are numpy arrays afterwards. This is
+        a no-op if the arrays are not lazily loaded.
+        """
+        for attr in ["data_array", "flag_array", "nsample_array"]:
+            value = getattr(self, attr)
+            if isinstance(value, hdf5_utils.LazyHDF5Array):
+                setattr(self, attr, np.asarray(value))
+
     def _fix_autos(self):
         """Remove imaginary component of auto-correlations."""
         if self.polarization_array is None or (
@@ -2131,6 +2343,9 @@ class UVData(UVBase):
         if (np.any(pol_screen) and np.any(auto_screen)) and not (
             pol_screen is None or auto_screen is None
         ):
+            # The data are modified in place, so they need to be in memory
+            self.load_lazy_data()
+
             # Select out the relevant data. Need to do this because we have two
             # complex slices we need to do
             auto_data = self.data_array[auto_screen]
@@ -2140,6 +2355,7 @@ class UVData(UVBase):
 
             # Finally, plug the modified values back into data_array
             self.data_array[auto_screen] = auto_data
+            self._mark_changed("_data_array")
 
     def check(
         self,
@@ -2152,6 +2368,8 @@ class UVData(UVBase):
         check_autos=False,
         fix_autos=False,
         lst_tol=utils.LST_RAD_TOL,
+        check_level="full",
+        only_changed=False,
     ):
         """
         Add some extra checks on top of checks on UVBase class.
@@ -2193,6 +2411,23 @@ class UVData(UVBase):
             for detection is used to prevent false issues from being reported), which
             for some observatories sets the precision with which these values are
             written.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full".
+            "shape" only checks that the parameters exist and have the expected
+            shapes and types. "cheap" runs all the checks except for the checks
+            that the LSTs match the times and that the uvws match the antenna
+            positions, which require recalculating the LSTs and uvws. "full" runs
+            all the checks. Default is "full".
+        only_changed : bool
+            Option to only check parameters (and run other checks on values
+            derived from them) that have been set since they last passed the
+            checks on this object. This allows repeated checks (e.g. in a long
+            pipeline) to skip the expensive checks if the relevant parameters have
+            not changed. Changes made in place by the methods on this object
+            (e.g. `conjugate_bls` or `phase`) are tracked, but other changes made
+            in place (e.g. setting elements of an array or entries in a dict) are
+            not, set the attribute again (e.g. ``uvd.time_array = uvd.time_array``)
+            to mark it as changed. Default is False.
 
         Returns
         -------
@@ -2215,10 +2450,26 @@ class UVData(UVBase):
 
         logger.debug("Doing UVBase check...")
         super().check(
-            check_extra=check_extra, run_check_acceptability=run_check_acceptability
+            check_extra=check_extra,
+            run_check_acceptability=run_check_acceptability,
+            check_level=check_level,
+            only_changed=only_changed,
         )
         logger.debug("... Done UVBase Check")
 
+        # then run telescope object check
+        self.telescope.check(
+            check_extra=check_extra,
+            run_check_acceptability=run_check_acceptability,
+            check_level=check_level,
+            only_changed=only_changed,
+        )
+
+        if check_level == "shape":
+            if check_freq_spacing:
+                self._check_freq_spacing()
+            return True
+
         # Check consistency between pol_convention and units of data
         if self.vis_units == "uncalib" and self.pol_convention is not None:
             raise ValueError(
@@ -2226,11 +2477,6 @@ class UVData(UVBase):
                 "is not allowed."
             )
 
-        # then run telescope object check
-        self.telescope.check(
-            check_extra=check_extra, run_check_acceptability=run_check_acceptability
-        )
-
         # Check that all values in flex_spw_id_array are entries in the spw_array
         if not np.all(np.isin(self.flex_spw_id_array, self.spw_array)):
             raise ValueError(
@@ -2255,25 +2501,41 @@ class UVData(UVBase):
 
         # Check internal consistency of numbers which don't explicitly correspond
         # to the shape of another array.
-        if self.Nants_data != self._calc_nants_data():
-            raise ValueError(
-                "Nants_data must be equal to the number of unique "
-                "values in ant_1_array and ant_2_array"
-            )
+        def check_blt_counts():
+            if self.Nants_data != self._calc_nants_data():
+                raise ValueError(
+                    "Nants_data must be equal to the number of unique "
+                    "values in ant_1_array and ant_2_array"
+                )
 
-        if self.Nbls != len(np.unique(self.baseline_array)):
-            raise ValueError(
-                "Nbls must be equal to the number of unique "
-                f"baselines in the data_array. Got {self.Nbls}, not"
-                f"{len(np.unique(self.baseline_array))}"
-            )
+            if self.Nbls != len(np.unique(self.baseline_array)):
+                raise ValueError(
+                    "Nbls must be equal to the number of unique "
+                    f"baselines in the data_array. Got {self.Nbls}, not"
+                    f"{len(np.unique(self.baseline_array))}"
+                )
 
-        if self.Ntimes != len(np.unique(self.time_array)):
-            raise ValueError(
-                "Ntimes must be equal to the number of unique "
-                f"times in the time_array. Got {self.Ntimes}, not "
-                f"{len(np.unique(self.time_array))}."
-            )
+            if self.Ntimes != len(np.unique(self.time_array)):
+                raise ValueError(
+                    "Ntimes must be equal to the number of unique "
+                    f"times in the time_array. Got {self.Ntimes}, not "
+                    f"{len(np.unique(self.time_array))}."
+                )
+
+        self._run_cached_check(
+            "blt_counts",
+            check_blt_counts,
+            params=[
+                "_Nants_data",
+                "_ant_1_array",
+                "_ant_2_array",
+                "_Nbls",
+                "_baseline_array",
+                "_Ntimes",
+                "_time_array",
+            ],
+            only_changed=only_changed,
+        )
 
         for val in np.unique(self.phase_center_id_array):
             if val not in self.phase_center_catalog:
@@ -2308,14 +2570,27 @@ class UVData(UVBase):
         # require that all entries in ant_1_array and ant_2_array exist in
         # antenna_numbers
         logger.debug("Doing Antenna Uniqueness Check...")
-        if not set(np.unique(self.ant_1_array)).issubset(
-            self.telescope.antenna_numbers
-        ):
-            raise ValueError("All antennas in ant_1_array must be in antenna_numbers.")
-        if not set(np.unique(self.ant_2_array)).issubset(
-            self.telescope.antenna_numbers
-        ):
-            raise ValueError("All antennas in ant_2_array must be in antenna_numbers.")
+
+        def check_antenna_numbers():
+            if not set(np.unique(self.ant_1_array)).issubset(
+                self.telescope.antenna_numbers
+            ):
+                raise ValueError(
+                    "All antennas in ant_1_array must be in antenna_numbers."
+                )
+            if not set(np.unique(self.ant_2_array)).issubset(
+                self.telescope.antenna_numbers
+            ):
+                raise ValueError(
+                    "All antennas in ant_2_array must be in antenna_numbers."
+                )
+
+        self._run_cached_check(
+            "antenna_numbers",
+            check_antenna_numbers,
+            params=["_ant_1_array", "_ant_2_array", "telescope._antenna_numbers"],
+            only_changed=only_changed,
+        )
         logger.debug("... Done Antenna Uniqueness Check")
 
         # issue warning if extra_keywords keys are longer than 8 characters
@@ -2338,58 +2613,102 @@ class UVData(UVBase):
 
         if run_check_acceptability:
             # Check antenna positions
-            utils.coordinates.check_surface_based_positions(
-                antenna_positions=self.telescope.antenna_positions,
-                telescope_loc=self.telescope.location,
-                raise_error=False,
+            self._run_cached_check(
+                "surface_based_positions",
+                lambda: utils.coordinates.check_surface_based_positions(
+                    antenna_positions=self.telescope.antenna_positions,
+                    telescope_loc=self.telescope.location,
+                    raise_error=False,
+                ),
+                params=["telescope._antenna_positions", "telescope._location"],
+                only_changed=only_changed,
             )
 
+        if run_check_acceptability and check_level == "full":
             # Check the LSTs against what we expect given up-to-date IERS data
-            utils.times.check_lsts_against_times(
-                jd_array=self.time_array,
-                lst_array=self.lst_array,
-                lst_tols=self._lst_array.tols if lst_tol is None else [0, lst_tol],
-                telescope_loc=self.telescope.location,
-            )
-
-            # create a metadata copy to do operations on
-            temp_obj = self.copy(metadata_only=True)
-
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                logger.debug("Setting UVWs from antenna positions...")
-                temp_obj.set_uvws_from_antenna_positions()
-                logger.debug("... Done Setting UVWs")
+            lst_tols = self._lst_array.tols if lst_tol is None else [0, lst_tol]
+            self._run_cached_check(
+                "lsts",
+                lambda: utils.times.check_lsts_against_times(
+                    jd_array=self.time_array,
+                    lst_array=self.lst_array,
+                    lst_tols=lst_tols,
+                    telescope_loc=self.telescope.location,
+                ),
+                params=["_time_array", "_lst_array", "telescope._location"],
+                options=tuple(lst_tols),
+                only_changed=only_changed,
+            )
+
+            def check_uvws():
+                # create a metadata copy to do operations on
+                temp_obj = self.copy(metadata_only=True)
+
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    logger.debug("Setting UVWs from antenna positions...")
+                    temp_obj.set_uvws_from_antenna_positions()
+                    logger.debug("... Done Setting UVWs")
+
+                # check that the uvws make sense given the antenna positions
+                # make a metadata only copy of this object to properly calculate uvws
+                if not np.allclose(temp_obj.uvw_array, self.uvw_array, atol=1):
+                    max_diff = np.max(np.abs(temp_obj.uvw_array - self.uvw_array))
+                    if allow_flip_conj and np.allclose(
+                        -temp_obj.uvw_array, self.uvw_array, atol=1
+                    ):
+                        warnings.warn(
+                            "UVW orientation appears to be flipped, attempting to "
+                            "fix by changing conjugation of baselines."
+                        )
+                        self.uvw_array *= -1
+                        self.data_array = np.conj(self.data_array)
+                        logger.info("Flipped Array")
+                    elif not strict_uvw_antpos_check:
+                        warnings.warn(
+                            "The uvw_array does not match the expected values given "
+                            "the antenna positions. The largest discrepancy is "
+                            f"{max_diff} meters. This is a fairly common situation "
+                            "but might indicate an error in the antenna positions, "
+                            "the uvws or the phasing."
+                        )
+                    else:
+                        raise ValueError(
+                            "The uvw_array does not match the expected values given "
+                            "the antenna positions. The largest discrepancy is "
+                            f"{max_diff} meters."
+                        )
 
-            # check that the uvws make sense given the antenna positions
-            # make a metadata only copy of this object to properly calculate uvws
-            if not np.allclose(temp_obj.uvw_array, self.uvw_array, atol=1):
-                max_diff = np.max(np.abs(temp_obj.uvw_array - self.uvw_array))
-                if allow_flip_conj and np.allclose(
-                    -temp_obj.uvw_array, self.uvw_array, atol=1
-                ):
-                    warnings.warn(
-                        "UVW orientation appears to be flipped, attempting to "
-                        "fix by changing conjugation of baselines."
-                    )
-                    self.uvw_array *= -1
-                    self.data_array = np.conj(self.data_array)
-                    logger.info("Flipped Array")
-                elif not strict_uvw_antpos_check:
-                    warnings.warn(
-                        "The uvw_array does not match the expected values given "
-                        "the antenna positions. The largest discrepancy is "
-                        f"{max_diff} meters. This is a fairly common situation "
-                        "but might indicate an error in the antenna positions, "
-                        "the uvws or the phasing."
-                    )
-                else:
-                    raise ValueError(
-                        "The uvw_array does not match the expected values given "
-                        "the antenna positions. The largest discrepancy is "
-                        f"{max_diff} meters."
-                    )
+            self._run_cached_check(
+                "uvws",
+                check_uvws,
+                params=[
+                    "_uvw_array",
+                    "_lst_array",
+                    "_ant_1_array",
+                    "_ant_2_array",
+                    "_phase_center_id_array",
+                    "_phase_center_app_ra",
+                    "_phase_center_app_dec",
+                    "_phase_center_frame_pa",
+                    "telescope._antenna_numbers",
+                    "telescope._antenna_positions",
+                    "telescope._location",
+                ],
+                # The uvw calculation only uses the catalog types of the phase
+                # centers (the catalog is a dict, so its changes are not tracked).
+                options=(
+                    strict_uvw_antpos_check,
+                    allow_flip_conj,
+                    sorted(
+                        (cat_id, cat_dict["cat_type"])
+                        for cat_id, cat_dict in self.phase_center_catalog.items()
+                    ),
+                ),
+                only_changed=only_changed,
+            )
 
+        if run_check_acceptability:
             # check auto and cross-corrs have sensible uvws
             logger.debug("Checking autos...")
             autos = self.ant_1_array == self.ant_2_array
@@ -2579,6 +2898,107 @@ class UVData(UVBase):
             use_miriad_convention=use_miriad_convention,
         )
 
+    def _get_antpair_blt_table(self):
+        """
+        Get the lookup table from antenna pairs to baseline-time indices.
+
+        The table is built in a single pass (a stable sort of the antenna pairs)
+        the first time it is needed and is cleared whenever the ant_1_array or
+        ant_2_array are set (e.g. by select or reorder_blts).
+
+        Returns
+        -------
+        dict
+            Dictionary with the following keys:
+
+            - "nants": int, one more than the largest antenna number, used to
+              combine the antenna numbers into a single integer key.
+            - "keys": sorted array of the unique combined antenna pair keys,
+              which are ``ant1 * nants + ant2``.
+            - "order": array of baseline-time indices sorted by antenna pair key,
+              in increasing order within each antenna pair.
+            - "bounds": array of length len(keys) + 1 giving the start and stop
+              of each antenna pair in `order`.
+            - "step": array giving the step between the baseline-time indices of
+              each antenna pair if they are evenly spaced (so they can be
+              represented as a slice) and 0 otherwise.
+        """
+        if self.__antpair_blt_table is not None:
+            return self.__antpair_blt_table
+
+        ant1 = np.asarray(self.ant_1_array, dtype=np.int64)
+        ant2 = np.asarray(self.ant_2_array, dtype=np.int64)
+        nants = int(max(ant1.max(), ant2.max())) + 1 if ant1.size > 0 else 1
+        antpair_keys = ant1 * nants + ant2
+
+        order = np.argsort(antpair_keys, kind="stable")
+        sorted_keys = antpair_keys[order]
+        starts = np.flatnonzero(np.diff(sorted_keys)) + 1
+        bounds = np.concatenate(([0], starts, [order.size])) if order.size else [0]
+        bounds = np.asarray(bounds, dtype=np.int64)
+
+        # Find the antenna pairs with evenly spaced blt indices by comparing each
+        # difference between consecutive blt indices in an antenna pair to the
+        # first difference for that antenna pair.
+        n_per_pair = np.diff(bounds)
+        step = np.ones(n_per_pair.size, dtype=np.int64)
+        multi = n_per_pair > 1
+        if np.any(multi):
+            diffs = np.diff(order)
+            pair_inds = np.repeat(np.arange(n_per_pair.size), n_per_pair)[:-1]
+            # ignore the differences across the boundaries between antenna pairs
+            within_pair = np.ones(diffs.size, dtype=bool)
+            within_pair[starts - 1] = False
+            step[multi] = diffs[bounds[:-1][multi]]
+            mismatch = within_pair & (diffs != step[pair_inds])
+            step[np.unique(pair_inds[mismatch])] = 0
+
+        self.__antpair_blt_table = {
+            "nants": nants,
+            "keys": sorted_keys[bounds[:-1]],
+            "order": order,
+            "bounds": bounds,
+            "step": step,
+        }
+        return self.__antpair_blt_table
+
+    def _antpair_blt_inds(self, ant1, ant2):
+        """
+        Get the baseline-time indices for an antenna pair from the lookup table.
+
+        Parameters
+        ----------
+        ant1, ant2 : int
+            The antenna numbers of the antenna pair.
+
+        Returns
+        -------
+        slice or ndarray of int or None
+            The baseline-time indices for the antenna pair, as a slice if they are
+            evenly spaced. None if the antenna pair is not in the data.
+        """
+        table = self._get_antpair_blt_table()
+        nants = table["nants"]
+        if not (0 <= ant1 < nants and 0 <= ant2 < nants):
+            return None
+        key = int(ant1) * nants + int(ant2)
+        group = np.searchsorted(table["keys"], key)
+        if group == table["keys"].size or table["keys"][group] != key:
+            return None
+
+        start, stop = table["bounds"][group], table["bounds"][group + 1]
+        step = int(table["step"][group])
+        if step == 0:
+            return table["order"][start:stop]
+
+        first = int(table["order"][start])
+        if self.blts_are_rectangular:
+            # use the same slices as the rectangular indexing helpers
+            if self.time_axis_faster_than_bls:
+                return slice(first, first + self.Ntimes)
+            return slice(first, None, self.Nbls)
+        return slice(first, first + step * int(stop - start - 1) + 1, step)
+
     def antpair2ind(
         self,
         ant1: int | tuple[int, int],
@@ -2633,50 +3053,21 @@ class UVData(UVBase):
         if (ant1, ant2, ordered) in self.__antpair2ind_cache:
             return self.__antpair2ind_cache[(ant1, ant2, ordered)]
 
-        if self.blts_are_rectangular:
-            antpairs = self.get_antpairs()
-            try:
-                idx = antpairs.index((ant1, ant2))
-                if self.time_axis_faster_than_bls:
-                    inds = slice(self.Ntimes * idx, self.Ntimes * (idx + 1))
-                else:
-                    inds = slice(idx, None, self.Nbls)
-
-            except ValueError:
-                # antpair is not in data
-                inds = None
-
-            if not ordered:
-                try:
-                    idx = antpairs.index((ant2, ant1))
-                    if self.time_axis_faster_than_bls:
-                        ind2 = slice(self.Ntimes * idx, self.Ntimes * (idx + 1))
-                    else:
-                        ind2 = slice(idx, None, self.Nbls)
-
-                    if inds is None:
-                        inds = ind2
-                    else:
-                        # concatenate them.
-                        indxs = np.arange(self.Nblts)
-                        inds = np.asarray(
-                            np.append(indxs[inds], indxs[ind2]), dtype=np.int64
-                        )
-                except ValueError:
-                    # inverse antpair is not in data
-                    pass
-        else:
-            # get indices
-            inds = np.where((self.ant_1_array == ant1) & (self.ant_2_array == ant2))[0]
-
-            if not ordered:
-                ind2 = np.where(
-                    (self.ant_1_array == ant2) & (self.ant_2_array == ant1)
-                )[0]
-                inds = np.asarray(np.append(inds, ind2), dtype=np.int64)
-
-            if inds.size == 0:
-                inds = None
+        inds = self._antpair_blt_inds(ant1, ant2)
+        if not ordered:
+            ind2 = self._antpair_blt_inds(ant2, ant1)
+            if inds is None:
+                inds = ind2
+            elif ind2 is not None:
+                # concatenate them.
+                inds = np.concatenate(
+                    [
+                        np.arange(*ind.indices(self.Nblts))
+                        if isinstance(ind, slice)
+                        else ind
+                        for ind in [inds, ind2]
+                    ]
+                ).astype(np.int64)
 
         inds = utils.tools.slicify(inds)
         self.__antpair2ind_cache[(ant1, ant2, ordered)] = inds
@@ -3457,7 +3848,9 @@ class UVData(UVBase):
         """
         dshape = data.shape
         inds = self._set_method_helper(dshape, key1, key2, key3)
+        self.load_lazy_data()
         hdf5_utils._index_dset(self.data_array, inds, input_array=data)
+        self._mark_changed("_data_array")
 
         return
 
@@ -3502,7 +3895,9 @@ class UVData(UVBase):
         """
         dshape = flags.shape
         inds = self._set_method_helper(dshape, key1, key2, key3)
+        self.load_lazy_data()
         hdf5_utils._index_dset(self.flag_array, inds, input_array=flags)
+        self._mark_changed("_flag_array")
 
         return
 
@@ -3549,7 +3944,9 @@ class UVData(UVBase):
         """
         dshape = nsamples.shape
         inds = self._set_method_helper(dshape, key1, key2, key3)
+        self.load_lazy_data()
         hdf5_utils._index_dset(self.nsample_array, inds, input_array=nsamples)
+        self._mark_changed("_nsample_array")
 
         return
 
@@ -3689,6 +4086,7 @@ class UVData(UVBase):
             self.uvw_array[index_array] *= -1
 
             if not self.metadata_only:
+                self.load_lazy_data()
                 orig_data_array = copy.copy(self.data_array)
                 for pol_ind in np.arange(self.Npols):
                     self.data_array[index_array, :, new_pol_inds[pol_ind]] = np.conj(
@@ -3704,6 +4102,11 @@ class UVData(UVBase):
             )
             self.Nbls = np.unique(self.baseline_array).size
             self._clear_antpair2ind_cache(self)
+            self._mark_changed(
+                "_uvw_array", "_ant_1_array", "_ant_2_array", "_baseline_array"
+            )
+            if not self.metadata_only:
+                self._mark_changed("_data_array")
 
     def reorder_pols(
         self,
@@ -3713,6 +4116,8 @@ class UVData(UVBase):
         check_extra=True,
         run_check_acceptability=True,
         strict_uvw_antpos_check=False,
+        check_level="full",
+        only_changed=False,
     ):
         """
         Arrange polarization axis according to desired order.
@@ -3737,6 +4142,13 @@ class UVData(UVBase):
         strict_uvw_antpos_check : bool
             Option to raise an error rather than a warning if the check that
             uvws match antenna positions does not pass.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full",
+            see the `check` method for details. Default is "full".
+        only_changed : bool
+            Option to only check parameters that have been set since they last passed
+            the checks on the object, see the `check` method for details. Default is
+            False.
 
         Raises
         ------
@@ -3780,6 +4192,8 @@ class UVData(UVBase):
                 check_extra=check_extra,
                 run_check_acceptability=run_check_acceptability,
                 strict_uvw_antpos_check=strict_uvw_antpos_check,
+                check_level=check_level,
+                only_changed=only_changed,
             )
 
     def set_rectangularity(self, *, force: bool = False) -> None:
@@ -3839,6 +4253,8 @@ class UVData(UVBase):
         check_extra=True,
         run_check_acceptability=True,
         strict_uvw_antpos_check=False,
+        check_level="full",
+        only_changed=False,
     ):
         """
         Arrange baseline-times axis according to desired order.
@@ -3890,6 +4306,13 @@ class UVData(UVBase):
         strict_uvw_antpos_check : bool
             Option to raise an error rather than a warning if the check that
             uvws match antenna positions does not pass.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full",
+            see the `check` method for details. Default is "full".
+        only_changed : bool
+            Option to only check parameters that have been set since they last passed
+            the checks on the object, see the `check` method for details. Default is
+            False.
 
         Raises
         ------
@@ -4057,6 +4480,8 @@ class UVData(UVBase):
                 check_extra=check_extra,
                 run_check_acceptability=run_check_acceptability,
                 strict_uvw_antpos_check=strict_uvw_antpos_check,
+                check_level=check_level,
+                only_changed=only_changed,
             )
 
     def reorder_freqs(
@@ -4069,6 +4494,8 @@ class UVData(UVBase):
         check_extra=True,
         run_check_acceptability=True,
         strict_uvw_antpos_check=False,
+        check_level="full",
+        only_changed=False,
     ):
         """
         Arrange frequency axis according to desired order.
@@ -4110,6 +4537,13 @@ class UVData(UVBase):
         strict_uvw_antpos_check : bool
             Option to raise an error rather than a warning if the check that
             uvws match antenna positions does not pass.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full",
+            see the `check` method for details. Default is "full".
+        only_changed : bool
+            Option to only check parameters that have been set since they last passed
+            the checks on the object, see the `check` method for details. Default is
+            False.
 
         Returns
         -------
@@ -4173,6 +4607,8 @@ class UVData(UVBase):
                 check_extra=check_extra,
                 run_check_acceptability=run_check_acceptability,
                 strict_uvw_antpos_check=strict_uvw_antpos_check,
+                check_level=check_level,
+                only_changed=only_changed,
             )
 
     def remove_eq_coeffs(self):
@@ -4232,10 +4668,12 @@ class UVData(UVBase):
             eq_coeff1 = np.repeat(eq_coeff1[:, np.newaxis], self.Npols, axis=1)
             eq_coeff2 = np.repeat(eq_coeff2[:, np.newaxis], self.Npols, axis=1)
 
+            self.load_lazy_data()
             if self.eq_coeffs_convention == "multiply":
                 self.data_array[blt_inds] *= eq_coeff1 * eq_coeff2
             else:
                 self.data_array[blt_inds] /= eq_coeff1 * eq_coeff2
+        self._mark_changed("_data_array")
 
         return
 
@@ -4315,9 +4753,11 @@ class UVData(UVBase):
             * self.freq_array.reshape(1, self.Nfreqs)
         )
 
+        self.load_lazy_data()
         self.data_array[select_mask] *= np.exp(
             (-1j * 2 * np.pi) * delta_w_lambda[:, :, None]
         )
+        self._mark_changed("_data_array")
 
     def unproject_phase(
         self, *, use_ant_pos=True, select_mask=None, cat_name="unprojected"
@@ -4394,6 +4834,12 @@ class UVData(UVBase):
         ].copy()
         self.phase_center_app_dec[select_mask_use] = self.telescope.location.lat.rad
         self.phase_center_frame_pa[select_mask_use] = 0
+        self._mark_changed(
+            "_phase_center_id_array",
+            "_phase_center_app_ra",
+            "_phase_center_app_dec",
+            "_phase_center_frame_pa",
+        )
 
         return
 
@@ -4413,6 +4859,7 @@ class UVData(UVBase):
         cat_name,
         lookup_name,
         time_array,
+        ephem_cache=None,
     ):
         """
         Supplies a dictionary with parameters for the phase method to use.
@@ -4447,7 +4894,10 @@ class UVData(UVBase):
             if (cat_type is None) or (cat_type == "ephem"):
                 [cat_times, cat_lon, cat_lat, cat_dist, cat_vrad] = (
                     phs_utils.lookup_jplhorizons(
-                        cat_name, time_array, telescope_loc=self.telescope.location
+                        cat_name,
+                        time_array,
+                        telescope_loc=self.telescope.location,
+                        ephem_cache=ephem_cache,
                     )
                 )
                 cat_type = "ephem"
@@ -4557,6 +5007,7 @@ class UVData(UVBase):
                         cat_name,
                         np.concatenate((np.reshape(time_array, -1), cat_times)),
                         telescope_loc=self.telescope.location,
+                        ephem_cache=ephem_cache,
                     )
                 )
             elif check_ephem:
@@ -4616,6 +5067,7 @@ class UVData(UVBase):
         use_ant_pos=True,
         select_mask=None,
         cleanup_old_sources=True,
+        ephem_cache=None,
     ):
         """
         Phase data to a new direction, supports sidereal, ephemeris and driftscan types.
@@ -4687,6 +5139,11 @@ class UVData(UVBase):
         select_mask : ndarray of bool
             Optional mask for selecting which data to operate on along the blt-axis.
             Shape is (Nblts,). Ignored if `use_old_proj` is True.
+        ephem_cache : str or path-like
+            Path to a JSON ephemeris store, only used if `lookup_name` is True and
+            the ephemeris is looked up from JPL-Horizons. Ephemerides in the store
+            are used rather than querying JPL-Horizons and queried ephemerides are
+            added to it. See `utils.phasing.lookup_jplhorizons` for details.
 
         Raises
         ------
@@ -4727,6 +5184,7 @@ class UVData(UVBase):
             cat_name=cat_name,
             lookup_name=lookup_name,
             time_array=self.time_array,
+            ephem_cache=ephem_cache,
         )
 
         if phase_dict["cat_type"] not in ["ephem", "unprojected"]:
@@ -4861,6 +5319,13 @@ class UVData(UVBase):
         self.phase_center_app_dec[select_mask] = new_app_dec
         self.phase_center_frame_pa[select_mask] = new_frame_pa
         self.phase_center_id_array[select_mask] = cat_id
+        self._mark_changed(
+            "_uvw_array",
+            "_phase_center_app_ra",
+            "_phase_center_app_dec",
+            "_phase_center_frame_pa",
+            "_phase_center_id_array",
+        )
 
         # If not multi phase center, make sure to update the ra/dec values, since
         # otherwise we'll have no record of source properties.
@@ -5149,6 +5614,7 @@ class UVData(UVBase):
                     * self.freq_array.reshape(1, self.Nfreqs)
                 )
                 phs = np.exp(-1j * 2 * np.pi * (-1) * w_lambda[:, :, None])
+                self.load_lazy_data()
                 self.data_array *= phs
 
             unique_times, _ = np.unique(self.time_array, return_index=True)
@@ -5239,15 +5705,21 @@ class UVData(UVBase):
         check_extra=True,
         run_check_acceptability=True,
         strict_uvw_antpos_check=False,
+        check_level="full",
+        only_changed=False,
         ignore_name=False,
     ):
         """
-        Combine two UVData objects along frequency, polarization and/or baseline-time.
+        Combine UVData objects along frequency, polarization and/or baseline-time.
 
         Parameters
         ----------
-        other : UVData object
-            Another UVData object which will be added to self.
+        other : UVData object or list of UVData objects
+            Another UVData object which will be added to self. If a list of objects
+            is passed, all of the objects are combined with self in a single pass:
+            the combined metadata are worked out first and the data-like arrays
+            are allocated once and filled from each object, rather than being
+            copied every time two objects are added.
         inplace : bool
             If True, overwrite self as we go, otherwise create a third object
             as the sum of the two.
@@ -5270,6 +5742,13 @@ class UVData(UVBase):
         strict_uvw_antpos_check : bool
             Option to raise an error rather than a warning if the check that
             uvws match antenna positions does not pass.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full",
+            see the `check` method for details. Default is "full".
+        only_changed : bool
+            Option to only check parameters that have been set since they last passed
+            the checks on the object, see the `check` method for details. Default is
+            False.
         ignore_name : bool
             Option to ignore the name of the phase center (`cat_name` in
             `phase_center_catalog`) when combining two UVData objects. If set to True,
@@ -5285,6 +5764,20 @@ class UVData(UVBase):
             or if data in self and other overlap.
 
         """
+        if isinstance(other, list | tuple):
+            return self._add_list(
+                other,
+                inplace=inplace,
+                verbose_history=verbose_history,
+                run_check=run_check,
+                check_extra=check_extra,
+                run_check_acceptability=run_check_acceptability,
+                strict_uvw_antpos_check=strict_uvw_antpos_check,
+                check_level=check_level,
+                only_changed=only_changed,
+                ignore_name=ignore_name,
+            )
+
         if inplace:
             this = self
         else:
@@ -5295,6 +5788,8 @@ class UVData(UVBase):
             check_extra=check_extra,
             run_check_acceptability=run_check_acceptability,
             strict_uvw_antpos_check=strict_uvw_antpos_check,
+            check_level=check_level,
+            only_changed=only_changed,
         )
         if not issubclass(other.__class__, this.__class__) and not issubclass(
             this.__class__, other.__class__
@@ -5307,6 +5802,8 @@ class UVData(UVBase):
             check_extra=check_extra,
             run_check_acceptability=run_check_acceptability,
             strict_uvw_antpos_check=strict_uvw_antpos_check,
+            check_level=check_level,
+            only_changed=only_changed,
         )
 
         # Define parameters that must be the same to add objects
@@ -5318,23 +5815,7 @@ class UVData(UVBase):
 
         # Create blt arrays for convenience
         prec_t = -2 * np.floor(np.log10(this._time_array.tols[-1])).astype(int)
-        prec_b = 8
-        this_blts = np.array(
-            [
-                "_".join(
-                    ["{1:.{0}f}".format(prec_t, blt[0]), str(blt[1]).zfill(prec_b)]
-                )
-                for blt in zip(this.time_array, this.baseline_array, strict=True)
-            ]
-        )
-        other_blts = np.array(
-            [
-                "_".join(
-                    ["{1:.{0}f}".format(prec_t, blt[0]), str(blt[1]).zfill(prec_b)]
-                )
-                for blt in zip(other.time_array, other.baseline_array, strict=True)
-            ]
-        )
+        this_blts, other_blts = _get_blt_keys([this, other], prec_t=prec_t)
         # Check we don't have overlapping data
         both_pol, this_pol_ind, other_pol_ind = np.intersect1d(
             this.polarization_array, other.polarization_array, return_indices=True
@@ -5725,9 +6206,11 @@ class UVData(UVBase):
         blt_t2o = np.nonzero(np.isin(this_blts, other_blts))[0]
 
         if not self.metadata_only:
+            this.load_lazy_data()
             this.data_array[np.ix_(blt_t2o, freq_t2o, pol_t2o)] = other.data_array
             this.nsample_array[np.ix_(blt_t2o, freq_t2o, pol_t2o)] = other.nsample_array
             this.flag_array[np.ix_(blt_t2o, freq_t2o, pol_t2o)] = other.flag_array
+            this._mark_changed("_data_array", "_nsample_array", "_flag_array")
 
             # Fix ordering
             axis_dict = {
@@ -5819,36 +6302,47 @@ class UVData(UVBase):
                 check_extra=check_extra,
                 run_check_acceptability=run_check_acceptability,
                 strict_uvw_antpos_check=strict_uvw_antpos_check,
+                check_level=check_level,
+                only_changed=only_changed,
             )
 
         if not inplace:
             return this
 
-    def __iadd__(
+    def _add_list(
         self,
-        other,
+        others,
         *,
+        inplace=False,
+        verbose_history=False,
         run_check=True,
         check_extra=True,
         run_check_acceptability=True,
         strict_uvw_antpos_check=False,
+        check_level="full",
+        only_changed=False,
         ignore_name=False,
     ):
         """
-        In place add.
+        Combine a list of UVData objects with this one in a single pass.
+
+        The combined baseline-time, frequency and polarization axes are worked
+        out once from all of the objects, with the same compatibility checks and
+        axis ordering as repeated pairwise adds (except that if none of the objects
+        add new elements to an axis, that axis keeps the order it has in this
+        object). The data-like arrays for the combined object are then allocated
+        once and each object's data are put into place, so the data are only copied
+        once no matter how many objects are being combined.
 
         Parameters
         ----------
-        other : UVData object
-            Another UVData object which will be added to self.
+        others : list of UVData objects
+            Other UVData objects which will be added to self.
+        inplace : bool
+            If True, overwrite self with the combined object, otherwise return a
+            new object.
         verbose_history : bool
-            Option to allow more verbose history. If True and if the histories for the
-            two objects are different, the combined object will keep all the history of
-            both input objects (if many objects are combined in succession this can
-            lead to very long histories). If False and if the histories for the two
-            objects are different, the combined object will have the history of the
-            first object and only the parts of the second object history that are unique
-            (this is done word by word and can result in hard to interpret histories).
+            Option to allow more verbose history, see `__add__` for details.
         run_check : bool
             Option to check for the existence and proper shapes of parameters
             after combining objects.
@@ -5860,51 +6354,490 @@ class UVData(UVBase):
         strict_uvw_antpos_check : bool
             Option to raise an error rather than a warning if the check that
             uvws match antenna positions does not pass.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full",
+            see the `check` method for details. Default is "full".
+        only_changed : bool
+            Option to only check parameters that have been set since they last passed
+            the checks on the object, see the `check` method for details. Default is
+            False.
         ignore_name : bool
-            Option to ignore the name of the phase center (`cat_name` in
-            `phase_center_catalog`) when combining two UVData objects. If set to True,
-            phase centers that are the same up to their name will be combined with the
-            name set to the name found in the first UVData object in the sum. If set to
-            False, phase centers that are the same up to the name will be kept as
-            separate phase centers. Default is False.
+            Option to ignore the name of the phase center when combining objects,
+            see `__add__` for details.
+
+        Returns
+        -------
+        UVData object
+            The combined object (only returned if inplace is False).
 
         Raises
         ------
         ValueError
-            If other is not a UVData object, self and other are not compatible
-            or if data in self and other overlap.
-            If `phase_center_radec` is not None and is not length 2.
+            If any of the objects are not UVData objects, if only some of the
+            objects are metadata only, if the objects are not compatible or if data
+            in the objects overlap.
 
         """
-        self.__add__(
-            other,
-            inplace=True,
-            run_check=run_check,
-            check_extra=check_extra,
-            run_check_acceptability=run_check_acceptability,
-            strict_uvw_antpos_check=strict_uvw_antpos_check,
-            ignore_name=ignore_name,
-        )
-        return self
+        uv_list = [self] + list(others)
+        for uv in uv_list[1:]:
+            if not issubclass(uv.__class__, self.__class__) and not issubclass(
+                self.__class__, uv.__class__
+            ):
+                raise ValueError(
+                    "Only UVData (or subclass) objects can be "
+                    "added to a UVData (or subclass) object"
+                )
+        metadata_only = [uv.metadata_only for uv in uv_list]
+        if any(metadata_only) and not all(metadata_only):
+            raise ValueError(
+                "Cannot combine a list of objects where some are metadata only and "
+                "some are not."
+            )
+        metadata_only = all(metadata_only)
 
-    def fast_concat(
-        self,
-        other,
-        axis,
-        *,
-        inplace=False,
-        verbose_history=False,
-        run_check=True,
-        check_extra=True,
-        run_check_acceptability=True,
-        strict_uvw_antpos_check=False,
-        ignore_name=None,
-    ):
-        """
-        Concatenate two UVData objects along specified axis with almost no checking.
+        for uv in uv_list:
+            uv.check(
+                check_extra=check_extra,
+                run_check_acceptability=run_check_acceptability,
+                strict_uvw_antpos_check=strict_uvw_antpos_check,
+                check_level=check_level,
+                only_changed=only_changed,
+            )
 
-        Warning! This method assumes all the metadata along other axes is sorted
-        the same way. The __add__ method is much safer, it checks all the metadata,
+        this = self.copy(metadata_only=True)
+
+        # Check parameters that must be the same to add objects
+        msg = "UVParameter {} does not match. Cannot combine objects."
+        for uv in uv_list[1:]:
+            for cp in ["_vis_units", "_telescope"]:
+                if getattr(this, cp) != getattr(uv, cp):
+                    raise ValueError(msg.format(cp[1:]))
+
+        flexpol_dict = {}
+        if any(
+            (uv.flex_spw_polarization_array is None)
+            != (this.flex_spw_polarization_array is None)
+            for uv in uv_list
+        ):
+            raise ValueError(
+                "Cannot add a flex-pol and non-flex-pol UVData objects. Use "
+                "the `remove_flex_pol` method to convert the objects to "
+                "have a regular polarization axis."
+            )
+        elif this.flex_spw_polarization_array is not None:
+            for uv in uv_list:
+                for spw_id, pol in zip(
+                    uv.spw_array, uv.flex_spw_polarization_array, strict=True
+                ):
+                    if flexpol_dict.setdefault(spw_id, pol) != pol:
+                        raise ValueError(
+                            "Cannot add a flex-pol UVData objects where the same "
+                            "spectral window contains different polarizations. Use "
+                            "the `remove_flex_pol` method to convert the objects "
+                            "to have a regular polarization axis."
+                        )
+
+        # Work out the combined axes from integer keys for each element. Channels
+        # can have the same frequency if they are in different spectral windows,
+        # so they are identified by both.
+        prec_t = -2 * np.floor(np.log10(this._time_array.tols[-1])).astype(int)
+        blt_keys = np.concatenate(_get_blt_keys(uv_list, prec_t=prec_t))
+        blt_union, blt_inds, new_blts = _get_axis_union(blt_keys)
+
+        freq_array = np.concatenate([uv.freq_array for uv in uv_list])
+        channel_width = np.concatenate([uv.channel_width for uv in uv_list])
+        flex_spw_id_array = np.concatenate([uv.flex_spw_id_array for uv in uv_list])
+        unique_freqs, freq_keys = np.unique(freq_array, return_inverse=True)
+        _, spw_keys = np.unique(flex_spw_id_array, return_inverse=True)
+        freq_union, freq_inds, new_freqs = _get_axis_union(
+            spw_keys.reshape(-1) * unique_freqs.size + freq_keys.reshape(-1)
+        )
+
+        polarization_array = np.concatenate([uv.polarization_array for uv in uv_list])
+        pol_union, pol_inds, new_pols = _get_axis_union(polarization_array)
+
+        blt_splits = np.cumsum([uv.Nblts for uv in uv_list])[:-1]
+        freq_splits = np.cumsum([uv.Nfreqs for uv in uv_list])[:-1]
+        pol_splits = np.cumsum([uv.Npols for uv in uv_list])[:-1]
+
+        # Merge the phase center catalogs in turn, as repeated adds would. The IDs
+        # in the combined catalog can change each time, so keep track of how the
+        # IDs of each object map onto it.
+        id_maps = [{cat_id: cat_id for cat_id in this.phase_center_catalog}]
+        for uv, uv_new_blts in zip(
+            uv_list[1:], np.split(new_blts, blt_splits)[1:], strict=True
+        ):
+            if not np.all(uv_new_blts):
+                for cp in ["_phase_center_catalog", "_Nphase"]:
+                    if getattr(this, cp) != getattr(uv, cp):
+                        raise ValueError(msg.format(cp[1:]))
+            # the IDs are updated in the phase_center_id_array as well as the
+            # catalog, so use it to find how they change.
+            cat_ids = list(this.phase_center_catalog)
+            this.phase_center_id_array = np.array(cat_ids)
+            this._consolidate_phase_center_catalogs(other=uv, ignore_name=ignore_name)
+            id_map = dict(
+                zip(cat_ids, this.phase_center_id_array.tolist(), strict=True)
+            )
+            id_maps = [{key: id_map[val] for key, val in m.items()} for m in id_maps]
+            id_maps.append({cat_id: cat_id for cat_id in uv.phase_center_catalog})
+
+        phase_center_id_array = []
+        for uv, id_map in zip(uv_list, id_maps, strict=True):
+            old_ids = np.array(sorted(id_map))
+            new_ids = np.array([id_map[cat_id] for cat_id in old_ids])
+            phase_center_id_array.append(
+                new_ids[np.searchsorted(old_ids, uv.phase_center_id_array)]
+            )
+
+        blt_params = {
+            name: np.concatenate([getattr(uv, name) for uv in uv_list])
+            for name in [
+                "uvw_array",
+                "time_array",
+                "integration_time",
+                "lst_array",
+                "ant_1_array",
+                "ant_2_array",
+                "baseline_array",
+                "phase_center_app_ra",
+                "phase_center_app_dec",
+                "phase_center_frame_pa",
+            ]
+        }
+        blt_params["phase_center_id_array"] = np.concatenate(phase_center_id_array)
+
+        # Check that the metadata for overlapping elements match, comparing with
+        # the first object each element appears in.
+        overlap = np.nonzero(~new_blts)[0]
+        if overlap.size > 0:
+            first = blt_union[blt_inds[overlap]]
+            for name in [
+                "integration_time",
+                "lst_array",
+                "phase_center_id_array",
+                "phase_center_app_ra",
+                "phase_center_app_dec",
+                "phase_center_frame_pa",
+                "uvw_array",
+            ]:
+                param = getattr(this, "_" + name)
+                if not np.allclose(
+                    blt_params[name][first],
+                    blt_params[name][overlap],
+                    rtol=param.tols[0],
+                    atol=param.tols[1],
+                ):
+                    raise ValueError(msg.format(name))
+        overlap = np.nonzero(~new_freqs)[0]
+        if overlap.size > 0 and not np.allclose(
+            channel_width[freq_union[freq_inds[overlap]]],
+            channel_width[overlap],
+            rtol=this._channel_width.tols[0],
+            atol=this._channel_width.tols[1],
+        ):
+            raise ValueError(msg.format("channel_width"))
+
+        # Order the combined axes. If there are new baseline-times they are sorted
+        # by time then baseline.
+        blt_order = np.arange(blt_union.size)
+        if blt_union.size > this.Nblts:
+            blt_order = np.argsort(blt_keys[blt_union])
+
+        freq_order = np.arange(freq_union.size)
+        if freq_union.size > this.Nfreqs:
+            union_spw_ids = flex_spw_id_array[freq_union]
+            # We want to preserve per-spw information based on first appearance
+            # in the concatenated array.
+            unique_index = np.sort(np.unique(union_spw_ids, return_index=True)[1])
+            this.spw_array = union_spw_ids[unique_index]
+            this.Nspws = len(this.spw_array)
+
+            if this.flex_spw_polarization_array is not None:
+                this.flex_spw_polarization_array = np.array(
+                    [flexpol_dict[key] for key in this.spw_array]
+                )
+            # Need to sort out the order of the individual windows first.
+            freq_order = np.concatenate(
+                [np.where(union_spw_ids == idx)[0] for idx in sorted(this.spw_array)]
+            )
+
+            # With spectral windows sorted, check and see if channels within
+            # windows need sorting. If they are ordered in ascending or descending
+            # fashion, leave them be. If not, sort in ascending order
+            for idx in this.spw_array:
+                select_mask = union_spw_ids[freq_order] == idx
+                check_freqs = freq_array[freq_union[freq_order[select_mask]]]
+                if (not np.all(check_freqs[1:] > check_freqs[:-1])) and (
+                    not np.all(check_freqs[1:] < check_freqs[:-1])
+                ):
+                    subsort_order = freq_order[select_mask]
+                    freq_order[select_mask] = subsort_order[np.argsort(check_freqs)]
+
+        pol_order = np.arange(pol_union.size)
+        if pol_union.size > this.Npols:
+            pol_order = np.argsort(np.abs(polarization_array[pol_union]))
+
+        # argsort of a permutation gives its inverse, which maps each element
+        # from its position in the union to its position in the combined axis.
+        blt_inds = np.argsort(blt_order)[blt_inds]
+        freq_inds = np.argsort(freq_order)[freq_inds]
+        pol_inds = np.argsort(pol_order)[pol_inds]
+
+        for name, value in blt_params.items():
+            setattr(this, name, value[blt_union[blt_order]])
+        this.freq_array = freq_array[freq_union[freq_order]]
+        this.channel_width = channel_width[freq_union[freq_order]]
+        this.flex_spw_id_array = flex_spw_id_array[freq_union[freq_order]]
+        this.polarization_array = polarization_array[pol_union[pol_order]]
+
+        # Update N parameters (e.g. Npols)
+        this.Ntimes = len(np.unique(this.time_array))
+        this.Nbls = len(np.unique(this.baseline_array))
+        this.Nblts = this.uvw_array.shape[0]
+        this.Nfreqs = this.freq_array.size
+        this.Npols = this.polarization_array.shape[0]
+        this.Nants_data = this._calc_nants_data()
+
+        # Build up the history and filename as repeated adds would.
+        for uv, *uv_new in zip(
+            uv_list[1:],
+            np.split(new_blts, blt_splits)[1:],
+            np.split(new_freqs, freq_splits)[1:],
+            np.split(new_pols, pol_splits)[1:],
+            strict=True,
+        ):
+            axes = [
+                axis
+                for axis, new in zip(
+                    ["baseline-time", "frequency", "polarization"], uv_new, strict=True
+                )
+                if np.any(new)
+            ]
+            if len(axes) > 0:
+                histories_match = utils.history._check_histories(
+                    this.history, uv.history
+                )
+
+                this.history += (
+                    " Combined data along " + ", ".join(axes) + " axis using pyuvdata."
+                )
+                if not histories_match:
+                    if verbose_history:
+                        this.history += " Next object history follows. " + uv.history
+                    else:
+                        extra_history = utils.history._combine_history_addition(
+                            this.history, uv.history
+                        )
+                        if extra_history is not None:
+                            this.history += (
+                                " Unique part of next object history follows. "
+                                + extra_history
+                            )
+
+            this.filename = utils.tools._combine_filenames(this.filename, uv.filename)
+        if this.filename is not None:
+            this._filename.form = (len(this.filename),)
+
+        # Check specific requirements
+        if this.Nfreqs > 1:
+            spacing_error, chanwidth_error = this._check_freq_spacing(
+                raise_errors=False
+            )
+
+            if spacing_error:
+                warnings.warn(
+                    "Combined frequencies are not evenly spaced or have differing "
+                    "values of channel widths. This will make it impossible to write "
+                    "this data out to some file types."
+                )
+            elif chanwidth_error:
+                warnings.warn(
+                    "Combined frequencies are separated by more than their "
+                    "channel width. This will make it impossible to write this data "
+                    "out to some file types."
+                )
+
+        this.blt_order = None
+        this.set_rectangularity(force=True)
+
+        if not metadata_only:
+            data_shape = (this.Nblts, this.Nfreqs, this.Npols)
+            data_array = np.zeros(
+                data_shape, dtype=np.result_type(*[uv.data_array for uv in uv_list])
+            )
+            nsample_array = np.zeros(
+                data_shape, dtype=np.result_type(*[uv.nsample_array for uv in uv_list])
+            )
+            flag_array = np.ones(data_shape, dtype=bool)
+
+            # Keep track of which samples have been filled to find overlapping data.
+            # The objects can overlap even if their total size is smaller than the
+            # combined data (e.g. if they differ on more than one axis).
+            filled = np.zeros(data_shape, dtype=bool)
+            overwrote = False
+
+            for uv, *uv_inds in zip(
+                uv_list,
+                np.split(blt_inds, blt_splits),
+                np.split(freq_inds, freq_splits),
+                np.split(pol_inds, pol_splits),
+                strict=True,
+            ):
+                # use basic slicing where possible, it avoids making index arrays
+                inds = tuple(_increasing_inds_to_slice(ind) for ind in uv_inds)
+                if any(ind is None for ind in inds):
+                    inds = np.ix_(*uv_inds)
+
+                overlap = filled[inds]
+                if np.any(overlap):
+                    if np.all(data_array[inds][overlap] == 0) and np.all(
+                        flag_array[inds][overlap]
+                    ):
+                        # we're fine to overwrite; update history at the end
+                        overwrote = True
+                    elif np.all(uv.data_array[overlap] == 0) and np.all(
+                        uv.flag_array[overlap]
+                    ):
+                        raise ValueError(
+                            "To combine these data, please run the add operation "
+                            "again, but with the object whose data is to be "
+                            "overwritten as the first object in the add "
+                            "operation."
+                        )
+                    else:
+                        raise ValueError(
+                            "These objects have overlapping data and cannot be "
+                            "combined."
+                        )
+                filled[inds] = True
+
+                data_array[inds] = uv.data_array
+                nsample_array[inds] = uv.nsample_array
+                flag_array[inds] = uv.flag_array
+
+            this.data_array = data_array
+            this.nsample_array = nsample_array
+            this.flag_array = flag_array
+            if overwrote:
+                this.history += " Overwrote invalid data using pyuvdata."
+
+        if inplace:
+            # include all attributes, not just UVParameter ones.
+            for attr in this.__iter__(uvparams_only=False):
+                # skip properties
+                if isinstance(getattr(type(this), attr, None), property):
+                    continue
+                setattr(self, attr, getattr(this, attr))
+            this = self
+
+        # Check final object is self-consistent
+        if run_check:
+            this.check(
+                check_extra=check_extra,
+                run_check_acceptability=run_check_acceptability,
+                strict_uvw_antpos_check=strict_uvw_antpos_check,
+                check_level=check_level,
+                only_changed=only_changed,
+            )
+
+        if not inplace:
+            return this
+
+    def __iadd__(
+        self,
+        other,
+        *,
+        run_check=True,
+        check_extra=True,
+        run_check_acceptability=True,
+        strict_uvw_antpos_check=False,
+        check_level="full",
+        only_changed=False,
+        ignore_name=False,
+    ):
+        """
+        In place add.
+
+        Parameters
+        ----------
+        other : UVData object
+            Another UVData object which will be added to self.
+        verbose_history : bool
+            Option to allow more verbose history. If True and if the histories for the
+            two objects are different, the combined object will keep all the history of
+            both input objects (if many objects are combined in succession this can
+            lead to very long histories). If False and if the histories for the two
+            objects are different, the combined object will have the history of the
+            first object and only the parts of the second object history that are unique
+            (this is done word by word and can result in hard to interpret histories).
+        run_check : bool
+            Option to check for the existence and proper shapes of parameters
+            after combining objects.
+        check_extra : bool
+            Option to check optional parameters as well as required ones.
+        run_check_acceptability : bool
+            Option to check acceptable range of the values of parameters after
+            combining objects.
+        strict_uvw_antpos_check : bool
+            Option to raise an error rather than a warning if the check that
+            uvws match antenna positions does not pass.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full",
+            see the `check` method for details. Default is "full".
+        only_changed : bool
+            Option to only check parameters that have been set since they last passed
+            the checks on the object, see the `check` method for details. Default is
+            False.
+        ignore_name : bool
+            Option to ignore the name of the phase center (`cat_name` in
+            `phase_center_catalog`) when combining two UVData objects. If set to True,
+            phase centers that are the same up to their name will be combined with the
+            name set to the name found in the first UVData object in the sum. If set to
+            False, phase centers that are the same up to the name will be kept as
+            separate phase centers. Default is False.
+
+        Raises
+        ------
+        ValueError
+            If other is not a UVData object, self and other are not compatible
+            or if data in self and other overlap.
+            If `phase_center_radec` is not None and is not length 2.
+
+        """
+        self.__add__(
+            other,
+            inplace=True,
+            run_check=run_check,
+            check_extra=check_extra,
+            run_check_acceptability=run_check_acceptability,
+            strict_uvw_antpos_check=strict_uvw_antpos_check,
+            check_level=check_level,
+            only_changed=only_changed,
+            ignore_name=ignore_name,
+        )
+        return self
+
+    def fast_concat(
+        self,
+        other,
+        axis,
+        *,
+        inplace=False,
+        verbose_history=False,
+        run_check=True,
+        check_extra=True,
+        run_check_acceptability=True,
+        strict_uvw_antpos_check=False,
+        check_level="full",
+        only_changed=False,
+        ignore_name=None,
+    ):
+        """
+        Concatenate two UVData objects along specified axis with almost no checking.
+
+        Warning! This method assumes all the metadata along other axes is sorted
+        the same way. The __add__ method is much safer, it checks all the metadata,
         but it is slower. Some quick checks are run, but this method doesn't
         make any guarantees that the resulting object is correct.
 
@@ -5943,6 +6876,13 @@ class UVData(UVBase):
         strict_uvw_antpos_check : bool
             Option to raise an error rather than a warning if the check that
             uvws match antenna positions does not pass.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full",
+            see the `check` method for details. Default is "full".
+        only_changed : bool
+            Option to only check parameters that have been set since they last passed
+            the checks on the object, see the `check` method for details. Default is
+            False.
         ignore_name : bool
             Option to ignore the name of the phase center (`cat_name` in
             `phase_center_catalog`) when combining two UVData objects. If set to True,
@@ -5975,6 +6915,8 @@ class UVData(UVBase):
             check_extra=check_extra,
             run_check_acceptability=run_check_acceptability,
             strict_uvw_antpos_check=strict_uvw_antpos_check,
+            check_level=check_level,
+            only_changed=only_changed,
         )
         for obj in other:
             if not issubclass(obj.__class__, this.__class__) and not issubclass(
@@ -5988,6 +6930,8 @@ class UVData(UVBase):
                 check_extra=check_extra,
                 run_check_acceptability=run_check_acceptability,
                 strict_uvw_antpos_check=strict_uvw_antpos_check,
+                check_level=check_level,
+                only_changed=only_changed,
             )
 
         # update the phase_center_catalog to make them consistent across objects
@@ -6214,6 +7158,8 @@ class UVData(UVBase):
                 check_extra=check_extra,
                 run_check_acceptability=run_check_acceptability,
                 strict_uvw_antpos_check=strict_uvw_antpos_check,
+                check_level=check_level,
+                only_changed=only_changed,
             )
 
         if not inplace:
@@ -6230,6 +7176,8 @@ class UVData(UVBase):
         check_extra=True,
         run_check_acceptability=True,
         strict_uvw_antpos_check=False,
+        check_level="full",
+        only_changed=False,
         override_params=None,
     ):
         """
@@ -6269,6 +7217,13 @@ class UVData(UVBase):
         strict_uvw_antpos_check : bool
             Option to raise an error rather than a warning if the check that
             uvws match antenna positions does not pass.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full",
+            see the `check` method for details. Default is "full".
+        only_changed : bool
+            Option to only check parameters that have been set since they last passed
+            the checks on the object, see the `check` method for details. Default is
+            False.
         override_params : array_like of strings
             List of object UVParameters to omit from compatibility check. Overridden
             parameters will not be compared between the objects, and the values
@@ -6296,6 +7251,8 @@ class UVData(UVBase):
             check_extra=check_extra,
             run_check_acceptability=run_check_acceptability,
             strict_uvw_antpos_check=strict_uvw_antpos_check,
+            check_level=check_level,
+            only_changed=only_changed,
         )
         if not issubclass(other.__class__, this.__class__) and not issubclass(
             this.__class__, other.__class__
@@ -6308,6 +7265,8 @@ class UVData(UVBase):
             check_extra=check_extra,
             run_check_acceptability=run_check_acceptability,
             strict_uvw_antpos_check=strict_uvw_antpos_check,
+            check_level=check_level,
+            only_changed=only_changed,
         )
 
         compatibility_params = list(this.__iter__())
@@ -6391,6 +7350,8 @@ class UVData(UVBase):
                 check_extra=check_extra,
                 run_check_acceptability=run_check_acceptability,
                 strict_uvw_antpos_check=strict_uvw_antpos_check,
+                check_level=check_level,
+                only_changed=only_changed,
             )
 
         if not inplace:
@@ -6405,6 +7366,8 @@ class UVData(UVBase):
         check_extra=True,
         run_check_acceptability=True,
         strict_uvw_antpos_check=False,
+        check_level="full",
+        only_changed=False,
         override_params=None,
     ):
         """
@@ -6433,6 +7396,13 @@ class UVData(UVBase):
         strict_uvw_antpos_check : bool
             Option to raise an error rather than a warning if the check that
             uvws match antenna positions does not pass.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full",
+            see the `check` method for details. Default is "full".
+        only_changed : bool
+            Option to only check parameters that have been set since they last passed
+            the checks on the object, see the `check` method for details. Default is
+            False.
         override_params : array_like of strings
             List of object UVParameters to omit from compatibility check. Overridden
             parameters will not be compared between the objects, and the values
@@ -6459,6 +7429,8 @@ class UVData(UVBase):
                 check_extra=check_extra,
                 run_check_acceptability=run_check_acceptability,
                 strict_uvw_antpos_check=strict_uvw_antpos_check,
+                check_level=check_level,
+                only_changed=only_changed,
                 override_params=override_params,
             )
         else:
@@ -6470,6 +7442,8 @@ class UVData(UVBase):
                 check_extra=check_extra,
                 run_check_acceptability=run_check_acceptability,
                 strict_uvw_antpos_check=strict_uvw_antpos_check,
+                check_level=check_level,
+                only_changed=only_changed,
                 override_params=override_params,
             )
 
@@ -7085,9 +8059,10 @@ class UVData(UVBase):
                         # In both cases, skip!
                         continue
 
-                    if isinstance(attr.value, np.ndarray):
+                    if isinstance(attr.value, np.ndarray | hdf5_utils.LazyHDF5Array):
                         # If we're working with an ndarray, use take to slice along
-                        # the axis that we want to grab from.
+                        # the axis that we want to grab from (this does not read any
+                        # data for lazily loaded arrays).
                         attr.value = attr.value.take(ind_arr, axis=sel_axis)
                         attr.setter(obj_use)
                     elif isinstance(attr.value, list):
@@ -7161,6 +8136,8 @@ class UVData(UVBase):
         check_extra=True,
         run_check_acceptability=True,
         strict_uvw_antpos_check=False,
+        check_level="full",
+        only_changed=False,
     ):
         """
         Downselect data to keep on the object along various axes.
@@ -7264,6 +8241,13 @@ class UVData(UVBase):
         strict_uvw_antpos_check : bool
             Option to raise an error rather than a warning if the check that
             uvws match antenna positions does not pass.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full",
+            see the `check` method for details. Default is "full".
+        only_changed : bool
+            Option to only check parameters that have been set since they last passed
+            the checks on the object, see the `check` method for details. Default is
+            False.
 
         Returns
         -------
@@ -7329,6 +8313,8 @@ class UVData(UVBase):
                 check_extra=check_extra,
                 run_check_acceptability=run_check_acceptability,
                 strict_uvw_antpos_check=strict_uvw_antpos_check,
+                check_level=check_level,
+                only_changed=only_changed,
             )
 
         if not inplace:
@@ -7381,8 +8367,10 @@ class UVData(UVBase):
             self.baseline_array
         )
 
-        # update metadata
+        # update metadata, baselines can be dropped if keep_ragged is False
         self.Nblts = self.baseline_array.shape[0]
+        self.Nbls = np.unique(self.baseline_array).size
+        self.Nants_data = self._calc_nants_data()
         self.Ntimes = np.unique(self.time_array).size
         self.uvw_array = np.zeros((self.Nblts, 3))
 
@@ -7512,74 +8500,61 @@ class UVData(UVBase):
             temp_new_samples[mask_close_floor]
         )
 
-        n_new_samples = np.asarray(list(map(int, np.ceil(temp_new_samples))))
+        n_new_samples = np.ceil(temp_new_samples).astype(int)
 
         temp_Nblts = np.sum(n_new_samples)
 
-        temp_baseline = np.zeros((temp_Nblts,), dtype=np.uint64)
-        temp_id_array = np.zeros((temp_Nblts,), dtype=int)
+        # each new sample is a copy of one of the original samples, so build an
+        # index array into the original blts and expand everything at once.
+        orig_inds = np.repeat(inds_to_upsample[0], n_new_samples)
+        n_per_sample = np.repeat(n_new_samples, n_new_samples)
+        # position of each new sample within its set of new samples
+        sub_inds = np.arange(temp_Nblts) - np.repeat(
+            np.cumsum(n_new_samples) - n_new_samples, n_new_samples
+        )
+
+        temp_baseline = self.baseline_array[orig_inds].astype(np.uint64)
+        temp_id_array = self.phase_center_id_array[orig_inds].astype(int)
         if initial_nphase_ids > 1 and initial_driftscan:
-            temp_initial_ids = np.zeros((temp_Nblts,), dtype=int)
+            temp_initial_ids = initial_ids[orig_inds].astype(int)
         else:
             temp_initial_ids = None
         if initial_nphase_ids > 1 and initial_unprojected:
-            temp_unprojected_blts = np.zeros((temp_Nblts,), dtype=bool)
+            temp_unprojected_blts = unprojected_blts[orig_inds].astype(bool)
         else:
             temp_unprojected_blts = None
-        temp_time = np.zeros((temp_Nblts,))
-        temp_int_time = np.zeros((temp_Nblts,))
         if self.metadata_only:
             temp_data = None
             temp_flag = None
             temp_nsample = None
         else:
-            new_data_shape = (temp_Nblts, self.Nfreqs, self.Npols)
-            temp_data = np.zeros(new_data_shape, dtype=self.data_array.dtype)
-            temp_flag = np.zeros(new_data_shape, dtype=self.flag_array.dtype)
-            temp_nsample = np.zeros(new_data_shape, dtype=self.nsample_array.dtype)
-
-        i0 = 0
-        for i, ind in enumerate(inds_to_upsample[0]):
-            i1 = i0 + n_new_samples[i]
-            temp_baseline[i0:i1] = self.baseline_array[ind]
-            temp_id_array[i0:i1] = self.phase_center_id_array[ind]
-            if initial_nphase_ids > 1:
-                if initial_driftscan:
-                    temp_initial_ids[i0:i1] = initial_ids[ind]
-                if initial_unprojected:
-                    temp_unprojected_blts[i0:i1] = unprojected_blts[ind]
-
-            if not self.metadata_only:
-                if summing_correlator_mode:
-                    temp_data[i0:i1] = self.data_array[ind] / n_new_samples[i]
-                else:
-                    temp_data[i0:i1] = self.data_array[ind]
-                temp_flag[i0:i1] = self.flag_array[ind]
-                temp_nsample[i0:i1] = self.nsample_array[ind]
-
-            # compute the new times of the upsampled array
-            t0 = self.time_array[ind]
-            dt = self.integration_time[ind] / n_new_samples[i]
-
-            # `offset` will be 0.5 or 1, depending on whether n_new_samples for
-            # this baseline is even or odd.
-            offset = 0.5 + 0.5 * (n_new_samples[i] % 2)
-            n2 = n_new_samples[i] // 2
-
-            # Figure out the new center for sample ii taking offset into
-            # account. Because `t0` is the central time for the original time
-            # sample, `nt` will range from negative to positive so that
-            # `temp_time` will result in the central time for the new samples.
-            # `idx2` tells us how to far to shift and in what direction for each
-            # new sample.
-            for ii, idx in enumerate(range(i0, i1)):
-                idx2 = ii + offset + n2 - n_new_samples[i]
-                nt = ((t0 * units.day) + (dt * idx2 * units.s)).to_value(units.day)
-                temp_time[idx] = nt
-
-            temp_int_time[i0:i1] = dt
-
-            i0 = i1
+            temp_data = self.data_array[orig_inds]
+            if summing_correlator_mode:
+                temp_data = (
+                    temp_data / n_per_sample[:, np.newaxis, np.newaxis]
+                ).astype(self.data_array.dtype, copy=False)
+            temp_flag = self.flag_array[orig_inds]
+            temp_nsample = self.nsample_array[orig_inds]
+
+        # compute the new times of the upsampled array
+        t0 = self.time_array[orig_inds]
+        dt = self.integration_time[orig_inds] / n_per_sample
+
+        # `offset` will be 0.5 or 1, depending on whether n_new_samples for
+        # this baseline is even or odd.
+        offset = 0.5 + 0.5 * (n_per_sample % 2)
+        n2 = n_per_sample // 2
+
+        # Figure out the new center for each new sample taking offset into
+        # account. Because `t0` is the central time for the original time
+        # sample, the shifts will range from negative to positive so that
+        # `temp_time` will result in the central time for the new samples.
+        # `idx2` tells us how to far to shift and in what direction for each
+        # new sample.
+        idx2 = sub_inds + offset + n2 - n_per_sample
+        temp_time = ((t0 * units.day) + (dt * idx2 * units.s)).to_value(units.day)
+
+        temp_int_time = dt
 
         # harmonize temporary arrays with existing ones
         inds_to_keep = np.nonzero(self.integration_time <= max_int_time)
@@ -7642,6 +8617,173 @@ class UVData(UVBase):
 
         return
 
+    def _downsample_time_gap_warnings(
+        self, *, bl_starts, bl_lengths, baselines, times, int_times
+    ):
+        """
+        Warn about baselines with time gaps before downsampling in time.
+
+        The samples must be grouped by baseline and time ordered within each
+        baseline.
+
+        Parameters
+        ----------
+        bl_starts : array of int
+            Index of the first sample for each baseline.
+        bl_lengths : array of int
+            Number of samples for each baseline.
+        baselines : array of int
+            Baseline number for each baseline.
+        times : array of float
+            Times of the samples in JD.
+        int_times : array of float
+            Integration times of the samples in seconds.
+
+        """
+        rtol, atol = self._integration_time.tols
+        # only baselines with more than one time can have gaps
+        multi_time = bl_lengths > 1
+        if not np.any(multi_time):
+            return
+
+        # figure out if there are any time gaps in the data
+        # meaning that the time differences are larger than the integration times
+        # time_array is in JD, need to convert to seconds for the diff
+        within_bl = np.ones(times.size - 1, dtype=bool)
+        within_bl[bl_starts[1:] - 1] = False
+        dtime = (np.diff(times) * 24 * 3600)[within_bl]
+        # index of the first time difference for each baseline
+        diff_starts = (bl_starts - np.arange(bl_starts.size))[multi_time]
+
+        # reduce over all the baselines so the windows stop at the next baseline
+        # (even if it only has one time) before selecting the multi-time ones
+        min_int_times = np.minimum.reduceat(int_times, bl_starts)[multi_time]
+        const_int_time = (
+            min_int_times == np.maximum.reduceat(int_times, bl_starts)[multi_time]
+        )
+        bl_starts = bl_starts[multi_time]
+        baselines = baselines[multi_time]
+
+        # for baselines with all the same integration times
+        min_dtime = np.minimum.reduceat(dtime, diff_starts)
+        max_dtime = np.maximum.reduceat(dtime, diff_starts)
+        time_gap = (min_dtime != max_dtime) & ~np.isclose(
+            min_dtime, max_dtime, rtol=rtol, atol=atol
+        )
+        int_time_mismatch = ~np.isclose(
+            dtime[diff_starts], int_times[bl_starts], rtol=rtol, atol=atol
+        )
+
+        # for baselines with varying integration times, need to be more careful
+        expected_dtimes = ((int_times[:-1] + int_times[1:]) / 2)[within_bl]
+        n_unexpected = np.add.reduceat(
+            (~np.isclose(dtime, expected_dtimes)).astype(int), diff_starts
+        )
+
+        for ind in np.nonzero(
+            (const_int_time & (time_gap | int_time_mismatch))
+            | (~const_int_time & (n_unexpected > 1))
+        )[0]:
+            antnums = self.baseline_to_antnums(baselines[ind])
+            if not const_int_time[ind]:
+                warnings.warn(
+                    "The time difference between integrations is different "
+                    "than the expected given the integration times for "
+                    f"baseline {antnums}. The output "
+                    "may include averages across long time gaps."
+                )
+            elif time_gap[ind]:
+                warnings.warn(
+                    "There is a gap in the times of baseline "
+                    f"{antnums}. "
+                    "The output may include averages across long time gaps."
+                )
+            else:
+                warnings.warn(
+                    "The time difference between integrations is not the "
+                    "same as the integration time for "
+                    f"baseline {antnums}. The output "
+                    "may average across longer time intervals than expected"
+                )
+
+    def _get_downsample_groups(
+        self,
+        *,
+        bl_starts,
+        bl_lengths,
+        int_times,
+        min_int_time=None,
+        n_times_to_avg=None,
+    ):
+        """
+        Find the averaging windows for downsampling in time.
+
+        The samples must be grouped by baseline and time ordered within each
+        baseline. The windows for a baseline cover all of its samples and never
+        cross into another baseline, so the last window for a baseline may not
+        reach the target (a ragged window).
+
+        Parameters
+        ----------
+        bl_starts : array of int
+            Index of the first sample for each baseline.
+        bl_lengths : array of int
+            Number of samples for each baseline.
+        int_times : array of float
+            Integration times of the samples in seconds.
+        min_int_time : float
+            Minimum integration time for the windows in seconds.
+        n_times_to_avg : int
+            Number of samples in each window, only used if `min_int_time` is None.
+
+        Returns
+        -------
+        group_starts : array of int
+            Sorted index of the first sample of each window.
+        group_complete : array of bool
+            Whether each window reaches the target (False for ragged windows).
+
+        """
+        n_samples = int_times.size
+        # index one past the last sample of the baseline for each sample
+        sample_bl_end = np.repeat(bl_starts + bl_lengths, bl_lengths)
+
+        if min_int_time is None:
+            bl_position = np.arange(n_samples) - np.repeat(bl_starts, bl_lengths)
+            group_starts = np.nonzero(bl_position % n_times_to_avg == 0)[0]
+            group_complete = (
+                group_starts + n_times_to_avg <= sample_bl_end[group_starts]
+            )
+            return group_starts, group_complete
+
+        # A window is complete once its total integration time is larger than or
+        # close to min_int_time, which is equivalent to being above this threshold.
+        rtol, atol = self._integration_time.tols
+        threshold = min_int_time - (atol + rtol * abs(min_int_time))
+
+        # The cumulative integration time increases across all the samples, so the
+        # end of a window starting at each sample can be found with one search.
+        cum_int_time = np.cumsum(int_times)
+        prev_cum_int_time = np.concatenate(([0.0], cum_int_time[:-1]))
+        window_end = np.searchsorted(
+            cum_int_time, prev_cum_int_time + threshold, side="left"
+        )
+        # windows always include at least one sample
+        window_end = np.maximum(window_end, np.arange(n_samples))
+        complete = window_end < sample_bl_end
+        next_start = np.minimum(window_end + 1, sample_bl_end)
+
+        # follow the chain of windows along all the baselines in parallel
+        group_starts = []
+        current = bl_starts
+        while current.size > 0:
+            group_starts.append(current)
+            following = next_start[current]
+            current = following[following < sample_bl_end[current]]
+        group_starts = np.sort(np.concatenate(group_starts))
+
+        return group_starts, complete[group_starts]
+
     def downsample_in_time(
         self,
         *,
@@ -7779,81 +8921,35 @@ class UVData(UVBase):
         else:
             bls_to_downsample = np.unique(self.baseline_array)
 
-        # figure out how many baseline times we'll end up with at the end
-        n_new_samples = 0
-        for bl in bls_to_downsample:
-            bl_inds = np.nonzero(self.baseline_array == bl)[0]
-            int_times = self.integration_time[bl_inds]
-
-            if min_int_time is not None:
-                running_int_time = 0.0
-                for itime, int_time in enumerate(int_times):
-                    running_int_time += int_time
-                    over_min_int_time = running_int_time > min_int_time or np.isclose(
-                        running_int_time,
-                        min_int_time,
-                        rtol=self._integration_time.tols[0],
-                        atol=self._integration_time.tols[1],
-                    )
-                    last_sample = itime == len(bl_inds) - 1
-                    # We sum up all the samples found so far if we're over the
-                    # target minimum time, or we've hit the end of the time
-                    # samples for this baseline.
-                    if over_min_int_time or last_sample:
-                        if last_sample and not (over_min_int_time or keep_ragged):
-                            # don't do anything -- implicitly drop these integrations
-                            continue
-                        n_new_samples += 1
-                        running_int_time = 0.0
-            else:
-                n_bl_times = self.time_array[bl_inds].size
-                nsample_temp = np.sum(n_bl_times / n_times_to_avg)
-                if keep_ragged and not np.isclose(nsample_temp, np.floor(nsample_temp)):
-                    n_new_samples += np.ceil(nsample_temp).astype(int)
-                else:
-                    n_new_samples += np.floor(nsample_temp).astype(int)
-
-            # figure out if there are any time gaps in the data
-            # meaning that the time differences are larger than the integration times
-            # time_array is in JD, need to convert to seconds for the diff
-            dtime = np.ediff1d(self.time_array[bl_inds]) * 24 * 3600
-            int_times = int_times
-            if len(np.unique(int_times)) == 1:
-                # this baseline has all the same integration times
-                if len(np.unique(dtime)) > 1 and not utils.tools._test_array_constant(
-                    dtime, tols=self._integration_time.tols
-                ):
-                    warnings.warn(
-                        "There is a gap in the times of baseline "
-                        f"{self.baseline_to_antnums(bl)}. "
-                        "The output may include averages across long time gaps."
-                    )
-                elif not np.isclose(
-                    dtime[0],
-                    int_times[0],
-                    rtol=self._integration_time.tols[0],
-                    atol=self._integration_time.tols[1],
-                ):
-                    warnings.warn(
-                        "The time difference between integrations is not the "
-                        "same as the integration time for "
-                        f"baseline {self.baseline_to_antnums(bl)}. The output "
-                        "may average across longer time intervals than expected"
-                    )
-
-            else:
-                # varying integration times for this baseline, need to be more careful
-                expected_dtimes = (int_times[:-1] + int_times[1:]) / 2
-                wh_diff = np.nonzero(~np.isclose(dtime, expected_dtimes))
-                if wh_diff[0].size > 1:
-                    warnings.warn(
-                        "The time difference between integrations is different "
-                        "than the expected given the integration times for "
-                        f"baseline {self.baseline_to_antnums(bl)}. The output "
-                        "may include averages across long time gaps."
-                    )
-
-        temp_Nblts = n_new_samples
+        # Gather all the blts to downsample, grouped by baseline (in the order of
+        # bls_to_downsample) and in time order within each baseline.
+        downsample_mask = np.isin(self.baseline_array, bls_to_downsample)
+        ds_inds = np.nonzero(downsample_mask)[0]
+        ds_inds = ds_inds[np.argsort(self.baseline_array[ds_inds], kind="stable")]
+        ds_bls = self.baseline_array[ds_inds]
+        bl_starts = np.nonzero(np.concatenate(([True], ds_bls[1:] != ds_bls[:-1])))[0]
+        bl_lengths = np.diff(np.append(bl_starts, ds_inds.size))
+
+        self._downsample_time_gap_warnings(
+            bl_starts=bl_starts,
+            bl_lengths=bl_lengths,
+            baselines=ds_bls[bl_starts],
+            times=self.time_array[ds_inds],
+            int_times=self.integration_time[ds_inds],
+        )
+
+        # figure out the averaging windows for all the baselines at once
+        group_starts, group_complete = self._get_downsample_groups(
+            bl_starts=bl_starts,
+            bl_lengths=bl_lengths,
+            int_times=self.integration_time[ds_inds],
+            min_int_time=min_int_time,
+            n_times_to_avg=n_times_to_avg,
+        )
+        group_lengths = np.diff(np.append(group_starts, ds_inds.size))
+        # windows at the end of a baseline that do not reach the target are only
+        # kept if keep_ragged is set.
+        groups_to_keep = group_complete | keep_ragged
 
         unprojected_blts = self._check_for_cat_type("unprojected")
         driftscan_blts = self._check_for_cat_type("driftscan")
@@ -7880,175 +8976,126 @@ class UVData(UVBase):
                 phase_time = Time(self.time_array[0], format="jd")
                 self.phase_to_time(phase_time)
 
-        # make temporary arrays
-        temp_baseline = np.zeros((temp_Nblts,), dtype=np.uint64)
-        temp_id_array = np.zeros((temp_Nblts,), dtype=int)
-        temp_time = np.zeros((temp_Nblts,))
-        temp_int_time = np.zeros((temp_Nblts,))
+        ds_ids = self.phase_center_id_array[ds_inds]
+        if self.Nphase > 1:
+            min_ids = np.minimum.reduceat(ds_ids, group_starts)
+            max_ids = np.maximum.reduceat(ds_ids, group_starts)
+            if np.any((min_ids != max_ids)[groups_to_keep]):
+                raise ValueError(
+                    "Multiple phase centers included in a downsampling "
+                    "window. Use `phase` to phase to a single phase center "
+                    "or decrease the `min_int_time` or `n_times_to_avg` "
+                    "parameter to avoid multiple phase centers being "
+                    "included in a downsampling window."
+                )
+
+        temp_baseline = ds_bls[group_starts][groups_to_keep].astype(np.uint64)
+        temp_id_array = ds_ids[group_starts][groups_to_keep].astype(int)
         if initial_nphase_ids > 1 and initial_driftscan:
-            temp_initial_ids = np.zeros((temp_Nblts,), dtype=int)
+            temp_initial_ids = np.minimum.reduceat(initial_ids[ds_inds], group_starts)
+            temp_initial_ids = temp_initial_ids[groups_to_keep].astype(int)
         else:
             temp_initial_ids = None
         if initial_nphase_ids > 1 and initial_unprojected:
-            temp_unprojected_blts = np.zeros((temp_Nblts,), dtype=bool)
+            temp_unprojected_blts = np.logical_and.reduceat(
+                unprojected_blts[ds_inds], group_starts
+            )[groups_to_keep]
         else:
             temp_unprojected_blts = None
+
+        # take potential non-uniformity of integration_time into account
+        ds_int_time = self.integration_time[ds_inds]
+        group_int_time = _window_sum(ds_int_time, group_starts, group_lengths)
+        temp_time = (
+            _window_sum(
+                self.time_array[ds_inds] * ds_int_time, group_starts, group_lengths
+            )
+            / group_int_time
+        )[groups_to_keep]
+        # the new integration times are running totals of the integration times,
+        # so add them in order (summing a column rather than pairwise)
+        temp_int_time = _window_sum(
+            ds_int_time[:, np.newaxis], group_starts, group_lengths
+        )[groups_to_keep, 0]
+
         if self.metadata_only:
             temp_data = None
             temp_flag = None
             temp_nsample = None
         else:
+            temp_Nblts = temp_baseline.size
             new_data_shape = (temp_Nblts, self.Nfreqs, self.Npols)
             temp_data = np.zeros(new_data_shape, dtype=self.data_array.dtype)
             temp_flag = np.zeros(new_data_shape, dtype=self.flag_array.dtype)
             temp_nsample = np.zeros(new_data_shape, dtype=self.nsample_array.dtype)
 
-        temp_idx = 0
-        for bl in bls_to_downsample:
-            bl_inds = np.nonzero(self.baseline_array == bl)[0]
-            running_int_time = 0.0
-            summing_idx = 0
-            n_sum = 0
-            for itime, int_time in enumerate(self.integration_time[bl_inds]):
-                running_int_time += int_time
-                n_sum += 1
-                if min_int_time is not None:
-                    over_min_int_time = running_int_time > min_int_time or np.isclose(
-                        running_int_time,
-                        min_int_time,
-                        rtol=self._integration_time.tols[0],
-                        atol=self._integration_time.tols[1],
+            # nsample array is the fraction of data that we actually kept,
+            # relative to the amount that went into the sum or average
+            # promote nsample dtype if half-precision
+            if self.nsample_array.dtype.type is np.float16:
+                nsample_dtype = np.float32
+            else:
+                nsample_dtype = self.nsample_array.dtype.type
+
+            # Do the window sums over chunks of whole averaging windows
+            # to limit the size of the temporary arrays.
+            group_bounds = np.append(group_starts, ds_inds.size)
+            out_inds = np.cumsum(groups_to_keep) - 1
+            chunk_blts = max(_DOWNSAMPLE_CHUNK_SIZE // (self.Nfreqs * self.Npols), 1)
+            g0 = 0
+            while g0 < group_starts.size:
+                g1 = np.searchsorted(
+                    group_bounds, group_bounds[g0] + chunk_blts, side="right"
+                )
+                g1 = min(max(g1 - 1, g0 + 1), group_starts.size)
+                chunk_inds = ds_inds[group_bounds[g0] : group_bounds[g1]]
+                local_starts = group_starts[g0:g1] - group_bounds[g0]
+                local_lengths = group_lengths[g0:g1]
+                keep = groups_to_keep[g0:g1]
+
+                # if all inputs are flagged, the flag array should be True,
+                # otherwise it should be False.
+                flags = self.flag_array[chunk_inds]
+                all_flagged = np.logical_and.reduceat(flags, local_starts, axis=0)
+                # need to update mask if a downsampled visibility will
+                # be flagged so that we don't set it to zero
+                mask = flags & ~np.repeat(all_flagged, local_lengths, axis=0)
+
+                # take potential non-uniformity of integration_time
+                # and nsamples into account
+                weights = np.where(
+                    mask,
+                    0,
+                    self.nsample_array[chunk_inds].astype(nsample_dtype, copy=False)
+                    * self.integration_time[chunk_inds, np.newaxis, np.newaxis],
+                )
+                weight_sum = _window_sum(weights, local_starts, local_lengths)
+                data = self.data_array[chunk_inds]
+                if summing_correlator_mode:
+                    chunk_data = _window_sum(
+                        np.where(mask, 0, data), local_starts, local_lengths
                     )
                 else:
-                    over_min_int_time = n_sum >= n_times_to_avg
-                last_sample = itime == len(bl_inds) - 1
-                # We sum up all the samples found so far if we're over the
-                # target minimum time, or we've hit the end of the time
-                # samples for this baseline.
-                if over_min_int_time or last_sample:
-                    if last_sample and not (over_min_int_time or keep_ragged):
-                        # don't do anything -- implicitly drop these integrations
-                        continue
-                    # sum together that number of samples
-                    temp_baseline[temp_idx] = bl
-                    # this might be wrong if some of the constituent times are
-                    # *totally* flagged
-                    averaging_idx = bl_inds[summing_idx : summing_idx + n_sum]
-                    if self.Nphase > 1:
-                        unique_phase_centers = np.unique(
-                            self.phase_center_id_array[averaging_idx]
-                        )
-                        if unique_phase_centers.size > 1:
-                            raise ValueError(
-                                "Multiple phase centers included in a downsampling "
-                                "window. Use `phase` to phase to a single phase center "
-                                "or decrease the `min_int_time` or `n_times_to_avg` "
-                                "parameter to avoid multiple phase centers being "
-                                "included in a downsampling window."
-                            )
-                    temp_id_array[temp_idx] = self.phase_center_id_array[
-                        averaging_idx[0]
-                    ]
-                    if initial_nphase_ids > 1:
-                        if initial_unprojected:
-                            unique_unprojected = np.unique(
-                                unprojected_blts[averaging_idx]
-                            )
-                            temp_unprojected_blts[temp_idx] = unique_unprojected[0]
-                        if initial_driftscan:
-                            unique_initial_ids = np.unique(initial_ids[averaging_idx])
-                            temp_initial_ids[temp_idx] = unique_initial_ids[0]
-                    # take potential non-uniformity of integration_time into account
-                    temp_time[temp_idx] = np.sum(
-                        self.time_array[averaging_idx]
-                        * self.integration_time[averaging_idx]
-                    ) / np.sum(self.integration_time[averaging_idx])
-                    temp_int_time[temp_idx] = running_int_time
-                    if not self.metadata_only:
-                        # if all inputs are flagged, the flag array should be True,
-                        # otherwise it should be False.
-                        # The sum below will be zero if it's all flagged and
-                        # greater than zero otherwise
-                        # Then we use a test against 0 to turn it into a Boolean
-                        temp_flag[temp_idx] = (
-                            np.sum(~self.flag_array[averaging_idx], axis=0) == 0
-                        )
-
-                        mask = self.flag_array[averaging_idx]
-                        # need to update mask if a downsampled visibility will
-                        # be flagged so that we don't set it to zero
-                        if (temp_flag[temp_idx]).any():
-                            ax1_inds, ax2_inds = np.nonzero(temp_flag[temp_idx])
-                            mask[:, ax1_inds, ax2_inds] = False
-
-                        masked_data = np.ma.masked_array(
-                            self.data_array[averaging_idx], mask=mask
-                        )
-
-                        # nsample array is the fraction of data that we actually kept,
-                        # relative to the amount that went into the sum or average
-                        nsample_dtype = self.nsample_array.dtype.type
-                        # promote nsample dtype if half-precision
-                        if nsample_dtype is np.float16:
-                            masked_nsample_dtype = np.float32
-                        else:
-                            masked_nsample_dtype = nsample_dtype
-                        masked_nsample = np.ma.masked_array(
-                            self.nsample_array[averaging_idx],
-                            mask=mask,
-                            dtype=masked_nsample_dtype,
-                        )
+                    chunk_data = _window_sum(
+                        np.where(mask, 0, data * weights), local_starts, local_lengths
+                    )
+                    np.divide(
+                        chunk_data, weight_sum, out=chunk_data, where=weight_sum != 0
+                    )
 
-                        int_time_arr = self.integration_time[
-                            averaging_idx, np.newaxis, np.newaxis
-                        ]
-                        masked_int_time = np.ma.masked_array(
-                            np.ones_like(
-                                self.data_array[averaging_idx],
-                                dtype=self.integration_time.dtype,
-                            )
-                            * int_time_arr,
-                            mask=mask,
-                        )
-                        if summing_correlator_mode:
-                            temp_data[temp_idx] = np.sum(masked_data, axis=0)
-                        else:
-                            # take potential non-uniformity of integration_time
-                            # and nsamples into account
-                            weights = masked_nsample * masked_int_time
-                            weighted_data = masked_data * weights
-                            temp_data[temp_idx] = np.sum(
-                                weighted_data, axis=0
-                            ) / np.sum(weights, axis=0)
-
-                        # output of masked array calculation should be coerced
-                        # to the datatype of temp_nsample (which has the same
-                        # precision as the original nsample_array)
-                        temp_nsample[temp_idx] = np.sum(
-                            masked_nsample * masked_int_time, axis=0
-                        ) / np.sum(self.integration_time[averaging_idx])
-                    # increment counters and reset values
-                    temp_idx += 1
-                    summing_idx += n_sum
-                    running_int_time = 0.0
-                    n_sum = 0
-
-        # make sure we've populated the right number of baseline-times
-        assert temp_idx == temp_Nblts, (
-            f"Wrong number of baselines. Got {temp_idx:d},  "
-            f"expected {temp_Nblts:d}. This is a bug, please make an issue at "
-            "https://github.com/RadioAstronomySoftwareGroup/pyuvdata/issues"
-        )
+                out_slice = out_inds[g0:g1][keep]
+                temp_data[out_slice] = chunk_data[keep]
+                temp_flag[out_slice] = all_flagged[keep]
+                # output of the calculation should be coerced to the datatype of
+                # temp_nsample (which has the same precision as nsample_array)
+                temp_nsample[out_slice] = (
+                    weight_sum[keep]
+                    / group_int_time[g0:g1][keep, np.newaxis, np.newaxis]
+                )
+                g0 = g1
 
         # harmonize temporary arrays with existing ones
-        if min_int_time is not None:
-            bls_not_downsampled = set(self.baseline_array) - set(bls_to_downsample)
-            inds_to_keep = []
-            for bl in bls_not_downsampled:
-                inds_to_keep += np.nonzero(self.baseline_array == bl)[0].tolist()
-            inds_to_keep = np.array(inds_to_keep, dtype=np.int64)
-        else:
-            inds_to_keep = np.array([], dtype=bool)
+        inds_to_keep = np.nonzero(~downsample_mask)[0]
         self._harmonize_resample_arrays(
             inds_to_keep=inds_to_keep,
             temp_baseline=temp_baseline,
@@ -8223,6 +9270,7 @@ class UVData(UVBase):
         propagate_flags=False,
         respect_spws=True,
         keep_ragged=True,
+        blt_chunk_size=None,
     ):
         """
         Average in frequency.
@@ -8259,8 +9307,23 @@ class UVData(UVBase):
             option controls whether the frequencies at the end of the spectral window
             will be dropped to make it evenly divisable (keep_ragged=False) or will be
             combined into a smaller frequency bin (keep_ragged=True). Default is True.
+        blt_chunk_size : int, optional
+            Number of baseline-times to average at once. Setting this limits the size
+            of the temporary arrays used in the averaging (which scale with the size
+            of the input data_array) at the cost of more iterations. Default is to
+            average all the baseline-times at once.
+
+        Raises
+        ------
+        ValueError
+            If blt_chunk_size is not a positive integer.
 
         """
+        if blt_chunk_size is not None and (
+            not isinstance(blt_chunk_size, int | np.integer) or blt_chunk_size < 1
+        ):
+            raise ValueError("blt_chunk_size must be a positive integer.")
+
         if self.Nspws > 1 and not respect_spws:
             # Put everything in one spectral window.
             self.Nspws = 1
@@ -8289,37 +9352,56 @@ class UVData(UVBase):
                     "before frequency averaging."
                 )
 
-        # Figure out how many channels are in each spw so we can tell if we have a
-        # ragged situation (indicated by the some_uneven variable).
-        # While we're at it, build up some useful dicts for later, keyed on spw
-        nchans_spw = np.zeros(self.Nspws, dtype=int)
-        # final_nchan will hold the number of Nfreqs after averaging.
-        final_nchan = 0
-        # spw_chans will hold the original channel indices for each spw
-        spw_chans = {}
-        # final_spw_chans will hold the final channel indices for each spw
-        final_spw_chans = {}
-        for spw_ind, spw in enumerate(self.spw_array):
-            these_inds = np.nonzero(self.flex_spw_id_array == spw)[0]
-            spw_chans[spw] = these_inds
-            nchans_spw[spw_ind] = these_inds.size
-            if keep_ragged:
-                this_final_nchan = int(np.ceil(nchans_spw[spw_ind] / n_chan_to_avg))
-            else:
-                this_final_nchan = int(np.floor(nchans_spw[spw_ind] / n_chan_to_avg))
-            final_spw_chans[spw] = np.arange(
-                final_nchan, final_nchan + this_final_nchan
-            )
-            final_nchan += this_final_nchan
-
-        # Since we have to loop through the spws, we cannot do the averaging with a
-        # simple reshape and average. So we need to create arrays to hold the
-        # various metadata & data after averaging
+        # Map every output channel to its input channels with a single array of
+        # shape (final_nchan, n_chan_to_avg) covering all the spws (output
+        # channels are ordered by spw, following the spw_array). Ragged output
+        # channels at the end of a spw only use the first entries in their row.
+        spw_sort = np.argsort(self.spw_array)
+        spw_inds = spw_sort[
+            np.searchsorted(self.spw_array, self.flex_spw_id_array, sorter=spw_sort)
+        ]
+        chan_order = np.argsort(spw_inds, kind="stable")
+        nchans_spw = np.bincount(spw_inds, minlength=self.Nspws)
+        spw_starts = np.cumsum(nchans_spw) - nchans_spw
+        if keep_ragged:
+            final_nchans_spw = -(-nchans_spw // n_chan_to_avg)
+        else:
+            final_nchans_spw = nchans_spw // n_chan_to_avg
+        final_nchan = int(np.sum(final_nchans_spw))
+        final_spw_starts = np.cumsum(final_nchans_spw) - final_nchans_spw
+
+        chan_spw_inds = spw_inds[chan_order]
+        spw_position = np.arange(self.Nfreqs) - spw_starts[chan_spw_inds]
+        spw_final_chan, avg_position = np.divmod(spw_position, n_chan_to_avg)
+        final_chan = final_spw_starts[chan_spw_inds] + spw_final_chan
+        use_chans = spw_final_chan < final_nchans_spw[chan_spw_inds]
+
+        chan_map = np.zeros((final_nchan, n_chan_to_avg), dtype=int)
+        chan_map[final_chan[use_chans], avg_position[use_chans]] = chan_order[use_chans]
+        final_nchan_avg = np.bincount(final_chan[use_chans], minlength=final_nchan)
+
+        # Group the output channels by the number of input channels they average
+        # (this is usually just n_chan_to_avg and the ragged number) so the sums
+        # can be done with one reduction per group over exactly those channels.
+        chan_groups = []
+        for nchan in np.unique(final_nchan_avg):
+            group_chans = np.nonzero(final_nchan_avg == nchan)[0]
+            chan_groups.append((group_chans, chan_map[group_chans, :nchan]))
+
+        # Now do the combining across the input channels
         final_freq_array = np.zeros(final_nchan, dtype=float)
         final_channel_width = np.zeros(final_nchan, dtype=float)
-        final_flex_spw_id_array = np.zeros(final_nchan, dtype=int)
         if self.eq_coeffs is not None:
             final_eq_coeffs = np.zeros((self.telescope.Nants, final_nchan), dtype=float)
+        for group_chans, group_map in chan_groups:
+            final_freq_array[group_chans] = self.freq_array[group_map].mean(axis=1)
+            # take a sum here rather to get final channel width
+            final_channel_width[group_chans] = self.channel_width[group_map].sum(axis=1)
+            if self.eq_coeffs is not None:
+                final_eq_coeffs[:, group_chans] = self.eq_coeffs[:, group_map].mean(
+                    axis=2
+                )
+        final_flex_spw_id_array = np.repeat(self.spw_array, final_nchans_spw)
 
         if not self.metadata_only:
             final_shape_tuple = (self.Nblts, final_nchan, self.Npols)
@@ -8329,188 +9411,77 @@ class UVData(UVBase):
                 final_shape_tuple, dtype=self.nsample_array.dtype
             )
 
-        # Now loop through the spws to actually do the averaging
-        for spw_ind, spw in enumerate(self.spw_array):
-            # n_final_chan_reg is the number of regular (non-ragged) channels after
-            # averaging in this spw.
-            # For the regular channels, we can average more quickly by reshaping the
-            # frequency axis into two axes of lengths (n_final_chan_reg, n_chan_to_avg)
-            # followed by an average (or sum) over the axis of length n_chan_to_avg.
-            # Then we just have to do one more calculation for the remaining input
-            # channels if there are ragged channels.
-            n_final_chan_reg = int(np.floor(nchans_spw[spw_ind] / n_chan_to_avg))
-            nfreq_mod_navg = nchans_spw[spw_ind] % n_chan_to_avg
-            these_inds = spw_chans[spw]
-            this_ragged = False
-            regular_inds = these_inds
-            irregular_inds = np.array([])
-            this_final_reg_inds = final_spw_chans[spw]
-            if nfreq_mod_navg != 0:
-                # not an even number of final channels
-                regular_inds = these_inds[0 : n_final_chan_reg * n_chan_to_avg]
-                if not keep_ragged:
-                    # only use the non-ragged inds
-                    these_inds = regular_inds
-                else:
-                    # find the irregular inds for this spw
-                    this_ragged = True
-                    irregular_inds = these_inds[n_final_chan_reg * n_chan_to_avg :]
-                    this_final_reg_inds = this_final_reg_inds[:-1]
-
-            # Now do the reshaping and combining across the n_chan_to_avg length axis
-            final_freq_array[this_final_reg_inds] = (
-                self.freq_array[regular_inds]
-                .reshape((n_final_chan_reg, n_chan_to_avg))
-                .mean(axis=1)
-            )
-            # take a sum here rather to get final channel width
-            final_channel_width[this_final_reg_inds] = (
-                self.channel_width[regular_inds]
-                .reshape((n_final_chan_reg, n_chan_to_avg))
-                .sum(axis=1)
-            )
-            if this_ragged:
-                # deal with the final ragged channel
-                final_freq_array[final_spw_chans[spw][-1]] = np.mean(
-                    self.freq_array[irregular_inds]
-                )
-                final_channel_width[final_spw_chans[spw][-1]] = np.sum(
-                    self.channel_width[irregular_inds]
-                )
-
-            final_flex_spw_id_array[final_spw_chans[spw]] = spw
-
-            if self.eq_coeffs is not None:
-                final_eq_coeffs[:, this_final_reg_inds] = (
-                    self.eq_coeffs[:, regular_inds]
-                    .reshape((self.telescope.Nants, n_final_chan_reg, n_chan_to_avg))
-                    .mean(axis=2)
-                )
-                if this_ragged:
-                    final_eq_coeffs[:, final_spw_chans[spw][-1]] = np.mean(
-                        self.eq_coeffs[:, irregular_inds], axis=1
-                    )
-
-            if not self.metadata_only:
-                shape_tuple = (self.Nblts, n_final_chan_reg, n_chan_to_avg, self.Npols)
+            # promote nsample dtype if half-precision
+            nsample_dtype = self.nsample_array.dtype.type
+            if nsample_dtype is np.float16:
+                masked_nsample_dtype = np.float32
+            else:
+                masked_nsample_dtype = nsample_dtype
 
-                reg_mask = self.flag_array[:, regular_inds].reshape(shape_tuple)
-                if this_ragged:
-                    irreg_mask = self.flag_array[:, irregular_inds]
+            if blt_chunk_size is None:
+                blt_chunk_size = max(self.Nblts, 1)
+            blt_slices = [
+                slice(blt_start, blt_start + blt_chunk_size)
+                for blt_start in range(0, self.Nblts, blt_chunk_size)
+            ]
+            for blts, (group_chans, group_map) in itertools.product(
+                blt_slices, chan_groups
+            ):
+                # shape (Nblts, Nchans in group, Nchans to average, Npols)
+                flags = self.flag_array[blts, group_map]
 
+                # if all inputs are flagged, the flag array should be True,
+                # otherwise it should be False.
+                all_flagged = np.all(flags, axis=2)
                 if propagate_flags:
                     # if any contributors are flagged, the result should be flagged
-                    final_flag_array[:, this_final_reg_inds] = np.any(
-                        self.flag_array[:, regular_inds].reshape(shape_tuple), axis=2
-                    )
-                    if this_ragged:
-                        final_flag_array[:, final_spw_chans[spw][-1]] = np.any(
-                            self.flag_array[:, irregular_inds], axis=1
-                        )
+                    final_flag_array[blts, group_chans] = np.any(flags, axis=2)
                 else:
-                    # if all inputs are flagged, the flag array should be True,
-                    # otherwise it should be False.
-                    final_flag_array[:, this_final_reg_inds] = np.all(
-                        self.flag_array[:, regular_inds].reshape(shape_tuple), axis=2
-                    )
-                    if this_ragged:
-                        final_flag_array[:, final_spw_chans[spw][-1]] = np.all(
-                            self.flag_array[:, irregular_inds], axis=1
-                        )
+                    final_flag_array[blts, group_chans] = all_flagged
 
                 # need to update mask if a downsampled visibility will be flagged
                 # so that we don't set it to zero
-                # This is a common radio astronomy convention that when averaging over
-                # entirely flagged channels, you include the flagged channels in the
-                # result (so it's not zero) whereas you exclude flagged channels if
-                # there are any unflagged channels in the average.
-                for chan_ind in np.arange(n_final_chan_reg):
-                    this_chan = final_spw_chans[spw][chan_ind]
-                    if (final_flag_array[:, this_chan]).any():
-                        ax0_inds, ax2_inds = np.nonzero(
-                            final_flag_array[:, this_chan, :]
-                        )
-                        # Only if all entries are masked
-                        # May not happen due to propagate_flags keyword
-                        # mask should be left alone otherwise
-                        fully_flagged = np.all(
-                            reg_mask[ax0_inds, this_chan, :, ax2_inds], axis=1
-                        )
-                        ff_inds = np.nonzero(fully_flagged)
-                        reg_mask[ax0_inds[ff_inds], this_chan, :, ax2_inds[ff_inds]] = (
-                            False
-                        )
-                if this_ragged:
-                    ax0_inds, ax2_inds = np.nonzero(
-                        final_flag_array[:, final_spw_chans[spw][-1], :]
-                    )
-                    fully_flagged = np.all(irreg_mask[ax0_inds, :, ax2_inds], axis=1)
-                    ff_inds = np.nonzero(fully_flagged)
-                    irreg_mask[ax0_inds[ff_inds], :, ax2_inds[ff_inds]] = False
-
-                # create a masked data array from the data_array and mask_array
-                # (based on the flag_array).
-                # This lets numpy handle the averaging with flags.
-                masked_reg_data = np.ma.masked_array(
-                    self.data_array[:, regular_inds].reshape(shape_tuple), mask=reg_mask
-                )
-                if this_ragged:
-                    masked_irreg_data = np.ma.masked_array(
-                        self.data_array[:, irregular_inds], mask=irreg_mask
-                    )
-
-                # promote nsample dtype if half-precision
-                nsample_dtype = self.nsample_array.dtype.type
-                if nsample_dtype is np.float16:
-                    masked_nsample_dtype = np.float32
-                else:
-                    masked_nsample_dtype = nsample_dtype
-                # create a masked nsample array from the data_array and mask_array
-                masked_reg_nsample = np.ma.masked_array(
-                    self.nsample_array[:, regular_inds].reshape(shape_tuple),
-                    mask=reg_mask,
-                    dtype=masked_nsample_dtype,
-                )
-                if this_ragged:
-                    masked_irreg_nsample = np.ma.masked_array(
-                        self.nsample_array[:, irregular_inds],
-                        mask=irreg_mask,
-                        dtype=masked_nsample_dtype,
-                    )
-
+                # This is a common radio astronomy convention that when averaging
+                # over entirely flagged channels, you include the flagged channels
+                # in the result (so it's not zero) whereas you exclude flagged
+                # channels if there are any unflagged channels in the average.
+                mask = flags & ~all_flagged[:, :, np.newaxis]
+
+                masked_nsample = np.where(
+                    mask,
+                    0,
+                    self.nsample_array[blts, group_map].astype(
+                        masked_nsample_dtype, copy=False
+                    ),
+                )
+                nsample_sum = np.sum(masked_nsample, axis=2)
                 if summing_correlator_mode:
                     # sum rather than average
-                    final_data_array[:, this_final_reg_inds] = np.sum(
-                        masked_reg_data, axis=2
-                    ).data
-                    if this_ragged:
-                        final_data_array[:, final_spw_chans[spw][-1]] = np.sum(
-                            masked_irreg_data, axis=1
-                        ).data
+                    final_data_array[blts, group_chans] = np.sum(
+                        np.where(mask, 0, self.data_array[blts, group_map]), axis=2
+                    )
                 else:
-                    # do a weighted average with the weights given by the nsample_array
-                    final_data_array[:, this_final_reg_inds] = (
-                        np.sum(masked_reg_data * masked_reg_nsample, axis=2)
-                        / np.sum(masked_reg_nsample, axis=2)
-                    ).data
-                    if this_ragged:
-                        final_data_array[:, final_spw_chans[spw][-1]] = (
-                            np.sum(masked_irreg_data * masked_irreg_nsample, axis=1)
-                            / np.sum(masked_irreg_nsample, axis=1)
-                        ).data
+                    # do a weighted average with the weights given by the
+                    # nsample_array
+                    data_sum = np.sum(
+                        np.where(
+                            mask, 0, self.data_array[blts, group_map] * masked_nsample
+                        ),
+                        axis=2,
+                    )
+                    np.divide(
+                        data_sum, nsample_sum, out=data_sum, where=nsample_sum != 0
+                    )
+                    final_data_array[blts, group_chans] = data_sum
 
                 # nsample array is the fraction of data that we actually kept,
                 # relative to the amount that went into the sum or average.
                 # So it's a sum over the averaged channels divided by the number of
                 # averaged channels
                 # Need to take care to return precision back to original value.
-                final_nsample_array[:, this_final_reg_inds] = (
-                    np.sum(masked_reg_nsample, axis=2) / float(n_chan_to_avg)
-                ).data.astype(nsample_dtype)
-                if this_ragged:
-                    final_nsample_array[:, final_spw_chans[spw][-1]] = (
-                        np.sum(masked_irreg_nsample, axis=1) / irregular_inds.size
-                    ).data.astype(nsample_dtype)
+                final_nsample_array[blts, group_chans] = (
+                    nsample_sum / float(group_map.shape[1])
+                ).astype(nsample_dtype)
 
         # Put the final arrays on the object
         self.freq_array = final_freq_array
@@ -8630,11 +9601,14 @@ class UVData(UVBase):
             ant2 = np.take(self.ant_2_array, unique_inds)
             antpos = self.telescope.get_enu_antpos()
 
-            ant1_inds = np.array(
-                [np.nonzero(self.telescope.antenna_numbers == ai)[0][0] for ai in ant1]
-            )
-            ant2_inds = np.array(
-                [np.nonzero(self.telescope.antenna_numbers == ai)[0][0] for ai in ant2]
+            ant_sort = np.argsort(self.telescope.antenna_numbers)
+            ant1_inds, ant2_inds = (
+                ant_sort[
+                    np.searchsorted(
+                        self.telescope.antenna_numbers, ants, sorter=ant_sort
+                    )
+                ]
+                for ants in (ant1, ant2)
             )
 
             baseline_vecs = np.take(antpos, ant2_inds, axis=0) - np.take(
@@ -8649,6 +9623,223 @@ class UVData(UVBase):
             use_grid_alg=use_grid_alg,
         )
 
+    def _get_redundant_average_inds(self, *, red_gps, conjugates, new_obj):
+        """
+        Find the compressed baseline-time each baseline-time is averaged into.
+
+        Each baseline-time is assigned to a redundant group and a time bin (times
+        within the time tolerance of each other are in the same bin), which is
+        matched to the index baseline for the group at the same time on the
+        compressed object.
+
+        Parameters
+        ----------
+        red_gps : list of list of int
+            The redundant groups of baseline numbers.
+        conjugates : list of int
+            Baseline numbers which are conjugated relative to their redundant group.
+        new_obj : UVData
+            The compressed object, which only has the index baselines.
+
+        Returns
+        -------
+        out_inds : ndarray of int
+            Index into the blt axis of `new_obj` for each baseline-time on this
+            object, -1 for baseline-times that are not in the compressed object.
+        conj : ndarray of bool
+            Whether each baseline-time needs to be conjugated before averaging.
+
+        """
+        group_bls = np.concatenate(red_gps)
+        group_ids = np.repeat(np.arange(len(red_gps)), [len(gp) for gp in red_gps])
+        bl_sort = np.argsort(group_bls)
+
+        unique_times = np.unique(self.time_array)
+        time_bins = np.concatenate(
+            ([0], np.cumsum(np.diff(unique_times) > self._time_array.tols[1]))
+        )
+        nbins = time_bins[-1] + 1
+
+        def _get_keys(uvd):
+            bl_inds = bl_sort[
+                np.searchsorted(group_bls, uvd.baseline_array, sorter=bl_sort).clip(
+                    max=group_bls.size - 1
+                )
+            ]
+            in_group = group_bls[bl_inds] == uvd.baseline_array
+            keys = (
+                group_ids[bl_inds].astype(np.int64) * nbins
+                + time_bins[np.searchsorted(unique_times, uvd.time_array)]
+            )
+            return np.where(in_group, keys, -1)
+
+        in_keys = _get_keys(self)
+        out_keys = _get_keys(new_obj)
+        # only use compressed baseline-times with a unique group and time bin
+        unique_out, out_counts = np.unique(out_keys, return_counts=True)
+        unique_out = unique_out[(out_counts == 1) & (unique_out >= 0)]
+        out_sort = np.argsort(out_keys)
+        unique_out_inds = out_sort[
+            np.searchsorted(out_keys, unique_out, sorter=out_sort)
+        ]
+        matched = (in_keys >= 0) & np.isin(in_keys, unique_out)
+        out_inds = np.full(self.Nblts, -1, dtype=np.int64)
+        out_inds[matched] = unique_out_inds[
+            np.searchsorted(unique_out, in_keys[matched])
+        ]
+
+        # warn once for each group and time bin that cannot be averaged
+        missing = (in_keys >= 0) & ~matched
+        for _ in range(np.unique(in_keys[missing]).size):
+            warnings.warn(
+                "Index baseline in the redundant group does not "
+                "have all the times, compressed object will be "
+                "missing those times."
+            )
+
+        inttime_diff = (
+            np.abs(
+                self.integration_time[matched]
+                - new_obj.integration_time[out_inds[matched]]
+            )
+            >= (new_obj._integration_time.tols[1])
+        )
+        for _ in range(np.unique(out_inds[matched][inttime_diff]).size):
+            warnings.warn(
+                "Integrations times are not identical in a redundant "
+                "group. Averaging anyway but this may cause unexpected "
+                "behavior."
+            )
+
+        # Baselines in the "conjugated" list are tabulated assuming that the
+        # baseline position is on the opposite side of the uvw origin, so they need
+        # to be conjugated to be averaged with the rest of the group, unless the
+        # index baseline is also in that list.
+        conj = np.isin(self.baseline_array, conjugates)
+        conj[matched] ^= np.isin(new_obj.baseline_array, conjugates)[out_inds[matched]]
+
+        return out_inds, conj
+
+    def _redundant_average(
+        self, *, out_inds, conj, nblts_out, chunk_size=None, meta=None
+    ):
+        """
+        Average the data into the compressed baseline-times.
+
+        The data are processed in chunks of baseline-times. Within each chunk the
+        baseline-times are sorted by the compressed baseline-time they are averaged
+        into and the nsample weighted sums are done with segmented reductions. Only
+        unflagged data are averaged unless all the data averaged into a compressed
+        baseline-time are flagged, in which case all the data are averaged.
+
+        Parameters
+        ----------
+        out_inds : ndarray of int
+            Index into the compressed blt axis for each baseline-time, -1 for
+            baseline-times that are not in the compressed object.
+        conj : ndarray of bool
+            Whether each baseline-time needs to be conjugated before averaging.
+        nblts_out : int
+            Number of baseline-times on the compressed object.
+        chunk_size : int, optional
+            Number of baseline-times to process at a time. Defaults to all of them
+            for data on the object or to the number of baselines if reading from a
+            file.
+        meta : FastUVH5Meta, optional
+            Metadata object for a UVH5 file to read the data from rather than using
+            the data on the object. Only the visdata, nsamples and flags datasets are
+            read, one chunk at a time.
+
+        Returns
+        -------
+        data_array : ndarray of complex
+            The averaged data.
+        nsample_array : ndarray of float
+            The summed nsamples of the averaged data.
+        flag_array : ndarray of bool
+            The flags for the averaged data, only True where all the averaged data
+            are flagged.
+
+        """
+        out_shape = (nblts_out, self.Nfreqs, self.Npols)
+        vis_sums = np.zeros((2,) + out_shape, dtype=np.complex128)
+        weight_sums = np.zeros((2,) + out_shape, dtype=np.float64)
+        flag_array = np.ones(out_shape, dtype=bool)
+        has_data = np.zeros(nblts_out, dtype=bool)
+
+        if meta is None:
+            if chunk_size is None:
+                chunk_size = max(self.Nblts, 1)
+            data_in = self.data_array
+            nsample_in = self.nsample_array
+            flag_in = self.flag_array
+        else:
+            if chunk_size is None:
+                chunk_size = self.Nbls
+            # these only read the indexed baseline-times from disk
+            data_in, nsample_in, flag_in = (
+                hdf5_utils.LazyHDF5Array(meta, name)
+                for name in ("visdata", "nsamples", "flags")
+            )
+        data_dtype = data_in.dtype
+        nsample_dtype = nsample_in.dtype
+        chunks = (
+            (
+                slice(start, start + chunk_size),
+                data_in[start : start + chunk_size],
+                nsample_in[start : start + chunk_size],
+                flag_in[start : start + chunk_size],
+            )
+            for start in range(0, self.Nblts, chunk_size)
+        )
+
+        for blts, data, nsamples, flags in chunks:
+            chunk_inds = out_inds[blts]
+            use = np.nonzero(chunk_inds >= 0)[0]
+            if use.size == 0:
+                continue
+            order = use[np.argsort(chunk_inds[use], kind="stable")]
+            sorted_inds = chunk_inds[order]
+            starts = np.concatenate(([0], np.nonzero(np.diff(sorted_inds))[0] + 1))
+            seg_inds = sorted_inds[starts]
+
+            vis = data[order]
+            vis = np.where(conj[blts][order, np.newaxis, np.newaxis], np.conj(vis), vis)
+            weights = nsamples[order].astype(np.float64)
+            chunk_flags = flags[order]
+            unflagged_weights = np.where(chunk_flags, 0, weights)
+            # first plane: only unflagged data, second plane: all data
+            vis_sums[0, seg_inds] += np.add.reduceat(
+                vis * unflagged_weights, starts, axis=0
+            )
+            weight_sums[0, seg_inds] += np.add.reduceat(
+                unflagged_weights, starts, axis=0
+            )
+            vis_sums[1, seg_inds] += np.add.reduceat(vis * weights, starts, axis=0)
+            weight_sums[1, seg_inds] += np.add.reduceat(weights, starts, axis=0)
+            flag_array[seg_inds] &= np.logical_and.reduceat(chunk_flags, starts, axis=0)
+            has_data[seg_inds] = True
+
+        # if all the data for a compressed baseline-time are flagged, average it
+        # all as if it were not flagged.
+        all_flagged = np.all(flag_array, axis=(1, 2))
+        vis_sums = np.where(all_flagged[:, np.newaxis, np.newaxis], *vis_sums[::-1])
+        weight_sums = np.where(
+            all_flagged[:, np.newaxis, np.newaxis], *weight_sums[::-1]
+        )
+        # do the final division at the precision of the input arrays
+        nsample_array = weight_sums.astype(nsample_dtype)
+        data_array = np.zeros(out_shape, dtype=data_dtype)
+        np.divide(
+            vis_sums.astype(data_dtype),
+            nsample_array,
+            out=data_array,
+            where=nsample_array > 0,
+        )
+        flag_array[~has_data] = False
+
+        return data_array, nsample_array, flag_array
+
     def compress_by_redundancy(
         self,
         *,
@@ -8657,6 +9848,8 @@ class UVData(UVBase):
         inplace=True,
         keep_all_metadata=True,
         use_grid_alg=False,
+        chunk_size=None,
+        filename=None,
     ):
         """
         Downselect or average to only have one baseline per redundant group.
@@ -8687,6 +9880,16 @@ class UVData(UVBase):
         use_grid_alg : bool
             Option to use the gridding based algorithm (developed by the HERA team)
             to find redundancies rather than the older clustering algorithm.
+        chunk_size : int, optional
+            Number of baseline-times to average at a time when method is "average",
+            which limits the size of temporary arrays. Defaults to all of them for
+            data on the object or to the number of baselines if `filename` is set.
+        filename : str or FastUVH5Meta, optional
+            UVH5 file to read the data to average from in chunks of `chunk_size`
+            baseline-times, so the full data are never held in memory. Only allowed
+            if method is "average" and the object is metadata only with the same
+            baseline-times (in the same order) as the file, e.g. if it was read from
+            the file with `read_data=False`.
 
         Returns
         -------
@@ -8697,6 +9900,42 @@ class UVData(UVBase):
         allowed_methods = ["select", "average"]
         if method not in allowed_methods:
             raise ValueError(f"method must be one of {allowed_methods}")
+        if chunk_size is not None and (
+            not isinstance(chunk_size, int | np.integer) or chunk_size < 1
+        ):
+            raise ValueError("chunk_size must be a positive integer.")
+        if filename is not None:
+            from .uvh5 import FastUVH5Meta
+
+            if method != "average":
+                raise ValueError('filename can only be set if method is "average".')
+            if not self.metadata_only:
+                raise ValueError("The object must be metadata only if filename is set.")
+            if not isinstance(filename, FastUVH5Meta):
+                meta = FastUVH5Meta(filename)
+                try:
+                    return self.compress_by_redundancy(
+                        method=method,
+                        tol=tol,
+                        inplace=inplace,
+                        keep_all_metadata=keep_all_metadata,
+                        use_grid_alg=use_grid_alg,
+                        chunk_size=chunk_size,
+                        filename=meta,
+                    )
+                finally:
+                    meta.close()
+            meta = filename
+            if (
+                (meta.Nblts, meta.Nfreqs, meta.Npols)
+                != (self.Nblts, self.Nfreqs, self.Npols)
+                or not np.array_equal(meta.baseline_array, self.baseline_array)
+                or not np.array_equal(meta.time_array, self.time_array)
+            ):
+                raise ValueError(
+                    "The baseline-times, frequencies or polarizations on this object "
+                    "do not match the file."
+                )
 
         red_gps, _, _, conjugates = self.get_redundancies(
             tol=tol, include_conjugates=True, use_grid_alg=use_grid_alg
@@ -8708,177 +9947,31 @@ class UVData(UVBase):
             new_obj = self.copy(metadata_only=True)
             new_obj.select(bls=bl_ants, keep_all_metadata=keep_all_metadata)
 
-            if not self.metadata_only:
-                # If the baseline is in the "conjugated" list, we will need to
-                # fix the conjugation on assignment (since the visibilities are
-                # tabulated assuming that the baseline position is on the opposite
-                # side of the uvw origin).
-                fix_conj = np.isin(new_obj.baseline_array, conjugates)
-
-                # initalize the data like arrays
-                new_data_shape = (new_obj.Nblts, new_obj.Nfreqs, new_obj.Npols)
-                temp_data_array = np.zeros(new_data_shape, dtype=self.data_array.dtype)
-                temp_nsample_array = np.zeros(
-                    new_data_shape, dtype=self.nsample_array.dtype
-                )
-                temp_flag_array = np.zeros(new_data_shape, dtype=self.flag_array.dtype)
-            for grp_ind, group in enumerate(red_gps):
-                if len(conjugates) > 0:
-                    conj_group = set(group).intersection(conjugates)
-                    reg_group = list(set(group) - conj_group)
-                    conj_group = list(conj_group)
-                else:
-                    reg_group = group
-                    conj_group = []
-                group_times = []
-                group_inds = []
-                conj_group_inds = []
-                conj_group_times = []
-                for bl in reg_group:
-                    bl_inds = np.where(self.baseline_array == bl)[0]
-                    group_inds.extend(bl_inds)
-                    group_times.extend(self.time_array[bl_inds])
-                for bl in conj_group:
-                    bl_inds = np.where(self.baseline_array == bl)[0]
-                    conj_group_inds.extend(bl_inds)
-                    conj_group_times.extend(self.time_array[bl_inds])
-
-                group_inds = np.array(group_inds, dtype=np.int64)
-                conj_group_inds = np.array(conj_group_inds, dtype=np.int64)
-                # now we have to figure out which times are the same to a tolerance
-                # so we can average over them.
-                time_inds = np.arange(len(group_times + conj_group_times))
-                time_gps = utils.redundancy.find_clusters(
-                    location_ids=time_inds,
-                    location_vectors=np.array(group_times + conj_group_times),
-                    tol=self._time_array.tols[1],
-                )
-
-                # average over the same times
-                obj_bl = bl_ants[grp_ind]
-                obj_inds = new_obj._key2inds(obj_bl)[0]
-                obj_times = new_obj.time_array[obj_inds]
-
-                for gp in time_gps:
-                    # Note that this average time is just used for identifying the
-                    # index to use for the blt axis on the averaged data set.
-                    # We do not update the actual time on that data set because it can
-                    # result in confusing behavior -- small numerical rounding errors
-                    # can result in many more unique times in the final data set than
-                    # in the initial data set.
-                    avg_time = np.average(np.array(group_times + conj_group_times)[gp])
-
-                    obj_time_ind = np.where(
-                        np.abs(obj_times - avg_time) < self._time_array.tols[1]
-                    )[0]
-
-                    if obj_time_ind.size == 1:
-                        if isinstance(obj_inds, slice):
-                            this_obj_ind = (obj_inds.start or 0) + obj_time_ind[0] * (
-                                obj_inds.step or 1
-                            )
-                        else:
-                            this_obj_ind = obj_inds[obj_time_ind[0]]
-                    else:
-                        warnings.warn(
-                            "Index baseline in the redundant group does not "
-                            "have all the times, compressed object will be "
-                            "missing those times."
-                        )
-                        continue
-
-                    # time_ind contains indices for both regular and conjugated bls
-                    # because we needed to group them together in time.
-                    # The regular ones are first and extend the length of group_times,
-                    # so we use that to split them back up.
-                    regular_orientation = np.array(
-                        [time_ind for time_ind in gp if time_ind < len(group_times)],
-                        dtype=np.int64,
-                    )
-                    regular_inds = group_inds[np.array(regular_orientation)]
-                    conj_orientation = np.array(
-                        [
-                            time_ind - len(group_times)
-                            for time_ind in gp
-                            if time_ind >= len(group_times)
-                        ],
-                        dtype=np.int64,
-                    )
-                    conj_inds = conj_group_inds[np.array(conj_orientation)]
-                    # check that the integration times are all the same
-                    int_times = np.concatenate(
-                        (
-                            self.integration_time[regular_inds],
-                            self.integration_time[conj_inds],
-                        )
-                    )
-                    if not np.all(
-                        np.abs(int_times - new_obj.integration_time[obj_time_ind])
-                        < new_obj._integration_time.tols[1]
-                    ):
-                        warnings.warn(
-                            "Integrations times are not identical in a redundant "
-                            "group. Averaging anyway but this may cause unexpected "
-                            "behavior."
-                        )
-
-                    if not self.metadata_only:
-                        vis_to_avg = np.concatenate(
-                            (
-                                self.data_array[regular_inds],
-                                np.conj(self.data_array[conj_inds]),
-                            )
-                        )
-                        nsample_to_avg = np.concatenate(
-                            (
-                                self.nsample_array[regular_inds],
-                                self.nsample_array[conj_inds],
-                            )
-                        )
-                        flags_to_avg = np.concatenate(
-                            (self.flag_array[regular_inds], self.flag_array[conj_inds])
-                        )
-                        # if all data is flagged, average it all as if it were not
-                        if np.all(flags_to_avg):
-                            mask = np.zeros_like(flags_to_avg)
-                        else:
-                            mask = flags_to_avg
-
-                        vis_to_avg = np.ma.masked_array(vis_to_avg, mask=mask)
-
-                        nsample_to_avg = np.ma.masked_array(nsample_to_avg, mask=mask)
-
-                        avg_vis = np.ma.average(
-                            vis_to_avg, weights=nsample_to_avg, axis=0
-                        )
-                        avg_nsample = np.sum(nsample_to_avg, axis=0)
-                        avg_flag = np.all(flags_to_avg, axis=0)
-                        temp_data_array[this_obj_ind] = avg_vis
-
-                        # If we need to flip the conjugation, to that on the
-                        # value assignment here.
-                        if fix_conj[this_obj_ind]:
-                            temp_data_array[this_obj_ind] = np.conj(avg_vis)
-                        else:
-                            temp_data_array[this_obj_ind] = avg_vis
-                        temp_nsample_array[this_obj_ind] = avg_nsample
-                        temp_flag_array[this_obj_ind] = avg_flag
+            out_inds, conj = self._get_redundant_average_inds(
+                red_gps=red_gps, conjugates=conjugates, new_obj=new_obj
+            )
+            average_data = not self.metadata_only or filename is not None
+            if average_data:
+                data_array, nsample_array, flag_array = self._redundant_average(
+                    out_inds=out_inds,
+                    conj=conj,
+                    nblts_out=new_obj.Nblts,
+                    chunk_size=chunk_size,
+                    meta=filename,
+                )
 
             if inplace:
                 self.select(bls=bl_ants, keep_all_metadata=keep_all_metadata)
-                if not self.metadata_only:
-                    self.data_array = temp_data_array
-                    self.nsample_array = temp_nsample_array
-                    self.flag_array = temp_flag_array
-                self.check()
-                return
+                out_obj = self
             else:
-                if not self.metadata_only:
-                    new_obj.data_array = temp_data_array
-                    new_obj.nsample_array = temp_nsample_array
-                    new_obj.flag_array = temp_flag_array
-                new_obj.check()
-                return new_obj
+                out_obj = new_obj
+            if average_data:
+                out_obj.data_array = data_array
+                out_obj.nsample_array = nsample_array
+                out_obj.flag_array = flag_array
+            out_obj.check()
+            if not inplace:
+                return out_obj
         else:
             return self.select(
                 bls=bl_ants, inplace=inplace, keep_all_metadata=keep_all_metadata
@@ -9084,6 +10177,13 @@ class UVData(UVBase):
         strict_uvw_antpos_check : bool
             Option to raise an error rather than a warning if the check that
             uvws match antenna positions does not pass.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full",
+            see the `check` method for details. Default is "full".
+        only_changed : bool
+            Option to only check parameters that have been set since they last passed
+            the checks on the object, see the `check` method for details. Default is
+            False.
         check_autos : bool
             Check whether any auto-correlations have non-zero imaginary values in
             data_array (which should not mathematically exist). Default is True.
@@ -9218,6 +10318,13 @@ class UVData(UVBase):
         strict_uvw_antpos_check : bool
             Option to raise an error rather than a warning if the check that
             uvw coordinates match antenna positions does not pass.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full",
+            see the `check` method for details. Default is "full".
+        only_changed : bool
+            Option to only check parameters that have been set since they last passed
+            the checks on the object, see the `check` method for details. Default is
+            False.
         allow_flex_pol : bool
             If only one polarization per spectral window is read (and the polarization
             differs from window to window), allow for the `UVData` object to use
@@ -9305,6 +10412,13 @@ class UVData(UVBase):
         strict_uvw_antpos_check : bool
             Option to raise an error rather than a warning if the check that
             uvws match antenna positions does not pass.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full",
+            see the `check` method for details. Default is "full".
+        only_changed : bool
+            Option to only check parameters that have been set since they last passed
+            the checks on the object, see the `check` method for details. Default is
+            False.
         calc_lst : bool
             Recalculate the LST values that are present within the file, useful in
             cases where the "online" calculate values have precision or value errors.
@@ -9365,74 +10479,152 @@ class UVData(UVBase):
         ----------
         filepath : str
             The measurement set root directory to read from.
-        data_column : str
-            name of CASA data column to read into data_array. Options are:
-            'DATA', 'MODEL', or 'CORRECTED_DATA'
-        pol_order : str or None
-            Option to specify polarizations order convention, options are
-            'CASA', 'AIPS', or None (no reordering). Default is 'AIPS'.
-        background_lsts : bool
-            When set to True, the lst_array is calculated in a background thread.
-        run_check : bool
-            Option to check for the existence and proper shapes of parameters
-            after after reading in the file (the default is True,
-            meaning the check will be run).
-        check_extra : bool
-            Option to check optional parameters as well as required ones (the
-            default is True, meaning the optional parameters will be checked).
-        run_check_acceptability : bool
-            Option to check acceptable range of the values of parameters after
-            reading in the file (the default is True, meaning the acceptable
-            range check will be done).
-        strict_uvw_antpos_check : bool
-            Option to raise an error rather than a warning if the check that
-            uvws match antenna positions does not pass.
-        ignore_single_chan : bool
-            Some measurement sets (e.g., those from ALMA) use single channel spectral
-            windows for recording pseudo-continuum channels or storing other metadata
-            in the track when the telescopes are not on source. Because of the way
-            the object is strutured (where all spectral windows are assumed to be
-            simultaneously recorded), this can significantly inflate the size and memory
-            footprint of UVData objects. By default, single channel windows are ignored
-            to avoid this issue, although they can be included if setting this parameter
-            equal to True.
-        raise_error : bool
-            The measurement set format allows for different spectral windows and
-            polarizations to have different metdata for the same time-baseline
-            combination, but UVData objects do not. It also allows for timescales that
-            are not supported by astropy. If any of these problems are detected, by
-            default the reader will throw an error. However, if set to False, the reader
-            will simply give a warning and try to do the best it can. If the problem is
-            with differing metadata, it will use the first value read in the file as the
-            "correct" metadata in the UVData object. If the problem is with the
-            timescale, it will just assume UTC.
-        read_weights : bool
-            Read in the weights from the MS file, default is True. If false, the method
-            will set the `nsamples_array` to the same uniform value (namely 1.0).
-        allow_flex_pol : bool
-            If only one polarization per spectral window is read (and the polarization
-            differs from window to window), allow for the `UVData` object to use
-            "flexible polarization", which compresses the polarization-axis of various
-            attributes to be of length 1, sets the `flex_spw_polarization_array`
-            attribute to define the polarization per spectral window.  Default is True.
-        check_autos : bool
-            Check whether any auto-correlations have non-zero imaginary values in
-            data_array (which should not mathematically exist). Default is True.
-        fix_autos : bool
-            If auto-correlations with imaginary values are found, fix those values so
-            that they are real-only in data_array. Default is True.
-        use_future_array_shapes : bool
-            Defunct option, will result in an error in version 3.2.
-        astrometry_library : str
-            Library used for calculating LSTs. Allowed options are 'erfa' (which uses
-            the pyERFA), 'novas' (which uses the python-novas library), and 'astropy'
-            (which uses the astropy utilities). Default is erfa unless the
-            telescope_location frame is MCMF (on the moon), in which case the default
-            is astropy.
-
-        Raises
-        ------
-        IOError
+        antenna_nums : array_like of int, optional
+            The antennas numbers to include when reading data into the object
+            (antenna positions and names for the removed antennas will be retained
+            unless `keep_all_metadata` is False). This cannot be provided if
+            `antenna_names` is also provided.
+        antenna_names : array_like of str, optional
+            The antennas names to include when reading data into the object
+            (antenna positions and names for the removed antennas will be retained
+            unless `keep_all_metadata` is False). This cannot be provided if
+            `antenna_nums` is also provided.
+        bls : list of tuple, optional
+            A list of antenna number tuples (e.g. [(0, 1), (3, 2)]) or a list of
+            baseline 3-tuples (e.g. [(0, 1, 'xx'), (2, 3, 'yy')]) specifying baselines
+            to include when reading data into the object. For length-2 tuples,
+            the ordering of the numbers within the tuple does not matter. For
+            length-3 tuples, the polarization string is in the order of the two
+            antennas. If length-3 tuples are provided, `polarizations` must be
+            None.
+        ant_str : str, optional
+            A string containing information about what antenna numbers
+            and polarizations to include when reading data into the object.
+            Can be 'auto', 'cross', 'all', or combinations of antenna numbers
+            and polarizations (e.g. '1', '1_2', '1x_2y').  See tutorial for more
+            examples of valid strings and the behavior of different forms for ant_str.
+            If '1x_2y,2y_3y' is passed, both polarizations 'xy' and 'yy' will
+            be kept for both baselines (1, 2) and (2, 3) to return a valid
+            pyuvdata object.
+            An ant_str cannot be passed in addition to any of `antenna_nums`,
+            `antenna_names`, `bls` args or the `polarizations` parameters,
+            if it is a ValueError will be raised.
+        frequencies : array_like of float, optional
+            The frequencies to include when reading data into the object, each
+            value passed here should exist in the freq_array.
+        freq_chans : array_like of int, optional
+            The frequency channel numbers to include when reading data into the
+            object.
+        times : array_like of float, optional
+            The times to include when reading data into the object, each value
+            passed here should exist in the time_array. Cannot be used with
+            `time_range`, `lsts`, or `lst_array`.
+        time_range : array_like of float, optional
+            The time range in Julian Date to keep in the object, must be
+            length 2. Some of the times in the object should fall between the
+            first and last elements. Cannot be used with `times`.
+        lsts : array_like of float, optional
+            The local sidereal times (LSTs) to keep in the object, each value
+            passed here should exist in the lst_array. Cannot be used with
+            `times`, `time_range`, or `lst_range`.
+        lst_range : array_like of float, optional
+            The local sidereal time (LST) range in radians to keep in the
+            object, must be of length 2. Some of the LSTs in the object should
+            fall between the first and last elements. If the second value is
+            smaller than the first, the LSTs are treated as having phase-wrapped
+            around LST = 2*pi = 0, and the LSTs kept on the object will run from
+            the larger value, through 0, and end at the smaller value.
+        polarizations : array_like of int, optional
+            The polarizations numbers to include when reading data into the
+            object, each value passed here should exist in the polarization_array.
+        blt_inds : array_like of int, optional
+            The baseline-time indices to include when reading data into the
+            object. This is not commonly used.
+        phase_center_ids : array_like of int, optional
+            Phase center IDs to include when reading data into the object (effectively
+            a selection on baseline-times). Cannot be used with catalog_names.
+        catalog_names : str or array-like of str, optional
+            The names of the phase centers (sources) to include when reading data into
+            the object, which should match exactly in spelling and capitalization.
+            Cannot be used with phase_center_ids.
+        keep_all_metadata : bool
+            Option to keep all the metadata associated with antennas, even those
+            that do not have data associated with them after the select option.
+        data_column : str
+            name of CASA data column to read into data_array. Options are:
+            'DATA', 'MODEL', or 'CORRECTED_DATA'
+        pol_order : str or None
+            Option to specify polarizations order convention, options are
+            'CASA', 'AIPS', or None (no reordering). Default is 'AIPS'.
+        background_lsts : bool
+            When set to True, the lst_array is calculated in a background thread.
+        run_check : bool
+            Option to check for the existence and proper shapes of parameters
+            after after reading in the file (the default is True,
+            meaning the check will be run).
+        check_extra : bool
+            Option to check optional parameters as well as required ones (the
+            default is True, meaning the optional parameters will be checked).
+        run_check_acceptability : bool
+            Option to check acceptable range of the values of parameters after
+            reading in the file (the default is True, meaning the acceptable
+            range check will be done).
+        strict_uvw_antpos_check : bool
+            Option to raise an error rather than a warning if the check that
+            uvws match antenna positions does not pass.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full",
+            see the `check` method for details. Default is "full".
+        only_changed : bool
+            Option to only check parameters that have been set since they last passed
+            the checks on the object, see the `check` method for details. Default is
+            False.
+        ignore_single_chan : bool
+            Some measurement sets (e.g., those from ALMA) use single channel spectral
+            windows for recording pseudo-continuum channels or storing other metadata
+            in the track when the telescopes are not on source. Because of the way
+            the object is strutured (where all spectral windows are assumed to be
+            simultaneously recorded), this can significantly inflate the size and memory
+            footprint of UVData objects. By default, single channel windows are ignored
+            to avoid this issue, although they can be included if setting this parameter
+            equal to True.
+        raise_error : bool
+            The measurement set format allows for different spectral windows and
+            polarizations to have different metdata for the same time-baseline
+            combination, but UVData objects do not. It also allows for timescales that
+            are not supported by astropy. If any of these problems are detected, by
+            default the reader will throw an error. However, if set to False, the reader
+            will simply give a warning and try to do the best it can. If the problem is
+            with differing metadata, it will use the first value read in the file as the
+            "correct" metadata in the UVData object. If the problem is with the
+            timescale, it will just assume UTC.
+        read_weights : bool
+            Read in the weights from the MS file, default is True. If false, the method
+            will set the `nsamples_array` to the same uniform value (namely 1.0).
+        allow_flex_pol : bool
+            If only one polarization per spectral window is read (and the polarization
+            differs from window to window), allow for the `UVData` object to use
+            "flexible polarization", which compresses the polarization-axis of various
+            attributes to be of length 1, sets the `flex_spw_polarization_array`
+            attribute to define the polarization per spectral window.  Default is True.
+        check_autos : bool
+            Check whether any auto-correlations have non-zero imaginary values in
+            data_array (which should not mathematically exist). Default is True.
+        fix_autos : bool
+            If auto-correlations with imaginary values are found, fix those values so
+            that they are real-only in data_array. Default is True.
+        use_future_array_shapes : bool
+            Defunct option, will result in an error in version 3.2.
+        astrometry_library : str
+            Library used for calculating LSTs. Allowed options are 'erfa' (which uses
+            the pyERFA), 'novas' (which uses the python-novas library), and 'astropy'
+            (which uses the astropy utilities). Default is erfa unless the
+            telescope_location frame is MCMF (on the moon), in which case the default
+            is astropy.
+
+        Raises
+        ------
+        IOError
             If root file directory doesn't exist.
         ValueError
             If the `data_column` is not set to an allowed value.
@@ -9553,6 +10745,13 @@ class UVData(UVBase):
         strict_uvw_antpos_check : bool
             Option to raise an error rather than a warning if the check that
             uvws match antenna positions does not pass.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full",
+            see the `check` method for details. Default is "full".
+        only_changed : bool
+            Option to only check parameters that have been set since they last passed
+            the checks on the object, see the `check` method for details. Default is
+            False.
         check_autos : bool
             Check whether any auto-correlations have non-zero imaginary values in
             data_array (which should not mathematically exist). Default is True.
@@ -9694,6 +10893,13 @@ class UVData(UVBase):
         strict_uvw_antpos_check : bool
             Option to raise an error rather than a warning if the check that
             uvws match antenna positions does not pass.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full",
+            see the `check` method for details. Default is "full".
+        only_changed : bool
+            Option to only check parameters that have been set since they last passed
+            the checks on the object, see the `check` method for details. Default is
+            False.
         fix_old_proj : bool
             Applies a fix to uvw-coordinates and phasing, assuming that the old `phase`
             method was used prior to writing the data, which had errors of the order of
@@ -9829,6 +11035,18 @@ class UVData(UVBase):
             Read in the visibility, nsample and flag data. If set to False, only
             the metadata will be read in. Setting read_data to False results in
             a metadata only object.
+        lazy : bool
+            Option to lazily load the visibility, nsample and flag data. If True,
+            the data_array, flag_array and nsample_array are set to
+            :class:`pyuvdata.utils.io.hdf5.LazyHDF5Array` objects, which only read
+            data from disk when they are indexed (e.g. by :meth:`get_data` or
+            :meth:`antpairpol_iter`) or converted to numpy arrays. Selections are
+            applied without reading any data. Methods that modify the data in place
+            require the data to be read into memory first using
+            :meth:`load_lazy_data`. The data are read into memory while reading the
+            file if the phasing needs to be fixed (see `fix_old_proj`), if
+            auto-correlations need to be fixed (see `fix_autos`) or if a flex-pol
+            file is converted (see `remove_flex_pol`). Ignored if read_data is False.
         data_array_dtype : numpy dtype
             Datatype to store the output data_array as. Must be either
             np.complex64 (single-precision real and imaginary) or np.complex128 (double-
@@ -9839,6 +11057,16 @@ class UVData(UVBase):
             simultaneously along all data axes. Otherwise index one axis at-a-time.
             This only works if data selection is sliceable along all but one axis.
             If indices are not well-matched to data chunks, this can be slow.
+            Ignored if lazy is True.
+        decompression_nworkers : int
+            Number of worker processes to use to read and decompress the visibility,
+            nsample and flag data. If greater than 1, each dataset read is split along
+            chunk boundaries on the baseline-time axis and the pieces are read
+            concurrently by separate processes (HDF5 calls cannot run concurrently
+            from threads). This helps for compressed files where reading is limited
+            by decompression rather than disk speed, it has no effect for
+            uncompressed (unchunked) datasets. Ignored if lazy is True or if
+            read_data is False.
         remove_flex_pol : bool
             If True and if the file is a flex_pol file, convert back to a standard
             UVData object.
@@ -9859,6 +11087,13 @@ class UVData(UVBase):
         strict_uvw_antpos_check : bool
             Option to raise an error rather than a warning if the check that
             uvws match antenna positions does not pass.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full",
+            see the `check` method for details. Default is "full".
+        only_changed : bool
+            Option to only check parameters that have been set since they last passed
+            the checks on the object, see the `check` method for details. Default is
+            False.
         fix_old_proj : bool
             Applies a fix to uvw-coordinates and phasing, assuming that the old `phase`
             method was used prior to writing the data, which had errors of the order of
@@ -9973,6 +11208,8 @@ class UVData(UVBase):
         check_extra=True,
         run_check_acceptability=True,
         strict_uvw_antpos_check=False,
+        check_level="full",
+        only_changed=False,
         check_autos=True,
         fix_autos=True,
         # file-type specific parameters
@@ -10036,6 +11273,9 @@ class UVData(UVBase):
         swarm_only=True,
         codes_check=True,
         recompute_nbls: bool | None = None,
+        # parallel reading
+        nworkers: int = 1,
+        executor: Literal["thread", "process"] = "thread",
     ):
         """
         Read a generic file into a UVData object.
@@ -10090,6 +11330,23 @@ class UVData(UVBase):
             name found in the first file read in. Default is False.
         use_future_array_shapes : bool
             Defunct option, will result in an error in version 3.2.
+        nworkers : int
+            Only relevant when reading in multiple files. Number of workers to use
+            to read the files concurrently. The first readable file is always read
+            in the calling process, the remaining files are distributed across the
+            workers and the results are concatenated in the order of the input list.
+            Default is 1, meaning files are read one after another.
+        executor : str
+            Only used if `nworkers` is greater than 1. The type of worker pool to
+            use, either "thread" (a `concurrent.futures.ThreadPoolExecutor`) or
+            "process" (a `concurrent.futures.ProcessPoolExecutor`). Process pools
+            avoid contention on the Python global interpreter lock (and the HDF5
+            library lock for uvh5 files) at the cost of pickling each object back
+            to the calling process. The `warnings` module state is shared by all
+            the threads in a process, so warnings raised while reading files in a
+            thread pool may be lost or reported for the wrong file. To keep the
+            checks reliable, they are not run in the threads but on each object in
+            the calling thread once it has been read. Default is "thread".
 
         Selecting
         ---------
@@ -10183,6 +11440,13 @@ class UVData(UVBase):
         strict_uvw_antpos_check : bool
             Option to raise an error rather than a warning if the check that
             uvws match antenna positions does not pass.
+        check_level : str
+            How thoroughly to check the object, one of "shape", "cheap" or "full",
+            see the `check` method for details. Default is "full".
+        only_changed : bool
+            Option to only check parameters that have been set since they last passed
+            the checks on the object, see the `check` method for details. Default is
+            False.
         check_autos : bool
             Check whether any auto-correlations have non-zero imaginary values in
             data_array (which should not mathematically exist). Default is True.
@@ -10535,6 +11799,15 @@ class UVData(UVBase):
                 "Only one of antenna_nums and antenna_names can be provided."
             )
 
+        if not isinstance(nworkers, int | np.integer) or nworkers < 1:
+            raise ValueError("nworkers must be a positive integer.")
+
+        if executor not in _PARALLEL_READ_EXECUTORS:
+            raise ValueError(
+                "executor must be one of "
+                f"{list(_PARALLEL_READ_EXECUTORS.keys())}, got {executor}."
+            )
+
         if multi:
             file_num = 0
             file_warnings = ""
@@ -10645,6 +11918,8 @@ class UVData(UVBase):
                         check_extra=check_extra,
                         run_check_acceptability=run_check_acceptability,
                         strict_uvw_antpos_check=strict_uvw_antpos_check,
+                        check_level=check_level,
+                        only_changed=only_changed,
                         check_autos=check_autos,
                         fix_autos=fix_autos,
                         # file-type specific parameters
@@ -10739,133 +12014,175 @@ class UVData(UVBase):
 
             uv_list = []
             if len(filename) > file_num + 1:
+                read_kwargs = {
+                    "file_type": file_type,
+                    "read_data": read_data,
+                    "skip_bad_files": skip_bad_files,
+                    "background_lsts": background_lsts,
+                    "astrometry_library": astrometry_library,
+                    # phasing parameters
+                    "fix_old_proj": fix_old_proj,
+                    "fix_use_ant_pos": fix_use_ant_pos,
+                    # selecting parameters
+                    "antenna_nums": antenna_nums,
+                    "antenna_names": antenna_names,
+                    "ant_str": ant_str,
+                    "bls": bls,
+                    "catalog_names": catalog_names,
+                    "frequencies": frequencies,
+                    "freq_chans": freq_chans,
+                    "times": times,
+                    "time_range": time_range,
+                    "lsts": lsts,
+                    "lst_range": lst_range,
+                    "polarizations": polarizations,
+                    "blt_inds": blt_inds,
+                    "phase_center_ids": phase_center_ids,
+                    "keep_all_metadata": keep_all_metadata,
+                    # checking parameters
+                    "run_check": run_check,
+                    "check_extra": check_extra,
+                    "run_check_acceptability": run_check_acceptability,
+                    "strict_uvw_antpos_check": strict_uvw_antpos_check,
+                    "check_level": check_level,
+                    "only_changed": only_changed,
+                    "check_autos": check_autos,
+                    "fix_autos": fix_autos,
+                    # file-type specific parameters
+                    # miriad
+                    "projected": projected,
+                    "correct_lat_lon": correct_lat_lon,
+                    "calc_lst": calc_lst,
+                    # MS
+                    "data_column": data_column,
+                    "pol_order": pol_order,
+                    "ignore_single_chan": ignore_single_chan,
+                    "raise_error": raise_error,
+                    "read_weights": read_weights,
+                    # MS & MIR
+                    "allow_flex_pol": allow_flex_pol,
+                    # uvh5
+                    "multidim_index": multidim_index,
+                    "remove_flex_pol": remove_flex_pol,
+                    "blts_are_rectangular": blts_are_rectangular,
+                    "time_axis_faster_than_bls": time_axis_faster_than_bls,
+                    "recompute_nbls": recompute_nbls,
+                    # uvh5 & mwa_corr_fits
+                    "data_array_dtype": data_array_dtype,
+                    # mwa_corr_fits
+                    "use_aoflagger_flags": use_aoflagger_flags,
+                    "remove_dig_gains": remove_dig_gains,
+                    "remove_coarse_band": remove_coarse_band,
+                    "correct_cable_len": correct_cable_len,
+                    "correct_van_vleck": correct_van_vleck,
+                    "cheby_approx": cheby_approx,
+                    "flag_small_auto_ants": flag_small_auto_ants,
+                    "propagate_coarse_flags": propagate_coarse_flags,
+                    "flag_init": flag_init,
+                    "edge_width": edge_width,
+                    "start_flag": start_flag,
+                    "end_flag": end_flag,
+                    "flag_dc_offset": flag_dc_offset,
+                    "remove_flagged_ants": remove_flagged_ants,
+                    "phase_to_pointing_center": phase_to_pointing_center,
+                    "nsample_array_dtype": nsample_array_dtype,
+                    # MIR
+                    "mir_select_where": mir_select_where,
+                    "apply_tsys": apply_tsys,
+                    "apply_flags": apply_flags,
+                    "apply_dedoppler": apply_dedoppler,
+                    "pseudo_cont": pseudo_cont,
+                    "rechunk": rechunk,
+                    "compass_soln": compass_soln,
+                    "swarm_only": swarm_only,
+                    "codes_check": codes_check,
+                }
+                file_kwargs = []
                 for f in filename[file_num + 1 :]:
+                    this_kwargs = read_kwargs.copy()
                     if file_type == "fhd":
-                        params_file_use = params_file[file_num]
-                        obs_file_use = obs_file[file_num]
-                        flags_file_use = flags_file[file_num]
-                        layout_file_use = layout_file[file_num]
-                        settings_file_use = settings_file[file_num]
-
-                    uv2 = UVData()
-                    try:
-                        uv2.read(
+                        this_kwargs.update(
+                            params_file=params_file[file_num],
+                            obs_file=obs_file[file_num],
+                            flags_file=flags_file[file_num],
+                            layout_file=layout_file[file_num],
+                            settings_file=settings_file[file_num],
+                        )
+                    file_kwargs.append((f, this_kwargs))
+
+                pool = None
+                # the warnings filters are process-global, so run the checks for
+                # files read in threads in this thread rather than in the workers
+                check_in_caller = nworkers > 1 and executor == "thread" and run_check
+                if nworkers > 1:
+                    # submit all the reads up front, results are collected in
+                    # order below so the concatenation order matches the file list
+                    pool = _PARALLEL_READ_EXECUTORS[executor](max_workers=nworkers)
+                    futures = [
+                        pool.submit(
+                            _read_single_file,
                             f,
-                            file_type=file_type,
-                            read_data=read_data,
-                            skip_bad_files=skip_bad_files,
-                            background_lsts=background_lsts,
-                            astrometry_library=astrometry_library,
-                            # phasing parameters
-                            fix_old_proj=fix_old_proj,
-                            fix_use_ant_pos=fix_use_ant_pos,
-                            # selecting parameters
-                            antenna_nums=antenna_nums,
-                            antenna_names=antenna_names,
-                            ant_str=ant_str,
-                            bls=bls,
-                            catalog_names=catalog_names,
-                            frequencies=frequencies,
-                            freq_chans=freq_chans,
-                            times=times,
-                            time_range=time_range,
-                            lsts=lsts,
-                            lst_range=lst_range,
-                            polarizations=polarizations,
-                            blt_inds=blt_inds,
-                            phase_center_ids=phase_center_ids,
-                            keep_all_metadata=keep_all_metadata,
-                            # checking parameters
-                            run_check=run_check,
-                            check_extra=check_extra,
-                            run_check_acceptability=run_check_acceptability,
-                            strict_uvw_antpos_check=strict_uvw_antpos_check,
-                            check_autos=check_autos,
-                            fix_autos=fix_autos,
-                            # file-type specific parameters
-                            # miriad
-                            projected=projected,
-                            correct_lat_lon=correct_lat_lon,
-                            calc_lst=calc_lst,
-                            # FHD
-                            params_file=params_file_use,
-                            obs_file=obs_file_use,
-                            flags_file=flags_file_use,
-                            layout_file=layout_file_use,
-                            settings_file=settings_file_use,
-                            # MS
-                            data_column=data_column,
-                            pol_order=pol_order,
-                            ignore_single_chan=ignore_single_chan,
-                            raise_error=raise_error,
-                            read_weights=read_weights,
-                            # MS & MIR
-                            allow_flex_pol=allow_flex_pol,
-                            # uvh5
-                            multidim_index=multidim_index,
-                            remove_flex_pol=remove_flex_pol,
-                            blts_are_rectangular=blts_are_rectangular,
-                            time_axis_faster_than_bls=time_axis_faster_than_bls,
-                            recompute_nbls=recompute_nbls,
-                            # uvh5 & mwa_corr_fits
-                            data_array_dtype=data_array_dtype,
-                            # mwa_corr_fits
-                            use_aoflagger_flags=use_aoflagger_flags,
-                            remove_dig_gains=remove_dig_gains,
-                            remove_coarse_band=remove_coarse_band,
-                            correct_cable_len=correct_cable_len,
-                            correct_van_vleck=correct_van_vleck,
-                            cheby_approx=cheby_approx,
-                            flag_small_auto_ants=flag_small_auto_ants,
-                            propagate_coarse_flags=propagate_coarse_flags,
-                            flag_init=flag_init,
-                            edge_width=edge_width,
-                            start_flag=start_flag,
-                            end_flag=end_flag,
-                            flag_dc_offset=flag_dc_offset,
-                            remove_flagged_ants=remove_flagged_ants,
-                            phase_to_pointing_center=phase_to_pointing_center,
-                            nsample_array_dtype=nsample_array_dtype,
-                            # MIR
-                            mir_select_where=mir_select_where,
-                            apply_tsys=apply_tsys,
-                            apply_flags=apply_flags,
-                            apply_dedoppler=apply_dedoppler,
-                            pseudo_cont=pseudo_cont,
-                            rechunk=rechunk,
-                            compass_soln=compass_soln,
-                            swarm_only=swarm_only,
-                            codes_check=codes_check,
+                            (
+                                {**this_kwargs, "run_check": False}
+                                if check_in_caller
+                                else this_kwargs
+                            ),
+                            record_warnings=executor == "process",
                         )
+                        for f, this_kwargs in file_kwargs
+                    ]
 
-                        uv_list.append(uv2)
-                    except KeyError as err:
-                        file_warnings = (
-                            file_warnings
-                            + f"Failed to read {f} due to KeyError: {err}\n"
-                        )
-                        if skip_bad_files:
-                            continue
-                        else:
-                            raise
-                    except ValueError as err:
-                        file_warnings = (
-                            file_warnings
-                            + f"Failed to read {f} due to ValueError: {err}\n"
-                        )
-                        if skip_bad_files:
-                            continue
-                        else:
-                            raise
-                    except OSError as err:  # pragma: nocover
-                        file_warnings = (
-                            file_warnings
-                            + f"Failed to read {f} due to OSError: {err}\n"
-                        )
-                        if skip_bad_files:
-                            continue
-                        else:
-                            raise
+                try:
+                    for file_ind, (f, this_kwargs) in enumerate(file_kwargs):
+                        try:
+                            if pool is None:
+                                uv2, read_warnings = _read_single_file(f, this_kwargs)
+                            else:
+                                uv2, read_warnings = futures[file_ind].result()
+                            for warn_args in read_warnings:
+                                warnings.warn_explicit(*warn_args)
+                            if check_in_caller:
+                                uv2.check(
+                                    check_extra=check_extra,
+                                    run_check_acceptability=run_check_acceptability,
+                                    strict_uvw_antpos_check=strict_uvw_antpos_check,
+                                    check_level=check_level,
+                                    only_changed=only_changed,
+                                    allow_flip_conj=True,
+                                    check_autos=check_autos,
+                                    fix_autos=fix_autos,
+                                )
+                            uv_list.append(uv2)
+                        except KeyError as err:
+                            file_warnings = (
+                                file_warnings
+                                + f"Failed to read {f} due to KeyError: {err}\n"
+                            )
+                            if skip_bad_files:
+                                continue
+                            else:
+                                raise
+                        except ValueError as err:
+                            file_warnings = (
+                                file_warnings
+                                + f"Failed to read {f} due to ValueError: {err}\n"
+                            )
+                            if skip_bad_files:
+                                continue
+                            else:
+                                raise
+                        except OSError as err:  # pragma: nocover
+                            file_warnings = (
+                                file_warnings
+                                + f"Failed to read {f} due to OSError: {err}\n"
+                            )
+                            if skip_bad_files:
+                                continue
+                            else:
+                                raise
+                finally:
+                    if pool is not None:
+                        pool.shutdown(cancel_futures=True)
             if len(file_warnings) > 0:
                 warnings.warn(file_warnings)
 
@@ -10878,31 +12195,25 @@ class UVData(UVBase):
                     run_check=run_check,
                     check_extra=check_extra,
                     run_check_acceptability=run_check_acceptability,
+                    check_level=check_level,
+                    only_changed=only_changed,
                     inplace=True,
                     ignore_name=ignore_name,
                 )
-            else:
-                # Too much work to rewrite __add__ to operate on lists
-                # of files, so instead doing a binary tree merge
-                uv_list = [self] + uv_list
-                while len(uv_list) > 1:
-                    # for an odd number of files, the second argument will be shorter
-                    # so the last element in the first list won't be combined, but it
-                    # will not be lost, so it's ok.
-                    for uv1, uv2 in zip(uv_list[0::2], uv_list[1::2], strict=False):
-                        uv1.__iadd__(
-                            uv2,
-                            run_check=run_check,
-                            check_extra=check_extra,
-                            run_check_acceptability=run_check_acceptability,
-                            ignore_name=ignore_name,
-                        )
-                    uv_list = uv_list[0::2]
-                # Because self was at the beginning of the list,
-                # everything is merged into it at the end of this loop
+            elif len(uv_list) > 0:
+                self.__add__(
+                    uv_list,
+                    inplace=True,
+                    run_check=run_check,
+                    check_extra=check_extra,
+                    run_check_acceptability=run_check_acceptability,
+                    check_level=check_level,
+                    only_changed=only_changed,
+                    ignore_name=ignore_name,
+                )
 
         else:
-            if file_type in ["fhd", "ms", "mwa_corr_fits"]:
+            if file_type in ["fhd", "mwa_corr_fits"]:
                 if (
                     antenna_nums is not None
                     or antenna_names is not None
@@ -10942,7 +12253,7 @@ class UVData(UVBase):
                     select_phase_center_ids = phase_center_ids
                 else:
                     select = False
-            elif file_type in ["uvfits", "uvh5"]:
+            elif file_type in ["ms", "uvfits", "uvh5"]:
                 select = False
             elif file_type in ["miriad"]:
                 if (
@@ -11063,6 +12374,8 @@ class UVData(UVBase):
                     check_extra=check_extra,
                     run_check_acceptability=run_check_acceptability,
                     strict_uvw_antpos_check=strict_uvw_antpos_check,
+                    check_level=check_level,
+                    only_changed=only_changed,
                     fix_old_proj=fix_old_proj,
                     fix_use_ant_pos=fix_use_ant_pos,
                     check_autos=check_autos,
@@ -11096,6 +12409,8 @@ class UVData(UVBase):
                     check_extra=check_extra,
                     run_check_acceptability=run_check_acceptability,
                     strict_uvw_antpos_check=strict_uvw_antpos_check,
+                    check_level=check_level,
+                    only_changed=only_changed,
                     allow_flex_pol=allow_flex_pol,
                     check_autos=check_autos,
                     fix_autos=fix_autos,
@@ -11116,6 +12431,8 @@ class UVData(UVBase):
                     check_extra=check_extra,
                     run_check_acceptability=run_check_acceptability,
                     strict_uvw_antpos_check=strict_uvw_antpos_check,
+                    check_level=check_level,
+                    only_changed=only_changed,
                     calc_lst=calc_lst,
                     fix_old_proj=fix_old_proj,
                     fix_use_ant_pos=fix_use_ant_pos,
@@ -11150,6 +12467,8 @@ class UVData(UVBase):
                     check_extra=check_extra,
                     run_check_acceptability=run_check_acceptability,
                     strict_uvw_antpos_check=strict_uvw_antpos_check,
+                    check_level=check_level,
+                    only_changed=only_changed,
                     check_autos=check_autos,
                     fix_autos=fix_autos,
                     astrometry_library=astrometry_library,
@@ -11169,6 +12488,8 @@ class UVData(UVBase):
                     check_extra=check_extra,
                     run_check_acceptability=run_check_acceptability,
                     strict_uvw_antpos_check=strict_uvw_antpos_check,
+                    check_level=check_level,
+                    only_changed=only_changed,
                     check_autos=check_autos,
                     fix_autos=fix_autos,
                     astrometry_library=astrometry_library,
@@ -11177,6 +12498,21 @@ class UVData(UVBase):
             elif file_type == "ms":
                 self.read_ms(
                     filename,
+                    antenna_nums=antenna_nums,
+                    antenna_names=antenna_names,
+                    ant_str=ant_str,
+                    bls=bls,
+                    frequencies=frequencies,
+                    freq_chans=freq_chans,
+                    times=times,
+                    time_range=time_range,
+                    lsts=lsts,
+                    lst_range=lst_range,
+                    polarizations=polarizations,
+                    blt_inds=blt_inds,
+                    phase_center_ids=phase_center_ids,
+                    catalog_names=catalog_names,
+                    keep_all_metadata=keep_all_metadata,
                     data_column=data_column,
                     pol_order=pol_order,
                     background_lsts=background_lsts,
@@ -11188,6 +12524,8 @@ class UVData(UVBase):
                     check_extra=check_extra,
                     run_check_acceptability=run_check_acceptability,
                     strict_uvw_antpos_check=strict_uvw_antpos_check,
+                    check_level=check_level,
+                    only_changed=only_changed,
                     check_autos=check_autos,
                     fix_autos=fix_autos,
                     astrometry_library=astrometry_library,
@@ -11220,6 +12558,8 @@ class UVData(UVBase):
                     check_extra=check_extra,
                     run_check_acceptability=run_check_acceptability,
                     strict_uvw_antpos_check=strict_uvw_antpos_check,
+                    check_level=check_level,
+                    only_changed=only_changed,
                     fix_old_proj=fix_old_proj,
                     fix_use_ant_pos=fix_use_ant_pos,
                     check_autos=check_autos,
@@ -11251,6 +12591,8 @@ class UVData(UVBase):
                     check_extra=check_extra,
                     run_check_acceptability=run_check_acceptability,
                     strict_uvw_antpos_check=strict_uvw_antpos_check,
+                    check_level=check_level,
+                    only_changed=only_changed,
                 )
 
     @classmethod
@@ -11261,6 +12603,105 @@ class UVData(UVBase):
         uvd.read(filename, **kwargs)
         return uvd
 
+    @classmethod
+    def iter_uvh5_chunks(cls, filename, *, chunk_size, axis="blt", **kwargs):
+        """
+        Iterate over chunks of data in a UVH5 file.
+
+        This is a generator that yields a new UVData object for each chunk of the
+        file along the specified axis, only reading the data for that chunk from
+        disk. This allows processing of files that are too large to fit in memory
+        with a fixed memory budget. The header is read once up front to determine
+        the chunks, then each chunk is read with :meth:`read_uvh5`.
+
+        Parameters
+        ----------
+        filename : str or FastUVH5Meta
+            The UVH5 file to read from.
+        chunk_size : int
+            The maximum number of elements along `axis` in each chunk. The last
+            chunk may be smaller.
+        axis : str
+            Axis to iterate along, one of "blt", "freq" or "polarization".
+        antenna_nums, antenna_names, ant_str, bls, frequencies, freq_chans, times,
+        time_range, lsts, lst_range, polarizations, blt_inds, phase_center_ids,
+        catalog_names : optional
+            Selections to apply when reading the file, see :meth:`read_uvh5`. The
+            chunks are made from the selected data.
+        **kwargs
+            All other keywords are passed to :meth:`read_uvh5` when reading each
+            chunk, except for `read_data`, which is not allowed.
+
+        Yields
+        ------
+        UVData
+            An object containing the data and metadata for each chunk.
+
+        Raises
+        ------
+        ValueError
+            If `axis` is not one of the allowed values, if `chunk_size` is not a
+            positive integer, if `read_data` is passed or if iterating over the
+            polarization axis of a flex-pol file.
+
+        """
+        from . import uvh5
+
+        uvh5_obj = uvh5.UVH5()
+        for chunk in uvh5_obj.iter_uvh5_chunks(
+            filename, chunk_size=chunk_size, axis=axis, **kwargs
+        ):
+            uvd = cls()
+            uvd._convert_from_filetype(chunk)
+            yield uvd
+
+    @classmethod
+    def iter_uvfits_chunks(cls, filename, *, chunk_size, axis="blt", **kwargs):
+        """
+        Iterate over chunks of data in a uvfits file.
+
+        This is a generator that yields a new UVData object for each chunk of the
+        file along the specified axis, only reading the data for that chunk from
+        disk. The metadata are read once up front, then the data for each chunk
+        are read from a memory map of the random groups, so only the pages of the
+        file holding the chunk are accessed.
+
+        Parameters
+        ----------
+        filename : str
+            The uvfits file to read from.
+        chunk_size : int
+            The maximum number of elements along `axis` in each chunk. The last
+            chunk may be smaller.
+        axis : str
+            Axis to iterate along, one of "blt", "freq" or "polarization".
+        **kwargs
+            All other keywords are passed to :meth:`UVFITS.iter_uvfits_chunks`,
+            these are the selection and checking keywords of :meth:`read_uvfits`
+            (except for `read_data`).
+
+        Yields
+        ------
+        UVData
+            An object containing the data and metadata for each chunk.
+
+        Raises
+        ------
+        ValueError
+            If `axis` is not one of the allowed values or if `chunk_size` is not
+            a positive integer.
+
+        """
+        from . import uvfits
+
+        uvfits_obj = uvfits.UVFITS()
+        for chunk in uvfits_obj.iter_uvfits_chunks(
+            filename, chunk_size=chunk_size, axis=axis, **kwargs
+        ):
+            uvd = cls()
+            uvd._convert_from_filetype(chunk)
+            yield uvd
+
     def write_miriad(
         self,
         filepath,
@@ -11480,6 +12921,7 @@ class UVData(UVBase):
         check_autos=True,
         fix_autos=False,
         use_miriad_convention=False,
+        chunk_size=None,
     ):
         """
         Write the data to a uvfits file.
@@ -11527,6 +12969,11 @@ class UVData(UVBase):
             `bl = 256 * ant1 + ant2` if `ant2 < 256`, otherwise
             `bl = 2048 * ant1 + ant2 + 2**16`.
             Note MIRIAD uses 1-indexed antenna IDs, but this code accepts 0-based.
+        chunk_size : int, optional
+            Number of baseline-times to write to the file at a time, the random
+            groups are streamed to the file in chunks so the full uvfits data array
+            is never built in memory. Defaults to the number that fits in about
+            32 MiB.
 
         Raises
         ------
@@ -11567,6 +13014,244 @@ class UVData(UVBase):
             check_autos=check_autos,
             fix_autos=fix_autos,
             use_miriad_convention=use_miriad_convention,
+            chunk_size=chunk_size,
+        )
+        del uvfits_obj
+
+    def initialize_uvfits_file(
+        self,
+        filename,
+        *,
+        clobber=False,
+        write_lst=True,
+        use_miriad_convention=False,
+        write_precision=None,
+        run_check=True,
+        check_extra=True,
+        run_check_acceptability=True,
+        strict_uvw_antpos_check=False,
+        chunk_size=None,
+    ):
+        """
+        Initialize a uvfits file on disk with the metadata and empty data.
+
+        Parameters
+        ----------
+        filename : str
+            The uvfits file to write to.
+        clobber : bool
+            Option to overwrite the file if it already exists.
+        write_lst : bool
+            Option to write the LSTs to the metadata (random group parameters).
+        use_miriad_convention : bool
+            Option to use the MIRIAD baseline convention, and write to BASELINE column.
+            See `write_uvfits` for details.
+        write_precision : int, optional
+            Number of bits in the floats written to the file, either 32 or 64.
+            Defaults to 64 if the data_array is complex128 and 32 otherwise
+            (including for metadata only objects).
+        run_check : bool
+            Option to check for the existence and proper shapes of parameters
+            before writing the file (the default is True,
+            meaning the check will be run).
+        check_extra : bool
+            Option to check optional parameters as well as required ones (the
+            default is True, meaning the optional parameters will be checked).
+        run_check_acceptability : bool
+            Option to check acceptable range of the values of parameters before
+            writing the file (the default is True, meaning the acceptable
+            range check will be done).
+        strict_uvw_antpos_check : bool
+            Option to raise an error rather than a warning if the check that
+            uvws match antenna positions does not pass.
+        chunk_size : int, optional
+            Number of baseline-times to write to the file at a time. Defaults to
+            the number that fits in about 32 MiB.
+
+        Raises
+        ------
+        IOError
+            If the file already exists and clobber is False.
+        ValueError
+            If the object has flexible polarizations.
+            If write_precision is not 32 or 64.
+            If any blts are not phased to a sidereal source.
+            If the frequencies are not evenly spaced or are separated by more
+            than their channel width.
+            The polarization values are not evenly spaced.
+
+        Notes
+        -----
+        When partially writing out data, this function should be called first
+        to initialize the file on disk. The data is then actually written by
+        calling the write_uvfits_part method, with the same filename as the one
+        specified in this function. The visibilities are written in place, so
+        large data sets can be exported to uvfits without holding all the data
+        in memory. Unwritten data read back as flagged with nsample = 0.
+
+        """
+        if self.flex_spw_polarization_array is not None:
+            raise ValueError(
+                "Cannot write flex-pol objects to uvfits files in parts, call "
+                "remove_flex_pol first."
+            )
+
+        uvfits_obj = self._convert_to_filetype("uvfits")
+        uvfits_obj.initialize_uvfits_file(
+            filename,
+            clobber=clobber,
+            write_lst=write_lst,
+            use_miriad_convention=use_miriad_convention,
+            write_precision=write_precision,
+            run_check=run_check,
+            check_extra=check_extra,
+            run_check_acceptability=run_check_acceptability,
+            strict_uvw_antpos_check=strict_uvw_antpos_check,
+            chunk_size=chunk_size,
+        )
+        del uvfits_obj
+
+    def write_uvfits_part(
+        self,
+        filename,
+        *,
+        data_array,
+        flag_array,
+        nsample_array,
+        check_header=True,
+        antenna_nums=None,
+        antenna_names=None,
+        ant_str=None,
+        bls=None,
+        frequencies=None,
+        freq_chans=None,
+        times=None,
+        time_range=None,
+        lsts=None,
+        lst_range=None,
+        polarizations=None,
+        blt_inds=None,
+        phase_center_ids=None,
+        catalog_names=None,
+    ):
+        """
+        Write data to a uvfits file that has already been initialized.
+
+        Parameters
+        ----------
+        filename : str
+            The uvfits file to write to. It must already exist, and is assumed to
+            have been initialized with initialize_uvfits_file.
+        data_array : ndarray
+            The data to write to disk. A check is done to ensure that the
+            dimensions of the data passed in conform to the ones specified by
+            the "selection" arguments.
+        flag_array : ndarray
+            The flags array to write to disk. A check is done to ensure that the
+            dimensions of the data passed in conform to the ones specified by
+            the "selection" arguments.
+        nsample_array : ndarray
+            The nsample array to write to disk. A check is done to ensure that the
+            dimensions of the data passed in conform to the ones specified by
+            the "selection" arguments.
+        check_header : bool
+            Option to check that the shape of the data on disk and the times of
+            the baseline-times being written match the object.
+        antenna_nums : array_like of int, optional
+            The antennas numbers to include when writing data into the file
+            (antenna positions and names for the removed antennas will be retained).
+            This cannot be provided if `antenna_names` is also provided.
+        antenna_names : array_like of str, optional
+            The antennas names to include when writing data into the file
+            (antenna positions and names for the removed antennas will be retained).
+            This cannot be provided if `antenna_nums` is also provided.
+        ant_str : str, optional
+            A string containing information about what antenna numbers
+            and polarizations to include writing data into the file.
+            Can be 'auto', 'cross', 'all', or combinations of antenna numbers
+            and polarizations (e.g. '1', '1_2', '1x_2y').  See tutorial for more
+            examples of valid strings and the behavior of different forms for ant_str.
+            An ant_str cannot be passed in addition to any of `antenna_nums`,
+            `antenna_names`, `bls` args or the `polarizations` parameters,
+            if it is a ValueError will be raised.
+        bls : list of tuple, optional
+            A list of antenna number tuples (e.g. [(0, 1), (3, 2)]) or a list of
+            baseline 3-tuples (e.g. [(0, 1, 'xx'), (2, 3, 'yy')]) specifying baselines
+            to include when writing data into the file. For length-2 tuples,
+            the ordering of the numbers within the tuple does not matter. For
+            length-3 tuples, the polarization string is in the order of the two
+            antennas. If length-3 tuples are provided, `polarizations` must be
+            None.
+        frequencies : array_like of float, optional
+            The frequencies to include when writing data into the file, each
+            value passed here should exist in the freq_array.
+        freq_chans : array_like of int, optional
+            The frequency channel numbers to include writing data into the file.
+        times : array_like of float, optional
+            The times to include when writing data into the file, each value
+            passed here should exist in the time_array. Cannot be used with
+            `time_range`, `lsts`, or `lst_array`.
+        time_range : array_like of float, optional
+            The time range in Julian Date to include when writing data to the
+            file, must be length 2. Some of the times in the object should fall
+            between the first and last elements. Cannot be used with `times`.
+        lsts : array_like of float, optional
+            The local sidereal times (LSTs) to keep in the object, each value
+            passed here should exist in the lst_array. Cannot be used with
+            `times`, `time_range`, or `lst_range`.
+        lst_range : array_like of float, optional
+            The local sidereal time (LST) range in radians to keep in the
+            object, must be of length 2. Some of the LSTs in the object should
+            fall between the first and last elements. If the second value is
+            smaller than the first, the LSTs are treated as having phase-wrapped
+            around LST = 2*pi = 0, and the LSTs kept on the object will run from
+            the larger value, through 0, and end at the smaller value.
+        polarizations : array_like of int, optional
+            The polarizations numbers to include when writing data into the file,
+            each value passed here should exist in the polarization_array.
+        blt_inds : array_like of int, optional
+            The baseline-time indices to include when writing data into the file.
+        phase_center_ids : array_like of int, optional
+            Phase center IDs to include when writing data into the file (effectively
+            a selection on baseline-times). Cannot be used with catalog_names.
+        catalog_names : str or array-like of str, optional
+            The names of the phase centers (sources) to include when writing data to
+            the file, which should match exactly in spelling and capitalization.
+            Cannot be used with phase_center_ids.
+
+        Raises
+        ------
+        ValueError
+            If the object has flexible polarizations.
+
+        """
+        if self.flex_spw_polarization_array is not None:
+            raise ValueError(
+                "Cannot write flex-pol objects to uvfits files in parts, call "
+                "remove_flex_pol first."
+            )
+
+        uvfits_obj = self._convert_to_filetype("uvfits")
+        uvfits_obj.write_uvfits_part(
+            filename,
+            data_array=data_array,
+            flag_array=flag_array,
+            nsample_array=nsample_array,
+            check_header=check_header,
+            antenna_nums=antenna_nums,
+            antenna_names=antenna_names,
+            ant_str=ant_str,
+            bls=bls,
+            frequencies=frequencies,
+            freq_chans=freq_chans,
+            times=times,
+            time_range=time_range,
+            lsts=lsts,
+            lst_range=lst_range,
+            polarizations=polarizations,
+            blt_inds=blt_inds,
+            phase_center_ids=phase_center_ids,
+            catalog_names=catalog_names,
         )
         del uvfits_obj
 
@@ -11948,6 +13633,7 @@ class UVData(UVBase):
         auto_pols = list(np.unique(pol_groups))
 
         # Grab references to data and flags, to manipulate later
+        self.load_lazy_data()
         data_arr = self.data_array
         flag_arr = self.flag_array
 
@@ -12021,3 +13707,5 @@ class UVData(UVBase):
                 except KeyError:
                     # If no data found for this antenna, then flag the whole blt
                     flag_arr[grp_idx] = True
+
+        self._mark_changed("_data_array", "_flag_array")
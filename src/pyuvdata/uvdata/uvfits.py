@@ -28,6 +28,90 @@ from . import UVData
 
 __all__ = ["UVFITS"]
 
+# target size of the chunks of random groups written at a time
+_UVFITS_CHUNK_BYTES = 2**25
+
+# numpy data types for the FITS BITPIX values (FITS data are big-endian)
+_BITPIX_DTYPES = {8: "u1", 16: ">i2", 32: ">i4", 64: ">i8", -32: ">f4", -64: ">f8"}
+
+
+def _get_uvfits_groups(hdu_list, *, mode="r"):
+    """
+    Memory map the random groups of an open uvfits file.
+
+    The offset and layout of the random groups are computed from the primary
+    header, so the group parameters and data can be read (or written) with numpy
+    indexing, only touching the parts of the file that are needed.
+
+    Parameters
+    ----------
+    hdu_list : astropy.io.fits.HDUList
+        The open uvfits file, with the random groups in the primary HDU.
+    mode : str
+        Mode to open the memory map with, "r" to read or "r+" to write.
+
+    Returns
+    -------
+    numpy.memmap
+        Structured array with one entry per group, with a "par" field containing
+        the raw (unscaled) group parameters and a "data" field containing the raw
+        data of the group, with shape (NAXISn, ..., NAXIS2).
+
+    """
+    header = hdu_list[0].header
+    file_info = hdu_list.fileinfo(0)
+    dtype = _BITPIX_DTYPES[header["BITPIX"]]
+    data_shape = tuple(header[f"NAXIS{axis}"] for axis in range(header["NAXIS"], 1, -1))
+    return np.memmap(
+        file_info["filename"],
+        dtype=[("par", dtype, (header["PCOUNT"],)), ("data", dtype, data_shape)],
+        mode=mode,
+        offset=file_info["datLoc"],
+        shape=(header["GCOUNT"],),
+    )
+
+
+def _check_nsample_zero(flag_array, nsample_array):
+    """Warn if there is unflagged data with nsample = 0."""
+    if np.any(~flag_array[nsample_array == 0]):
+        warnings.warn(
+            "Some unflagged data has nsample = 0. Flags and "
+            "nsamples are combined in uvfits files such that "
+            "these data will appear to be flagged."
+        )
+
+
+def _get_uvfits_vis(data_array, flag_array, nsample_array, *, dtype):
+    """
+    Get the uvfits visibilities (real, imaginary, weight) from the data arrays.
+
+    FITS uvw direction convention is opposite ours and Miriad's, so the
+    visibilities are conjugated (the uvws are flipped in the group parameters).
+    The flags and nsamples are combined into the weights.
+
+    Parameters
+    ----------
+    data_array : ndarray of complex
+        Visibility data.
+    flag_array : ndarray of bool
+        Flags, same shape as data_array.
+    nsample_array : ndarray of float
+        Number of samples, same shape as data_array.
+    dtype : numpy dtype
+        Data type of the output array.
+
+    Returns
+    -------
+    ndarray
+        Array with the shape of data_array plus a trailing axis of length 3.
+
+    """
+    vis = np.empty(data_array.shape + (3,), dtype=dtype)
+    vis[..., 0] = data_array.real
+    vis[..., 1] = -data_array.imag
+    vis[..., 2] = np.where(flag_array, -nsample_array, nsample_array)
+    return vis
+
 
 class UVFITS(UVData):
     """
@@ -43,6 +127,7 @@ class UVFITS(UVData):
         *,
         read_source,
         run_check_acceptability,
+        check_level="full",
         background_lsts=True,
         astrometry_library=None,
     ):
@@ -68,7 +153,7 @@ class UVFITS(UVData):
         if "LST" in vis_hdu.data.parnames:
             # angles in uvfits files are stored in degrees, so convert to radians
             self.lst_array = np.deg2rad(vis_hdu.data.par("lst"))
-            if run_check_acceptability:
+            if run_check_acceptability and check_level == "full":
                 utils.times.check_lsts_against_times(
                     jd_array=self.time_array,
                     lst_array=self.lst_array,
@@ -198,7 +283,7 @@ class UVFITS(UVData):
 
     def _get_data(
         self,
-        vis_hdu,
+        hdu_list,
         *,
         antenna_nums,
         antenna_names,
@@ -241,35 +326,27 @@ class UVFITS(UVData):
             catalog_names=catalog_names,
         )
 
-        if blt_inds is not None:
-            blt_frac = len(blt_inds) / float(self.Nblts)
-        else:
-            blt_frac = 1
-
-        if freq_inds is not None:
-            freq_frac = len(freq_inds) * float(self.Nspws) / float(self.Nfreqs)
-        else:
-            freq_frac = 1
-
-        if pol_inds is not None:
-            pol_frac = len(pol_inds) / float(self.Npols)
-        else:
-            pol_frac = 1
-
-        min_frac = np.min([blt_frac, freq_frac, pol_frac])
-
-        if min_frac == 1:
-            # no select, read in all the data
-            if vis_hdu.header["NAXIS"] == 7:
-                raw_data_array = vis_hdu.data.data[:, 0, 0, :, :, :, :]
-                assert self.Nspws == raw_data_array.shape[1]
-
-            else:
-                # in many uvfits files the spw axis is left out,
-                # here we put it back in so the dimensionality stays the same
-                raw_data_array = vis_hdu.data.data[:, 0, 0, :, :, :]
-                raw_data_array = raw_data_array[:, np.newaxis, :, :]
+        # memory map the data block of the random groups as
+        # (Nblts, Nfreqs, Npols, Ncomplex) so only the selected data are read
+        file_info = hdu_list.fileinfo(0)
+        if file_info["file"].compression is None:
+            vis = _get_uvfits_groups(hdu_list)["data"]
+            bscale = hdu_list[0].header.get("BSCALE", 1.0)
+            bzero = hdu_list[0].header.get("BZERO", 0.0)
         else:
+            # compressed files cannot be memory mapped, so use astropy
+            vis = hdu_list[0].data.data
+            bscale, bzero = 1.0, 0.0
+        vis = vis.reshape(self.Nblts, self.Nfreqs, self.Npols, vis.shape[-1])
+
+        if any(
+            ax_inds is not None and len(ax_inds) < ax_len
+            for ax_inds, ax_len in zip(
+                (blt_inds, freq_inds, pol_inds),
+                (self.Nblts, self.Nfreqs, self.Npols),
+                strict=True,
+            )
+        ):
             # do select operations on everything except data_array, flag_array
             # and nsample_array
             self._select_by_index(
@@ -280,63 +357,24 @@ class UVFITS(UVData):
                 keep_all_metadata=keep_all_metadata,
             )
 
-            # just read in the right portions of the data and flag arrays
-            if blt_frac == min_frac:
-                if vis_hdu.header["NAXIS"] == 7:
-                    raw_data_array = vis_hdu.data.data[blt_inds, :, :, :, :, :, :]
-                    raw_data_array = raw_data_array[:, 0, 0, :, :, :, :]
-                    assert self.Nspws == raw_data_array.shape[1]
-                else:
-                    # in many uvfits files the spw axis is left out,
-                    # here we put it back in so the dimensionality stays the same
-                    raw_data_array = vis_hdu.data.data[blt_inds, :, :, :, :, :]
-                    raw_data_array = raw_data_array[:, 0, 0, :, :, :]
-                    raw_data_array = raw_data_array[:, np.newaxis, :, :, :]
-                if freq_frac < 1:
-                    raw_data_array = raw_data_array[:, :, freq_inds, :, :]
-                if pol_frac < 1:
-                    raw_data_array = raw_data_array[:, :, :, pol_inds, :]
-            elif freq_frac == min_frac:
-                if vis_hdu.header["NAXIS"] == 7:
-                    raw_data_array = vis_hdu.data.data[:, :, :, :, freq_inds, :, :]
-                    raw_data_array = raw_data_array[:, 0, 0, :, :, :, :]
-                    assert self.Nspws == raw_data_array.shape[1]
-                else:
-                    # in many uvfits files the spw axis is left out,
-                    # here we put it back in so the dimensionality stays the same
-                    raw_data_array = vis_hdu.data.data[:, :, :, freq_inds, :, :]
-                    raw_data_array = raw_data_array[:, 0, 0, :, :, :]
-                    raw_data_array = raw_data_array[:, np.newaxis, :, :, :]
-
-                if blt_frac < 1:
-                    raw_data_array = raw_data_array[blt_inds, :, :, :, :]
-                if pol_frac < 1:
-                    raw_data_array = raw_data_array[:, :, :, pol_inds, :]
-            else:
-                if vis_hdu.header["NAXIS"] == 7:
-                    raw_data_array = vis_hdu.data.data[:, :, :, :, :, pol_inds, :]
-                    raw_data_array = raw_data_array[:, 0, 0, :, :, :, :]
-                    assert self.Nspws == raw_data_array.shape[1]
-                else:
-                    # in many uvfits files the spw axis is left out,
-                    # here we put it back in so the dimensionality stays the same
-                    raw_data_array = vis_hdu.data.data[:, :, :, :, pol_inds, :]
-                    raw_data_array = raw_data_array[:, 0, 0, :, :, :]
-                    raw_data_array = raw_data_array[:, np.newaxis, :, :, :]
-
-                if blt_frac < 1:
-                    raw_data_array = raw_data_array[blt_inds, :, :, :, :]
-                if freq_frac < 1:
-                    raw_data_array = raw_data_array[:, :, freq_inds, :, :]
-
-        assert len(raw_data_array.shape) == 5
-
-        # Reshape the data array to be the right size if we are working w/ multiple
-        # spectral windows
-        raw_data_array = np.reshape(
-            raw_data_array,
-            (self.Nblts, self.Nfreqs, self.Npols, raw_data_array.shape[4]),
-        )
+        # use slices where possible, which can be read straight from the memory map
+        inds = [
+            np.s_[:] if ax_inds is None else utils.tools.slicify(ax_inds)
+            for ax_inds in (blt_inds, freq_inds, pol_inds)
+        ]
+        if sum(not isinstance(ax_inds, slice) for ax_inds in inds) > 1:
+            # several fancy indexes need to be broadcast against each other
+            inds = np.ix_(
+                *[
+                    np.arange(ax_len)[ax_inds]
+                    if isinstance(ax_inds, slice)
+                    else ax_inds
+                    for ax_inds, ax_len in zip(inds, vis.shape[:3], strict=True)
+                ]
+            )
+        raw_data_array = vis[tuple(inds)]
+        if bscale != 1 or bzero != 0:
+            raw_data_array = raw_data_array * bscale + bzero
 
         # FITS uvw direction convention is opposite ours and Miriad's.
         # So conjugate the visibilities and flip the uvws:
@@ -373,6 +411,8 @@ class UVFITS(UVData):
         check_extra=True,
         run_check_acceptability=True,
         strict_uvw_antpos_check=False,
+        check_level="full",
+        only_changed=False,
         fix_old_proj=False,
         fix_use_ant_pos=True,
         check_autos=True,
@@ -701,6 +741,7 @@ class UVFITS(UVData):
                 vis_hdu,
                 read_source=read_source,
                 run_check_acceptability=run_check_acceptability,
+                check_level=check_level,
                 background_lsts=background_lsts,
                 astrometry_library=astrometry_library,
             )
@@ -771,7 +812,7 @@ class UVFITS(UVData):
             if read_data:
                 # Now read in the data
                 self._get_data(
-                    vis_hdu,
+                    hdu_list,
                     antenna_nums=antenna_nums,
                     antenna_names=antenna_names,
                     ant_str=ant_str,
@@ -797,6 +838,8 @@ class UVFITS(UVData):
                 check_extra=check_extra,
                 run_check_acceptability=run_check_acceptability,
                 strict_uvw_antpos_check=strict_uvw_antpos_check,
+                check_level=check_level,
+                only_changed=only_changed,
                 allow_flip_conj=True,
                 check_autos=check_autos,
                 fix_autos=fix_autos,
@@ -815,6 +858,7 @@ class UVFITS(UVData):
         check_autos=True,
         fix_autos=False,
         use_miriad_convention=False,
+        chunk_size=None,
     ):
         """
         Write the data to a uvfits file.
@@ -859,6 +903,11 @@ class UVFITS(UVData):
             `bl = 256 * ant1 + ant2` if `ant2 < 256`, otherwise
             `bl = 2048 * ant1 + ant2 + 2**16`.
             Note MIRIAD uses 1-indexed antenna IDs, but this code accepts 0-based.
+        chunk_size : int, optional
+            Number of baseline-times to write to the file at a time, the random
+            groups are streamed to the file in chunks so the full uvfits data array
+            is never built in memory. Defaults to the number that fits in about
+            32 MiB.
 
         Raises
         ------
@@ -898,6 +947,61 @@ class UVFITS(UVData):
                     "writing a uvfits file."
                 )
 
+        if self.data_array.dtype == "complex128":
+            write_precision = 64
+        else:
+            write_precision = 32
+
+        header, group_params, pol_indexing, table_hdus = self._get_uvfits_hdus(
+            write_lst=write_lst,
+            use_miriad_convention=use_miriad_convention,
+            write_precision=write_precision,
+        )
+        self._write_uvfits_groups(
+            filename,
+            header=header,
+            group_params=group_params,
+            pol_indexing=pol_indexing,
+            table_hdus=table_hdus,
+            chunk_size=chunk_size,
+        )
+
+    def _get_uvfits_hdus(self, *, write_lst, use_miriad_convention, write_precision):
+        """
+        Build the primary header, group parameters and tables for a uvfits file.
+
+        Parameters
+        ----------
+        write_lst : bool
+            Option to write the LSTs to the metadata (random group parameters).
+        use_miriad_convention : bool
+            Option to use the MIRIAD baseline convention, see `write_uvfits`.
+        write_precision : int
+            Number of bits in the floats of the random groups, either 32 or 64.
+
+        Returns
+        -------
+        header : astropy.io.fits.Header
+            The primary (random groups) header.
+        group_params : ndarray of float
+            The random group parameters, shape (Nblts, PCOUNT).
+        pol_indexing : ndarray of int
+            Indices to put the polarization axis in the uvfits order.
+        table_hdus : list of astropy.io.fits.BinTableHDU
+            The AIPS AN, AIPS FQ (if there are multiple spectral windows) and
+            AIPS SU tables.
+
+        Raises
+        ------
+        ValueError
+            If the frequencies are not evenly spaced or are separated by more
+            than their channel width.
+            The polarization values are not evenly spaced.
+            If the `timesys` parameter is set to anything other than "UTC" or None.
+        TypeError
+            If any entry in extra_keywords is not a single string or number.
+
+        """
         nchan_list = []
         start_freq_array = []
         delta_freq_array = []
@@ -960,45 +1064,14 @@ class UVFITS(UVData):
             pol_spacing = 1
 
         # check for unflagged data with nsample = 0. Warn if any found
-        wh_nsample0 = np.where(self.nsample_array == 0)
-        if np.any(~self.flag_array[wh_nsample0]):
-            warnings.warn(
-                "Some unflagged data has nsample = 0. Flags and "
-                "nsamples are combined in uvfits files such that "
-                "these data will appear to be flagged."
-            )
+        if self.nsample_array is not None:
+            _check_nsample_zero(self.flag_array, self.nsample_array)
 
-        uvfits_data_shape = (
-            self.Nblts,
-            1,
-            1,
-            self.Nspws,
-            self.Nfreqs // self.Nspws,
-            self.Npols,
-            1,
-        )
-
-        # Reshape the arrays so that they match the uvfits conventions
         # FITS uvw direction convention is opposite ours and Miriad's.
-        # So conjugate the visibilities and flip the uvws:
-        data_array = np.reshape(np.conj(self.data_array), uvfits_data_shape)
-        weights_array = np.reshape(
-            self.nsample_array * np.where(self.flag_array, -1, 1), uvfits_data_shape
-        )
-        data_array = data_array[:, :, :, :, :, pol_indexing, :]
-        weights_array = weights_array[:, :, :, :, :, pol_indexing, :]
-
-        uvfits_array_data = np.concatenate(
-            [data_array.real, data_array.imag, weights_array], axis=6
-        )
-        # convert to seconds units
+        # So flip the uvws here (the visibilities are conjugated when written)
+        # and convert to seconds units
         uvw_array_sec = -1 * self.uvw_array / const.c.to_value("m/s")
 
-        if self.data_array.dtype == "complex128":
-            write_precision = 64
-        else:
-            write_precision = 32
-
         # uvfits convention is that there are two float32 time_arrays and the
         # float64 sum of them + relevant PZERO = actual JD
         # a common practice is to set the PZERO to the JD at midnight of the first time
@@ -1142,13 +1215,19 @@ class UVFITS(UVData):
         else:
             parnames_write = copy.deepcopy(parnames_use)
 
+        # build the header from a single (empty) group, the groups themselves are
+        # streamed to the file by _write_uvfits_groups
         hdu = fits.GroupData(
-            uvfits_array_data,
+            np.zeros(
+                (1, 1, 1, self.Nspws, self.Nfreqs // self.Nspws, self.Npols, 3),
+                dtype=f"f{write_precision // 8}",
+            ),
             parnames=parnames_write,
-            pardata=group_parameter_list,
+            pardata=[np.zeros(1)] * len(parnames_write),
             bitpix=(-1 * write_precision),
         )
         hdu = fits.GroupsHDU(hdu)
+        hdu.header["GCOUNT"] = self.Nblts
 
         for i, key in enumerate(parnames_use):
             hdu.header["PSCAL" + str(i + 1) + "  "] = pscal_dict[key]
@@ -1413,7 +1492,7 @@ class UVFITS(UVData):
         # ant_hdu.header["POLARX"] = 0.0
         # ant_hdu.header["POLARY"] = 0.0
 
-        fits_tables = [hdu, ant_hdu]
+        table_hdus = [ant_hdu]
         # If needed, add the FQ table
         if self.Nspws > 1:
             fmt_d = "%iD" % self.Nspws
@@ -1442,7 +1521,7 @@ class UVFITS(UVData):
 
             fq_hdu.header["EXTNAME"] = "AIPS FQ"
             fq_hdu.header["NO_IF"] = self.Nspws
-            fits_tables.append(fq_hdu)
+            table_hdus.append(fq_hdu)
 
         # Always write the SU table
         fmt_d = "%iD" % self.Nspws
@@ -1539,9 +1618,483 @@ class UVFITS(UVData):
         # present does not carry around any velocity information. As per usual,
         # I (Karto) am tipping my hand on what I might be working on next...
         su_hdu.header["VELTYP"] = "LSR"
-        fits_tables.append(su_hdu)
+        table_hdus.append(su_hdu)
+
+        group_params = np.stack(group_parameter_list, axis=1).astype(
+            f"f{write_precision // 8}"
+        )
+
+        return hdu.header, group_params, pol_indexing, table_hdus
+
+    def _write_uvfits_groups(
+        self,
+        filename,
+        *,
+        header,
+        group_params,
+        pol_indexing,
+        table_hdus,
+        chunk_size=None,
+        write_data=True,
+    ):
+        """
+        Write a uvfits file, streaming the random groups in baseline-time chunks.
+
+        Parameters
+        ----------
+        filename : str
+            The uvfits file to write to.
+        header : astropy.io.fits.Header
+            The primary (random groups) header from `_get_uvfits_hdus`.
+        group_params : ndarray of float
+            The random group parameters from `_get_uvfits_hdus`.
+        pol_indexing : ndarray of int
+            Indices to put the polarization axis in the uvfits order.
+        table_hdus : list of astropy.io.fits.BinTableHDU
+            The tables to write after the random groups.
+        chunk_size : int, optional
+            Number of baseline-times to write at a time. Defaults to the number
+            that fits in about 32 MiB.
+        write_data : bool
+            Option to write the data, flags and nsamples. If False, the visibilities
+            and weights are written as zeros (which read back as flagged data).
+
+        """
+        if chunk_size is not None and (
+            not isinstance(chunk_size, int | np.integer) or chunk_size < 1
+        ):
+            raise ValueError("chunk_size must be a positive integer.")
+
+        dtype = np.dtype(f">f{abs(header['BITPIX']) // 8}")
+        npar = group_params.shape[1]
+        row_size = npar + self.Nfreqs * self.Npols * 3
+        if chunk_size is None:
+            chunk_size = max(_UVFITS_CHUNK_BYTES // (row_size * dtype.itemsize), 1)
+
+        with open(filename, "wb") as fobj:
+            fobj.write(header.tostring().encode("ascii"))
+            for blt_start in range(0, self.Nblts, chunk_size):
+                blt_slice = slice(blt_start, blt_start + chunk_size)
+                rows = np.zeros(
+                    (min(chunk_size, self.Nblts - blt_start), row_size), dtype=dtype
+                )
+                rows[:, :npar] = group_params[blt_slice]
+                if write_data:
+                    rows[:, npar:] = _get_uvfits_vis(
+                        self.data_array[blt_slice][:, :, pol_indexing],
+                        self.flag_array[blt_slice][:, :, pol_indexing],
+                        self.nsample_array[blt_slice][:, :, pol_indexing],
+                        dtype=dtype,
+                    ).reshape(rows.shape[0], -1)
+                fobj.write(rows.data)
+            # pad the random groups out to a whole number of 2880 byte FITS blocks
+            nbytes = self.Nblts * row_size * dtype.itemsize
+            fobj.write(b"\0" * (-nbytes % 2880))
+
+        with fits.open(filename, mode="append") as hdu_list:
+            for table_hdu in table_hdus:
+                hdu_list.append(table_hdu)
+
+    def initialize_uvfits_file(
+        self,
+        filename,
+        *,
+        clobber=False,
+        write_lst=True,
+        use_miriad_convention=False,
+        write_precision=None,
+        run_check=True,
+        check_extra=True,
+        run_check_acceptability=True,
+        strict_uvw_antpos_check=False,
+        chunk_size=None,
+    ):
+        """
+        Initialize a uvfits file on disk to be written to in parts.
+
+        The header, random group parameters and tables are written, with the
+        visibilities and weights set to zero (so unwritten data read as flagged).
+
+        Parameters
+        ----------
+        filename : str
+            The uvfits file to write to.
+        clobber : bool
+            Option to overwrite the file if it already exists.
+        write_lst : bool
+            Option to write the LSTs to the metadata (random group parameters).
+        use_miriad_convention : bool
+            Option to use the MIRIAD baseline convention, see `write_uvfits`.
+        write_precision : int, optional
+            Number of bits in the floats written to the file, either 32 or 64.
+            Defaults to 64 if the data_array is complex128 and 32 otherwise
+            (including for metadata only objects).
+        run_check : bool
+            Option to check for the existence and proper shapes of parameters
+            before writing the file.
+        check_extra : bool
+            Option to check optional parameters as well as required ones.
+        run_check_acceptability : bool
+            Option to check acceptable range of the values of parameters before
+            writing the file.
+        strict_uvw_antpos_check : bool
+            Option to raise an error rather than a warning if the check that
+            uvws match antenna positions does not pass.
+        chunk_size : int, optional
+            Number of baseline-times to write at a time. Defaults to the number
+            that fits in about 32 MiB.
+
+        Raises
+        ------
+        IOError
+            If the file located at `filename` already exists and clobber=False.
+        ValueError
+            If write_precision is not 32 or 64.
+            If any blts are not phased to a sidereal source.
+
+        """
+        if os.path.exists(filename):
+            if clobber:
+                print("File exists; clobbering")
+            else:
+                raise OSError("File exists; skipping")
+
+        if write_precision is None:
+            if self.data_array is not None and self.data_array.dtype == "complex128":
+                write_precision = 64
+            else:
+                write_precision = 32
+        elif write_precision not in (32, 64):
+            raise ValueError("write_precision must be 32 or 64.")
 
-        # write the file
-        hdulist = fits.HDUList(hdus=fits_tables)
-        hdulist.writeto(filename, overwrite=True)
-        hdulist.close()
+        if run_check:
+            self.check(
+                check_extra=check_extra,
+                run_check_acceptability=run_check_acceptability,
+                check_freq_spacing=True,
+                strict_uvw_antpos_check=strict_uvw_antpos_check,
+            )
+
+        if np.any(~self._check_for_cat_type(["sidereal"])):
+            raise ValueError(
+                "The data are not all phased to a sidereal source. Phase the data "
+                "before initializing a uvfits file."
+            )
+
+        header, group_params, pol_indexing, table_hdus = self._get_uvfits_hdus(
+            write_lst=write_lst,
+            use_miriad_convention=use_miriad_convention,
+            write_precision=write_precision,
+        )
+        self._write_uvfits_groups(
+            filename,
+            header=header,
+            group_params=group_params,
+            pol_indexing=pol_indexing,
+            table_hdus=table_hdus,
+            chunk_size=chunk_size,
+            write_data=False,
+        )
+
+    def write_uvfits_part(
+        self,
+        filename,
+        *,
+        data_array,
+        flag_array,
+        nsample_array,
+        check_header=True,
+        antenna_nums=None,
+        antenna_names=None,
+        ant_str=None,
+        bls=None,
+        frequencies=None,
+        freq_chans=None,
+        times=None,
+        time_range=None,
+        lsts=None,
+        lst_range=None,
+        polarizations=None,
+        blt_inds=None,
+        phase_center_ids=None,
+        catalog_names=None,
+    ):
+        """
+        Write out a part of a uvfits file that has been previously initialized.
+
+        Parameters
+        ----------
+        filename : str
+            The file on disk to write data to. It must already exist,
+            and is assumed to have been initialized with initialize_uvfits_file.
+        data_array : array of complex
+            The data to write to disk. A check is done to ensure that
+            the dimensions of the data passed in conform to the ones specified by
+            the "selection" arguments.
+        flag_array : array of bool
+            The flags array to write to disk. A check is done to ensure that
+            the dimensions of the data passed in conform to the ones specified by
+            the "selection" arguments.
+        nsample_array : array of float
+            The nsample array to write to disk. A check is done to ensure that
+            the dimensions of the data passed in conform to the ones specified by
+            the "selection" arguments.
+        check_header : bool
+            Option to check that the shape of the random groups on disk and the
+            times of the baseline-times being written match the object.
+        antenna_nums : array_like of int, optional
+            The antennas numbers to include when writing data into the file.
+            This cannot be provided if antenna_names is also provided.
+        antenna_names : array_like of str, optional
+            The antennas names to include when writing data into the file.
+            This cannot be provided if antenna_nums is also provided.
+        ant_str : str, optional
+            A string containing information about what antenna numbers
+            and polarizations to include when writing data into the file.
+            See the `select` method for details.
+        bls : list of tuples, optional
+            A list of antenna number tuples (e.g. [(0, 1), (3, 2)]) or a list of
+            baseline 3-tuples (e.g. [(0, 1, 'xx'), (2, 3, 'yy')]) specifying baselines
+            to write to the file.
+        frequencies : array_like of float, optional
+            The frequencies to include when writing data to the file.
+        freq_chans : array_like of int, optional
+            The frequency channel numbers to include when writing data to the file.
+        times : array_like of float, optional
+            The times in Julian Day to include when writing data to the file.
+        time_range : array_like of float, optional
+            The time range in Julian Date to include when writing data to the
+            file, must be length 2.
+        lsts : array_like of float, optional
+            The local sidereal times (LSTs) to include when writing data to the file.
+        lst_range : array_like of float, optional
+            The local sidereal time (LST) range in radians to include when writing
+            data to the file, must be of length 2.
+        polarizations : array_like of int, optional
+            The polarizations to include when writing data to the file.
+        blt_inds : array_like of int, optional
+            The baseline-time indices to include when writing data to the file.
+        phase_center_ids : array_like of int, optional
+            Phase center IDs to include when writing data to the file.
+            Cannot be used with catalog_names.
+        catalog_names : str or array-like of str, optional
+            The names of the phase centers (sources) to include when writing data
+            to the file. Cannot be used with phase_center_ids.
+
+        Raises
+        ------
+        AssertionError
+            If the file does not exist, if the data_array, flag_array and
+            nsample_array do not have the same shape or a shape that matches the
+            selection, or if check_header is set and the file does not match the
+            object.
+
+        Notes
+        -----
+        When partially writing out data, this function should be called after
+        calling initialize_uvfits_file with the same filename. The data are
+        written in place through a memory map of the random groups.
+
+        """
+        if not os.path.exists(filename):
+            raise AssertionError(
+                f"{filename} does not exists; please first initialize it with "
+                "initialize_uvfits_file"
+            )
+
+        # figure out which "full file" indices to write data to
+        blt_inds, freq_inds, pol_inds, _ = self._select_preprocess(
+            antenna_nums=antenna_nums,
+            antenna_names=antenna_names,
+            ant_str=ant_str,
+            bls=bls,
+            frequencies=frequencies,
+            freq_chans=freq_chans,
+            times=times,
+            time_range=time_range,
+            lsts=lsts,
+            lst_range=lst_range,
+            polarizations=polarizations,
+            blt_inds=blt_inds,
+            phase_center_ids=phase_center_ids,
+            catalog_names=catalog_names,
+        )
+        blt_inds = np.arange(self.Nblts) if blt_inds is None else np.asarray(blt_inds)
+        freq_inds = (
+            np.arange(self.Nfreqs) if freq_inds is None else np.asarray(freq_inds)
+        )
+        pol_inds = np.arange(self.Npols) if pol_inds is None else np.asarray(pol_inds)
+
+        if data_array.shape != flag_array.shape:
+            raise AssertionError("data_array and flag_array must have the same shape")
+        if data_array.shape != nsample_array.shape:
+            raise AssertionError(
+                "data_array and nsample_array must have the same shape"
+            )
+        proper_shape = (blt_inds.size, freq_inds.size, pol_inds.size)
+        if data_array.shape != proper_shape:
+            raise AssertionError(
+                f"data_array has shape {data_array.shape}; was expecting {proper_shape}"
+            )
+
+        _check_nsample_zero(flag_array, nsample_array)
+
+        with fits.open(filename) as hdu_list:
+            header = hdu_list[0].header
+            if check_header and (
+                header["GCOUNT"] != self.Nblts
+                or header["NAXIS3"] != self.Npols
+                or header["NAXIS4"] * header["NAXIS5"] != self.Nfreqs
+            ):
+                raise AssertionError(
+                    "The object metadata in memory and metadata on disk are different"
+                )
+            groups = _get_uvfits_groups(hdu_list, mode="r+")
+
+        if check_header:
+            file_times = np.zeros(blt_inds.size, dtype=np.float64)
+            for par_ind in range(header["PCOUNT"]):
+                if header[f"PTYPE{par_ind + 1}"].strip() == "DATE":
+                    file_times += (
+                        groups["par"][blt_inds, par_ind].astype(np.float64)
+                        * header[f"PSCAL{par_ind + 1}"]
+                        + header[f"PZERO{par_ind + 1}"]
+                    )
+            if not np.allclose(
+                file_times,
+                self.time_array[blt_inds],
+                rtol=self._time_array.tols[0],
+                atol=self._time_array.tols[1],
+            ):
+                raise AssertionError(
+                    "The object metadata in memory and metadata on disk are different"
+                )
+
+        # the polarizations are sorted into the uvfits order on disk
+        if self.Npols > 1:
+            file_pol_inds = np.argsort(np.argsort(np.abs(self.polarization_array)))
+        else:
+            file_pol_inds = np.asarray([0])
+        vis = groups["data"].reshape(self.Nblts, self.Nfreqs, self.Npols, 3)
+        vis[np.ix_(blt_inds, freq_inds, file_pol_inds[pol_inds])] = _get_uvfits_vis(
+            data_array, flag_array, nsample_array, dtype=vis.dtype
+        )
+        groups.flush()
+
+    def iter_uvfits_chunks(
+        self,
+        filename,
+        *,
+        chunk_size,
+        axis="blt",
+        antenna_nums=None,
+        antenna_names=None,
+        ant_str=None,
+        bls=None,
+        frequencies=None,
+        freq_chans=None,
+        times=None,
+        time_range=None,
+        lsts=None,
+        lst_range=None,
+        polarizations=None,
+        blt_inds=None,
+        phase_center_ids=None,
+        catalog_names=None,
+        keep_all_metadata=True,
+        background_lsts=True,
+        run_check=True,
+        check_extra=True,
+        run_check_acceptability=True,
+        strict_uvw_antpos_check=False,
+        fix_old_proj=False,
+        fix_use_ant_pos=True,
+        check_autos=True,
+        fix_autos=True,
+        astrometry_library=None,
+    ):
+        """Iterate over chunks of data in a uvfits file."""
+        allowed_axes = ["blt", "freq", "polarization"]
+        if axis not in allowed_axes:
+            raise ValueError("Axis must be one of: " + ", ".join(allowed_axes))
+
+        if not isinstance(chunk_size, int | np.integer) or chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+
+        # Read the metadata once, each chunk is then selected from it and only the
+        # data for the chunk are read from the memory mapped random groups.
+        self.read_uvfits(
+            filename,
+            read_data=False,
+            background_lsts=background_lsts,
+            run_check=False,
+            run_check_acceptability=run_check_acceptability,
+            astrometry_library=astrometry_library,
+        )
+        sel_inds = dict(
+            zip(
+                allowed_axes,
+                self._select_preprocess(
+                    antenna_nums=antenna_nums,
+                    antenna_names=antenna_names,
+                    ant_str=ant_str,
+                    bls=bls,
+                    frequencies=frequencies,
+                    freq_chans=freq_chans,
+                    times=times,
+                    time_range=time_range,
+                    lsts=lsts,
+                    lst_range=lst_range,
+                    polarizations=polarizations,
+                    blt_inds=blt_inds,
+                    phase_center_ids=phase_center_ids,
+                    catalog_names=catalog_names,
+                )[:3],
+                strict=True,
+            )
+        )
+        axis_len = {"blt": self.Nblts, "freq": self.Nfreqs, "polarization": self.Npols}[
+            axis
+        ]
+        if sel_inds[axis] is None:
+            sel_inds[axis] = np.arange(axis_len)
+
+        with fits.open(filename, memmap=True) as hdu_list:
+            for start in range(0, len(sel_inds[axis]), chunk_size):
+                chunk_inds = dict(sel_inds)
+                chunk_inds[axis] = sel_inds[axis][start : start + chunk_size]
+                pols = None
+                if chunk_inds["polarization"] is not None:
+                    pols = self.polarization_array[chunk_inds["polarization"]]
+
+                chunk = self.copy()
+                chunk._get_data(
+                    hdu_list,
+                    antenna_nums=None,
+                    antenna_names=None,
+                    ant_str=None,
+                    bls=None,
+                    frequencies=None,
+                    freq_chans=chunk_inds["freq"],
+                    times=None,
+                    time_range=None,
+                    lsts=None,
+                    lst_range=None,
+                    polarizations=pols,
+                    blt_inds=chunk_inds["blt"],
+                    phase_center_ids=None,
+                    catalog_names=None,
+                    keep_all_metadata=keep_all_metadata,
+                    fix_old_proj=fix_old_proj,
+                    fix_use_ant_pos=fix_use_ant_pos,
+                )
+                if run_check:
+                    chunk.check(
+                        check_extra=check_extra,
+                        run_check_acceptability=run_check_acceptability,
+                        strict_uvw_antpos_check=strict_uvw_antpos_check,
+                        allow_flip_conj=True,
+                        check_autos=check_autos,
+                        fix_autos=fix_autos,
+                    )
+                yield chunk
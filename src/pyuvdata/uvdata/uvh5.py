@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import contextlib
+import copy
 import os
 import warnings
 from functools import cached_property
@@ -476,12 +477,14 @@ class UVH5(UVData):
         run_check: bool = True,
         check_extra: bool = True,
         run_check_acceptability: bool = True,
+        check_level: str = "full",
         blt_order: tuple[str] | None | Literal["determine"] = None,
         blts_are_rectangular: bool | None = None,
         time_axis_faster_than_bls: bool | None = None,
         background_lsts: bool = True,
         recompute_nbls: bool | None = None,
         astrometry_library: str | None = None,
+        copy_header: bool = False,
     ):
         if not isinstance(filename, FastUVH5Meta):
             obj = FastUVH5Meta(
@@ -522,7 +525,7 @@ class UVH5(UVData):
             self.lst_array = obj.header["lst_array"][:]
             proc = None
 
-            if run_check_acceptability:
+            if run_check_acceptability and check_level == "full":
                 utils.times.check_lsts_against_times(
                     jd_array=self.time_array,
                     lst_array=self.lst_array,
@@ -567,10 +570,14 @@ class UVH5(UVData):
                 "Nphase",
             ]
 
+        # The FastUVH5Meta object caches the header values, so they need to be copied
+        # if it is used for multiple reads (e.g. in `iter_uvh5_chunks`).
+        get_value = copy.deepcopy if copy_header else lambda value: value
+
         # Required parameters
         for attr in req_params:
             try:
-                setattr(self, attr, getattr(obj, attr))
+                setattr(self, attr, get_value(getattr(obj, attr)))
             except AttributeError as e:
                 raise KeyError(str(e)) from e
 
@@ -619,7 +626,7 @@ class UVH5(UVData):
             "pol_convention",
         ]:
             with contextlib.suppress(AttributeError):
-                setattr(self, attr, getattr(obj, attr))
+                setattr(self, attr, get_value(getattr(obj, attr)))
 
         if self.blt_order is not None:
             self._blt_order.form = (len(self.blt_order),)
@@ -709,6 +716,10 @@ class UVH5(UVData):
         data_array_dtype,
         keep_all_metadata,
         multidim_index,
+        lazy=False,
+        meta=None,
+        decompression_nworkers=1,
+        decompression_pool=None,
     ):
         """
         Read the data-size arrays (data, flags, nsamples) from a file.
@@ -725,6 +736,8 @@ class UVH5(UVData):
         dgrp : h5py datagroup
             The HDF5 datagroup containing the datasets. Should be "/Data" for
             UVH5 files conforming to spec.
+        meta : FastUVH5Meta
+            The metadata object for the file, required if `lazy` is True.
 
         Returns
         -------
@@ -804,17 +817,62 @@ class UVH5(UVData):
         else:
             custom_dtype = False
 
-        if min_frac == 1:
+        if lazy:
+            # do select operations on the metadata, then set the data-like arrays to
+            # objects that only read data from disk when indexed.
+            if min_frac < 1:
+                self._select_by_index(
+                    blt_inds=blt_inds,
+                    freq_inds=freq_inds,
+                    pol_inds=pol_inds,
+                    history_update_string=history_update_string,
+                    keep_all_metadata=keep_all_metadata,
+                )
+            for attr, name in [
+                ("data_array", "visdata"),
+                ("flag_array", "flags"),
+                ("nsample_array", "nsamples"),
+            ]:
+                setattr(
+                    self,
+                    attr,
+                    hdf5_utils.LazyHDF5Array(
+                        meta,
+                        name,
+                        dtype=data_array_dtype if custom_dtype else None,
+                        indices=(blt_inds, freq_inds, pol_inds),
+                    ),
+                )
+        elif min_frac == 1:
             # no select, read in all the data
             inds = (np.s_[:], np.s_[:], np.s_[:])
             if custom_dtype:
                 self.data_array = hdf5_utils._read_complex_astype(
-                    dgrp["visdata"], inds, data_array_dtype
+                    dgrp["visdata"],
+                    inds,
+                    data_array_dtype,
+                    nworkers=decompression_nworkers,
+                    pool=decompression_pool,
                 )
             else:
-                self.data_array = hdf5_utils._index_dset(dgrp["visdata"], inds)
-            self.flag_array = hdf5_utils._index_dset(dgrp["flags"], inds)
-            self.nsample_array = hdf5_utils._index_dset(dgrp["nsamples"], inds)
+                self.data_array = hdf5_utils._index_dset(
+                    dgrp["visdata"],
+                    inds,
+                    nworkers=decompression_nworkers,
+                    pool=decompression_pool,
+                )
+            self.flag_array = hdf5_utils._index_dset(
+                dgrp["flags"],
+                inds,
+                nworkers=decompression_nworkers,
+                pool=decompression_pool,
+            )
+            self.nsample_array = hdf5_utils._index_dset(
+                dgrp["nsamples"],
+                inds,
+                nworkers=decompression_nworkers,
+                pool=decompression_pool,
+            )
         else:
             # do select operations on everything except data_array, flag_array
             # and nsample_array
@@ -888,12 +946,31 @@ class UVH5(UVData):
                 # index datasets
                 if custom_dtype:
                     visdata = hdf5_utils._read_complex_astype(
-                        visdata_dset, inds, data_array_dtype
+                        visdata_dset,
+                        inds,
+                        data_array_dtype,
+                        nworkers=decompression_nworkers,
+                        pool=decompression_pool,
                     )
                 else:
-                    visdata = hdf5_utils._index_dset(visdata_dset, inds)
-                flags = hdf5_utils._index_dset(flags_dset, inds)
-                nsamples = hdf5_utils._index_dset(nsamples_dset, inds)
+                    visdata = hdf5_utils._index_dset(
+                        visdata_dset,
+                        inds,
+                        nworkers=decompression_nworkers,
+                        pool=decompression_pool,
+                    )
+                flags = hdf5_utils._index_dset(
+                    flags_dset,
+                    inds,
+                    nworkers=decompression_nworkers,
+                    pool=decompression_pool,
+                )
+                nsamples = hdf5_utils._index_dset(
+                    nsamples_dset,
+                    inds,
+                    nworkers=decompression_nworkers,
+                    pool=decompression_pool,
+                )
                 # down select on other dimensions if necessary
                 # use indices not slices here: generally not the bottleneck
                 if not multidim_index and freq_frac < 1:
@@ -926,12 +1003,31 @@ class UVH5(UVData):
                 # index datasets
                 if custom_dtype:
                     visdata = hdf5_utils._read_complex_astype(
-                        visdata_dset, inds, data_array_dtype
+                        visdata_dset,
+                        inds,
+                        data_array_dtype,
+                        nworkers=decompression_nworkers,
+                        pool=decompression_pool,
                     )
                 else:
-                    visdata = hdf5_utils._index_dset(visdata_dset, inds)
-                flags = hdf5_utils._index_dset(flags_dset, inds)
-                nsamples = hdf5_utils._index_dset(nsamples_dset, inds)
+                    visdata = hdf5_utils._index_dset(
+                        visdata_dset,
+                        inds,
+                        nworkers=decompression_nworkers,
+                        pool=decompression_pool,
+                    )
+                flags = hdf5_utils._index_dset(
+                    flags_dset,
+                    inds,
+                    nworkers=decompression_nworkers,
+                    pool=decompression_pool,
+                )
+                nsamples = hdf5_utils._index_dset(
+                    nsamples_dset,
+                    inds,
+                    nworkers=decompression_nworkers,
+                    pool=decompression_pool,
+                )
 
                 # down select on other dimensions if necessary
                 # use indices not slices here: generally not the bottleneck
@@ -964,12 +1060,31 @@ class UVH5(UVData):
                 # index datasets
                 if custom_dtype:
                     visdata = hdf5_utils._read_complex_astype(
-                        visdata_dset, inds, data_array_dtype
+                        visdata_dset,
+                        inds,
+                        data_array_dtype,
+                        nworkers=decompression_nworkers,
+                        pool=decompression_pool,
                     )
                 else:
-                    visdata = hdf5_utils._index_dset(visdata_dset, inds)
-                flags = hdf5_utils._index_dset(flags_dset, inds)
-                nsamples = hdf5_utils._index_dset(nsamples_dset, inds)
+                    visdata = hdf5_utils._index_dset(
+                        visdata_dset,
+                        inds,
+                        nworkers=decompression_nworkers,
+                        pool=decompression_pool,
+                    )
+                flags = hdf5_utils._index_dset(
+                    flags_dset,
+                    inds,
+                    nworkers=decompression_nworkers,
+                    pool=decompression_pool,
+                )
+                nsamples = hdf5_utils._index_dset(
+                    nsamples_dset,
+                    inds,
+                    nworkers=decompression_nworkers,
+                    pool=decompression_pool,
+                )
 
                 # down select on other dimensions if necessary
                 # use indices not slices here: generally not the bottleneck
@@ -1017,14 +1132,18 @@ class UVH5(UVData):
         catalog_names=None,
         keep_all_metadata=True,
         read_data=True,
+        lazy=False,
         data_array_dtype=np.complex128,
         multidim_index=False,
+        decompression_nworkers=1,
         remove_flex_pol=True,
         background_lsts=True,
         run_check=True,
         check_extra=True,
         run_check_acceptability=True,
         strict_uvw_antpos_check=False,
+        check_level="full",
+        only_changed=False,
         fix_old_proj=None,
         fix_use_ant_pos=True,
         check_autos=True,
@@ -1035,6 +1154,7 @@ class UVH5(UVData):
         time_axis_faster_than_bls: bool | None = None,
         recompute_nbls: bool | None = None,
         astrometry_library: str | None = None,
+        copy_header: bool = False,
     ):
         """Read in data from a UVH5 file."""
         # Check for defunct keyword
@@ -1065,32 +1185,42 @@ class UVH5(UVData):
             run_check=run_check,
             check_extra=check_extra,
             run_check_acceptability=run_check_acceptability,
+            check_level=check_level,
             background_lsts=background_lsts,
             astrometry_library=astrometry_library,
+            copy_header=copy_header,
         )
 
         if read_data:
-            # Now read in the data
-            self._get_data(
-                meta.datagrp,
-                antenna_nums=antenna_nums,
-                antenna_names=antenna_names,
-                ant_str=ant_str,
-                bls=bls,
-                frequencies=frequencies,
-                freq_chans=freq_chans,
-                times=times,
-                time_range=time_range,
-                lsts=lsts,
-                lst_range=lst_range,
-                polarizations=polarizations,
-                blt_inds=blt_inds,
-                phase_center_ids=phase_center_ids,
-                catalog_names=catalog_names,
-                data_array_dtype=data_array_dtype,
-                keep_all_metadata=keep_all_metadata,
-                multidim_index=multidim_index,
-            )
+            # Now read in the data, sharing one pool of worker processes between
+            # the datasets if decompressing in parallel
+            with hdf5_utils._decompression_pool(
+                decompression_nworkers
+            ) as decompression_pool:
+                self._get_data(
+                    meta.datagrp,
+                    antenna_nums=antenna_nums,
+                    antenna_names=antenna_names,
+                    ant_str=ant_str,
+                    bls=bls,
+                    frequencies=frequencies,
+                    freq_chans=freq_chans,
+                    times=times,
+                    time_range=time_range,
+                    lsts=lsts,
+                    lst_range=lst_range,
+                    polarizations=polarizations,
+                    blt_inds=blt_inds,
+                    phase_center_ids=phase_center_ids,
+                    catalog_names=catalog_names,
+                    data_array_dtype=data_array_dtype,
+                    keep_all_metadata=keep_all_metadata,
+                    multidim_index=multidim_index,
+                    lazy=lazy,
+                    meta=meta,
+                    decompression_nworkers=decompression_nworkers,
+                    decompression_pool=decompression_pool,
+                )
         if close_meta:
             meta.close()
 
@@ -1110,6 +1240,8 @@ class UVH5(UVData):
         old_phase_compatible, _ = self._old_phase_attributes_compatible()
         if np.any(~self._check_for_cat_type("unprojected")) and old_phase_compatible:
             if (fix_old_proj) or (fix_old_proj is None and add_app_coords):
+                # fixing the phasing requires the data to be in memory
+                self.load_lazy_data()
                 self.fix_phase(use_ant_pos=fix_use_ant_pos)
             elif add_app_coords:
                 warnings.warn(
@@ -1121,6 +1253,9 @@ class UVH5(UVData):
                 )
 
         if remove_flex_pol:
+            if self.flex_spw_polarization_array is not None:
+                # reshaping the data requires it to be in memory
+                self.load_lazy_data()
             self.remove_flex_pol()
 
         # check if object has all required UVParameters set
@@ -1129,6 +1264,8 @@ class UVH5(UVData):
                 check_extra=check_extra,
                 run_check_acceptability=run_check_acceptability,
                 strict_uvw_antpos_check=strict_uvw_antpos_check,
+                check_level=check_level,
+                only_changed=only_changed,
                 allow_flip_conj=True,
                 check_autos=check_autos,
                 fix_autos=fix_autos,
@@ -1136,6 +1273,127 @@ class UVH5(UVData):
 
         return
 
+    @copy_replace_short_description(
+        UVData.iter_uvh5_chunks, style=DocstringStyle.NUMPYDOC
+    )
+    def iter_uvh5_chunks(
+        self,
+        filename,
+        *,
+        chunk_size,
+        axis="blt",
+        antenna_nums=None,
+        antenna_names=None,
+        ant_str=None,
+        bls=None,
+        frequencies=None,
+        freq_chans=None,
+        times=None,
+        time_range=None,
+        lsts=None,
+        lst_range=None,
+        polarizations=None,
+        blt_inds=None,
+        phase_center_ids=None,
+        catalog_names=None,
+        blt_order: tuple[str] | Literal["determine"] | None = None,
+        blts_are_rectangular: bool | None = None,
+        time_axis_faster_than_bls: bool | None = None,
+        recompute_nbls: bool | None = None,
+        astrometry_library: str | None = None,
+        **kwargs,
+    ):
+        """Iterate over chunks of data in a UVH5 file."""
+        allowed_axes = ["blt", "freq", "polarization"]
+        if axis not in allowed_axes:
+            raise ValueError("Axis must be one of: " + ", ".join(allowed_axes))
+
+        if not isinstance(chunk_size, int | np.integer) or chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+
+        for key in ["read_data", "use_future_array_shapes", "copy_header"]:
+            if key in kwargs:
+                raise ValueError(f"{key} cannot be passed to iter_uvh5_chunks.")
+
+        if isinstance(filename, FastUVH5Meta):
+            meta = filename
+            close_meta = False
+        else:
+            close_meta = True
+            meta = FastUVH5Meta(
+                filename,
+                blt_order=blt_order,
+                blts_are_rectangular=blts_are_rectangular,
+                time_axis_faster_than_bls=time_axis_faster_than_bls,
+                recompute_nbls=recompute_nbls,
+            )
+
+        try:
+            # Read the header once to work out which indices are selected along
+            # each axis, the chunks are then defined on the selected indices.
+            self._read_header(
+                meta,
+                run_check=False,
+                background_lsts=False,
+                astrometry_library=astrometry_library,
+            )
+            if axis == "polarization" and self.flex_spw_polarization_array is not None:
+                raise ValueError(
+                    "Cannot iterate over the polarization axis for flex-pol files."
+                )
+
+            sel_inds = dict(
+                zip(
+                    allowed_axes,
+                    self._select_preprocess(
+                        antenna_nums=antenna_nums,
+                        antenna_names=antenna_names,
+                        ant_str=ant_str,
+                        bls=bls,
+                        frequencies=frequencies,
+                        freq_chans=freq_chans,
+                        times=times,
+                        time_range=time_range,
+                        lsts=lsts,
+                        lst_range=lst_range,
+                        polarizations=polarizations,
+                        blt_inds=blt_inds,
+                        phase_center_ids=phase_center_ids,
+                        catalog_names=catalog_names,
+                    )[:3],
+                    strict=True,
+                )
+            )
+            axis_len = {
+                "blt": self.Nblts,
+                "freq": self.Nfreqs,
+                "polarization": self.Npols,
+            }[axis]
+            if sel_inds[axis] is None:
+                sel_inds[axis] = np.arange(axis_len)
+
+            for start in range(0, len(sel_inds[axis]), chunk_size):
+                chunk_inds = dict(sel_inds)
+                chunk_inds[axis] = sel_inds[axis][start : start + chunk_size]
+                pols = None
+                if chunk_inds["polarization"] is not None:
+                    pols = self.polarization_array[chunk_inds["polarization"]]
+
+                chunk = type(self)()
+                chunk.read_uvh5(
+                    meta,
+                    blt_inds=chunk_inds["blt"],
+                    freq_chans=chunk_inds["freq"],
+                    polarizations=pols,
+                    astrometry_library=astrometry_library,
+                    copy_header=True,
+                    **kwargs,
+                )
+                yield chunk
+        finally:
+            if close_meta:
+                meta.close()
+
     def _write_header(self, header):
         """
         Write data to the header datagroup of a UVH5 file.
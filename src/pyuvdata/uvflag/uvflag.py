@@ -13,6 +13,7 @@ import h5py
 import numpy as np
 
 from .. import Telescope, UVCal, UVData, parameter as uvp, utils
+from ..utils.io import hdf5 as hdf5_utils
 from ..uvbase import UVBase
 
 __all__ = ["UVFlag", "flags2waterfall", "and_rows_cols"]
@@ -55,7 +56,200 @@ def and_rows_cols(waterfall):
     return wf
 
 
-def flags2waterfall(uv, *, flag_array=None, keep_pol=False):
+def _time_segments(time_array):
+    """
+    Get the indices to collapse an array along the blt axis by time.
+
+    Parameters
+    ----------
+    time_array : array of float
+        Times for each blt.
+
+    Returns
+    -------
+    order : array of int or None
+        Indices to sort the blt axis so that each time is contiguous, keeping
+        the original order within each time. None if it is already sorted.
+    starts : array of int
+        Start index of each unique time (in sorted order) in the sorted blt axis.
+
+    """
+    _, time_inds = np.unique(time_array, return_inverse=True)
+    time_inds = time_inds.reshape(-1)
+    if np.all(time_inds[1:] >= time_inds[:-1]):
+        order = None
+    else:
+        order = np.argsort(time_inds, kind="stable")
+        time_inds = time_inds[order]
+    starts = np.flatnonzero(np.diff(time_inds, prepend=-1))
+    return order, starts
+
+
+def _flag_sums_by_time(time_array, flag_array):
+    """
+    Sum a UVData-like flag array over baselines for each unique time.
+
+    Parameters
+    ----------
+    time_array : array of float
+        Times for each blt.
+    flag_array : array
+        Flag array with the blt axis first.
+
+    Returns
+    -------
+    times : array of float
+        The unique times.
+    flag_sums : array of float
+        Sum of the flags over baselines for each time, shape
+        (Ntimes,) + flag_array.shape[1:].
+    counts : array of int
+        Number of blts for each time.
+
+    """
+    order, starts = _time_segments(time_array)
+    if order is not None:
+        flag_array = flag_array[order]
+    flag_sums = np.add.reduceat(flag_array, starts, axis=0, dtype=float)
+    counts = np.diff(np.append(starts, len(time_array)))
+    return np.unique(time_array), flag_sums, counts
+
+
+def _read_uvh5_flags(meta, blt_slice):
+    """
+    Read the flags for a slice of baseline-times from a UVH5 file.
+
+    Parameters
+    ----------
+    meta : FastUVH5Meta
+        The metadata object for the file.
+    blt_slice : slice
+        The baseline-times to read.
+
+    Returns
+    -------
+    ndarray of bool
+        The flags, shape (Nblts in the slice, Nfreqs, Npols).
+
+    """
+    flags = hdf5_utils._index_dset(
+        meta.datagrp["flags"], (blt_slice, slice(None), slice(None))
+    )
+    if flags.ndim == 4:
+        # old shaped datasets have a length one spw axis
+        flags = flags[:, 0]
+    return flags
+
+
+def _uvh5_flags2waterfall(filename, *, keep_pol=False, chunk_size=None):
+    """
+    Accumulate a flag waterfall from a UVH5 file chunk by chunk.
+
+    Parameters
+    ----------
+    filename : str or pathlib.Path or FastUVH5Meta
+        The UVH5 file to read the flags from.
+    keep_pol : bool
+        Option to keep the polarization axis intact.
+    chunk_size : int, optional
+        Number of blts to read at a time. Defaults to the number of baselines.
+
+    Returns
+    -------
+    waterfall : 2D array or 3D array
+        Fraction of baselines which are flagged for every time and frequency.
+
+    """
+    from ..uvdata.uvh5 import FastUVH5Meta
+
+    if isinstance(filename, FastUVH5Meta):
+        meta = filename
+        close_meta = False
+    else:
+        meta = FastUVH5Meta(filename)
+        close_meta = True
+
+    try:
+        time_array = meta.time_array
+        times = np.unique(time_array)
+        if chunk_size is None:
+            chunk_size = meta.Nbls
+        if hasattr(meta, "flex_spw_polarization_array"):
+            # flex-pol data are converted to regular polarizations on read, so
+            # read them as UVData objects to get the same waterfall.
+            chunks = (
+                (chunk.time_array, chunk.flag_array)
+                for chunk in UVData.iter_uvh5_chunks(
+                    meta, chunk_size=chunk_size, run_check=False
+                )
+            )
+        else:
+            # only read the flags
+            chunks = (
+                (
+                    time_array[start : start + chunk_size],
+                    _read_uvh5_flags(meta, slice(start, start + chunk_size)),
+                )
+                for start in range(0, meta.Nblts, chunk_size)
+            )
+        flag_sums = None
+        counts = np.zeros(times.size, dtype=int)
+        for chunk_time_array, chunk_flag_array in chunks:
+            chunk_times, chunk_sums, chunk_counts = _flag_sums_by_time(
+                chunk_time_array, chunk_flag_array
+            )
+            if flag_sums is None:
+                flag_sums = np.zeros((times.size,) + chunk_sums.shape[1:])
+            time_inds = np.searchsorted(times, chunk_times)
+            flag_sums[time_inds] += chunk_sums
+            counts[time_inds] += chunk_counts
+    finally:
+        if close_meta:
+            meta.close()
+
+    if keep_pol:
+        return flag_sums / counts[:, np.newaxis, np.newaxis]
+    return flag_sums.sum(axis=2) / (counts[:, np.newaxis] * flag_sums.shape[2])
+
+
+def _match_time_inds(times, match_times, *, rtol, atol):
+    """
+    Find the index of the matching time for each of a set of times.
+
+    Parameters
+    ----------
+    times : array of float
+        Sorted unique times to match to.
+    match_times : array of float
+        Times to find matches for.
+    rtol : float
+        Relative tolerance for a match (relative to the value in `times`).
+    atol : float
+        Absolute tolerance for a match.
+
+    Returns
+    -------
+    time_inds : array of int
+        Index into `times` of the matching time for each entry in `match_times`,
+        -1 where there is no match. If more than one time matches, the later
+        time is used.
+
+    """
+    unique_match, inverse = np.unique(match_times, return_inverse=True)
+    # only the times on either side of each value can match it
+    upper = np.searchsorted(times, unique_match, side="right")
+    unique_inds = np.full(unique_match.size, -1)
+    for candidate in [upper - 1, upper]:
+        valid = (candidate >= 0) & (candidate < times.size)
+        close = np.zeros(unique_match.size, dtype=bool)
+        close[valid] = np.isclose(
+            unique_match[valid], times[candidate[valid]], rtol=rtol, atol=atol
+        )
+        unique_inds[close] = candidate[close]
+    return unique_inds[inverse.reshape(-1)]
+
+
+def flags2waterfall(uv, *, flag_array=None, keep_pol=False, chunk_size=None):
     """Convert a flag array to a 2D waterfall of dimensions (Ntimes, Nfreqs).
 
     Averages over baselines and polarizations (in the case of visibility data),
@@ -63,14 +257,21 @@ def flags2waterfall(uv, *, flag_array=None, keep_pol=False):
 
     Parameters
     ----------
-    uv : A UVData or UVCal object
+    uv : A UVData or UVCal object or str or pathlib.Path or FastUVH5Meta
         Object defines the times and frequencies, and supplies the
-        flag_array to convert (if flag_array not specified)
+        flag_array to convert (if flag_array not specified). If a path to a
+        UVH5 file (or a FastUVH5Meta object), the flags are read from the
+        file in chunks along the blt axis and accumulated into the waterfall,
+        so the full flag array is never held in memory.
     flag_array :  Optional,
         flag array to convert instead of uv.flag_array.
         Must have same dimensions as uv.flag_array.
+        Not allowed if `uv` is a UVH5 file.
     keep_pol : bool
         Option to keep the polarization axis intact.
+    chunk_size : int, optional
+        Number of blts to read at a time if `uv` is a UVH5 file. Defaults to
+        the number of baselines in the file. Not used otherwise.
 
     Returns
     -------
@@ -80,6 +281,15 @@ def flags2waterfall(uv, *, flag_array=None, keep_pol=False):
         Size is (Ntimes, Nfreqs) or (Ntimes, Nfreqs, Npols).
 
     """
+    from ..uvdata.uvh5 import FastUVH5Meta
+
+    if isinstance(uv, str | pathlib.Path | FastUVH5Meta):
+        if flag_array is not None:
+            raise ValueError(
+                "flag_array cannot be passed to flags2waterfall() if reading "
+                "from a UVH5 file."
+            )
+        return _uvh5_flags2waterfall(uv, keep_pol=keep_pol, chunk_size=chunk_size)
     if not isinstance(uv, UVData | UVCal):
         raise ValueError(
             "flags2waterfall() requires a UVData or UVCal object as "
@@ -101,23 +311,13 @@ def flags2waterfall(uv, *, flag_array=None, keep_pol=False):
         else:
             waterfall = np.mean(flag_array, axis=mean_axis).T
     else:
-        mean_axis = [0]
-        if not keep_pol:
-            mean_axis.append(2)
-
-        mean_axis = tuple(mean_axis)
+        _, flag_sums, counts = _flag_sums_by_time(uv.time_array, flag_array)
         if keep_pol:
-            waterfall = np.zeros((uv.Ntimes, uv.Nfreqs, uv.Npols))
-            for i, t in enumerate(np.unique(uv.time_array)):
-                waterfall[i, :] = np.mean(
-                    flag_array[uv.time_array == t], axis=mean_axis
-                )
+            waterfall = flag_sums / counts[:, np.newaxis, np.newaxis]
         else:
-            waterfall = np.zeros((uv.Ntimes, uv.Nfreqs))
-            for i, t in enumerate(np.unique(uv.time_array)):
-                waterfall[i, :] = np.mean(
-                    flag_array[uv.time_array == t], axis=mean_axis
-                )
+            waterfall = flag_sums.sum(axis=2) / (
+                counts[:, np.newaxis] * flag_sums.shape[2]
+            )
 
     return waterfall
 
@@ -1267,37 +1467,27 @@ class UVFlag(UVBase):
             if self.mode == "metric":
                 self.weights_array = np.swapaxes(w, 0, 1)
         elif self.type == "baseline":
-            Nt = len(np.unique(self.time_array))
-            Nf = self.freq_array.size
-            Np = len(self.polarization_array)
-            d = np.zeros((Nt, Nf, Np))
-            w = np.zeros((Nt, Nf, Np))
+            # collapse all the times at once on the blt axis sorted by time
+            order, starts = _time_segments(self.time_array)
+            if self.mode == "metric":
+                _weights = self.weights_array
+            else:
+                _weights = np.ones_like(darr, dtype=float)
+            if order is not None:
+                darr = darr[order]
+                _weights = _weights[order]
+            out = utils.array_collapse.collapse_segments(
+                darr,
+                method,
+                starts=starts,
+                weights=_weights,
+                return_weights=True,
+                return_weights_square=return_weights_square,
+            )
             if return_weights_square:
-                ws = np.zeros((Nt, Nf, Np))
-            for i, t in enumerate(np.unique(self.time_array)):
-                ind = self.time_array == t
-                if self.mode == "metric":
-                    _weights = self.weights_array[ind, :, :]
-                else:
-                    _weights = np.ones_like(darr[ind, :, :], dtype=float)
-                if return_weights_square:
-                    d[i, :, :], w[i, :, :], ws[i, :, :] = utils.collapse(
-                        darr[ind, :, :],
-                        method,
-                        axis=0,
-                        weights=_weights,
-                        return_weights=True,
-                        return_weights_square=return_weights_square,
-                    )
-                else:
-                    d[i, :, :], w[i, :, :] = utils.collapse(
-                        darr[ind, :, :],
-                        method,
-                        axis=0,
-                        weights=_weights,
-                        return_weights=True,
-                        return_weights_square=return_weights_square,
-                    )
+                d, w, ws = (arr.astype(float) for arr in out)
+            else:
+                d, w = (arr.astype(float) for arr in out)
             darr = d
             if self.mode == "metric":
                 self.weights_array = w
@@ -1383,6 +1573,7 @@ class UVFlag(UVBase):
         uv,
         *,
         force_pol=False,
+        blt_chunk_size=None,
         run_check=True,
         check_extra=True,
         run_check_acceptability=True,
@@ -1404,6 +1595,12 @@ class UVFlag(UVBase):
             Otherwise, will require polarizations match.
             For example, this keyword is useful if one flags on all
             pols combined, and wants to broadcast back to individual pols.
+        blt_chunk_size : int, optional
+            The number of baseline-times to fill at once. The flags (or metrics)
+            for all baselines in a chunk of baseline-times are gathered together,
+            which requires temporary arrays the size of the chunk of the output
+            arrays. Set this to limit the memory used for large data sets.
+            Defaults to all the baseline-times at once.
         run_check : bool
             Option to check for the existence and proper shapes of parameters
             after converting to baseline type.
@@ -1416,6 +1613,10 @@ class UVFlag(UVBase):
         """
         if self.type == "baseline":
             return
+        if blt_chunk_size is not None and (
+            not isinstance(blt_chunk_size, int | np.integer) or blt_chunk_size < 1
+        ):
+            raise ValueError("blt_chunk_size must be a positive integer.")
         if not (
             issubclass(uv.__class__, UVData)
             or (isinstance(uv, UVFlag) and uv.type == "baseline")
@@ -1497,6 +1698,22 @@ class UVFlag(UVBase):
                 )
             else:
                 raise ValueError("Polarizations could not be made to match.")
+        if blt_chunk_size is None:
+            blt_chunk_size = max(uv.Nblts, 1)
+        blt_slices = [
+            slice(blt_start, blt_start + blt_chunk_size)
+            for blt_start in range(0, uv.Nblts, blt_chunk_size)
+        ]
+        # Index into the time axis on this object for each blt on uv
+        unique_times, first_inds = np.unique(self.time_array, return_index=True)
+        time_inds = _match_time_inds(
+            unique_times,
+            uv.time_array,
+            rtol=max(self._time_array.tols[0], uv._time_array.tols[0]),
+            atol=max(self._time_array.tols[1], uv._time_array.tols[1]),
+        )
+        has_time = time_inds >= 0
+        time_inds[has_time] = first_inds[time_inds[has_time]]
         if self.type == "waterfall":
             # Populate arrays
             if self.mode == "flag":
@@ -1506,18 +1723,12 @@ class UVFlag(UVBase):
                 arr = np.zeros_like(uv.flag_array, dtype=np.float64)
                 warr = np.zeros_like(uv.flag_array, dtype=np.float64)
                 sarr = self.metric_array
-            for i, t in enumerate(np.unique(self.time_array)):
-                ti = np.where(
-                    np.isclose(
-                        uv.time_array,
-                        t,
-                        rtol=max(self._time_array.tols[0], uv._time_array.tols[0]),
-                        atol=max(self._time_array.tols[1], uv._time_array.tols[1]),
-                    )
-                )
-                arr[ti] = sarr[i][np.newaxis, :, :]
+            for blts in blt_slices:
+                blt_inds = np.arange(uv.Nblts)[blts][has_time[blts]]
+                wf_inds = time_inds[blt_inds]
+                arr[blt_inds] = sarr[wf_inds]
                 if self.mode == "metric":
-                    warr[ti] = self.weights_array[i][np.newaxis, :, :]
+                    warr[blt_inds] = self.weights_array[wf_inds]
             if self.mode == "flag":
                 self.flag_array = arr
             elif self.mode == "metric":
@@ -1540,29 +1751,26 @@ class UVFlag(UVBase):
                 new_flags = np.full(flag_shape, True, dtype=bool)
                 self.flag_array = np.append(self.flag_array, new_flags, axis=0)
 
+            # Index into the ant_array for each antenna on uv
+            ant_array = np.asarray(self.ant_array)
+            ant_sort = np.argsort(ant_array, kind="stable")
+            ant1_inds = ant_sort[
+                np.searchsorted(ant_array, uv.ant_1_array, sorter=ant_sort)
+            ]
+            ant2_inds = ant_sort[
+                np.searchsorted(ant_array, uv.ant_2_array, sorter=ant_sort)
+            ]
+
             baseline_flags = np.full(
                 (uv.Nblts, self.Nfreqs, self.Npols), True, dtype=bool
             )
-            for blt_index, bl in enumerate(uv.baseline_array):
-                uvf_t_index = np.nonzero(
-                    np.isclose(
-                        uv.time_array[blt_index],
-                        self.time_array,
-                        rtol=max(self._time_array.tols[0], uv._time_array.tols[0]),
-                        atol=max(self._time_array.tols[1], uv._time_array.tols[1]),
-                    )
-                )[0]
-                if uvf_t_index.size > 0:
-                    # if the time is found in the uvflag object time_array
-                    # input the or'ed data from each antenna
-                    ant1, ant2 = uv.baseline_to_antnums(bl)
-                    ant1_index = np.nonzero(np.array(self.ant_array) == ant1)
-                    ant2_index = np.nonzero(np.array(self.ant_array) == ant2)
-                    or_flag = np.logical_or(
-                        self.flag_array[ant1_index, :, uvf_t_index, :],
-                        self.flag_array[ant2_index, :, uvf_t_index, :],
-                    )
-                    baseline_flags[blt_index] = or_flag.copy()
+            for blts in blt_slices:
+                blt_inds = np.arange(uv.Nblts)[blts][has_time[blts]]
+                # input the or'ed data from each antenna
+                baseline_flags[blt_inds] = np.logical_or(
+                    self.flag_array[ant1_inds[blt_inds], :, time_inds[blt_inds]],
+                    self.flag_array[ant2_inds[blt_inds], :, time_inds[blt_inds]],
+                )
 
             self.flag_array = baseline_flags
 
@@ -1581,6 +1789,7 @@ class UVFlag(UVBase):
         self.time_array = uv.time_array
         self.lst_array = uv.lst_array
         self.Nblts = self.time_array.size
+        self.Ntimes = np.unique(self.time_array).size
 
         for param in self.telescope:
             this_param = getattr(self.telescope, param)
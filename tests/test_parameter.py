@@ -12,6 +12,7 @@ from astropy.coordinates import (
     Longitude,
     SkyCoord,
 )
+from astropy.time import Time
 
 try:
     from lunarsky import MoonLocation
@@ -993,3 +994,114 @@ def test_compare_value(value, param_value, value_type, status):
         expected_type=value_type,
     )
     assert param.compare_value(value) == status
+
+
+def test_value_version():
+    param = uvp.UVParameter("test", value=np.arange(3))
+    version = param.value_version
+    assert version is not None
+
+    # in place changes do not change the version
+    param.value[0] = 5
+    assert param.value_version == version
+
+    param.value = param.value
+    assert param.value_version != version
+
+    # copies keep the version
+    assert copy.deepcopy(param).value_version == param.value_version
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        3,
+        np.arange(6).reshape(2, 3),
+        np.linspace(0, 1, 1000).reshape(10, 10, 10) + 1j,
+        "test",
+        ["a", "b"],
+        {"b": np.arange(3), "a": {"c": None}},
+        np.array(["foo", "bar"]),
+        np.rec.fromarrays(
+            [np.arange(3), np.array(["a", "b", "c"])], names=["num", "name"]
+        ),
+        np.arange(3) * units.m,
+        EarthLocation.from_geodetic(0, 0, 0),
+        SkyCoord(
+            ra=Longitude([5.0, 5.1], unit="hourangle"), dec=[-30, -20] * units.deg
+        ),
+        Time(2459000.5, format="jd", scale="utc"),
+    ],
+)
+def test_digest(value):
+    param = uvp.UVParameter("test", value=value)
+    digest = param.digest()
+    assert isinstance(digest, str)
+    assert digest == uvp.UVParameter("test", value=copy.deepcopy(value)).digest()
+    assert digest == param.digest(chunk_size=16, use_cache=False)
+    assert digest != param.digest(algorithm="md5")
+
+
+def test_digest_values():
+    param1 = uvp.UVParameter("test", value=np.arange(6, dtype=float))
+    param2 = uvp.UVParameter("test", value=param1.value.reshape(2, 3))
+    assert param1.digest() != param2.digest()
+
+    # arrays are hashed exactly, including the datatype
+    param2.value = param1.value.astype(np.float32)
+    assert param1.digest() != param2.digest()
+
+    # but not the byte order
+    param2.value = param1.value.astype(">f8")
+    assert param1.digest() == param2.digest()
+
+    # or the order of dict keys
+    param1.value = {"a": 1, "b": 2}
+    param2.value = {"b": 2, "a": 1}
+    assert param1.digest() == param2.digest()
+
+    # scalars are hashed as python types
+    param1.value = 3
+    param2.value = np.int32(3)
+    assert param1.digest() == param2.digest()
+    param2.value = 3.0
+    assert param1.digest() != param2.digest()
+
+    param1.value = "3"
+    assert param1.digest() != param2.digest()
+
+    param1.value = 3 * units.m
+    param2.value = 3 * units.km
+    assert param1.digest() != param2.digest()
+
+
+def test_digest_cache():
+    param = uvp.UVParameter("test", value=np.arange(3))
+    digest = param.digest()
+
+    # in place changes are only detected if the cache is not used
+    param.value[0] = 5
+    assert param.digest() == digest
+    new_digest = param.digest(use_cache=False)
+    assert new_digest != digest
+    assert param.digest() == new_digest
+
+    param.value = np.arange(3)
+    assert param.digest() == digest
+
+    # dicts are never cached
+    param.value = {"a": 1}
+    digest = param.digest()
+    param.value["a"] = 2
+    assert param.digest() != digest
+
+
+def test_digest_errors():
+    param = uvp.UVParameter("test", value=np.arange(3))
+    with pytest.raises(ValueError, match="chunk_size must be a positive integer."):
+        param.digest(chunk_size=0)
+
+    param.value = [object()]
+    with pytest.raises(ValueError, match="Cannot compute a digest for values of type"):
+        param.digest()
@@ -280,6 +280,117 @@ def test_check():
     assert test_obj.check()
 
 
+def test_check_only_changed():
+    test_obj = UVTest()
+    assert test_obj.check()
+
+    # in place changes are not tracked, so the bad shape is not found
+    test_obj.floatarr2.resize(5, refcheck=False)
+    assert test_obj.check(only_changed=True)
+
+    # setting the attribute marks it as changed
+    test_obj.floatarr2 = test_obj.floatarr2
+    with pytest.raises(
+        ValueError, match="UVParameter _floatarr2 is not expected shape"
+    ):
+        test_obj.check(only_changed=True)
+
+    test_obj.floatarr2 = np.random.rand(4)
+    assert test_obj.check(only_changed=True)
+
+    # changing a parameter in the form also marks the parameter as changed
+    test_obj.floatarr = test_obj.floatarr[:, :4]
+    test_obj._int2.value = 4
+    assert test_obj.check(only_changed=True)
+    test_obj.int2 = 5
+    with pytest.raises(ValueError, match="UVParameter _floatarr is not expected shape"):
+        test_obj.check(only_changed=True)
+
+
+def test_check_only_changed_mark_changed():
+    test_obj = UVTest()
+    assert test_obj.check(only_changed=True)
+
+    test_obj.floatarr2.resize(5, refcheck=False)
+    test_obj._mark_changed("_floatarr2")
+    with pytest.raises(
+        ValueError, match="UVParameter _floatarr2 is not expected shape"
+    ):
+        test_obj.check(only_changed=True)
+
+
+def test_check_only_changed_acceptability():
+    test_obj = UVTest()
+    test_obj._float1.acceptable_range = (0, 10)
+    assert test_obj.check(run_check_acceptability=False)
+
+    # the acceptability check has not passed yet, so it is run
+    with pytest.raises(ValueError, match="UVParameter _float1 has unacceptable values"):
+        test_obj.check(only_changed=True)
+
+    # changing the acceptable range triggers a recheck
+    test_obj._float1.acceptable_range = (0, 20)
+    assert test_obj.check(only_changed=True)
+    test_obj._float1.acceptable_range = (0, 10)
+    with pytest.raises(ValueError, match="UVParameter _float1 has unacceptable values"):
+        test_obj.check(only_changed=True)
+
+
+def test_check_level_shape():
+    test_obj = UVTest()
+    test_obj._float1.acceptable_range = (0, 10)
+    assert test_obj.check(check_level="shape")
+    with pytest.raises(ValueError, match="UVParameter _float1 has unacceptable values"):
+        test_obj.check(check_level="cheap")
+
+
+def test_check_level_error():
+    test_obj = UVTest()
+    with pytest.raises(
+        ValueError, match="check_level must be one of: shape, cheap, full."
+    ):
+        test_obj.check(check_level="foo")
+
+
+def test_fingerprint():
+    test_obj = UVTest()
+    fingerprint = test_obj.fingerprint()
+    test_obj2 = test_obj.copy()
+    assert test_obj2.fingerprint() == fingerprint
+
+    test_obj2.float1 = 19.0
+    assert test_obj2.fingerprint() != fingerprint
+    test_obj2.float1 = test_obj.float1
+    assert test_obj2.fingerprint() == fingerprint
+
+    # changes to nested UVBase objects are detected
+    test_obj2.telescope.name = "foo"
+    assert test_obj2.fingerprint() != fingerprint
+    assert test_obj2.fingerprint(ignore_params="telescope") == test_obj.fingerprint(
+        ignore_params=["_telescope"]
+    )
+
+    # optional parameters are only included if check_extra is True
+    test_obj2 = test_obj.copy()
+    test_obj2.optional_int1 = 4
+    assert test_obj2.fingerprint() != fingerprint
+    assert test_obj2.fingerprint(check_extra=False) == test_obj.fingerprint(
+        check_extra=False
+    )
+
+    # in place changes are only found if the cache is not used or the parameter
+    # is marked as changed
+    test_obj2 = test_obj.copy()
+    assert test_obj2.fingerprint() == fingerprint
+    test_obj2.floatarr2[0] += 1
+    assert test_obj2.fingerprint() == fingerprint
+    new_fingerprint = test_obj2.fingerprint(use_cache=False)
+    assert new_fingerprint != fingerprint
+    test_obj2.floatarr2[0] = test_obj.floatarr2[0]
+    test_obj2._mark_changed("_floatarr2")
+    assert test_obj2.fingerprint() == fingerprint
+
+
 def test_check_required():
     """Test simple check function."""
     test_obj = UVTest()
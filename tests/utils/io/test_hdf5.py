@@ -2,6 +2,9 @@
 # Licensed under the 2-clause BSD License
 """Tests for hdf5 utility functions."""
 
+import concurrent.futures
+
+import h5py
 import numpy as np
 import pytest
 
@@ -72,3 +75,92 @@ def test_telescope_attr():
     meta = hdf5_utils.HDF5Meta(f"{data.DATA_PATH}/zen.2457698.40355.xx.HH.uvcAA.uvh5")
 
     assert meta.telescope.location == meta.telescope_location_obj
+
+
+@pytest.mark.parametrize(
+    "indices",
+    [
+        (np.s_[:], np.s_[:], np.s_[:]),
+        (np.s_[5:53], [0, 3, 7], np.s_[:]),
+        ([1, 2, 3, 17, 18, 40, 41, 42, 43, 59], np.s_[:], np.s_[1:]),
+        ([slice(2, 12, 1), slice(30, 45, 1)], np.s_[2:6], np.s_[:]),
+        (3, np.s_[:], np.s_[:]),
+    ],
+)
+@pytest.mark.parametrize("complex_type", ["native", "custom"])
+@pytest.mark.parametrize("shared_pool", [False, True])
+def test_read_dset_parallel(tmp_path, indices, complex_type, shared_pool):
+    """Test that parallel chunked reads match serial reads."""
+    rng = np.random.default_rng(5)
+    shape = (60, 8, 2)
+    filename = str(tmp_path / "test.h5")
+    with h5py.File(filename, "w") as h5f:
+        if complex_type == "native":
+            dtype_out = None
+            values = rng.normal(size=shape) + 1j * rng.normal(size=shape)
+            h5f.create_dataset("dset", data=values, chunks=(7, 8, 2), compression="lzf")
+        else:
+            dtype_out = np.complex64
+            dset = h5f.create_dataset(
+                "dset",
+                shape,
+                dtype=np.dtype([("r", "<i4"), ("i", "<i4")]),
+                chunks=(7, 8, 2),
+                compression="lzf",
+            )
+            values = rng.integers(-100, 100, size=shape) + 1j * rng.integers(
+                -100, 100, size=shape
+            )
+            hdf5_utils._write_complex_astype(values, dset, (np.s_[:],) * 3)
+
+    with (
+        h5py.File(filename, "r") as h5f,
+        hdf5_utils._decompression_pool(3 if shared_pool else 1) as pool,
+    ):
+        dset = h5f["dset"]
+        if dtype_out is None:
+            expected = hdf5_utils._index_dset(dset, indices)
+            result = hdf5_utils._index_dset(dset, indices, nworkers=3, pool=pool)
+        else:
+            expected = hdf5_utils._read_complex_astype(dset, indices, dtype_out)
+            result = hdf5_utils._read_complex_astype(
+                dset, indices, dtype_out, nworkers=3, pool=pool
+            )
+
+    assert result.dtype == expected.dtype
+    np.testing.assert_array_equal(result, expected)
+
+    # parallel reads are copied out of shared memory
+    assert result.flags.owndata
+    assert result.flags.writeable
+
+
+@pytest.mark.parametrize("shm_space", [None, 2**14, 2**10])
+def test_read_dset_parallel_block_limits(tmp_path, monkeypatch, shm_space):
+    """Test parallel reads with limited block sizes and shared memory."""
+    rng = np.random.default_rng(5)
+    shape = (60, 8, 2)
+    filename = str(tmp_path / "test.h5")
+    values = rng.normal(size=shape) + 1j * rng.normal(size=shape)
+    with h5py.File(filename, "w") as h5f:
+        h5f.create_dataset("dset", data=values, chunks=(3, 8, 2), compression="lzf")
+
+    # rows are 256 bytes, so limit the blocks to two chunks each
+    monkeypatch.setattr(hdf5_utils, "_PARALLEL_READ_BLOCK_BYTES", 1536)
+    monkeypatch.setattr(hdf5_utils, "_shared_memory_space", lambda: shm_space)
+    if shm_space is not None and shm_space < 2**12:
+        # the blocks do not fit in shared memory, so the read should be serial
+        monkeypatch.setattr(hdf5_utils, "shared_memory", None)
+
+    indices = (np.s_[4:59], np.s_[:], np.s_[:])
+    with h5py.File(filename, "r") as h5f:
+        result = hdf5_utils._index_dset(h5f["dset"], indices, nworkers=3)
+
+    np.testing.assert_array_equal(result, values[indices])
+
+
+def test_decompression_pool():
+    with hdf5_utils._decompression_pool(1) as pool:
+        assert pool is None
+    with hdf5_utils._decompression_pool(2) as pool:
+        assert isinstance(pool, concurrent.futures.ProcessPoolExecutor)
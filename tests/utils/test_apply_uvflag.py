@@ -2,10 +2,14 @@
 # Licensed under the 2-clause BSD License
 """Tests for apply_uvflag function."""
 
+import os
+
 import numpy as np
 import pytest
 
-from pyuvdata import UVFlag
+import pyuvdata.utils.io.hdf5 as hdf5_utils
+from pyuvdata import UVData, UVFlag
+from pyuvdata.data import DATA_PATH
 from pyuvdata.utils import apply_uvflag
 
 
@@ -116,3 +120,22 @@ def test_apply_uvflag(uvcalibrate_uvdata_oldfiles):
     uvf2 = uvf.select(times=np.unique(uvf.time_array)[:1], inplace=False)
     uvd2 = apply_uvflag(uvd, uvf2, inplace=False)
     assert np.all(uvd2.get_flags(9, 10))
+
+
+@pytest.mark.parametrize("unflag_first", [True, False])
+def test_apply_uvflag_lazy(unflag_first):
+    testfile = os.path.join(DATA_PATH, "zen.2458661.23480.HH.uvh5")
+    uvd = UVData.from_file(testfile)
+    uvd_lazy = UVData()
+    uvd_lazy.read_uvh5(testfile, lazy=True)
+    assert isinstance(uvd_lazy.flag_array, hdf5_utils.LazyHDF5Array)
+
+    uvf = UVFlag(uvd)
+    uvf.to_flag()
+    uvf.flag_array[uvf.antpair2ind(*uvf.get_antpairs()[0])[:2]] = True
+
+    for uv in [uvd, uvd_lazy]:
+        apply_uvflag(uv, uvf, inplace=True, unflag_first=unflag_first)
+    assert isinstance(uvd_lazy.flag_array, np.ndarray)
+    np.testing.assert_array_equal(uvd_lazy.flag_array, uvd.flag_array)
+    assert uvd_lazy == uvd
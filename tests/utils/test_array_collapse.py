@@ -402,3 +402,93 @@ def test_and_collapse_weights():
 def test_and_collapse_errors():
     data = np.zeros(5)
     pytest.raises(ValueError, array_collapse.and_collapse, data)
+
+
+@pytest.mark.parametrize("alg", ["mean", "absmean", "quadmean", "or", "and"])
+@pytest.mark.parametrize("use_weights", [True, False])
+def test_collapse_segments(alg, use_weights):
+    rng = np.random.default_rng(5)
+    if alg in ["or", "and"]:
+        data = rng.random((23, 4, 2)) > 0.5
+    else:
+        data = rng.standard_normal((23, 4, 2)) + 1j * rng.standard_normal((23, 4, 2))
+        data[3, 1, 0] = np.inf
+    weights = rng.random(data.shape) if use_weights else None
+    starts = np.array([0, 1, 10, 11, 20])
+    ends = np.append(starts[1:], data.shape[0])
+
+    if alg == "mean":
+        return_weights_square = use_weights
+    else:
+        return_weights_square = False
+    out = array_collapse.collapse_segments(
+        data,
+        alg,
+        starts=starts,
+        weights=None if alg in ["or", "and"] else weights,
+        return_weights=True,
+        return_weights_square=return_weights_square,
+    )
+    for seg, (start, end) in enumerate(zip(starts, ends, strict=True)):
+        exp = array_collapse.collapse(
+            data[start:end],
+            alg,
+            axis=0,
+            weights=(
+                None
+                if (weights is None or alg in ["or", "and"])
+                else weights[start:end]
+            ),
+            return_weights=True,
+            return_weights_square=return_weights_square,
+        )
+        for this_out, this_exp in zip(out, exp, strict=True):
+            if alg in ["or", "and"]:
+                np.testing.assert_array_equal(this_out[seg], this_exp)
+            else:
+                np.testing.assert_allclose(this_out[seg], this_exp, rtol=1e-12)
+
+
+@pytest.mark.parametrize("alg", ["mean", "quadmean"])
+def test_collapse_segments_rectangular(alg):
+    rng = np.random.default_rng(7)
+    data = rng.standard_normal((20, 3, 2))
+    weights = rng.random(data.shape)
+    starts = np.arange(0, 20, 5)
+
+    out, wts, wts_sq = array_collapse.collapse_segments(
+        data,
+        alg,
+        starts=starts,
+        weights=weights,
+        return_weights=True,
+        return_weights_square=True,
+    )
+    exp, exp_wts, exp_wts_sq = array_collapse.collapse(
+        data.reshape(4, 5, 3, 2),
+        alg,
+        axis=1,
+        weights=weights.reshape(4, 5, 3, 2),
+        return_weights=True,
+        return_weights_square=True,
+    )
+    np.testing.assert_allclose(out, exp, rtol=1e-12)
+    np.testing.assert_allclose(wts, exp_wts, rtol=1e-12)
+    np.testing.assert_allclose(wts_sq, exp_wts_sq, rtol=1e-12)
+
+
+def test_collapse_segments_weights_warning():
+    data = np.zeros((10, 3), dtype=bool)
+    weights = np.ones((10, 3))
+    weights[0, 1] = 0.3
+    with check_warnings(UserWarning, "Currently weights are not handled when OR-ing"):
+        array_collapse.collapse_segments(
+            data, "or", starts=np.array([0, 5]), weights=weights
+        )
+
+
+def test_collapse_segments_errors():
+    with pytest.raises(ValueError, match="Collapse algorithm must be one of"):
+        array_collapse.collapse_segments(np.zeros(5), "fooboo", starts=np.array([0]))
+    with pytest.raises(ValueError, match="Input to and_collapse function must be"):
+        array_collapse.collapse_segments(np.zeros(5), "and", starts=np.array([0]))
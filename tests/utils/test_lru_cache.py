@@ -0,0 +1,100 @@
+# Copyright (c) 2024 Radio Astronomy Software Group
+# Licensed under the 2-clause BSD License
+"""Tests for the least recently used cache utility."""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from pyuvdata.testing import check_warnings
+from pyuvdata.utils.lru_cache import LRUCache, array_key
+
+
+def test_lru_cache():
+    cache = LRUCache(2)
+    assert cache.info() == {"hits": 0, "misses": 0, "maxsize": 2, "currsize": 0}
+
+    calls = []
+
+    def calc_func():
+        calls.append(1)
+        return [np.zeros(3)]
+
+    value = cache.get("a", calc_func)
+    # the cached values are copies, so changing them does not change the cache
+    value[0] += 1
+    value.append(None)
+    value2 = cache.get("a", calc_func)
+    assert len(value2) == 1
+    np.testing.assert_array_equal(value2[0], 0)
+    assert len(calls) == 1
+    assert cache.info() == {"hits": 1, "misses": 1, "maxsize": 2, "currsize": 1}
+
+    # the least recently used entries are removed
+    cache.get("b", calc_func)
+    cache.get("a", calc_func)
+    cache.get("c", calc_func)
+    cache.get("a", calc_func)
+    assert len(calls) == 3
+    cache.get("b", calc_func)
+    assert len(calls) == 4
+    assert cache.info()["currsize"] == 2
+
+    cache.set_size(1)
+    assert cache.info()["currsize"] == 1
+
+    cache.clear()
+    assert cache.info() == {"hits": 0, "misses": 0, "maxsize": 1, "currsize": 0}
+
+    # setting the size to zero turns off the cache
+    cache.set_size(0)
+    cache.get("a", calc_func)
+    cache.get("a", calc_func)
+    assert len(calls) == 6
+    assert cache.info() == {"hits": 0, "misses": 0, "maxsize": 0, "currsize": 0}
+
+    with pytest.raises(ValueError, match="maxsize must be a non-negative integer."):
+        cache.set_size(-1)
+    with pytest.raises(ValueError, match="maxsize must be a non-negative integer."):
+        LRUCache(1.5)
+
+
+def test_lru_cache_warnings():
+    cache = LRUCache(2)
+
+    def calc_func():
+        warnings.warn("a warning from the calculation")
+        return np.zeros(3)
+
+    with check_warnings(UserWarning, match="a warning from the calculation"):
+        np.testing.assert_array_equal(cache.get("a", calc_func), 0)
+
+    # the warnings are recorded and raised again on cache hits
+    with check_warnings(UserWarning, match="a warning from the calculation"):
+        np.testing.assert_array_equal(cache.get("a", calc_func), 0)
+    assert cache.info()["hits"] == 1
+
+    # calculations without warnings do not raise any on cache hits
+    with check_warnings(None):
+        cache.get("b", lambda: np.ones(3))
+        cache.get("b", lambda: np.ones(3))
+    assert cache.info()["hits"] == 2
+
+
+def test_array_key():
+    assert array_key(None) is None
+
+    values = np.arange(1000.0)
+    key = array_key(values)
+    # the key holds a hash of the values rather than a copy of them
+    assert key == (values.dtype.str, (1000,), key[2])
+    assert isinstance(key[2], str) and len(key[2]) == 64
+
+    assert array_key(values.copy()) == key
+    assert array_key(values.tolist()) == key
+    assert array_key(values[::-1]) != key
+    assert array_key(values.astype(np.float32)) != key
+    assert array_key(values.reshape(10, 100)) != key
+    # non-contiguous arrays are supported
+    assert array_key(values[::2]) == array_key(values[::2].copy())
@@ -4,6 +4,7 @@
 
 import os
 import re
+import warnings
 
 import numpy as np
 import pytest
@@ -14,6 +15,7 @@ from astropy.time import Time
 import pyuvdata.utils.phasing as phs_utils
 from pyuvdata import UVData, utils
 from pyuvdata.data import DATA_PATH
+from pyuvdata.testing import check_warnings
 from pyuvdata.utils.phasing import hasmoon
 
 from .test_coordinates import frame_selenoid
@@ -1105,6 +1107,132 @@ def test_calc_frame_pos_angle():
     assert np.isclose(frame_pa[-25], -0.0019098101664715339)
 
 
+@pytest.fixture
+def app_coords_cache():
+    maxsize = phs_utils.app_coords_cache_info()["maxsize"]
+    phs_utils.clear_app_coords_cache()
+
+    yield
+
+    phs_utils.set_app_coords_cache_size(maxsize)
+    phs_utils.clear_app_coords_cache()
+
+
+@pytest.mark.parametrize("astrometry_library", ["erfa", "astropy"])
+def test_app_coords_cache(astrometry_args, app_coords_cache, astrometry_library):
+    kwargs = {
+        "time_array": astrometry_args["time_array"],
+        "ra": astrometry_args["icrs_ra"],
+        "dec": astrometry_args["icrs_dec"],
+        "telescope_loc": astrometry_args["telescope_loc"],
+        "astrometry_library": astrometry_library,
+    }
+    app_ra, app_dec = phs_utils.transform_icrs_to_app(**kwargs)
+    assert phs_utils.app_coords_cache_info() == {
+        "hits": 0,
+        "misses": 1,
+        "maxsize": 128,
+        "currsize": 1,
+    }
+
+    # cached values are identical, and changing them does not change the cache
+    app_ra2, app_dec2 = phs_utils.transform_icrs_to_app(**kwargs)
+    np.testing.assert_array_equal(app_ra2, app_ra)
+    np.testing.assert_array_equal(app_dec2, app_dec)
+    app_ra2 += 1
+    app_ra3, _ = phs_utils.transform_icrs_to_app(**kwargs)
+    np.testing.assert_array_equal(app_ra3, app_ra)
+    assert phs_utils.app_coords_cache_info()["hits"] == 2
+
+    # different inputs are different entries
+    kwargs["dec"] = kwargs["dec"] + 0.1
+    app_ra3, _ = phs_utils.transform_icrs_to_app(**kwargs)
+    assert not np.array_equal(app_ra3, app_ra)
+    assert phs_utils.app_coords_cache_info()["currsize"] == 2
+
+    # the least recently used entries are removed
+    phs_utils.set_app_coords_cache_size(1)
+    assert phs_utils.app_coords_cache_info()["currsize"] == 1
+    kwargs["dec"] = kwargs["dec"] - 0.1
+    phs_utils.transform_icrs_to_app(**kwargs)
+    assert phs_utils.app_coords_cache_info()["misses"] == 3
+
+    # setting the size to zero turns off the cache
+    phs_utils.set_app_coords_cache_size(0)
+    app_ra3, _ = phs_utils.transform_icrs_to_app(**kwargs)
+    np.testing.assert_array_equal(app_ra3, app_ra)
+    assert phs_utils.app_coords_cache_info() == {
+        "hits": 2,
+        "misses": 3,
+        "maxsize": 0,
+        "currsize": 0,
+    }
+
+
+def test_app_coords_cache_frame_pa(app_coords_cache):
+    kwargs = {
+        "time_array": np.array([2458849.5] * 100),
+        "app_ra": np.arange(100) * (np.pi / 50),
+        "app_dec": np.zeros(100),
+        "telescope_loc": (0, 0, 0),
+        "ref_frame": "fk5",
+        "ref_epoch": 2000.0,
+    }
+    frame_pa = phs_utils.calc_frame_pos_angle(**kwargs)
+    np.testing.assert_array_equal(phs_utils.calc_frame_pos_angle(**kwargs), frame_pa)
+    assert phs_utils.app_coords_cache_info()["hits"] == 1
+
+    kwargs["ref_epoch"] = 2010.0
+    frame_pa2 = phs_utils.calc_frame_pos_angle(**kwargs)
+    assert not np.array_equal(frame_pa2, frame_pa)
+    assert phs_utils.app_coords_cache_info()["misses"] == 2
+
+
+def test_app_coords_cache_warnings(app_coords_cache):
+    def calc_func():
+        warnings.warn("a warning from the calculation")
+        return (np.zeros(3),)
+
+    with check_warnings(UserWarning, match="a warning from the calculation"):
+        (arr,) = phs_utils._cached_app_coords(("test",), calc_func)
+    np.testing.assert_array_equal(arr, 0)
+
+    # the warnings are recorded and raised again on cache hits
+    with check_warnings(UserWarning, match="a warning from the calculation"):
+        (arr,) = phs_utils._cached_app_coords(("test",), calc_func)
+    np.testing.assert_array_equal(arr, 0)
+    assert phs_utils.app_coords_cache_info()["hits"] == 1
+
+    # calculations without warnings do not raise any on cache hits
+    with check_warnings(None):
+        phs_utils._cached_app_coords(("other",), lambda: (np.ones(3),))
+        phs_utils._cached_app_coords(("other",), lambda: (np.ones(3),))
+    assert phs_utils.app_coords_cache_info()["hits"] == 2
+
+
+def test_app_coords_cache_key():
+    values = np.arange(1000.0)
+    key = phs_utils._cache_array_key(values)
+    # the key holds a hash of the values rather than a copy of them
+    assert key == (values.dtype.str, (1000,), key[2])
+    assert isinstance(key[2], str) and len(key[2]) == 64
+
+    assert phs_utils._cache_array_key(values.copy()) == key
+    assert phs_utils._cache_array_key(values[::-1]) != key
+    assert phs_utils._cache_array_key(values.astype(np.float32)) != key
+    assert phs_utils._cache_array_key(values.reshape(10, 100)) != key
+    # non-contiguous arrays are supported
+    assert phs_utils._cache_array_key(values[::2]) == phs_utils._cache_array_key(
+        values[::2].copy()
+    )
+    assert phs_utils._cache_array_key(2000.0) != phs_utils._cache_array_key([2000.0])
+
+
+def test_set_app_coords_cache_size_error():
+    with pytest.raises(ValueError, match="maxsize must be a non-negative integer."):
+        phs_utils.set_app_coords_cache_size(-1)
+
+
 def test_jphl_lookup(astrometry_args):
     """
     A very simple lookup query to verify that the astroquery tools for accessing
@@ -1152,6 +1280,198 @@ def test_jphl_lookup(astrometry_args):
         assert item == ephem_info_el[ind]
 
 
+def _fake_ephem(times):
+    times = np.asarray(times, dtype=float)
+    return (
+        times,
+        (times - 2456789.0) * 0.1,
+        (times - 2456789.0) * 0.01,
+        np.full_like(times, 1.5),
+        np.full_like(times, 2.5),
+    )
+
+
+@pytest.mark.parametrize("use_el", [True, False])
+def test_ephem_cache_points(tmp_path, astrometry_args, use_el):
+    ephem_cache = tmp_path / "ephem.json"
+    telescope_loc = astrometry_args["telescope_loc"]
+    ephem_info = _fake_ephem(2456789.0 + np.arange(5) * 0.1)
+    phs_utils.add_to_ephem_cache(
+        ephem_cache,
+        "Mars",
+        ephem_times=ephem_info[0],
+        ephem_ra=ephem_info[1],
+        ephem_dec=ephem_info[2],
+        ephem_dist=ephem_info[3],
+        ephem_vel=ephem_info[4],
+        telescope_loc=telescope_loc,
+        force_indv_lookup=True,
+    )
+    if use_el:
+        telescope_loc = EarthLocation.from_geodetic(
+            lat=telescope_loc[0] * units.rad,
+            lon=telescope_loc[1] * units.rad,
+            height=telescope_loc[2] * units.m,
+        )
+
+    # individual lookups are served if all of the times are in the store
+    time_array = ephem_info[0][[3, 1, 1]] + 1e-8
+    result = phs_utils.lookup_jplhorizons(
+        "Mars",
+        time_array,
+        telescope_loc=telescope_loc,
+        force_indv_lookup=True,
+        ephem_cache=ephem_cache,
+    )
+    for item, expected in zip(result, ephem_info, strict=True):
+        np.testing.assert_array_equal(item, expected[[1, 3]])
+
+    # adding more points merges them with the existing ones
+    new_info = _fake_ephem([2456789.05, 2456789.2])
+    phs_utils.add_to_ephem_cache(
+        ephem_cache,
+        "Mars",
+        ephem_times=new_info[0],
+        ephem_ra=new_info[1],
+        ephem_dec=new_info[2] + 1.0,
+        ephem_dist=new_info[3],
+        ephem_vel=new_info[4],
+        telescope_loc=telescope_loc,
+        force_indv_lookup=True,
+    )
+    result = phs_utils.lookup_jplhorizons(
+        "Mars",
+        [2456789.0, 2456789.05, 2456789.2],
+        telescope_loc=telescope_loc,
+        force_indv_lookup=True,
+        ephem_cache=ephem_cache,
+    )
+    np.testing.assert_array_equal(result[0], [2456789.0, 2456789.05, 2456789.2])
+    # the newest values are used for repeated times
+    np.testing.assert_allclose(result[2], [0.0, 0.0005 + 1.0, 0.002 + 1.0])
+
+    # other targets and sites are not in the store
+    for target, loc in [("Venus", telescope_loc), ("Mars", None)]:
+        assert (
+            phs_utils._read_ephem_cache(
+                ephem_cache,
+                phs_utils._get_ephem_cache_key(
+                    target, phs_utils._get_jplh_site_loc(loc), None
+                ),
+                ephem_info[0],
+                step=None,
+            )
+            is None
+        )
+    # and neither are times that have not been added
+    key = phs_utils._get_ephem_cache_key(
+        "Mars", phs_utils._get_jplh_site_loc(telescope_loc), None
+    )
+    assert (
+        phs_utils._read_ephem_cache(
+            ephem_cache, key, np.array([2456789.0, 2456789.01]), step=None
+        )
+        is None
+    )
+
+
+@pytest.mark.parametrize("high_cadence", [True, False])
+def test_ephem_cache_span(tmp_path, high_cadence):
+    ephem_cache = tmp_path / "ephem.json"
+    step = 3.0 / 1440.0 if high_cadence else 0.125
+    # Store two overlapping spans, which should be merged into one.
+    span1 = _fake_ephem(2456789.0 + np.arange(9) * step)
+    span2 = _fake_ephem(2456789.0 + np.arange(6, 17) * step)
+    for span in [span1, span2]:
+        phs_utils.add_to_ephem_cache(
+            ephem_cache,
+            "Mars",
+            ephem_times=span[0],
+            ephem_ra=span[1],
+            ephem_dec=span[2],
+            ephem_dist=span[3],
+            ephem_vel=span[4],
+            high_cadence=high_cadence,
+        )
+    key = phs_utils._get_ephem_cache_key("Mars", None, "3m" if high_cadence else "3h")
+    store = phs_utils._load_ephem_cache(ephem_cache)
+    assert len(store[key]) == 1
+    np.testing.assert_allclose(store[key][0]["jd"], 2456789.0 + np.arange(17) * step)
+
+    # A separate span is kept separately.
+    span3 = _fake_ephem(2456795.0 + np.arange(3) * step)
+    phs_utils.add_to_ephem_cache(
+        ephem_cache,
+        "Mars",
+        ephem_times=span3[0],
+        ephem_ra=span3[1],
+        ephem_dec=span3[2],
+        ephem_dist=span3[3],
+        ephem_vel=span3[4],
+        high_cadence=high_cadence,
+    )
+    store = phs_utils._load_ephem_cache(ephem_cache)
+    assert len(store[key]) == 2
+
+    # Lookups of enough times to use a regular time grid are served from disk if
+    # the query range is covered.
+    if high_cadence:
+        time_array = np.linspace(2456789.002, 2456789.03, 100)
+    else:
+        time_array = np.linspace(2456789.26, 2456789.7, 100)
+    result = phs_utils.lookup_jplhorizons(
+        "Mars", time_array, high_cadence=high_cadence, ephem_cache=ephem_cache
+    )
+    assert result[0][0] <= time_array[0]
+    assert result[0][-1] >= time_array[-1] - step
+    for item in result[1:]:
+        assert item.shape == result[0].shape
+    np.testing.assert_allclose(result[1], (result[0] - 2456789.0) * 0.1)
+
+    # Ranges that are not covered are not served from disk.
+    assert (
+        phs_utils._read_ephem_cache(
+            ephem_cache,
+            key,
+            np.array([2456789.0, 2456789.0 + 20 * step]),
+            step="3m" if high_cadence else "3h",
+        )
+        is None
+    )
+
+
+def test_ephem_cache_write_from_lookup(tmp_path):
+    ephem_cache = tmp_path / "ephem.json"
+    key = phs_utils._get_ephem_cache_key("Mars", None, None)
+    phs_utils._write_ephem_cache(
+        ephem_cache, key, _fake_ephem([2456789.0, 2456789.5]), step=None
+    )
+    # writing replaces the file and leaves no temporary files behind
+    assert os.listdir(tmp_path) == ["ephem.json"]
+    result = phs_utils.lookup_jplhorizons(
+        "Mars",
+        np.array([2456789.5, 2456789.0]),
+        force_indv_lookup=True,
+        ephem_cache=ephem_cache,
+    )
+    np.testing.assert_array_equal(result[0], [2456789.0, 2456789.5])
+
+
+def test_add_to_ephem_cache_error(tmp_path):
+    with pytest.raises(
+        ValueError, match="ephem_times, ephem_ra, ephem_dec, ephem_dist and ephem_vel"
+    ):
+        phs_utils.add_to_ephem_cache(
+            tmp_path / "ephem.json",
+            "Mars",
+            ephem_times=np.arange(3),
+            ephem_ra=np.arange(3),
+            ephem_dec=np.arange(3),
+            ephem_dist=np.arange(3),
+            ephem_vel=np.arange(2),
+        )
+
+
 def test_ephem_interp_one_point():
     """
     These tests do some simple checks to verify that the interpolator behaves properly
@@ -275,11 +275,8 @@ def test_redundancy_finder_fully_redundant_array(grid_alg):
     assert baseline_groups[0].sort() == np.unique(uvd.baseline_array).sort()
 
 
-@pytest.mark.parametrize("n_blocks", [1, 10])
-def test_adjacency_lists(n_blocks):
-    """Test the adjacency list method in utils."""
-    # n_blocks: in _adj_list, loop over chunks of vectors when computing distances.
-
+def test_neighbor_pairs():
+    """Test the neighbor pair method in utils."""
     # Make a grid.
     Nx = 5
     Lmax = 50
@@ -303,7 +300,11 @@ def test_adjacency_lists(n_blocks):
     # Tolerance = half of cell diagonal.
     tol = Lmax / Nx * np.sqrt(2) / 2
 
-    adj = red_utils._adj_list(vecs, tol, n_blocks=n_blocks)
+    pairs = red_utils._neighbor_pairs(vecs, tol)
+    adj = [{k} for k in range(Npts)]
+    for vi, vj in pairs:
+        adj[vi].add(vj)
+        adj[vj].add(vi)
 
     # Confirm that each adjacency set contains all of the vectors that
     # are within the tolerance distance.
@@ -320,32 +321,87 @@ def test_adjacency_lists(n_blocks):
     # The way the grid is set up, every clique should have two elements.
     assert all(len(vi) == 2 for vi in adj)
 
+    # pairs exactly tol apart are not neighbors
+    vecs = np.array([[0.0, 0.0], [1.0, 0.0], [1.5, 0.0]])
+    np.testing.assert_array_equal(red_utils._neighbor_pairs(vecs, 1.0), [[1, 2]])
+
 
 def test_strict_cliques():
-    # Adjacency lists comprising only isolated cliques.
-    adj_isol = [
-        {0, 1, 2},
-        {1, 0, 2},
-        {2, 0, 1},
-        {3},
-        {4},
-        {5, 6, 7, 8},
-        {5, 6, 7, 8},
-        {5, 6, 7, 8},
-        {5, 6, 7, 8},
-    ]
-    adj_isol = [frozenset(st) for st in adj_isol]
+    # Neighbor pairs comprising only isolated cliques.
+    pairs_isol = np.array([[0, 1], [0, 2], [1, 2], [5, 6], [5, 7], [5, 8], [6, 7]])
+    pairs_isol = np.concatenate((pairs_isol, [[6, 8], [7, 8]]))
     exp_cliques = [[0, 1, 2], [3], [4], [5, 6, 7, 8]]
 
-    res = red_utils._find_cliques(adj_isol, strict=True)
+    res = red_utils._find_isolated_cliques(pairs_isol, 9, strict=True)
     assert res == exp_cliques
 
     # Error if two cliques are not isolated
-    adj_link = adj_isol
-    adj_link[-1] = frozenset({5, 6, 7, 8, 1})
+    pairs_link = np.concatenate((pairs_isol, [[1, 8]]))
 
     with pytest.raises(ValueError, match="Non-isolated cliques found in graph."):
-        red_utils._find_cliques(adj_link, strict=True)
+        red_utils._find_isolated_cliques(pairs_link, 9, strict=True)
+
+    # items in non-isolated cliques are not in any group if not strict
+    res = red_utils._find_isolated_cliques(pairs_link, 9)
+    assert res == [[3], [4]]
+
+
+def test_pair_baselines():
+    """Test that the vectorized baseline numbers match the scalar ones."""
+    ant_nums = np.array([0, 1, 5, 300, 2100, 3000])
+    ant1, ant2 = np.triu_indices(ant_nums.size)
+    ant1, ant2 = ant_nums[ant1], ant_nums[ant2]
+    bls = red_utils._pair_baselines(ant1, ant2, Nants_telescope=ant_nums.size)
+    flipped = red_utils._flip_baselines(bls, Nants_telescope=ant_nums.size)
+    for a1, a2, bl, flip in zip(ant1, ant2, bls, flipped, strict=True):
+        assert bl == utils.antnums_to_baseline(a1, a2, Nants_telescope=ant_nums.size)
+        assert flip == utils.antnums_to_baseline(a2, a1, Nants_telescope=ant_nums.size)
+
+
+def test_redundancy_cache():
+    antpos = np.array([[0.0, 0, 0], [14.6, 0, 0], [29.2, 0, 0], [0, 14.6, 0]])
+    ant_nums = np.arange(4)
+    red_utils.clear_redundancy_cache()
+    info = red_utils.redundancy_cache_info()
+    assert (info["hits"], info["misses"], info["currsize"]) == (0, 0, 0)
+
+    gps, vecs, lens = red_utils.get_antenna_redundancies(
+        ant_nums, antpos, tol=1.0, use_grid_alg=True
+    )
+    gps[0].append(100)
+    gps2, vecs2, lens2 = red_utils.get_antenna_redundancies(
+        ant_nums, antpos, tol=1.0, use_grid_alg=True
+    )
+    info = red_utils.redundancy_cache_info()
+    assert (info["hits"], info["misses"], info["currsize"]) == (1, 1, 1)
+    assert 100 not in gps2[0]
+    np.testing.assert_array_equal(vecs, vecs2)
+    np.testing.assert_array_equal(lens, lens2)
+    # the cache is keyed on hashes of the arrays rather than copies of them
+    ((key, _),) = red_utils._redundancy_cache._entries.items()
+    assert key[:2] == (
+        utils.lru_cache.array_key(ant_nums),
+        utils.lru_cache.array_key(antpos),
+    )
+
+    # changing the tolerance or layout is a new entry
+    red_utils.get_antenna_redundancies(ant_nums, antpos, tol=0.5, use_grid_alg=True)
+    antpos[0, 0] = 1.0
+    red_utils.get_antenna_redundancies(ant_nums, antpos, tol=1.0, use_grid_alg=True)
+    assert red_utils.redundancy_cache_info()["currsize"] == 3
+
+    red_utils.set_redundancy_cache_size(1)
+    assert red_utils.redundancy_cache_info()["currsize"] == 1
+    red_utils.set_redundancy_cache_size(0)
+    red_utils.get_antenna_redundancies(ant_nums, antpos, tol=1.0, use_grid_alg=True)
+    info = red_utils.redundancy_cache_info()
+    assert (info["hits"], info["currsize"]) == (1, 0)
+
+    with pytest.raises(ValueError, match="maxsize must be a non-negative integer."):
+        red_utils.set_redundancy_cache_size(-1)
+
+    red_utils.set_redundancy_cache_size(16)
+    red_utils.clear_redundancy_cache()
 
 
 @pytest.mark.parametrize("grid_alg", [True, False])
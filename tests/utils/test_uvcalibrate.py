@@ -320,6 +320,48 @@ def test_uvcalibrate(uvcalibrate_data, flip_gain_conj, gain_convention, time_ran
     assert uvdcal.vis_units == "uncalib"
 
 
+@pytest.mark.filterwarnings("ignore:Changing number of antennas, but preserving")
+@pytest.mark.parametrize("blt_chunk_size", [1, 7, 1000])
+def test_uvcalibrate_blt_chunk_size(uvcalibrate_data, blt_chunk_size):
+    uvd, uvc = uvcalibrate_data
+
+    # flag some gains and drop an antenna so all the flagging paths are exercised
+    uvc.flag_array[0, :10] = True
+    uvc.gain_array[1, 5:8] = 0
+    uvc.select(antenna_nums=uvc.ant_array[:-1])
+
+    warn_msg = "have data on UVData but are missing on UVCal"
+    with check_warnings(UserWarning, match=warn_msg):
+        uvdcal = uvcalibrate(uvd, uvc, inplace=False, ant_check=False)
+    with check_warnings(UserWarning, match=warn_msg):
+        uvdcal2 = uvcalibrate(
+            uvd, uvc, inplace=False, ant_check=False, blt_chunk_size=blt_chunk_size
+        )
+
+    assert uvdcal == uvdcal2
+
+
+def test_uvcalibrate_blt_order(uvcalibrate_data):
+    uvd, uvc = uvcalibrate_data
+
+    uvdcal = uvcalibrate(uvd, uvc, inplace=False)
+    uvdcal.reorder_blts(order="time", minor_order="baseline")
+
+    # gains should be matched to the data by time, not the order of the blts
+    uvd.reorder_blts(order="time", minor_order="baseline")
+    uvdcal2 = uvcalibrate(uvd, uvc, inplace=False)
+
+    assert uvdcal == uvdcal2
+
+
+@pytest.mark.parametrize("blt_chunk_size", [0, 2.5])
+def test_uvcalibrate_blt_chunk_size_error(uvcalibrate_data, blt_chunk_size):
+    uvd, uvc = uvcalibrate_data
+
+    with pytest.raises(ValueError, match="blt_chunk_size must be a positive integer."):
+        uvcalibrate(uvd, uvc, inplace=False, blt_chunk_size=blt_chunk_size)
+
+
 @pytest.mark.filterwarnings("ignore:Combined frequencies are separated by more than")
 def test_uvcalibrate_dterm_handling(uvcalibrate_data):
     uvd, uvc = uvcalibrate_data
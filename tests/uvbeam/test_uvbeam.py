@@ -429,12 +429,43 @@ def test_efield_to_pstokes(cst_efield_2freq_cut, cst_efield_2freq_cut_healpix):
     assert np.allclose(pstokes_beam.data_array, beam_return.data_array, atol=1e-2)
 
 
-def test_efield_to_pstokes_error(cst_power_2freq_cut):
+@pytest.mark.parametrize("chunk_size", [None, 7])
+@pytest.mark.parametrize("healpix", [True, False])
+def test_efield_to_pstokes_mueller(
+    cst_efield_2freq_cut, cst_efield_2freq_cut_healpix, healpix, chunk_size
+):
+    efield_beam = cst_efield_2freq_cut_healpix if healpix else cst_efield_2freq_cut
+    pstokes_beam = efield_beam.efield_to_pstokes(inplace=False, chunk_size=chunk_size)
+
+    # compare to calculating the Mueller matrix elements for each frequency
+    efield_data = efield_beam.data_array.reshape(
+        efield_beam.data_array.shape[:3] + (-1,)
+    )
+    pstokes_data = pstokes_beam.data_array.reshape(
+        pstokes_beam.data_array.shape[:3] + (-1,)
+    )
+    for freq_i in range(efield_beam.Nfreqs):
+        jones = np.moveaxis(efield_data[:2, :2, freq_i], -1, 0)
+        for pol_i in range(4):
+            np.testing.assert_allclose(
+                pstokes_data[0, pol_i, freq_i],
+                efield_beam._construct_mueller(
+                    jones=jones, pol_index1=pol_i, pol_index2=pol_i
+                ),
+                rtol=1e-12,
+                atol=1e-12 * np.max(pstokes_data),
+            )
+
+
+def test_efield_to_pstokes_error(cst_efield_2freq_cut, cst_power_2freq_cut):
     power_beam = cst_power_2freq_cut
 
     with pytest.raises(ValueError, match="beam_type must be efield."):
         power_beam.efield_to_pstokes()
 
+    with pytest.raises(ValueError, match="chunk_size must be a positive integer."):
+        cst_efield_2freq_cut.efield_to_pstokes(chunk_size=0)
+
 
 @pytest.mark.parametrize("physical_orientation", [True, False])
 def test_efield_to_power(
@@ -602,6 +633,30 @@ def test_efield_to_power_crosspol(cst_efield_2freq_cut, tmp_path):
     assert np.allclose(new_power_beam.data_array, np.abs(efield_beam.data_array) ** 2)
 
 
+@pytest.mark.parametrize(
+    ("calc_cross_pols", "keep_basis_vector"),
+    [(True, False), (False, False), (True, True)],
+)
+@pytest.mark.parametrize("healpix", [True, False])
+def test_efield_to_power_chunk_size(
+    cst_efield_2freq_cut,
+    cst_efield_2freq_cut_healpix,
+    healpix,
+    calc_cross_pols,
+    keep_basis_vector,
+):
+    efield_beam = cst_efield_2freq_cut_healpix if healpix else cst_efield_2freq_cut
+    kwargs = {
+        "calc_cross_pols": calc_cross_pols,
+        "keep_basis_vector": keep_basis_vector,
+        "inplace": False,
+    }
+    power_beam = efield_beam.efield_to_power(**kwargs)
+    power_beam_chunked = efield_beam.efield_to_power(chunk_size=7, **kwargs)
+
+    assert power_beam == power_beam_chunked
+
+
 def test_efield_to_power_errors(cst_efield_2freq_cut, cst_power_2freq_cut):
     efield_beam = cst_efield_2freq_cut
     power_beam = cst_power_2freq_cut
@@ -610,6 +665,9 @@ def test_efield_to_power_errors(cst_efield_2freq_cut, cst_power_2freq_cut):
     with pytest.raises(ValueError, match="beam_type must be efield"):
         power_beam.efield_to_power()
 
+    with pytest.raises(ValueError, match="chunk_size must be a positive integer."):
+        efield_beam.efield_to_power(chunk_size=1.5)
+
     # test raises error if input efield beam has Naxes_vec=3
     efield_beam.Naxes_vec = 3
     with pytest.raises(
@@ -1532,6 +1590,175 @@ def test_healpix_interpolation(antenna_type, cst_efield_2freq, phased_array_beam
         power_beam.interp(az_array=az_orig_vals, za_array=za_orig_vals)
 
 
+@pytest.mark.parametrize(
+    ("antenna_type", "beam_type"),
+    [("simple", "efield"), ("simple", "power"), ("phased_array", "efield")],
+)
+@pytest.mark.parametrize("healpix", [True, False])
+@pytest.mark.parametrize("interp_freq", [True, False])
+def test_interp_plan(
+    antenna_type,
+    beam_type,
+    healpix,
+    interp_freq,
+    cst_efield_2freq,
+    phased_array_beam_2freq,
+):
+    if antenna_type == "simple":
+        beam = cst_efield_2freq
+    else:
+        beam = phased_array_beam_2freq
+
+    # select every fourth point to make it smaller
+    beam.select(
+        axis1_inds=np.arange(0, beam.Naxes1, 4), axis2_inds=np.arange(0, beam.Naxes2, 4)
+    )
+    if beam_type == "power":
+        beam.efield_to_power()
+    if healpix:
+        pytest.importorskip("astropy_healpix")
+        beam.to_healpix()
+        interp_kwargs = {"interpolation_function": "healpix_simple"}
+    else:
+        interp_kwargs = {
+            "interpolation_function": "az_za_map_coordinates",
+            "spline_opts": {"order": 1},
+        }
+
+    rng = np.random.default_rng(5)
+    interp_kwargs["az_array"] = rng.uniform(0, 2 * np.pi, 50)
+    interp_kwargs["za_array"] = rng.uniform(0, np.pi / 2, 50)
+    if interp_freq:
+        interp_kwargs["freq_array"] = np.array([125e6, 130e6, 145e6])
+        interp_kwargs["freq_interp_kind"] = "linear"
+    return_kwargs = {
+        "return_bandpass": True,
+        "return_coupling": antenna_type == "phased_array",
+    }
+
+    interp_plan = beam.make_interp_plan(**interp_kwargs)
+    expected = beam.interp(**interp_kwargs, **return_kwargs)
+    interp_arrays = beam.interp(interp_plan=interp_plan, **return_kwargs)
+    assert len(interp_arrays) == len(expected)
+    for interp_array, expected_array in zip(interp_arrays, expected, strict=True):
+        if expected_array is None:
+            assert interp_array is None
+        else:
+            np.testing.assert_allclose(interp_array, expected_array, rtol=1e-10)
+
+    # plans can be used for other beams with the same pixels and frequencies
+    beam2 = beam.copy()
+    beam2.data_array = beam2.data_array * 2
+    expected = beam2.interp(**interp_kwargs, **return_kwargs)
+    interp_arrays = beam2.interp(interp_plan=interp_plan, **return_kwargs)
+    np.testing.assert_allclose(interp_arrays[0], expected[0], rtol=1e-10)
+
+    if beam.beam_type == "power":
+        expected = beam.interp(polarizations=["xx"], **interp_kwargs)
+        interp_arrays = beam.interp(interp_plan=interp_plan, polarizations=["xx"])
+        assert interp_arrays[0].shape[1] == 1
+        np.testing.assert_allclose(interp_arrays[0], expected[0], rtol=1e-10)
+
+
+@pytest.mark.parametrize("healpix", [True, False])
+def test_interp_plan_interp_defaults(healpix, cst_efield_2freq):
+    beam = cst_efield_2freq
+    beam.select(
+        axis1_inds=np.arange(0, beam.Naxes1, 4), axis2_inds=np.arange(0, beam.Naxes2, 4)
+    )
+    if healpix:
+        pytest.importorskip("astropy_healpix")
+        beam.to_healpix()
+        plan_kwargs = {"interpolation_function": "healpix_simple"}
+    else:
+        plan_kwargs = {
+            "interpolation_function": "az_za_map_coordinates",
+            "spline_opts": {"order": 1},
+        }
+
+    rng = np.random.default_rng(5)
+    point_kwargs = {
+        "az_array": rng.uniform(0, 2 * np.pi, 50),
+        "za_array": rng.uniform(0, np.pi / 2, 50),
+    }
+
+    expected = beam.interp(**point_kwargs)
+    interp_plan = beam.make_interp_plan(**plan_kwargs, **point_kwargs)
+    interp_arrays = beam.interp(interp_plan=interp_plan)
+    if healpix:
+        # healpix_simple is the default interpolation function for HEALPix beams
+        np.testing.assert_allclose(interp_arrays[0], expected[0], rtol=1e-10)
+    else:
+        # the default az_za_simple interpolation uses cubic splines, so it does not
+        # match the linear interpolation supported by plans
+        assert not np.allclose(interp_arrays[0], expected[0])
+
+
+def test_interp_plan_errors(cst_efield_2freq):
+    beam = cst_efield_2freq
+    az_array = np.array([0.5, 1.0])
+    za_array = np.array([0.2, 0.4])
+
+    with pytest.raises(
+        ValueError,
+        match="Interpolation plans are only supported for the healpix_simple and "
+        "az_za_map_coordinates interpolation functions.",
+    ):
+        beam.make_interp_plan(
+            az_array=az_array, za_array=za_array, interpolation_function="az_za_simple"
+        )
+
+    with pytest.raises(ValueError, match="interpolation_function must be set."):
+        beam.make_interp_plan(
+            az_array=az_array, za_array=za_array, interpolation_function=None
+        )
+
+    for spline_opts in [None, {"order": 3}]:
+        with pytest.raises(
+            ValueError,
+            match="Interpolation plans for az_za_map_coordinates interpolation are "
+            "only supported for linear interpolation",
+        ):
+            beam.make_interp_plan(
+                az_array=az_array,
+                za_array=za_array,
+                interpolation_function="az_za_map_coordinates",
+                spline_opts=spline_opts,
+            )
+
+    interp_plan = beam.make_interp_plan(
+        az_array=az_array,
+        za_array=za_array,
+        interpolation_function="az_za_map_coordinates",
+        spline_opts={"order": 1},
+        freq_array=np.array([130e6]),
+        freq_interp_kind="linear",
+    )
+    with pytest.raises(
+        ValueError,
+        match="az_array, za_array, az_za_grid, healpix_nside, healpix_inds, "
+        "freq_array, interpolation_function, freq_interp_kind and new_object cannot "
+        "be set if interp_plan is set.",
+    ):
+        beam.interp(interp_plan=interp_plan, az_array=az_array, za_array=za_array)
+
+    beam2 = beam.select(axis1_inds=np.arange(0, beam.Naxes1, 2), inplace=False)
+    with pytest.raises(
+        ValueError,
+        match="The axis1_array on this beam does not match the beam the "
+        "interpolation plan was made for.",
+    ):
+        beam2.interp(interp_plan=interp_plan)
+
+    beam2 = beam.select(freq_chans=[0], inplace=False)
+    with pytest.raises(
+        ValueError,
+        match="The freq_array on this beam does not match the beam the "
+        "interpolation plan was made for.",
+    ):
+        beam2.interp(interp_plan=interp_plan)
+
+
 @pytest.mark.parametrize(
     "start, stop",
     [
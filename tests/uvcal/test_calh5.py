@@ -99,6 +99,24 @@ def test_calh5_loop_bitshuffle(gain_data, tmp_path):
     assert calobj == calobj2
 
 
+@pytest.mark.parametrize("select_kwargs", [{}, {"antenna_nums": [9, 10, 20, 89]}])
+def test_calh5_decompression_nworkers(gain_data, tmp_path, select_kwargs):
+    calobj = gain_data
+    write_file = str(tmp_path / "outtest.calh5")
+    calobj.write_calh5(
+        write_file,
+        clobber=True,
+        chunks=(calobj.Nants_data // 3, calobj.Nfreqs, calobj.Ntimes, calobj.Njones),
+        data_compression="lzf",
+    )
+    calobj1 = UVCal()
+    calobj1.read_calh5(write_file, **select_kwargs)
+    calobj2 = UVCal()
+    calobj2.read_calh5(write_file, decompression_nworkers=3, **select_kwargs)
+
+    assert calobj1 == calobj2
+
+
 @pytest.mark.parametrize("selenoid", selenoids)
 def test_calh5_loop_moon(tmp_path, gain_data, selenoid):
     pytest.importorskip("lunarsky")
@@ -369,3 +369,138 @@ def test_uv_selector(polstr, antstr, ants_exp, nrec_exp):
 
     assert nrec == nrec_exp
     aipy_uv.close()
+
+
+@pytest.mark.parametrize("chunk_size", [7, 4096])
+@pytest.mark.parametrize("antstr", ["all", "(0,1)_(2,3)"])
+def test_bulk_read(chunk_size, antstr):
+    infile = os.path.join(DATA_PATH, "zen.2456865.60537.xy.uvcRREAA")
+    variables = {"pol": "i", "inttime": "r", "lst": "d", "source": "a"}
+
+    aipy_uv = aipy_extracts.UV(infile)
+    aipy_extracts.uv_selector(aipy_uv, ants=antstr)
+    preamble, data, flags, var_dict = aipy_uv.bulk_read(
+        aipy_uv.nchan, variables, chunk_size=chunk_size
+    )
+    aipy_uv.close()
+
+    aipy_uv = aipy_extracts.UV(infile)
+    aipy_extracts.uv_selector(aipy_uv, ants=antstr)
+    for rec_ind, ((uvw, t, (i, j)), rec_data, rec_flags) in enumerate(
+        aipy_uv.all_data(raw=True)
+    ):
+        assert np.array_equal(preamble[rec_ind, :3], uvw)
+        assert preamble[rec_ind, 3] == t
+        assert aipy_extracts.bl2ij(preamble[rec_ind, 4]) == (i, j)
+        assert np.array_equal(data[rec_ind], rec_data)
+        assert np.array_equal(flags[rec_ind], rec_flags)
+        for name, value in var_dict.items():
+            assert value[rec_ind] == aipy_uv[name]
+    aipy_uv.close()
+
+    assert preamble.shape[0] == rec_ind + 1
+    assert data.shape == flags.shape == (rec_ind + 1, aipy_uv.nchan)
+
+
+def test_bulk_read_errors():
+    infile = os.path.join(DATA_PATH, "zen.2456865.60537.xy.uvcRREAA")
+    aipy_uv = aipy_extracts.UV(infile)
+
+    with pytest.raises(ValueError, match="Unsupported type for UV variable pol: c"):
+        aipy_uv.bulk_read(aipy_uv.nchan, {"pol": "c"})
+    aipy_uv.close()
+
+
+@pytest.mark.parametrize("dtype", [np.complex64, np.complex128])
+def test_bulk_write(tmp_path, dtype):
+    infile = os.path.join(DATA_PATH, "zen.2456865.60537.xy.uvcRREAA")
+    test_file = os.path.join(tmp_path, "miriad_test.uv")
+
+    aipy_uv = aipy_extracts.UV(infile)
+    nchan = aipy_uv.nchan
+    aipy_uv2 = aipy_extracts.UV(test_file, status="new")
+    aipy_uv2.init_from_uv(aipy_uv)
+    aipy_uv.close()
+
+    rng = np.random.default_rng(5)
+    nblts, npols = 3, 2
+    preamble = np.zeros((nblts, 5), dtype=np.float64)
+    preamble[:, :3] = rng.normal(size=(nblts, 3))
+    preamble[:, 3] = 2456865.6 + np.arange(nblts) / 86400.0
+    preamble[:, 4] = [aipy_extracts.ij2bl(0, 1), aipy_extracts.ij2bl(1, 2), 258]
+    data = (
+        rng.normal(size=(nblts, nchan, npols))
+        + 1j * rng.normal(size=(nblts, nchan, npols))
+    ).astype(dtype)
+    flags = rng.random(size=(nblts, nchan, npols)) > 0.5
+    cnt = rng.random(size=(nblts, nchan, npols))
+    pols = np.array([-5, -6], dtype=np.intc)
+    lst = np.array([1.0, 2.0, 3.0])
+    source = np.array(["foo", "foo", "bar"], dtype=object)
+    # only write the lst for the first baseline-time, it should then be constant
+    lst_write = np.array([True, False, False])
+    aipy_uv2.bulk_write(
+        preamble,
+        data,
+        flags,
+        cnt,
+        pols,
+        {
+            "lst": ("d", lst, lst_write),
+            "source": ("a", source, np.ones(nblts, dtype=bool)),
+        },
+    )
+    aipy_uv2.close()
+
+    aipy_uv2 = aipy_extracts.UV(test_file)
+    for rec_ind, ((uvw, t, (i, j)), rec_data, rec_flags) in enumerate(
+        aipy_uv2.all_data(raw=True)
+    ):
+        blt_ind, pol_ind = divmod(rec_ind, npols)
+        assert np.array_equal(uvw, preamble[blt_ind, :3])
+        assert t == preamble[blt_ind, 3]
+        assert aipy_extracts.ij2bl(i, j) == preamble[blt_ind, 4]
+        assert np.allclose(rec_data, data[blt_ind, :, pol_ind])
+        assert np.array_equal(rec_flags, flags[blt_ind, :, pol_ind])
+        assert aipy_uv2["pol"] == pols[pol_ind]
+        assert np.allclose(aipy_uv2["cnt"], cnt[blt_ind, :, pol_ind])
+        assert aipy_uv2["lst"] == lst[0]
+        assert aipy_uv2["source"] == source[blt_ind]
+    aipy_uv2.close()
+    assert rec_ind == nblts * npols - 1
+
+
+def test_bulk_write_errors(tmp_path):
+    infile = os.path.join(DATA_PATH, "zen.2456865.60537.xy.uvcRREAA")
+    test_file = os.path.join(tmp_path, "miriad_test.uv")
+
+    aipy_uv = aipy_extracts.UV(infile)
+    nchan = aipy_uv.nchan
+    aipy_uv2 = aipy_extracts.UV(test_file, status="new")
+    aipy_uv2.init_from_uv(aipy_uv)
+    aipy_uv.close()
+
+    preamble = np.zeros((2, 5), dtype=np.float64)
+    data = np.zeros((2, nchan, 1), dtype=np.complex64)
+    flags = np.zeros((2, nchan, 1), dtype=bool)
+    cnt = np.zeros((2, nchan, 1), dtype=np.float64)
+    pols = np.array([-5], dtype=np.intc)
+    write = np.ones(2, dtype=bool)
+
+    with pytest.raises(
+        ValueError, match="Input arrays for bulk_write do not have consistent shapes."
+    ):
+        aipy_uv2.bulk_write(preamble, data, flags[:, :-1], cnt, pols, {})
+
+    with pytest.raises(
+        ValueError, match="UV variable lst must have one value per baseline-time."
+    ):
+        aipy_uv2.bulk_write(
+            preamble, data, flags, cnt, pols, {"lst": ("d", np.zeros(3), write)}
+        )
+
+    with pytest.raises(ValueError, match="Unsupported type for UV variable lst: c"):
+        aipy_uv2.bulk_write(
+            preamble, data, flags, cnt, pols, {"lst": ("c", np.zeros(2), write)}
+        )
+    aipy_uv2.close()
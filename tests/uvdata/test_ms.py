@@ -1130,3 +1130,64 @@ def test_read_ms_write_ms_alt_data_colums(sma_mir, tmp_path, data_column):
     assert sma_mir.history in uvd.history
     uvd.history = sma_mir.history
     assert uvd == sma_mir
+
+
+@pytest.mark.parametrize(
+    "select_kwargs",
+    [
+        {"antenna_nums": [1, 6, 7]},
+        {"freq_chans": np.arange(10, 40)},
+        {"freq_chans": [0, 3, 17, 63]},
+        {"polarizations": ["rr", "ll"]},
+        {"polarizations": ["lr"]},
+        {"blt_inds": np.arange(0, 1360, 7)},
+        {"bls": [(1, 6), (7, 14)], "freq_chans": np.arange(5), "polarizations": [-2]},
+    ],
+)
+def test_select_on_read(nrao_uv, select_kwargs):
+    """Test that select on read matches selecting after reading."""
+    testfile = os.path.join(DATA_PATH, "day2_TDEM0003_10s_norx_1src_1spw.ms")
+
+    uvd = UVData.from_file(testfile, **select_kwargs)
+    nrao_uv.select(**select_kwargs)
+
+    assert uvd == nrao_uv
+
+
+@pytest.mark.filterwarnings("ignore:Writing in the MS file that the units of the data")
+@pytest.mark.parametrize("read_weights", [True, False])
+@pytest.mark.parametrize(
+    "select_kwargs",
+    [
+        {"freq_chans": np.arange(16380, 16390)},
+        {"freq_chans": np.arange(0, 131072, 4097)},
+        {"polarizations": ["yy"]},
+        {"times": "first_time", "freq_chans": np.arange(16384, 32768)},
+    ],
+)
+def test_select_on_read_multispw(sma_mir, tmp_path, select_kwargs, read_weights):
+    """Test select on read with multiple spectral windows."""
+    testfile = os.path.join(tmp_path, "select_on_read_multispw.ms")
+    sma_mir.nsample_array[:] = np.arange(sma_mir.Nfreqs)[None, :, None]
+    sma_mir.write_ms(testfile)
+
+    if select_kwargs.get("times") == "first_time":
+        select_kwargs["times"] = np.unique(sma_mir.time_array)[:1]
+
+    uvd = UVData.from_file(testfile, read_weights=read_weights, **select_kwargs)
+    uvd_full = UVData.from_file(testfile, read_weights=read_weights)
+    uvd_full.select(**select_kwargs)
+
+    assert uvd == uvd_full
+
+
+def test_select_on_read_generic_read(nrao_uv):
+    """Test that the generic read passes selections through to the MS reader."""
+    testfile = os.path.join(DATA_PATH, "day2_TDEM0003_10s_norx_1src_1spw.ms")
+    nrao_uv.select(freq_chans=np.arange(5), keep_all_metadata=False)
+
+    uvd = UVData()
+    with check_warnings(UserWarning, match="The uvw_array does not match"):
+        uvd.read(testfile, freq_chans=np.arange(5), keep_all_metadata=False)
+
+    assert uvd == nrao_uv
@@ -20,9 +20,11 @@ from astropy.coordinates import Angle, EarthLocation, Latitude, Longitude, SkyCo
 from astropy.time import Time
 from astropy.utils import iers
 
-from pyuvdata import UVCal, UVData, utils
+from pyuvdata import UVCal, UVData, utils, uvbase
 from pyuvdata.data import DATA_PATH
 from pyuvdata.testing import check_warnings
+from pyuvdata.uvdata.uvdata import _get_blt_keys, _window_sum
+from pyuvdata.uvdata.uvh5 import FastUVH5Meta
 
 from ..utils.test_coordinates import frame_selenoid
 from .test_mwa_corr_fits import filelist as mwa_corr_files
@@ -623,6 +625,173 @@ def test_check_uvw_array(hera_uvh5_xx):
         uvd.check()
 
 
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+def test_check_only_changed(hera_uvh5_xx, monkeypatch):
+    uvd = hera_uvh5_xx
+    assert uvd.check(only_changed=True)
+
+    calls = Counter()
+    check_lsts = utils.times.check_lsts_against_times
+    set_uvws = UVData.set_uvws_from_antenna_positions
+
+    def count_check_lsts(**kwargs):
+        calls["lsts"] += 1
+        return check_lsts(**kwargs)
+
+    def count_set_uvws(self, **kwargs):
+        calls["uvws"] += 1
+        return set_uvws(self, **kwargs)
+
+    monkeypatch.setattr(utils.times, "check_lsts_against_times", count_check_lsts)
+    monkeypatch.setattr(UVData, "set_uvws_from_antenna_positions", count_set_uvws)
+
+    # nothing has changed, so the expensive checks are skipped
+    assert uvd.check(only_changed=True)
+    assert calls == {}
+
+    # the checks are always run if only_changed is False
+    assert uvd.check()
+    assert calls == {"lsts": 1, "uvws": 1}
+
+    # setting the lst_array reruns both the lst and uvw checks
+    uvd.lst_array = uvd.lst_array
+    assert uvd.check(only_changed=True)
+    assert calls == {"lsts": 2, "uvws": 2}
+
+    # setting the uvw_array only reruns the uvw check
+    uvd.uvw_array = uvd.uvw_array
+    assert uvd.check(only_changed=True)
+    assert calls == {"lsts": 2, "uvws": 3}
+
+    # a different lst_tol reruns the lst check
+    assert uvd.check(only_changed=True, lst_tol=1e-6)
+    assert calls == {"lsts": 3, "uvws": 3}
+
+    # cheap checks skip the lst and uvw checks
+    uvd.time_array = uvd.time_array
+    uvd.lst_array = uvd.lst_array
+    assert uvd.check(check_level="cheap")
+    assert calls == {"lsts": 3, "uvws": 3}
+
+    uvd.Nbls += 1
+    with pytest.raises(ValueError, match="Nbls must be equal to the number of unique"):
+        uvd.check(only_changed=True)
+
+
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+@pytest.mark.parametrize(
+    ("method", "kwargs"),
+    [
+        ("conjugate_bls", {"convention": "ant2<ant1"}),
+        ("phase", {"ra": 0.0, "dec": 0.0, "cat_name": "foo"}),
+    ],
+)
+def test_check_only_changed_in_place(hera_uvh5_xx, monkeypatch, method, kwargs):
+    uvd = hera_uvh5_xx
+    assert uvd.check(only_changed=True)
+
+    calls = Counter()
+    set_uvws = UVData.set_uvws_from_antenna_positions
+
+    def count_set_uvws(self, **kwargs):
+        calls["uvws"] += 1
+        return set_uvws(self, **kwargs)
+
+    # methods that change the uvws in place mark them as changed
+    getattr(uvd, method)(**kwargs)
+    monkeypatch.setattr(UVData, "set_uvws_from_antenna_positions", count_set_uvws)
+    assert uvd.check(only_changed=True)
+    assert calls == {"uvws": 1}
+
+    assert uvd.check(only_changed=True)
+    assert calls == {"uvws": 1}
+
+
+def test_check_only_changed_warnings(hera_uvh5_xx, monkeypatch):
+    # the uvws on this file do not match the antenna positions
+    uvd = hera_uvh5_xx
+
+    # the warnings are only recorded if only_changed is True
+    class NoCatchWarnings:
+        def __getattr__(self, name):
+            if name == "catch_warnings":
+                raise AssertionError("warnings should not be recorded")
+            return getattr(warnings, name)
+
+    warn_msg = "The uvw_array does not match the expected values"
+    with monkeypatch.context() as mp:
+        mp.setattr(uvbase, "warnings", NoCatchWarnings())
+        with check_warnings(UserWarning, match=warn_msg):
+            uvd.check()
+
+    with check_warnings(UserWarning, match=warn_msg):
+        uvd.check(only_changed=True)
+
+    # the warning is raised again when the check is skipped
+    with check_warnings(UserWarning, match=warn_msg):
+        uvd.check(only_changed=True)
+
+    with pytest.raises(ValueError, match=warn_msg):
+        uvd.check(only_changed=True, strict_uvw_antpos_check=True)
+
+
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+def test_check_level_passed_through(hera_uvh5_xx, monkeypatch):
+    """Test passing check_level and only_changed to methods that run the check."""
+    uvd = hera_uvh5_xx
+    assert uvd.check(only_changed=True)
+
+    calls = Counter()
+    check_lsts = utils.times.check_lsts_against_times
+    set_uvws = UVData.set_uvws_from_antenna_positions
+
+    def count_check_lsts(**kwargs):
+        calls["lsts"] += 1
+        return check_lsts(**kwargs)
+
+    def count_set_uvws(self, **kwargs):
+        calls["uvws"] += 1
+        return set_uvws(self, **kwargs)
+
+    monkeypatch.setattr(utils.times, "check_lsts_against_times", count_check_lsts)
+    monkeypatch.setattr(UVData, "set_uvws_from_antenna_positions", count_set_uvws)
+
+    # reordering the frequencies does not change the lsts or uvws
+    uvd.reorder_freqs(channel_order="-freq", only_changed=True)
+    assert calls == {}
+
+    uvd2 = uvd.select(freq_chans=np.arange(5), inplace=False, check_level="cheap")
+    uvd3 = uvd.select(freq_chans=np.arange(5, 10), inplace=False, check_level="cheap")
+    assert calls == {}
+
+    uvd2.__add__([uvd3], inplace=False, check_level="shape")
+    uvd2.__add__(uvd3, inplace=True, check_level="cheap")
+    assert calls == {}
+
+    filename = os.path.join(DATA_PATH, "zen.2457698.40355.xx.HH.uvcA.uvh5")
+    UVData.from_file(filename, check_level="cheap")
+    assert calls == {}
+
+    uvd.select(freq_chans=np.arange(10), only_changed=True)
+    assert calls == {}
+    uvd.select(freq_chans=np.arange(5))
+    assert calls == {"lsts": 1, "uvws": 1}
+
+
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+@pytest.mark.parametrize("check_freq_spacing", [True, False])
+def test_check_level_shape(hera_uvh5_xx, check_freq_spacing):
+    uvd = hera_uvh5_xx
+    uvd.Nbls += 1
+    assert uvd.check(check_level="shape", check_freq_spacing=check_freq_spacing)
+
+    with pytest.raises(ValueError, match="Nbls must be equal to the number of unique"):
+        uvd.check(check_level="cheap")
+
+    with pytest.raises(ValueError, match="check_level must be one of"):
+        uvd.check(check_level="foo")
+
+
 @pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
 def test_check_flag_array(casa_uvfits):
     uvobj = casa_uvfits
@@ -2929,6 +3098,29 @@ def test_conjugate_bls(casa_uvfits, metadata_only):
         uv2.conjugate_bls([uv2.Nblts])
 
 
+def test_fingerprint_conjugate_bls(hera_uvh5):
+    uv = hera_uvh5
+    fingerprint = uv.fingerprint()
+    ant1_digest = uv._ant_1_array.digest()
+
+    # conjugate_bls changes the arrays in place
+    uv.conjugate_bls("ant2<ant1")
+    assert uv._ant_1_array.digest() != ant1_digest
+    assert uv.fingerprint() != fingerprint
+
+
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+def test_fingerprint_phase(hera_uvh5):
+    uv = hera_uvh5
+    fingerprint = uv.fingerprint()
+    uvw_digest = uv._uvw_array.digest()
+
+    # phase changes the uvw_array in place
+    uv.phase(lon=Angle("23h").rad, lat=Angle("15d").rad, cat_name="foo")
+    assert uv._uvw_array.digest() != uvw_digest
+    assert uv.fingerprint() != fingerprint
+
+
 @pytest.mark.filterwarnings("ignore:Telescope EVLA is not")
 @pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
 def test_reorder_pols(casa_uvfits):
@@ -4134,6 +4326,235 @@ def test_break_add(casa_uvfits, attr_to_set, attr_to_get, msg):
         uv1 += uv2
 
 
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+@pytest.mark.parametrize("inplace", [True, False])
+def test_add_list(hera_uvh5, inplace):
+    """Test adding a list of objects split along all the axes at once."""
+    uv_full = hera_uvh5
+    times = np.unique(uv_full.time_array)
+    half_nfreqs = uv_full.Nfreqs // 2
+    uv_list = []
+    for time_inds in [np.arange(0, 5), np.arange(5, 12), np.arange(12, times.size)]:
+        for freq_chans in [np.arange(half_nfreqs), np.arange(half_nfreqs, 4)]:
+            for pols in [
+                uv_full.polarization_array[:1],
+                uv_full.polarization_array[1:],
+            ]:
+                uv_list.append(
+                    uv_full.select(
+                        times=times[time_inds],
+                        freq_chans=freq_chans,
+                        polarizations=pols,
+                        inplace=False,
+                    )
+                )
+
+    # get the expected metadata from repeated pairwise adds (with metadata only
+    # objects, since padding the data in repeated adds also adds history about
+    # overwriting invalid data)
+    uv_pairwise = uv_list[0].copy(metadata_only=True)
+    for uv in uv_list[1:]:
+        uv_pairwise += uv.copy(metadata_only=True)
+
+    if inplace:
+        uv_out = uv_list[0]
+        uv_out.__add__(uv_list[1:], inplace=True)
+    else:
+        uv_out = uv_list[0].__add__(uv_list[1:])
+        assert uv_out is not uv_list[0]
+    # new baseline-times are sorted by time then baseline, repeated adds can end up
+    # in a different order when they reorder to match overlapping baseline-times.
+    np.testing.assert_array_equal(
+        np.lexsort((uv_out.baseline_array, uv_out.time_array)), np.arange(uv_out.Nblts)
+    )
+    uv_out.reorder_blts()
+    uv_pairwise.reorder_blts()
+    assert uv_out.copy(metadata_only=True) == uv_pairwise
+    assert uv_out.history == uv_pairwise.history
+
+    uv_full.reorder_blts()
+    uv_out.history = uv_full.history
+    uv_out.filename = uv_full.filename
+    uv_out._filename.form = (1,)
+    assert uv_out == uv_full
+
+
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+def test_add_list_order(hera_uvh5):
+    """Test that adding a list of objects does not depend on the list order."""
+    uv_full = hera_uvh5
+    times = np.unique(uv_full.time_array)
+    uv_list = [
+        uv_full.select(times=times[time_inds], freq_chans=freq_chans, inplace=False)
+        for time_inds in [np.arange(0, 10), np.arange(10, times.size)]
+        for freq_chans in [np.arange(0, 2), np.arange(2, 4)]
+    ]
+    uv_out = uv_list[3].__add__([uv_list[0], uv_list[2], uv_list[1]])
+
+    uv_out.reorder_blts()
+    uv_out.reorder_freqs(channel_order="freq")
+    uv_full.reorder_blts()
+    uv_out.history = uv_full.history
+    uv_out.filename = uv_full.filename
+    uv_out._filename.form = (1,)
+    assert uv_out == uv_full
+
+
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+def test_add_list_overwrite(hera_uvh5):
+    """Test overwriting invalid data when adding a list of objects."""
+    uv_full = hera_uvh5
+    times = np.unique(uv_full.time_array)
+    uv1 = uv_full.select(times=times[:10], inplace=False)
+    uv2 = uv_full.select(times=times[10:], inplace=False)
+    uv_invalid = uv_full.copy()
+    uv_invalid.data_array[:] = 0
+    uv_invalid.flag_array[:] = True
+
+    uv_out = uv_invalid.__add__([uv1, uv2])
+    assert uv_out.history.endswith(" Overwrote invalid data using pyuvdata.")
+    np.testing.assert_array_equal(uv_out.data_array, uv_full.data_array)
+    np.testing.assert_array_equal(uv_out.flag_array, uv_full.flag_array)
+
+    with pytest.raises(ValueError, match="please run the add operation again"):
+        uv1.__add__([uv_invalid, uv2])
+
+    with pytest.raises(ValueError, match="These objects have overlapping data"):
+        uv1.__add__([uv_full, uv2])
+
+
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+def test_add_list_overlap_multi_axis(hera_uvh5):
+    """Test finding overlaps between objects that differ on more than one axis."""
+    uv_a = hera_uvh5.select(freq_chans=[0], inplace=False)
+    uv_b = hera_uvh5.select(
+        times=np.unique(hera_uvh5.time_array)[0], freq_chans=[0, 1], inplace=False
+    )
+    uv_b.data_array[:] = 12345
+    # the objects are smaller in total than the combined object
+    assert uv_a.data_array.size + uv_b.data_array.size < (
+        hera_uvh5.Nblts * 2 * hera_uvh5.Npols
+    )
+
+    with pytest.raises(ValueError, match="These objects have overlapping data"):
+        uv_a + uv_b
+    with pytest.raises(ValueError, match="These objects have overlapping data"):
+        uv_a.__add__([uv_b])
+
+
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+def test_add_list_errors(hera_uvh5):
+    times = np.unique(hera_uvh5.time_array)
+    uv1 = hera_uvh5.select(times=times[:10], inplace=False)
+    uv2 = hera_uvh5.select(times=times[10:], inplace=False)
+
+    with pytest.raises(ValueError, match="Only UVData"):
+        uv1.__add__([uv2, UVCal()])
+
+    with pytest.raises(
+        ValueError, match="Cannot combine a list of objects where some are metadata"
+    ):
+        uv1.__add__([uv2.copy(metadata_only=True)])
+
+    uv3 = uv2.copy()
+    uv3.vis_units = "Jy"
+    with pytest.raises(ValueError, match="UVParameter vis_units does not match"):
+        uv1.__add__([uv2, uv3])
+
+    uv3 = uv2.copy()
+    uv3.integration_time = uv3.integration_time * 2
+    with pytest.raises(ValueError, match="UVParameter integration_time does not match"):
+        uv1.__add__([uv2, uv3])
+
+    uv3 = uv2.copy()
+    uv3.channel_width = uv3.channel_width * 2
+    with pytest.raises(ValueError, match="UVParameter channel_width does not match"):
+        uv1.__add__([uv2, uv3])
+
+    uv3 = uv2.copy()
+    uv3.convert_to_flex_pol()
+    with pytest.raises(ValueError, match="Cannot add a flex-pol and non-flex-pol"):
+        uv1.__add__([uv2, uv3])
+
+
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+def test_add_list_phase_centers(hera_uvh5):
+    """Test combining the phase center catalogs when adding a list of objects."""
+    times = np.unique(hera_uvh5.time_array)
+    uv_list = [
+        hera_uvh5.select(times=times[inds], inplace=False)
+        for inds in [np.arange(0, 5), np.arange(5, 10), np.arange(10, times.size)]
+    ]
+    uv_list[1].phase(ra=0.0, dec=0.0, epoch="J2000", cat_name="foo")
+    uv_list[2].phase(ra=0.0, dec=0.0, epoch="J2000", cat_name="foo")
+    uv_list[2]._update_phase_center_id(
+        list(uv_list[2].phase_center_catalog)[0], new_id=5
+    )
+
+    uv_out = uv_list[0].__add__(uv_list[1:])
+    uv_pairwise = uv_list[0] + uv_list[1]
+    uv_pairwise += uv_list[2]
+    assert uv_out == uv_pairwise
+    assert uv_out.Nphase == 2
+
+    with pytest.raises(ValueError, match="UVParameter phase_center_catalog does not"):
+        uv_list[0].__add__([uv_list[1], hera_uvh5])
+
+
+def test_get_blt_keys(hera_uvh5):
+    """Test the integer keys used to match up baseline-times when adding."""
+    uv_full = hera_uvh5
+    uv_part = uv_full.select(blt_inds=np.arange(uv_full.Nblts)[::3], inplace=False)
+    # jitter the times by much less than the time tolerance
+    uv_part.time_array += 1e-12
+    prec_t = -2 * np.floor(np.log10(uv_full._time_array.tols[-1])).astype(int)
+    full_keys, part_keys = _get_blt_keys([uv_full, uv_part], prec_t=prec_t)
+
+    assert full_keys.dtype == np.int64
+    assert np.unique(full_keys).size == uv_full.Nblts
+    np.testing.assert_array_equal(
+        np.argsort(full_keys), np.lexsort((uv_full.baseline_array, uv_full.time_array))
+    )
+    np.testing.assert_array_equal(part_keys, full_keys[::3])
+
+
+@pytest.mark.parametrize("add_list", [False, True])
+def test_add_times_far_apart(hera_uvh5, add_list):
+    """Test adding objects with times more than 1000 days apart."""
+    times = np.unique(hera_uvh5.time_array)
+    uv1 = hera_uvh5.select(times=times[:5], inplace=False)
+    uv2 = hera_uvh5.select(times=times[5:10], inplace=False)
+    uv2.time_array += 1000
+    uv2.set_lsts_from_time_array()
+
+    prec_t = -2 * np.floor(np.log10(uv1._time_array.tols[-1])).astype(int)
+    keys1, keys2 = _get_blt_keys([uv1, uv2], prec_t=prec_t)
+    assert np.max(keys1) < np.min(keys2)
+
+    uv_sum = uv1.__add__([uv2]) if add_list else uv1 + uv2
+    assert uv_sum.Ntimes == 10
+    assert uv_sum.Nblts == uv1.Nblts + uv2.Nblts
+    assert np.all(np.diff(uv_sum.time_array) >= 0)
+    np.testing.assert_array_equal(
+        uv_sum.time_array, np.concatenate((uv1.time_array, uv2.time_array))
+    )
+
+
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+def test_add_list_metadata_only(hera_uvh5):
+    times = np.unique(hera_uvh5.time_array)
+    uv_list = [
+        hera_uvh5.select(times=times[inds], inplace=False).copy(metadata_only=True)
+        for inds in [np.arange(0, 5), np.arange(5, 10), np.arange(10, times.size)]
+    ]
+    uv_out = uv_list[0].__add__(uv_list[1:])
+    assert uv_out.metadata_only
+
+    uv_pairwise = uv_list[0] + uv_list[1]
+    uv_pairwise += uv_list[2]
+    assert uv_out == uv_pairwise
+
+
 @pytest.mark.filterwarnings("ignore:Telescope EVLA is not")
 @pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
 def test_fast_concat(casa_uvfits, hera_uvh5_xx):
@@ -6346,6 +6767,147 @@ def test_compress_redundancy_wrong_method(pyuvsim_redundant):
         uv0.compress_by_redundancy(method="foo", tol=tol, inplace=True)
 
 
+@pytest.mark.parametrize("chunk_size", [None, 7])
+def test_compress_redundancy_average_chunks(
+    pyuvsim_redundant, tmp_path, chunk_size, monkeypatch
+):
+    uv0 = pyuvsim_redundant
+    tol = 0.05
+    rng = np.random.default_rng(5)
+    uv0.data_array += rng.normal(size=uv0.data_array.shape)
+    uv0.nsample_array = rng.uniform(size=uv0.nsample_array.shape).astype(np.float32)
+    uv0.flag_array = rng.uniform(size=uv0.flag_array.shape) < 0.3
+    uv0.flag_array[::5] = True
+
+    uv1 = uv0.compress_by_redundancy(method="average", tol=tol, inplace=False)
+    uv2 = uv0.compress_by_redundancy(
+        method="average", tol=tol, inplace=False, chunk_size=5
+    )
+    np.testing.assert_allclose(uv2.data_array, uv1.data_array, rtol=1e-6)
+    np.testing.assert_allclose(uv2.nsample_array, uv1.nsample_array, rtol=1e-6)
+    uv2.data_array = uv1.data_array
+    uv2.nsample_array = uv1.nsample_array
+    assert uv2 == uv1
+
+    # stream the data from a file, only reading the data-like datasets and closing
+    # the file afterwards
+    testfile = os.path.join(tmp_path, "redundant.uvh5")
+    uv0.write_uvh5(testfile)
+    uv3 = UVData.from_file(testfile, read_data=False)
+
+    def _no_iter(*args, **kwargs):
+        raise AssertionError("iter_uvh5_chunks should not be used.")
+
+    closed = []
+    close = FastUVH5Meta.close
+
+    def _close(self):
+        closed.append(self.path)
+        close(self)
+
+    monkeypatch.setattr(UVData, "iter_uvh5_chunks", _no_iter)
+    monkeypatch.setattr(FastUVH5Meta, "close", _close)
+    uv3.compress_by_redundancy(
+        method="average", tol=tol, filename=testfile, chunk_size=chunk_size
+    )
+    assert len(closed) == 1
+    np.testing.assert_allclose(uv3.data_array, uv1.data_array, rtol=1e-6)
+    np.testing.assert_allclose(uv3.nsample_array, uv1.nsample_array, rtol=1e-6)
+    np.testing.assert_array_equal(uv3.flag_array, uv1.flag_array)
+
+
+def test_compress_redundancy_average_reference(pyuvsim_redundant):
+    uv0 = pyuvsim_redundant
+    tol = 0.05
+    rng = np.random.default_rng(7)
+    uv0.data_array = (
+        rng.normal(size=uv0.data_array.shape)
+        + 1j * rng.normal(size=uv0.data_array.shape)
+    ).astype(uv0.data_array.dtype)
+    uv0.nsample_array = rng.uniform(size=uv0.nsample_array.shape).astype(np.float32)
+    uv0.flag_array = rng.uniform(size=uv0.flag_array.shape) < 0.3
+    uv0.flag_array[::5] = True
+    # conjugate some baselines so they are averaged in the other orientation
+    uv0.conjugate_bls(
+        convention=np.nonzero(
+            np.isin(uv0.baseline_array, np.unique(uv0.baseline_array)[::3])
+        )[0]
+    )
+
+    uv1 = uv0.compress_by_redundancy(
+        method="average", tol=tol, inplace=False, use_grid_alg=True
+    )
+
+    # the summation order (and precision) differs from a direct weighted average,
+    # so compare within a tolerance
+    red_gps, _, _, conjugates = uv0.get_redundancies(
+        tol=tol, include_conjugates=True, use_grid_alg=True
+    )
+    for gp in red_gps:
+        for ind in np.nonzero(uv1.baseline_array == gp[0])[0]:
+            blts = np.nonzero(
+                np.isin(uv0.baseline_array, gp)
+                & np.isclose(uv0.time_array, uv1.time_array[ind], rtol=0, atol=1e-6)
+            )[0]
+            vis = uv0.data_array[blts].astype(np.complex128)
+            # conjugate the baselines with the opposite orientation to the index
+            conj = np.isin(uv0.baseline_array[blts], conjugates) != (
+                gp[0] in conjugates
+            )
+            vis = np.where(conj[:, None, None], np.conj(vis), vis)
+            weights = uv0.nsample_array[blts].astype(np.float64)
+            flags = uv0.flag_array[blts]
+            if not np.all(flags):
+                weights = np.where(flags, 0, weights)
+            exp_nsample = np.sum(weights, axis=0)
+            exp_vis = np.zeros_like(vis[0])
+            np.divide(
+                np.sum(vis * weights, axis=0),
+                exp_nsample,
+                out=exp_vis,
+                where=exp_nsample > 0,
+            )
+            np.testing.assert_allclose(uv1.data_array[ind], exp_vis, rtol=1e-5)
+            np.testing.assert_allclose(uv1.nsample_array[ind], exp_nsample, rtol=1e-6)
+            np.testing.assert_array_equal(uv1.flag_array[ind], np.all(flags, axis=0))
+
+
+@pytest.mark.parametrize(
+    ["kwargs", "metadata_only", "msg"],
+    [
+        [{"chunk_size": 0}, False, "chunk_size must be a positive integer."],
+        [{"chunk_size": 2.5}, False, "chunk_size must be a positive integer."],
+        [
+            {"method": "select"},
+            True,
+            'filename can only be set if method is "average".',
+        ],
+        [{}, False, "The object must be metadata only if filename is set."],
+        [
+            {"select": True},
+            True,
+            "The baseline-times, frequencies or polarizations on this object do not "
+            "match the file.",
+        ],
+    ],
+)
+def test_compress_redundancy_average_errors(
+    pyuvsim_redundant, tmp_path, kwargs, metadata_only, msg
+):
+    uv0 = pyuvsim_redundant
+    testfile = os.path.join(tmp_path, "redundant.uvh5")
+    uv0.write_uvh5(testfile)
+    uv1 = UVData.from_file(testfile, read_data=not metadata_only)
+    if kwargs.pop("select", False):
+        uv1.select(blt_inds=np.arange(uv1.Nblts - 1))
+    kwargs.setdefault("method", "average")
+    if "chunk_size" not in kwargs:
+        kwargs["filename"] = testfile
+
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        uv1.compress_by_redundancy(tol=0.05, **kwargs)
+
+
 @pytest.mark.filterwarnings("ignore:antenna_diameters are not set or are being")
 @pytest.mark.parametrize("grid_alg", [True, False])
 @pytest.mark.parametrize("method", ("select", "average"))
@@ -7561,6 +8123,126 @@ def test_partial_downsample_in_time(hera_uvh5):
     return
 
 
+@pytest.mark.parametrize("keep_ragged", [True, False])
+@pytest.mark.parametrize("summing_correlator_mode", [True, False])
+def test_downsample_in_time_matches_single_baseline(
+    hera_uvh5, keep_ragged, summing_correlator_mode
+):
+    """Test that downsampling all baselines at once matches doing them one by one"""
+    uv_object = hera_uvh5
+    uv_object.phase_to_time(Time(uv_object.time_array[0], format="jd"))
+    rng = np.random.default_rng(5)
+    uv_object.flag_array = rng.random(uv_object.flag_array.shape) < 0.3
+    uv_object.nsample_array = rng.random(uv_object.nsample_array.shape).astype(
+        uv_object.nsample_array.dtype
+    )
+
+    # this file has 20 integrations, so make the windows uneven
+    min_integration_time = np.amax(uv_object.integration_time) * 3
+    kwargs = {
+        "min_int_time": min_integration_time,
+        "keep_ragged": keep_ragged,
+        "summing_correlator_mode": summing_correlator_mode,
+    }
+    uv_all = uv_object.copy()
+    uv_all.downsample_in_time(**kwargs)
+
+    for antpair in uv_object.get_antpairs()[:3]:
+        uv_bl = uv_object.select(bls=[antpair], inplace=False)
+        uv_bl.downsample_in_time(**kwargs)
+        np.testing.assert_array_equal(
+            uv_all.get_times(antpair), uv_bl.get_times(antpair)
+        )
+        np.testing.assert_array_equal(uv_all.get_data(antpair), uv_bl.get_data(antpair))
+        np.testing.assert_array_equal(
+            uv_all.get_flags(antpair), uv_bl.get_flags(antpair)
+        )
+        np.testing.assert_array_equal(
+            uv_all.get_nsamples(antpair), uv_bl.get_nsamples(antpair)
+        )
+
+
+@pytest.mark.parametrize("shape", [(200,), (200, 3, 2)])
+def test_window_sum(shape):
+    """Test that the window sums match calling np.sum on each window."""
+    rng = np.random.default_rng(7)
+    array = rng.normal(size=shape) * 1e3 + 2459000
+    lengths = np.asarray([1, 3, 8, 9, 16, 17, 40, 2, 33, 16, 55])
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+    window_sum = _window_sum(array, starts, lengths)
+    expected = np.asarray(
+        [
+            np.sum(array[start : start + length], axis=0)
+            for start, length in zip(starts, lengths, strict=True)
+        ]
+    )
+    np.testing.assert_array_equal(window_sum, expected)
+
+
+def test_downsample_in_time_long_windows(hera_uvh5):
+    """Test downsampling with windows longer than 8 samples matches np.sum."""
+    uv_object = hera_uvh5
+    uv_object.phase_to_time(Time(uv_object.time_array[0], format="jd"))
+    rng = np.random.default_rng(5)
+    uv_object.nsample_array = rng.random(uv_object.nsample_array.shape).astype(
+        uv_object.nsample_array.dtype
+    )
+    uv_in = uv_object.copy()
+
+    # this file has 20 integrations, so this gives windows of 16 and 4 samples
+    uv_object.downsample_in_time(n_times_to_avg=16)
+
+    antpair = uv_in.get_antpairs()[1]
+    inds = uv_in.antpair2ind(antpair)
+    times = uv_in.time_array[inds]
+    int_times = uv_in.integration_time[inds]
+    data = uv_in.data_array[inds]
+    weights = uv_in.nsample_array[inds] * int_times[:, np.newaxis, np.newaxis]
+    exp_times = []
+    exp_int_times = []
+    exp_data = []
+    exp_nsamples = []
+    for window in [slice(0, 16), slice(16, 20)]:
+        exp_times.append(
+            np.sum(times[window] * int_times[window]) / np.sum(int_times[window])
+        )
+        running_int_time = 0.0
+        for int_time in int_times[window]:
+            running_int_time += int_time
+        exp_int_times.append(running_int_time)
+        exp_data.append(
+            np.sum(data[window] * weights[window], axis=0)
+            / np.sum(weights[window], axis=0)
+        )
+        exp_nsamples.append(np.sum(weights[window], axis=0) / np.sum(int_times[window]))
+
+    out_inds = uv_object.antpair2ind(antpair)
+    np.testing.assert_array_equal(uv_object.time_array[out_inds], exp_times)
+    np.testing.assert_array_equal(uv_object.integration_time[out_inds], exp_int_times)
+    np.testing.assert_array_equal(
+        uv_object.data_array[out_inds],
+        np.asarray(exp_data).astype(uv_object.data_array.dtype),
+    )
+    np.testing.assert_array_equal(
+        uv_object.nsample_array[out_inds],
+        np.asarray(exp_nsamples).astype(uv_object.nsample_array.dtype),
+    )
+
+
+def test_downsample_in_time_drop_ragged_baselines(bda_test_file):
+    """Test that dropping ragged windows updates the baseline and antenna counts."""
+    uv_object = bda_test_file
+    assert uv_object.Nbls == 6
+    uv_object.downsample_in_time(n_times_to_avg=3, keep_ragged=False)
+
+    # most baselines have fewer than 3 integrations, so they are dropped
+    assert uv_object.Nbls == 2
+    assert uv_object.Nbls == np.unique(uv_object.baseline_array).size
+    assert uv_object.Nants_data == uv_object._calc_nants_data()
+    uv_object.check()
+
+
 @pytest.mark.filterwarnings("ignore:The xyz array in ENU_from_ECEF")
 @pytest.mark.filterwarnings("ignore:The enu array in ECEF_from_ENU")
 @pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
@@ -7852,6 +8534,30 @@ def test_downsample_in_time_errors(hera_uvh5):
     return
 
 
+def test_downsample_time_gap_warning_single_time_bl(hera_uvh5):
+    """Test the time gap warning when the next baseline has a single time.
+
+    The single time baseline has a different integration time, which should not
+    affect the checks on the previous baseline.
+    """
+    uv_object = hera_uvh5
+    baselines = np.array(
+        [uv_object.antnums_to_baseline(0, 0), uv_object.antnums_to_baseline(0, 1)]
+    )
+    # the first baseline is missing an integration, the second one has one sample
+    # with three times the integration time.
+    times = 2459000.0 + np.array([0.0, 10.0, 30.0, 0.0]) / (24 * 3600)
+    int_times = np.array([10.0, 10.0, 10.0, 30.0])
+    with check_warnings(UserWarning, match="There is a gap in the times of baseline"):
+        uv_object._downsample_time_gap_warnings(
+            bl_starts=np.array([0, 3]),
+            bl_lengths=np.array([3, 1]),
+            baselines=baselines,
+            times=times,
+            int_times=int_times,
+        )
+
+
 @pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
 def test_downsample_in_time_int_time_mismatch_warning(hera_uvh5):
     """Test warning in downsample_in_time about mismatch between integration
@@ -9045,6 +9751,71 @@ def test_frequency_average_warnings(casa_uvfits):
     assert chanwidth_error
 
 
+@pytest.mark.parametrize("propagate_flags", [True, False])
+@pytest.mark.parametrize("keep_ragged", [True, False])
+def test_frequency_average_multi_spw_flags(hera_uvh5, propagate_flags, keep_ragged):
+    """Test averaging flagged data with multiple spws matches doing each spw."""
+    uvobj = hera_uvh5
+    rng = np.random.default_rng(7)
+    uvobj.flag_array = rng.random(uvobj.flag_array.shape) < 0.4
+    uvobj.nsample_array = rng.random(uvobj.nsample_array.shape).astype(
+        uvobj.nsample_array.dtype
+    )
+    uvobj.flex_spw_id_array = np.array([1, 1, 1, 0])
+    uvobj.spw_array = np.array([1, 0])
+    uvobj.Nspws = 2
+
+    uvobj2 = uvobj.copy()
+    uvobj2.frequency_average(
+        n_chan_to_avg=2, propagate_flags=propagate_flags, keep_ragged=keep_ragged
+    )
+
+    for spw in uvobj.spw_array:
+        uv_spw = uvobj.select(
+            freq_chans=np.nonzero(uvobj.flex_spw_id_array == spw)[0], inplace=False
+        )
+        uv_spw.frequency_average(
+            n_chan_to_avg=2, propagate_flags=propagate_flags, keep_ragged=keep_ragged
+        )
+        spw_chans = uvobj2.flex_spw_id_array == spw
+        np.testing.assert_array_equal(uvobj2.freq_array[spw_chans], uv_spw.freq_array)
+        np.testing.assert_array_equal(
+            uvobj2.data_array[:, spw_chans], uv_spw.data_array
+        )
+        np.testing.assert_array_equal(
+            uvobj2.flag_array[:, spw_chans], uv_spw.flag_array
+        )
+        np.testing.assert_array_equal(
+            uvobj2.nsample_array[:, spw_chans], uv_spw.nsample_array
+        )
+
+
+@pytest.mark.parametrize("summing_correlator_mode", [True, False])
+def test_frequency_average_blt_chunk_size(hera_uvh5, summing_correlator_mode):
+    """Test averaging in chunks of baseline-times gives the same result."""
+    uvobj = hera_uvh5
+    rng = np.random.default_rng(8)
+    uvobj.flag_array = rng.random(uvobj.flag_array.shape) < 0.4
+
+    uvobj2 = uvobj.copy()
+    uvobj.frequency_average(
+        n_chan_to_avg=3, summing_correlator_mode=summing_correlator_mode
+    )
+    uvobj2.frequency_average(
+        n_chan_to_avg=3,
+        summing_correlator_mode=summing_correlator_mode,
+        blt_chunk_size=7,
+    )
+    assert uvobj == uvobj2
+    np.testing.assert_array_equal(uvobj.data_array, uvobj2.data_array)
+
+
+@pytest.mark.parametrize("blt_chunk_size", [0, 2.5])
+def test_frequency_average_blt_chunk_size_error(hera_uvh5, blt_chunk_size):
+    with pytest.raises(ValueError, match="blt_chunk_size must be a positive integer."):
+        hera_uvh5.frequency_average(n_chan_to_avg=2, blt_chunk_size=blt_chunk_size)
+
+
 @pytest.mark.filterwarnings("ignore:Telescope EVLA is not")
 @pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
 def test_remove_eq_coeffs_divide(casa_uvfits):
@@ -9366,6 +10137,102 @@ def test_multifile_read_check_long_list(hera_uvh5, tmp_path, err_type):
     return
 
 
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+@pytest.mark.parametrize("executor", ["thread", "process"])
+@pytest.mark.parametrize("axis", [None, "blt"])
+def test_multifile_read_parallel(hera_uvh5, tmp_path, executor, axis):
+    """Test reading multiple files with a pool of workers."""
+    uv = hera_uvh5
+
+    file_list = []
+    for i in range(4):
+        uv2 = uv.select(
+            times=np.unique(uv.time_array)[i * 5 : i * 5 + 5], inplace=False
+        )
+        fname = str(tmp_path / f"minifile_{i}.uvh5")
+        file_list.append(fname)
+        uv2.write_uvh5(fname)
+
+    uv_serial = UVData.from_file(file_list, axis=axis)
+    uv_parallel = UVData.from_file(file_list, axis=axis, nworkers=2, executor=executor)
+    assert uv_parallel == uv_serial
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_multifile_read_parallel_warnings(hera_uvh5, tmp_path, executor):
+    """Test that warnings from the checks on files read in parallel are raised."""
+    uv = hera_uvh5
+    # make the uvws inconsistent with the antenna positions so reading warns
+    uv.uvw_array[uv.ant_1_array != uv.ant_2_array] += 10.0
+
+    file_list = []
+    for i in range(2):
+        uv2 = uv.select(
+            times=np.unique(uv.time_array)[i * 5 : i * 5 + 5],
+            inplace=False,
+            run_check=False,
+        )
+        fname = str(tmp_path / f"minifile_{i}.uvh5")
+        file_list.append(fname)
+        uv2.write_uvh5(fname, run_check=False)
+
+    warn_msg = "The uvw_array does not match the expected values"
+    with warnings.catch_warnings(record=True) as serial_warnings:
+        warnings.simplefilter("always")
+        uv_serial = UVData.from_file(file_list)
+    with warnings.catch_warnings(record=True) as parallel_warnings:
+        warnings.simplefilter("always")
+        uv_parallel = UVData.from_file(file_list, nworkers=2, executor=executor)
+
+    n_serial = sum(warn_msg in str(w.message) for w in serial_warnings)
+    n_parallel = sum(warn_msg in str(w.message) for w in parallel_warnings)
+    assert n_serial > 0
+    assert n_parallel == n_serial
+    assert uv_parallel == uv_serial
+
+
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+def test_multifile_read_parallel_bad_files(hera_uvh5, tmp_path):
+    """Test skipping and raising on bad files when reading with a pool of workers."""
+    uv = hera_uvh5
+
+    file_list = []
+    for i in range(3):
+        uv2 = uv.select(
+            times=np.unique(uv.time_array)[i * 5 : i * 5 + 5], inplace=False
+        )
+        fname = str(tmp_path / f"minifile_{i}.uvh5")
+        file_list.append(fname)
+        uv2.write_uvh5(fname)
+    with h5py.File(file_list[1], "r+") as h5f:
+        del h5f["Header/ant_1_array"]
+
+    uv_true = UVData.from_file([file_list[0], file_list[2]])
+    with check_warnings(UserWarning, match="Failed to read"):
+        uv_test = UVData.from_file(file_list, skip_bad_files=True, nworkers=2)
+    assert uv_test == uv_true
+
+    with (
+        pytest.raises(KeyError, match="ant_1_array not found"),
+        check_warnings(UserWarning, match="Failed to read"),
+    ):
+        UVData.from_file(file_list, skip_bad_files=False, nworkers=2)
+
+
+@pytest.mark.parametrize(
+    "kwargs,msg",
+    [
+        ({"nworkers": 0}, "nworkers must be a positive integer."),
+        ({"nworkers": 1.5}, "nworkers must be a positive integer."),
+        ({"nworkers": 2, "executor": "foo"}, "executor must be one of"),
+    ],
+)
+def test_multifile_read_parallel_errors(kwargs, msg):
+    testfile = os.path.join(DATA_PATH, "zen.2458661.23480.HH.uvh5")
+    with pytest.raises(ValueError, match=msg):
+        UVData.from_file([testfile] * 2, **kwargs)
+
+
 @pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
 def test_read_background_lsts():
     """Test reading a file with the lst calc in the background."""
@@ -10496,6 +11363,40 @@ def test_phase_dict_helper_jpl_lookup_append(sma_mir):
         assert len(phase_dict[key]) == 13
 
 
+def test_phase_jpl_lookup_ephem_cache(sma_mir, tmp_path):
+    """
+    Test that ephemerides are read from an ephemeris store when phasing with a
+    JPL-Horizons lookup, so that no query is needed.
+    """
+    ephem_cache = tmp_path / "ephem.json"
+    ephem_times = np.unique(sma_mir.time_array)
+    utils.phasing.add_to_ephem_cache(
+        ephem_cache,
+        "Mars",
+        ephem_times=ephem_times,
+        ephem_ra=np.full_like(ephem_times, 1.0),
+        ephem_dec=np.full_like(ephem_times, 0.5),
+        ephem_dist=np.full_like(ephem_times, 1.5),
+        ephem_vel=np.zeros_like(ephem_times),
+        telescope_loc=sma_mir.telescope.location,
+        force_indv_lookup=True,
+    )
+
+    sma_mir.phase(
+        lon=0, lat=0, cat_name="Mars", lookup_name=True, ephem_cache=ephem_cache
+    )
+    cat_id = utils.phase_center_catalog.look_for_name(
+        sma_mir.phase_center_catalog, "Mars"
+    )[0]
+    phase_dict = sma_mir.phase_center_catalog[cat_id]
+    assert phase_dict["cat_type"] == "ephem"
+    assert phase_dict["info_source"] == "jplh"
+    np.testing.assert_array_equal(phase_dict["cat_times"], ephem_times)
+    np.testing.assert_allclose(phase_dict["cat_lon"], 1.0)
+    np.testing.assert_allclose(phase_dict["cat_lat"], 0.5)
+    np.testing.assert_allclose(sma_mir.phase_center_app_dec, 0.5, atol=0.05)
+
+
 @pytest.mark.parametrize("use_ant_pos", [True, False])
 @pytest.mark.parametrize("phase_frame", ["icrs", "gcrs"])
 @pytest.mark.parametrize("file_type", ["uvh5", "uvfits", "miriad"])
@@ -11949,6 +12850,50 @@ def test_antpair2ind_unordered_both_exist(hera_uvh5):
     assert len(idxs[inds_ordered]) < len(idxs[inds_unordered])
 
 
+@pytest.mark.parametrize("blt_order", ["shuffle", "subset", "time", "baseline"])
+def test_antpair2ind_lookup_table(hera_uvh5, blt_order):
+    rng = np.random.default_rng(5)
+    if blt_order == "shuffle":
+        hera_uvh5.reorder_blts(order=rng.permutation(hera_uvh5.Nblts))
+    elif blt_order == "subset":
+        hera_uvh5.select(
+            blt_inds=np.sort(
+                rng.choice(hera_uvh5.Nblts, hera_uvh5.Nblts // 2, replace=False)
+            )
+        )
+    else:
+        hera_uvh5.reorder_blts(order=blt_order)
+
+    blt_inds = np.arange(hera_uvh5.Nblts)
+    for ant1, ant2 in hera_uvh5.get_antpairs():
+        expected = np.nonzero(
+            (hera_uvh5.ant_1_array == ant1) & (hera_uvh5.ant_2_array == ant2)
+        )[0]
+        np.testing.assert_array_equal(
+            blt_inds[hera_uvh5.antpair2ind(ant1, ant2)], expected
+        )
+        if blt_order in ["time", "baseline"]:
+            assert isinstance(hera_uvh5.antpair2ind(ant1, ant2), slice)
+
+    assert hera_uvh5.antpair2ind(1000, 0) is None
+    assert hera_uvh5.antpair2ind(0, 1000) is None
+
+
+def test_antpair2ind_cache_cleared(hera_uvh5):
+    ant1, ant2 = hera_uvh5.get_antpairs()[3]
+    inds_orig = hera_uvh5.antpair2ind(ant1, ant2)
+
+    hera_uvh5.reorder_blts(order="baseline")
+    inds = hera_uvh5.antpair2ind(ant1, ant2)
+    assert inds != inds_orig
+    assert np.all(hera_uvh5.ant_1_array[inds] == ant1)
+    assert np.all(hera_uvh5.ant_2_array[inds] == ant2)
+
+    hera_uvh5.select(bls=[(ant1, ant2)])
+    inds = hera_uvh5.antpair2ind(ant1, ant2)
+    assert np.all(np.arange(hera_uvh5.Nblts)[inds] == np.arange(hera_uvh5.Nblts))
+
+
 def test_key2inds_nonexistent_pol(hera_uvh5):
     with pytest.raises(KeyError, match="Polarization -7 not found in data"):
         hera_uvh5._key2inds((1, 0, -7))
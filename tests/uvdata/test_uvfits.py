@@ -1776,3 +1776,243 @@ def test_miriad_convention(tmp_path):
     uv2.baseline_array = uv2.antnums_to_baseline(uv2.ant_1_array, uv2.ant_2_array)
 
     assert uv2 == uv
+
+
+@pytest.mark.parametrize("uv_in", ["uvfits_nospw", "sma_mir"])
+@pytest.mark.parametrize("chunk_size", [1, 7, None])
+def test_write_uvfits_chunks(request, tmp_path, uv_in, chunk_size):
+    uv_in = request.getfixturevalue(uv_in)
+    testfile = str(tmp_path / "full.uvfits")
+    uv_in.write_uvfits(testfile, chunk_size=uv_in.Nblts, run_check=False)
+    testfile_chunks = str(tmp_path / "chunks.uvfits")
+    uv_in.write_uvfits(testfile_chunks, chunk_size=chunk_size, run_check=False)
+
+    with open(testfile, "rb") as file1, open(testfile_chunks, "rb") as file2:
+        assert file1.read() == file2.read()
+
+
+def test_write_uvfits_chunks_error(uvfits_nospw, tmp_path):
+    with pytest.raises(ValueError, match="chunk_size must be a positive integer."):
+        uvfits_nospw.write_uvfits(
+            str(tmp_path / "outtest.uvfits"), chunk_size=0, run_check=False
+        )
+
+
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+@pytest.mark.parametrize("uv_in", ["uvfits_nospw", "sma_mir"])
+def test_uvfits_partial_write(request, tmp_path, uv_in):
+    uv_in = request.getfixturevalue(uv_in)
+    testfile = str(tmp_path / "full.uvfits")
+    uv_in.write_uvfits(testfile, run_check=False)
+
+    partial_file = str(tmp_path / "partial.uvfits")
+    uv_meta = uv_in.copy(metadata_only=True)
+    uv_meta.initialize_uvfits_file(partial_file, run_check=False, chunk_size=5)
+
+    # unwritten data read back as flagged
+    uv_out = UVData.from_file(partial_file)
+    assert np.all(uv_out.flag_array)
+    assert np.all(uv_out.nsample_array == 0)
+    assert np.all(uv_out.data_array == 0)
+
+    # write in parts split on baseline-times, frequencies and polarizations
+    blt_parts = np.array_split(np.arange(uv_in.Nblts), 2)
+    freq_parts = np.array_split(np.arange(uv_in.Nfreqs), 3)
+    for blt_inds in blt_parts:
+        if blt_inds.size == 0:
+            continue
+        for freq_chans in freq_parts:
+            for pol in uv_in.polarization_array:
+                pol_ind = np.nonzero(uv_in.polarization_array == pol)[0]
+                inds = np.ix_(blt_inds, freq_chans, pol_ind)
+                uv_meta.write_uvfits_part(
+                    partial_file,
+                    data_array=uv_in.data_array[inds],
+                    flag_array=uv_in.flag_array[inds],
+                    nsample_array=uv_in.nsample_array[inds],
+                    blt_inds=blt_inds,
+                    freq_chans=freq_chans,
+                    polarizations=[pol],
+                )
+
+    with open(testfile, "rb") as file1, open(partial_file, "rb") as file2:
+        assert file1.read() == file2.read()
+
+
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+def test_uvfits_partial_write_errors(uvfits_nospw, hera_uvh5, tmp_path):
+    uv_in = uvfits_nospw
+    partial_file = str(tmp_path / "partial.uvfits")
+
+    with pytest.raises(AssertionError, match="does not exists; please first"):
+        uv_in.write_uvfits_part(
+            partial_file,
+            data_array=uv_in.data_array,
+            flag_array=uv_in.flag_array,
+            nsample_array=uv_in.nsample_array,
+        )
+
+    with pytest.raises(ValueError, match="write_precision must be 32 or 64."):
+        uv_in.initialize_uvfits_file(partial_file, write_precision=16, run_check=False)
+
+    uv_in.initialize_uvfits_file(partial_file, write_precision=64, run_check=False)
+    with fits.open(partial_file) as hdu_list:
+        assert hdu_list[0].header["BITPIX"] == -64
+
+    with pytest.raises(OSError, match="File exists; skipping"):
+        uv_in.initialize_uvfits_file(partial_file, run_check=False)
+
+    with pytest.raises(AssertionError, match="data_array and flag_array must have"):
+        uv_in.write_uvfits_part(
+            partial_file,
+            data_array=uv_in.data_array,
+            flag_array=uv_in.flag_array[:1],
+            nsample_array=uv_in.nsample_array,
+        )
+
+    with pytest.raises(AssertionError, match="data_array and nsample_array must"):
+        uv_in.write_uvfits_part(
+            partial_file,
+            data_array=uv_in.data_array,
+            flag_array=uv_in.flag_array,
+            nsample_array=uv_in.nsample_array[:1],
+        )
+
+    with pytest.raises(AssertionError, match="data_array has shape"):
+        uv_in.write_uvfits_part(
+            partial_file,
+            data_array=uv_in.data_array,
+            flag_array=uv_in.flag_array,
+            nsample_array=uv_in.nsample_array,
+            blt_inds=[0],
+        )
+
+    nsample_array = uv_in.nsample_array.copy()
+    nsample_array[0] = 0
+    with check_warnings(UserWarning, match="Some unflagged data has nsample = 0"):
+        uv_in.write_uvfits_part(
+            partial_file,
+            data_array=uv_in.data_array,
+            flag_array=uv_in.flag_array,
+            nsample_array=nsample_array,
+        )
+
+    uv_in.time_array[0] += 1
+    with pytest.raises(AssertionError, match="The object metadata in memory and"):
+        uv_in.write_uvfits_part(
+            partial_file,
+            data_array=uv_in.data_array[:1],
+            flag_array=uv_in.flag_array[:1],
+            nsample_array=uv_in.nsample_array[:1],
+            blt_inds=[0],
+        )
+    # the check can be skipped
+    uv_in.write_uvfits_part(
+        partial_file,
+        data_array=uv_in.data_array[:1],
+        flag_array=uv_in.flag_array[:1],
+        nsample_array=uv_in.nsample_array[:1],
+        blt_inds=[0],
+        check_header=False,
+    )
+    uv_in.time_array[0] -= 1
+
+    uv_in.select(freq_chans=np.arange(uv_in.Nfreqs - 1))
+    with pytest.raises(AssertionError, match="The object metadata in memory and"):
+        uv_in.write_uvfits_part(
+            partial_file,
+            data_array=uv_in.data_array,
+            flag_array=uv_in.flag_array,
+            nsample_array=uv_in.nsample_array,
+        )
+
+    with pytest.raises(
+        ValueError, match="The data are not all phased to a sidereal source"
+    ):
+        hera_uvh5.initialize_uvfits_file(partial_file, clobber=True, run_check=False)
+
+    hera_uvh5.convert_to_flex_pol()
+    with pytest.raises(ValueError, match="Cannot write flex-pol objects to uvfits"):
+        hera_uvh5.initialize_uvfits_file(partial_file, clobber=True, run_check=False)
+    with pytest.raises(ValueError, match="Cannot write flex-pol objects to uvfits"):
+        hera_uvh5.write_uvfits_part(
+            partial_file,
+            data_array=hera_uvh5.data_array,
+            flag_array=hera_uvh5.flag_array,
+            nsample_array=hera_uvh5.nsample_array,
+        )
+
+
+@pytest.mark.filterwarnings("ignore:Fixing auto-correlations to be be real-only")
+@pytest.mark.filterwarnings("ignore:Selected frequencies are not")
+@pytest.mark.filterwarnings("ignore:Combined frequencies are not evenly spaced")
+@pytest.mark.parametrize(
+    ("axis", "chunk_size", "select_kwargs"),
+    [
+        ("blt", 1000, {}),
+        ("blt", 7, {"antenna_nums": [1, 2, 3], "polarizations": ["xx", "yy"]}),
+        ("freq", 4, {}),
+        ("freq", 2, {"freq_chans": [1, 3, 4, 8]}),
+        ("polarization", 3, {"ant_str": "cross"}),
+    ],
+)
+def test_iter_uvfits_chunks(axis, chunk_size, select_kwargs):
+    """Test that iterating over chunks gives the same data as a full read."""
+    testfile = os.path.join(DATA_PATH, "1133866760.uvfits")
+    uvd = UVData.from_file(testfile, **select_kwargs)
+
+    axis_len = {"blt": uvd.Nblts, "freq": uvd.Nfreqs, "polarization": uvd.Npols}
+    chunks = list(
+        UVData.iter_uvfits_chunks(
+            testfile, chunk_size=chunk_size, axis=axis, **select_kwargs
+        )
+    )
+    assert len(chunks) == int(np.ceil(axis_len[axis] / chunk_size))
+    for chunk in chunks:
+        assert isinstance(chunk, UVData)
+        assert {"blt": chunk.Nblts, "freq": chunk.Nfreqs, "polarization": chunk.Npols}[
+            axis
+        ] <= chunk_size
+
+    uvd2 = chunks[0]
+    if len(chunks) > 1:
+        uvd2 = uvd2.fast_concat(chunks[1:], axis=axis)
+    assert uvd2.filename == uvd.filename
+    uvd2.history = uvd.history
+    assert uvd2 == uvd
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "msg"),
+    [
+        ({"axis": "foo"}, "Axis must be one of: blt, freq, polarization"),
+        ({"chunk_size": 0}, "chunk_size must be a positive integer."),
+        ({"chunk_size": 1.5}, "chunk_size must be a positive integer."),
+    ],
+)
+def test_iter_uvfits_chunks_errors(kwargs, msg):
+    kwargs = {"chunk_size": 10} | kwargs
+    with pytest.raises(ValueError, match=msg):
+        next(UVData.iter_uvfits_chunks(paper_uvfits, **kwargs))
+
+
+@pytest.mark.filterwarnings("ignore:Selected frequencies are not evenly spaced")
+@pytest.mark.filterwarnings("ignore:Combined frequencies are separated by more than")
+def test_read_uvfits_freq_chans_multi_spw(sma_mir, tmp_path):
+    """Test selecting channels across spectral windows on read."""
+    testfile = str(tmp_path / "sma_multi_spw.uvfits")
+    sma_mir._set_app_coords_helper()
+    sma_mir.write_uvfits(testfile)
+
+    freq_chans = np.concatenate([np.arange(0, sma_mir.Nfreqs, 7), [sma_mir.Nfreqs - 1]])
+    uvd = UVData.from_file(testfile)
+    uvd2 = UVData.from_file(testfile, freq_chans=freq_chans)
+    uvd.select(freq_chans=freq_chans)
+    uvd2.history = uvd.history
+    assert uvd2 == uvd
+
+    chunks = list(UVData.iter_uvfits_chunks(testfile, chunk_size=5, axis="freq"))
+    uvd3 = chunks[0].fast_concat(chunks[1:], axis="freq")
+    uvd4 = UVData.from_file(testfile)
+    uvd3.history = uvd4.history
+    assert uvd3 == uvd4
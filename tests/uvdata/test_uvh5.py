@@ -3,6 +3,8 @@
 
 """Tests for HDF5 object"""
 
+import concurrent.futures
+import copy
 import json
 import os
 import re
@@ -3273,6 +3275,423 @@ def test_uvh5_bitshuffle(uv_phase_comp, tmp_path):
     assert uvd == uvd2
 
 
+@pytest.mark.parametrize(
+    "select_kwargs",
+    [
+        {},
+        {"bls": [(0, 1), (1, 12)]},
+        {"freq_chans": np.arange(4, 40), "times": "first"},
+    ],
+)
+@pytest.mark.parametrize("custom_dtype", [False, True])
+def test_read_decompression_nworkers(
+    tmp_path, monkeypatch, select_kwargs, custom_dtype
+):
+    """Test reading compressed files with multiple decompression workers."""
+    testfile = os.path.join(DATA_PATH, "zen.2458432.34569.uvh5")
+    uvd = UVData.from_file(testfile)
+    if select_kwargs.get("times") == "first":
+        select_kwargs = select_kwargs | {"times": np.unique(uvd.time_array)[0]}
+
+    outfile = str(tmp_path / "test.uvh5")
+    chunks = (uvd.Nbls // 2, uvd.Nfreqs, uvd.Npols)
+    if custom_dtype:
+        uvd.data_array = np.round(uvd.data_array)
+        uvd.write_uvh5(
+            outfile,
+            chunks=chunks,
+            data_compression="lzf",
+            data_write_dtype=uvh5._hera_corr_dtype,
+        )
+    else:
+        uvd.write_uvh5(outfile, chunks=chunks, data_compression="lzf")
+
+    # check that one pool of workers is shared by all the datasets
+    pools = []
+
+    class CountingPool(concurrent.futures.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", CountingPool)
+
+    uvd1 = UVData()
+    uvd1.read_uvh5(outfile, **select_kwargs)
+    assert len(pools) == 0
+    uvd2 = UVData()
+    uvd2.read_uvh5(outfile, decompression_nworkers=3, **select_kwargs)
+    assert len(pools) == 1
+    assert uvd1 == uvd2
+
+
+@pytest.mark.parametrize(
+    ("axis", "chunk_size", "select_kwargs"),
+    [
+        ("blt", 7, {}),
+        ("blt", 5, {"bls": [(0, 1), (1, 12)], "polarizations": [-5]}),
+        ("freq", 10, {}),
+        ("freq", 3, {"freq_chans": np.arange(4, 40), "times": "first"}),
+        ("polarization", 1, {}),
+        ("polarization", 3, {"ant_str": "cross"}),
+    ],
+)
+def test_iter_uvh5_chunks(axis, chunk_size, select_kwargs):
+    """Test that iterating over chunks gives the same data as a full read."""
+    testfile = os.path.join(DATA_PATH, "zen.2458432.34569.uvh5")
+    uvd_file = testfile
+    if select_kwargs.get("times") == "first":
+        # also test passing a FastUVH5Meta object
+        testfile = uvh5.FastUVH5Meta(uvd_file)
+        select_kwargs["times"] = testfile.times[0]
+
+    uvd = UVData.from_file(uvd_file, **select_kwargs)
+
+    axis_len = {"blt": uvd.Nblts, "freq": uvd.Nfreqs, "polarization": uvd.Npols}
+    chunks = list(
+        UVData.iter_uvh5_chunks(
+            testfile, chunk_size=chunk_size, axis=axis, **select_kwargs
+        )
+    )
+    assert len(chunks) == int(np.ceil(axis_len[axis] / chunk_size))
+    for chunk in chunks:
+        assert isinstance(chunk, UVData)
+        assert {"blt": chunk.Nblts, "freq": chunk.Nfreqs, "polarization": chunk.Npols}[
+            axis
+        ] <= chunk_size
+
+    uvd2 = chunks[0]
+    if len(chunks) > 1:
+        uvd2 = uvd2.fast_concat(chunks[1:], axis=axis)
+    assert uvd2.filename == uvd.filename
+    uvd2.history = uvd.history
+    assert uvd2 == uvd
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "msg"),
+    [
+        ({"axis": "foo"}, "Axis must be one of: blt, freq, polarization"),
+        ({"chunk_size": 0}, "chunk_size must be a positive integer."),
+        ({"chunk_size": 1.5}, "chunk_size must be a positive integer."),
+        ({"read_data": False}, "read_data cannot be passed to iter_uvh5_chunks."),
+    ],
+)
+def test_iter_uvh5_chunks_errors(kwargs, msg):
+    testfile = os.path.join(DATA_PATH, "zen.2458432.34569.uvh5")
+    kwargs = {"chunk_size": 10} | kwargs
+    with pytest.raises(ValueError, match=msg):
+        next(UVData.iter_uvh5_chunks(testfile, **kwargs))
+
+
+def test_iter_uvh5_chunks_header_copies():
+    """Test that chunks do not share header values, but plain reads do not copy."""
+    testfile = os.path.join(DATA_PATH, "zen.2458432.34569.uvh5")
+    meta = uvh5.FastUVH5Meta(testfile)
+    chunks = UVData.iter_uvh5_chunks(meta, chunk_size=10, axis="blt")
+    chunk1, chunk2 = next(chunks), next(chunks)
+    freq_array = chunk2.freq_array.copy()
+    chunk1.freq_array += 1
+    chunk1.phase_center_catalog[0]["cat_name"] = "foo"
+    np.testing.assert_array_equal(chunk2.freq_array, freq_array)
+    assert chunk2.phase_center_catalog[0]["cat_name"] != "foo"
+
+    uvd = uvh5.UVH5()
+    uvd.read_uvh5(meta)
+    assert uvd.polarization_array is meta.polarization_array
+    meta.close()
+
+
+def test_iter_uvh5_chunks_flex_pol(uv_uvh5, tmp_path):
+    testfile = os.path.join(tmp_path, "flex_pol.uvh5")
+    uv_uvh5.convert_to_flex_pol()
+    uv_uvh5.write_uvh5(testfile)
+
+    with pytest.raises(
+        ValueError,
+        match="Cannot iterate over the polarization axis for flex-pol files.",
+    ):
+        next(UVData.iter_uvh5_chunks(testfile, chunk_size=1, axis="polarization"))
+
+    chunks = list(UVData.iter_uvh5_chunks(testfile, chunk_size=40, axis="blt"))
+    uvd = UVData.from_file(testfile)
+    uvd2 = chunks[0].fast_concat(chunks[1:], axis="blt")
+    uvd2.history = uvd.history
+    assert uvd2 == uvd
+
+
+@pytest.mark.parametrize("file_type", ["default", "old_shapes", "ints"])
+@pytest.mark.parametrize(
+    "select_kwargs",
+    [
+        {},
+        {"bls": [(0, 1), (1, 12)], "freq_chans": np.arange(3, 40)},
+        {"polarizations": [-5, -7], "times": "first"},
+    ],
+)
+def test_read_lazy(uv_uvh5, tmp_path, file_type, select_kwargs):
+    """Test lazily reading data-like arrays."""
+    testfile = os.path.join(tmp_path, "lazy.uvh5")
+    if file_type == "ints":
+        uv_uvh5.write_uvh5(testfile, data_write_dtype=uvh5._hera_corr_dtype)
+    else:
+        uv_uvh5.write_uvh5(testfile)
+    if file_type == "old_shapes":
+        make_old_shapes(testfile)
+    if select_kwargs.get("times") == "first":
+        select_kwargs["times"] = np.unique(uv_uvh5.time_array)[0]
+
+    uvd = UVData.from_file(testfile, data_array_dtype=np.complex64, **select_kwargs)
+    uvd_lazy = UVData()
+    uvd_lazy.read_uvh5(
+        testfile, lazy=True, data_array_dtype=np.complex64, **select_kwargs
+    )
+    for attr in ["data_array", "flag_array", "nsample_array"]:
+        lazy_arr = getattr(uvd_lazy, attr)
+        arr = getattr(uvd, attr)
+        assert isinstance(lazy_arr, hdf5_utils.LazyHDF5Array)
+        assert lazy_arr.shape == arr.shape
+        assert lazy_arr.dtype == arr.dtype
+        assert lazy_arr.nbytes == arr.nbytes
+        assert len(lazy_arr) == len(arr)
+    assert uvd_lazy == uvd
+    # hashing the lazy arrays reads them in chunks, giving the same fingerprint
+    assert uvd_lazy.fingerprint(chunk_size=1000) == uvd.fingerprint()
+
+    for key in uvd.get_antpairpols():
+        np.testing.assert_array_equal(uvd_lazy.get_data(key), uvd.get_data(key))
+        np.testing.assert_array_equal(uvd_lazy.get_flags(key), uvd.get_flags(key))
+        np.testing.assert_array_equal(uvd_lazy.get_nsamples(key), uvd.get_nsamples(key))
+    for (key1, data1), (key2, data2) in zip(
+        uvd_lazy.antpairpol_iter(), uvd.antpairpol_iter(), strict=True
+    ):
+        assert key1 == key2
+        np.testing.assert_array_equal(data1, data2)
+
+    # selecting does not read the data
+    times = np.unique(uvd.time_array)[::2]
+    uvd_lazy.select(times=times)
+    uvd.select(times=times)
+    assert isinstance(uvd_lazy.data_array, hdf5_utils.LazyHDF5Array)
+    assert uvd_lazy == uvd
+
+    uvd_lazy2 = uvd_lazy.copy()
+    assert isinstance(uvd_lazy2.data_array, hdf5_utils.LazyHDF5Array)
+    uvd_lazy2.load_lazy_data()
+    for attr in ["data_array", "flag_array", "nsample_array"]:
+        assert isinstance(getattr(uvd_lazy2, attr), np.ndarray)
+    assert uvd_lazy2 == uvd
+    assert uvd_lazy2 == uvd_lazy
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        3,
+        -1,
+        (3, 4, 0),
+        (slice(None), 2),
+        ([5, 2, 2], slice(3, 10, 2), -1),
+        ([1, 40], [2, 3]),
+        ([1, 40], slice(None), 2),
+        (2, [3, 1, 3]),
+        (slice(None, None, -3), -1, [1, 1, 0]),
+        (slice(70, None), [1, 2], [0, 3]),
+        (..., 1),
+        (1, ..., slice(1, 3)),
+        np.arange(80) % 3 == 0,
+        "flags",
+        (np.newaxis, 2),
+        (np.arange(0, 80, 4), np.arange(0, 40, 2)),
+        (np.arange(0, 80, 4)[:, np.newaxis], np.arange(0, 64, 2)),
+        (slice(5, 5),),
+    ],
+)
+def test_lazy_array_indexing(uv_uvh5, key):
+    testfile = os.path.join(DATA_PATH, "zen.2458432.34569.uvh5")
+    lazy_arr = hdf5_utils.LazyHDF5Array(uvh5.FastUVH5Meta(testfile), "visdata")
+    if isinstance(key, str):
+        key = uv_uvh5.flag_array
+    np.testing.assert_array_equal(lazy_arr[key], uv_uvh5.data_array[key])
+
+    # also check indexing after a select along each axis
+    inds = [np.arange(0, 80, 3), np.arange(60, 0, -2), [3, 1]]
+    for axis, ind in enumerate(inds):
+        lazy_sel = lazy_arr.take(ind, axis=axis)
+        arr_sel = uv_uvh5.data_array.take(ind, axis=axis)
+        if isinstance(key, np.ndarray) and key.shape != arr_sel.shape[: key.ndim]:
+            continue
+        try:
+            expected = arr_sel[key]
+        except IndexError:
+            with pytest.raises(IndexError):
+                lazy_sel[key]
+            continue
+        np.testing.assert_array_equal(lazy_sel[key], expected)
+
+
+def test_lazy_array_misc(uv_uvh5):
+    testfile = os.path.join(DATA_PATH, "zen.2458432.34569.uvh5")
+    meta = uvh5.FastUVH5Meta(testfile)
+    lazy_arr = hdf5_utils.LazyHDF5Array(meta, "nsamples")
+    assert lazy_arr.ndim == 3
+    assert lazy_arr.size == uv_uvh5.nsample_array.size
+    assert lazy_arr.item(5) == uv_uvh5.nsample_array.item(5)
+    assert lazy_arr.item(1, 2, 3) == uv_uvh5.nsample_array.item(1, 2, 3)
+    assert (
+        lazy_arr.take([0], 0).take([0], 1).take([1], 2).item()
+        == (uv_uvh5.nsample_array[0, 0, 1])
+    )
+    assert repr(lazy_arr).startswith("LazyHDF5Array(path=")
+    np.testing.assert_array_equal(
+        np.asarray(lazy_arr, dtype=np.float32), uv_uvh5.nsample_array.astype(np.float32)
+    )
+
+    # the file is reopened as needed
+    meta.close()
+    np.testing.assert_array_equal(lazy_arr[:5], uv_uvh5.nsample_array[:5])
+
+    with pytest.raises(ValueError, match="dtype must be np.complex64 or np.complex128"):
+        hdf5_utils.LazyHDF5Array(meta, "visdata", dtype=np.float64)
+
+    with pytest.raises(ValueError, match="indices must have a length of 3."):
+        hdf5_utils.LazyHDF5Array(meta, "nsamples", indices=(None, None))
+
+    with pytest.raises(ValueError, match="indices must be one dimensional."):
+        lazy_arr.take(np.zeros((2, 2), dtype=int), 0)
+
+    with pytest.raises(IndexError, match="an index can only have a single ellipsis"):
+        lazy_arr[..., 0, ...]
+
+    with pytest.raises(IndexError, match="too many indices for array"):
+        lazy_arr[0, 0, 0, 0]
+
+    with pytest.raises(
+        ValueError, match="can only convert an array of size 1 to a Python scalar"
+    ):
+        lazy_arr.item()
+
+    with pytest.raises(ValueError, match="A copy is always required"):
+        np.array(lazy_arr, copy=False)
+
+    # arithmetic and array methods read the data
+    nsamples = uv_uvh5.nsample_array
+    for result, expected in [
+        (lazy_arr + 1, nsamples + 1),
+        (2 * lazy_arr, 2 * nsamples),
+        (lazy_arr - lazy_arr, np.zeros_like(nsamples)),
+        (np.sqrt(lazy_arr), np.sqrt(nsamples)),
+        (lazy_arr.astype(np.float64), nsamples.astype(np.float64)),
+        (lazy_arr.copy(), nsamples),
+        (lazy_arr.conj(), nsamples),
+        (lazy_arr.reshape(-1), nsamples.reshape(-1)),
+        (lazy_arr.flatten(), nsamples.flatten()),
+        (lazy_arr.repeat(2, axis=1), nsamples.repeat(2, axis=1)),
+        (lazy_arr.transpose(2, 0, 1), nsamples.transpose(2, 0, 1)),
+        (lazy_arr.T, nsamples.T),
+        (lazy_arr.real, nsamples.real),
+        (lazy_arr.imag, nsamples.imag),
+    ]:
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_array_equal(result, expected)
+
+    # writing to the object reads the data into memory, leaving the file unchanged
+    lazy_copy = copy.copy(lazy_arr)
+    lazy_arr *= 2
+    assert isinstance(lazy_arr, hdf5_utils.LazyHDF5Array)
+    np.testing.assert_array_equal(lazy_arr, 2 * nsamples)
+    lazy_arr[0] = -1
+    np.testing.assert_array_equal(lazy_arr[0], -1)
+    np.testing.assert_array_equal(lazy_arr[1:], 2 * nsamples[1:])
+    np.testing.assert_array_equal(
+        lazy_arr.take([1, 2], axis=0), 2 * nsamples.take([1, 2], axis=0)
+    )
+    lazy_arr_copy = lazy_arr.copy()
+    assert isinstance(lazy_arr_copy, np.ndarray)
+    assert isinstance(copy.copy(lazy_arr), np.ndarray)
+    lazy_arr_copy[0] = 5
+    np.testing.assert_array_equal(lazy_arr[0], -1)
+
+    assert isinstance(lazy_copy, hdf5_utils.LazyHDF5Array)
+    np.testing.assert_array_equal(lazy_copy, nsamples)
+    np.testing.assert_array_equal(
+        hdf5_utils.LazyHDF5Array(meta, "nsamples"), uv_uvh5.nsample_array
+    )
+
+
+def test_read_lazy_load(uv_uvh5, tmp_path):
+    """Test that lazy arrays are loaded when the data needs fixing on read."""
+    testfile = os.path.join(tmp_path, "lazy.uvh5")
+    autos = uv_uvh5.ant_1_array == uv_uvh5.ant_2_array
+    uv_uvh5.data_array[autos] += 1j
+    uv_uvh5.write_uvh5(testfile, run_check=False)
+
+    uvd = UVData()
+    with check_warnings(UserWarning, "Fixing auto-correlations to be be real-only"):
+        uvd.read_uvh5(testfile, lazy=True)
+    assert isinstance(uvd.data_array, np.ndarray)
+    assert isinstance(uvd.flag_array, np.ndarray)
+
+    uv_uvh5.data_array[autos] -= 1j
+    uv_uvh5.convert_to_flex_pol()
+    uv_uvh5.write_uvh5(testfile, clobber=True)
+    uvd.read_uvh5(testfile, lazy=True)
+    assert isinstance(uvd.data_array, np.ndarray)
+    assert uvd.flex_spw_polarization_array is None
+
+    uvd.read_uvh5(testfile, lazy=True, remove_flex_pol=False)
+    assert isinstance(uvd.data_array, hdf5_utils.LazyHDF5Array)
+    uvd2 = UVData.from_file(testfile, remove_flex_pol=False)
+    assert uvd == uvd2
+
+
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+@pytest.mark.parametrize(
+    "method",
+    [
+        "write_uvh5",
+        "sum_vis",
+        "diff_vis",
+        "conjugate_bls",
+        "phase",
+        "set_data",
+        "remove_eq_coeffs",
+    ],
+)
+def test_read_lazy_methods(uv_uvh5, tmp_path, method):
+    """Test methods that use or modify the data on lazily read objects."""
+    testfile = os.path.join(tmp_path, "lazy.uvh5")
+    if method == "remove_eq_coeffs":
+        uv_uvh5.eq_coeffs = np.full(
+            (uv_uvh5.telescope.Nants, uv_uvh5.Nfreqs), 2.0, dtype=np.float64
+        )
+        uv_uvh5.eq_coeffs_convention = "divide"
+    uv_uvh5.write_uvh5(testfile)
+    uvd = UVData.from_file(testfile)
+    uvd_lazy = UVData()
+    uvd_lazy.read_uvh5(testfile, lazy=True)
+
+    for uv in [uvd, uvd_lazy]:
+        if method == "write_uvh5":
+            outfile = os.path.join(tmp_path, "lazy_out.uvh5")
+            uv.write_uvh5(outfile, clobber=True)
+            uv2 = UVData.from_file(outfile)
+            uv.data_array = uv2.data_array
+        elif method in ["sum_vis", "diff_vis"]:
+            uv.data_array = getattr(uv, method)(uv).data_array
+        elif method == "conjugate_bls":
+            uv.conjugate_bls("ant2<ant1")
+        elif method == "phase":
+            uv.phase(lon=0.3, lat=-0.5, cat_name="foo")
+        elif method == "set_data":
+            key = uv.get_antpairpols()[0]
+            uv.set_data(np.ones_like(uv.get_data(key, squeeze="none")), key)
+        else:
+            uv.remove_eq_coeffs()
+    assert isinstance(uvd_lazy.data_array, np.ndarray)
+    assert uvd_lazy == uvd
+
+
 @pytest.mark.usefixtures("tmp_path_factory")
 @pytest.mark.usefixtures("sma_mir")
 class TestFastUVH5Meta:
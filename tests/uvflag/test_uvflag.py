@@ -2106,6 +2106,59 @@ def test_to_waterfall_bl_ret_wt_sq():
     assert uvf.weights_square_array is None
 
 
+@pytest.mark.filterwarnings("ignore:The lst_array is not self-consistent")
+@pytest.mark.parametrize(
+    ("mode", "method"),
+    [("metric", "quadmean"), ("metric", "mean"), ("flag", "absmean"), ("flag", "or")],
+)
+def test_to_waterfall_bl_blt_order(mode, method):
+    uvf = UVFlag(test_f_file)
+    rng = np.random.default_rng(2)
+    if mode == "metric":
+        uvf.weights_array = rng.random(uvf.weights_array.shape)
+    else:
+        uvf.to_flag()
+        uvf.flag_array = rng.random(uvf.flag_array.shape) > 0.5
+    darr = uvf.metric_array if mode == "metric" else uvf.flag_array
+    weights = uvf.weights_array if mode == "metric" else np.ones_like(darr, dtype=float)
+
+    # shuffle the blts so the times are not contiguous
+    order = rng.permutation(uvf.Nblts)
+    for param in uvf._data_params + [
+        "time_array",
+        "lst_array",
+        "baseline_array",
+        "ant_1_array",
+        "ant_2_array",
+    ]:
+        if getattr(uvf, param) is not None:
+            setattr(uvf, param, getattr(uvf, param)[order])
+    darr = darr[order]
+    weights = weights[order]
+
+    times = np.unique(uvf.time_array)
+    exp_d = np.zeros((times.size,) + darr.shape[1:])
+    exp_w = np.zeros_like(exp_d)
+    exp_ws = np.zeros_like(exp_d)
+    for i, t in enumerate(times):
+        ind = uvf.time_array == t
+        exp_d[i], exp_w[i] = utils.collapse(
+            darr[ind], method, axis=0, weights=weights[ind], return_weights=True
+        )
+        exp_ws[i] = np.sum(weights[ind] ** 2 * ~np.isinf(darr[ind]), axis=0)
+
+    uvf.to_waterfall(method=method, return_weights_square=method != "or")
+    assert uvf.type == "waterfall"
+    np.testing.assert_array_equal(uvf.time_array, times)
+    if method == "or":
+        np.testing.assert_array_equal(uvf.flag_array, exp_d.astype(bool))
+    else:
+        np.testing.assert_allclose(uvf.metric_array, exp_d, rtol=1e-12)
+    if mode == "metric":
+        np.testing.assert_allclose(uvf.weights_array, exp_w, rtol=1e-12)
+        np.testing.assert_allclose(uvf.weights_square_array, exp_ws, rtol=1e-12)
+
+
 @pytest.mark.filterwarnings("ignore:The lst_array is not self-consistent")
 def test_collapse_pol(test_outfile):
     uvf = UVFlag(test_f_file)
@@ -2374,6 +2427,54 @@ def test_to_baseline_metric(uvdata_obj):
     )
 
 
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+@pytest.mark.parametrize("mode", ["flag", "metric"])
+@pytest.mark.parametrize("blt_chunk_size", [None, 7])
+def test_to_baseline_blt_order(uvdata_obj, mode, blt_chunk_size):
+    uv = uvdata_obj
+    rng = np.random.default_rng(4)
+    uv.reorder_blts(order=rng.permutation(uv.Nblts))
+
+    uvf = UVFlag(uv, mode=mode, waterfall=True)
+    if mode == "flag":
+        uvf.flag_array = rng.random(uvf.flag_array.shape) > 0.5
+        darr = uvf.flag_array
+    else:
+        uvf.metric_array = rng.random(uvf.metric_array.shape)
+        uvf.weights_array = rng.random(uvf.weights_array.shape)
+        darr = uvf.metric_array
+    weights = uvf.weights_array
+    wf_times = uvf.time_array
+
+    # drop the last time, those blts should not be filled
+    uvf.select(times=wf_times[:-1])
+    uvf.to_baseline(uv, blt_chunk_size=blt_chunk_size)
+
+    out_arr = uvf.flag_array if mode == "flag" else uvf.metric_array
+    for t_ind, time in enumerate(wf_times):
+        blt_inds = np.nonzero(uv.time_array == time)[0]
+        if t_ind == wf_times.size - 1:
+            assert not np.any(out_arr[blt_inds])
+            continue
+        np.testing.assert_array_equal(
+            out_arr[blt_inds], np.broadcast_to(darr[t_ind], out_arr[blt_inds].shape)
+        )
+        if mode == "metric":
+            np.testing.assert_array_equal(
+                uvf.weights_array[blt_inds],
+                np.broadcast_to(weights[t_ind], out_arr[blt_inds].shape),
+            )
+
+
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+@pytest.mark.parametrize("blt_chunk_size", [0, 2.5])
+def test_to_baseline_blt_chunk_size_error(uvdata_obj, blt_chunk_size):
+    uv = uvdata_obj
+    uvf = UVFlag(uv, waterfall=True)
+    with pytest.raises(ValueError, match="blt_chunk_size must be a positive integer"):
+        uvf.to_baseline(uv, blt_chunk_size=blt_chunk_size)
+
+
 @pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
 def test_to_baseline_add_version_str(uvdata_obj):
     uv = uvdata_obj
@@ -2428,7 +2529,8 @@ def test_to_baseline_metric_error(uvdata_obj, uvf_from_uvcal):
 
 
 @pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
-def test_to_baseline_from_antenna(uvdata_obj, uvf_from_uvcal):
+@pytest.mark.parametrize("blt_chunk_size", [None, 10])
+def test_to_baseline_from_antenna(uvdata_obj, uvf_from_uvcal, blt_chunk_size):
     uvf = uvf_from_uvcal
     uv = uvdata_obj
 
@@ -2465,13 +2567,13 @@ def test_to_baseline_from_antenna(uvdata_obj, uvf_from_uvcal):
         match="x_orientation is not the same on this object and on uv. Keeping "
         "the value on this object.",
     ):
-        uvf.to_baseline(uv, force_pol=True)
+        uvf.to_baseline(uv, force_pol=True, blt_chunk_size=blt_chunk_size)
     with check_warnings(
         UserWarning,
         match="x_orientation is not the same on this object and on uv. Keeping "
         "the value on this object.",
     ):
-        uvf2.to_baseline(uv2, force_pol=True)
+        uvf2.to_baseline(uv2, force_pol=True, blt_chunk_size=blt_chunk_size)
     uvf.check()
 
     uvf2.select(bls=old_baseline, times=old_times)
@@ -3162,6 +3264,74 @@ def test_flags2waterfall_uvdata(uvdata_obj):
     assert wf.shape == (uv.Ntimes, uv.Nfreqs)
 
 
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+@pytest.mark.parametrize("keep_pol", [True, False])
+def test_flags2waterfall_uvdata_blt_order(uvdata_obj, keep_pol):
+    uv = uvdata_obj
+
+    rng = np.random.default_rng(0)
+    uv.flag_array = rng.random(uv.flag_array.shape) > 0.5
+    uv.reorder_blts(order=rng.permutation(uv.Nblts))
+
+    mean_axis = (0,) if keep_pol else (0, 2)
+    expected = np.zeros((uv.Ntimes,) + uv.flag_array.shape[1 : 3 if keep_pol else 2])
+    for i, t in enumerate(np.unique(uv.time_array)):
+        expected[i] = np.mean(uv.flag_array[uv.time_array == t], axis=mean_axis)
+
+    wf = flags2waterfall(uv, keep_pol=keep_pol)
+    np.testing.assert_array_equal(wf, expected)
+
+
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+@pytest.mark.parametrize("keep_pol", [True, False])
+@pytest.mark.parametrize("chunk_size", [None, 7])
+@pytest.mark.parametrize("use_meta", [True, False])
+def test_flags2waterfall_uvh5(
+    uvdata_obj, tmp_path, keep_pol, chunk_size, use_meta, monkeypatch
+):
+    uv = uvdata_obj
+
+    rng = np.random.default_rng(1)
+    uv.flag_array = rng.random(uv.flag_array.shape) > 0.5
+    uv.reorder_blts(order=rng.permutation(uv.Nblts))
+    testfile = str(tmp_path / "flags2waterfall.uvh5")
+    uv.write_uvh5(testfile)
+
+    # only the flags are read from the file
+    def no_chunks(*args, **kwargs):
+        raise AssertionError("should not read UVData objects")
+
+    monkeypatch.setattr(UVData, "iter_uvh5_chunks", no_chunks)
+
+    if use_meta:
+        from pyuvdata.uvdata.uvh5 import FastUVH5Meta
+
+        meta = FastUVH5Meta(testfile)
+        wf = flags2waterfall(meta, keep_pol=keep_pol, chunk_size=chunk_size)
+        meta.close()
+    else:
+        wf = flags2waterfall(testfile, keep_pol=keep_pol, chunk_size=chunk_size)
+
+    np.testing.assert_array_equal(wf, flags2waterfall(uv, keep_pol=keep_pol))
+
+
+@pytest.mark.filterwarnings("ignore:The uvw_array does not match the expected values")
+@pytest.mark.parametrize("keep_pol", [True, False])
+def test_flags2waterfall_uvh5_flex_pol(uvdata_obj, tmp_path, keep_pol):
+    uv = uvdata_obj
+
+    rng = np.random.default_rng(1)
+    uv.flag_array = rng.random(uv.flag_array.shape) > 0.5
+    uv.convert_to_flex_pol()
+    testfile = str(tmp_path / "flags2waterfall.uvh5")
+    uv.write_uvh5(testfile)
+
+    wf = flags2waterfall(testfile, keep_pol=keep_pol, chunk_size=7)
+    np.testing.assert_array_equal(
+        wf, flags2waterfall(UVData.from_file(testfile), keep_pol=keep_pol)
+    )
+
+
 def test_flags2waterfall_uvcal(uvcal_obj):
     uvc = uvcal_obj
 
@@ -3190,6 +3360,11 @@ def test_flags2waterfall_errors(uvdata_obj):
     with pytest.raises(ValueError, match="Flag array must align with UVData or UVCal"):
         flags2waterfall(uv, flag_array=np.array([4, 5]))
 
+    with pytest.raises(
+        ValueError, match="flag_array cannot be passed to flags2waterfall()"
+    ):
+        flags2waterfall(test_d_file, flag_array=uv.flag_array)
+
 
 def test_and_rows_cols():
     d = np.zeros((10, 20), np.bool_)